@@ -2,17 +2,21 @@
 Chloe Alpha Read-Only API
 FastAPI service for dashboard data access.
 """
-from fastapi import FastAPI, Request, HTTPException, Response
+from fastapi import FastAPI, Header, Request, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
 import os
+from typing import Optional
 
 from .auth import require_auth, check_rate_limit
+from .http_cache import HTTPCacheMiddleware
 from .readers import (
-    get_health_status, get_status_data, get_pf_data, get_positions, get_symbol_states,
+    get_health_status, get_status_data, get_pf_data, get_pf_windows, get_positions, get_symbol_states,
     get_promotion_data, get_recent_trades, get_meta_log_sizes
 )
+from .streams import TOPICS, get_hub
+from .views import get_registry
 from .models import (
     HealthResponse, MetaLogSizesResponse, TradeEntry,
     PfResponse, PositionStateResponse, SymbolStatesResponse,
@@ -29,6 +33,29 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+ERROR_CODES = {401: "UNAUTHORIZED", 429: "RATE_LIMITED"}
+
+
+async def cache_guard(request: Request) -> Optional[JSONResponse]:
+    """Run the cached routes' auth and rate-limit dependencies before serving from cache."""
+    try:
+        require_auth(request)
+        check_rate_limit(request)
+    except HTTPException as exc:
+        return JSONResponse(
+            status_code=exc.status_code,
+            content=ErrorResponse(
+                error=ERROR_CODES.get(exc.status_code, "ERROR"),
+                message=exc.detail
+            ).dict()
+        )
+    return None
+
+
+# Response cache + ETag/Last-Modified/304 + gzip for file-backed endpoints
+# (added before CORS so CORS headers still wrap cached responses)
+app.add_middleware(HTTPCacheMiddleware, guard=cache_guard)
+
 # CORS middleware (restrict to your dashboard domains in production)
 app.add_middleware(
     CORSMiddleware,
@@ -209,6 +236,64 @@ async def get_recent_trades_data(
     return TradesRecentResponse(trades=data)
 
 
+@app.get("/pf/windows")
+async def get_pf_windows_data(request: Request = require_auth, rate_limit: Request = check_rate_limit):
+    """Get PF per window (1D/7D/14D/30D/90D/all), global and per symbol."""
+    data, error = get_pf_windows()
+    if error:
+        raise HTTPException(status_code=404, detail=error)
+
+    return APIResponse(success=True, data=data)
+
+
+@app.get("/views/{name}")
+async def get_view_data(
+    name: str,
+    if_none_match: Optional[str] = Header(None),
+    request: Request = require_auth,
+    rate_limit: Request = check_rate_limit
+):
+    """Get a materialized view from memory (ETag / If-None-Match aware)."""
+    registry = get_registry()
+    if name not in registry.names():
+        raise HTTPException(status_code=404, detail=f"Unknown view: {name}")
+
+    snapshot = registry.get(name)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if if_none_match == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    if snapshot.data is None:
+        raise HTTPException(status_code=404, detail=snapshot.error)
+
+    return JSONResponse(
+        content=APIResponse(success=True, data=snapshot.data).dict(),
+        headers=headers,
+    )
+
+
+@app.get("/stream")
+async def stream_events(
+    topics: str = ",".join(TOPICS),
+    request: Request = require_auth,
+    rate_limit: Request = check_rate_limit
+):
+    """
+    Server-sent events for new trades, opportunity events and loop health.
+
+    topics: comma-separated subset of trades, opportunity, health.
+    """
+    requested = [t.strip() for t in topics.split(",") if t.strip()]
+    unknown = [t for t in requested if t not in TOPICS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown topics: {', '.join(unknown)}")
+
+    return StreamingResponse(
+        get_hub().events(requested),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/meta/log_sizes", response_model=MetaLogSizesResponse)
 async def get_meta_log_sizes_data(request: Request = require_auth, rate_limit: Request = check_rate_limit):
     """Get sizes and metadata for key log files."""
@@ -0,0 +1,297 @@
+"""
+HTTP response cache for the read-only API.
+
+Responses of file-backed GET endpoints are cached in memory, keyed by
+(path, query, source file signatures). A signature is (mtime_ns, size) for
+each source report, so an entry stays valid until a source file changes.
+Endpoints whose output also depends on the clock (e.g. /trades/recent with an
+hours cutoff) add a time bucket to the key.
+
+Each cached response carries ETag and Last-Modified validators; matching
+If-None-Match / If-Modified-Since requests get a 304 without touching the
+handler, and HEAD requests get the same validators (a HEAD miss runs the GET
+handler to fill the entry). Large bodies are served gzip-compressed to
+clients that accept it (compressed once per entry).
+
+Cached and 304 responses bypass the route handler and its dependencies, so
+only routes whose request-scoped dependencies (auth, rate limiting) are
+replayed by the middleware's guard may be listed in ENDPOINT_SOURCES.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from starlette.requests import Request
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+
+# path -> (source files relative to repo root, time bucket seconds or None)
+ENDPOINT_SOURCES: Dict[str, Tuple[Tuple[str, ...], Optional[int]]] = {
+    "/health": (("reports/loop_health.json", "reports/loop/loop_health.json"), None),
+    "/status": (
+        (
+            "reports/loop_health.json",
+            "reports/pf_local.json",
+            "reports/position_state.json",
+            "reports/risk/symbol_states.json",
+            "reports/trades.jsonl",
+            "reports/gpt/promotion_advice.json",
+            "reports/risk/auto_promotions.json",
+        ),
+        None,
+    ),
+    "/pf": (("reports/pf_local.json",), None),
+    "/pf/windows": (("reports/trades.jsonl",), 60),
+    "/positions": (("reports/position_state.json",), None),
+    "/symbols": (("reports/risk/symbol_states.json",), None),
+    "/symbols/states": (("reports/risk/symbol_states.json",), None),
+    "/promotion": (("reports/gpt/promotion_advice.json", "reports/risk/auto_promotions.json"), None),
+    "/trades/recent": (("reports/trades.jsonl",), 30),
+    "/meta/log_sizes": (
+        (
+            "reports/counterfactual_ledger.jsonl",
+            "reports/inaction_performance_log.jsonl",
+            "reports/opportunity_events.jsonl",
+            "reports/fair_value_gaps.jsonl",
+        ),
+        None,
+    ),
+}
+
+MAX_ENTRIES = 256
+GZIP_MIN_BYTES = 1024
+
+
+@dataclass
+class CachedResponse:
+    """A cached 200 response plus its validators."""
+    body: bytes
+    media_type: str
+    etag: str
+    last_modified: str
+    last_modified_ts: float
+    _gzipped: Optional[bytes] = field(default=None, repr=False)
+
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+
+class ResponseCache:
+    """LRU of CachedResponse keyed by (path, query, source signature)."""
+
+    def __init__(
+        self,
+        sources: Dict[str, Tuple[Tuple[str, ...], Optional[int]]] = ENDPOINT_SOURCES,
+        root: Path = REPO_ROOT,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        self.sources = sources
+        self.root = root
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Any, ...], CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, path: str, query: str, now: Optional[float] = None) -> Optional[Tuple[Any, ...]]:
+        """Cache key for a request, or None if the path is not cacheable."""
+        spec = self.sources.get(path)
+        if spec is None:
+            return None
+        files, bucket_s = spec
+        signature = []
+        for rel in files:
+            try:
+                st = (self.root / rel).stat()
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        bucket = int((now if now is not None else time.time()) // bucket_s) if bucket_s else None
+        normalized_query = "&".join(sorted(q for q in query.split("&") if q))
+        return (path, normalized_query, tuple(signature), bucket)
+
+    def validators(self, key: Tuple[Any, ...]) -> Tuple[str, str, float]:
+        """
+        (ETag, Last-Modified, last-modified epoch) derived from the key alone.
+
+        Last-Modified is empty when none of the source files exist.
+        """
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=12).hexdigest()
+        mtimes = [sig[0] / 1e9 for sig in key[2] if sig is not None]
+        if not mtimes:
+            return f'"{digest}"', "", 0.0
+        last_modified_ts = float(int(max(mtimes)))
+        return f'"{digest}"', formatdate(last_modified_ts, usegmt=True), last_modified_ts
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple[Any, ...], body: bytes, media_type: str) -> CachedResponse:
+        etag, last_modified, last_modified_ts = self.validators(key)
+        entry = CachedResponse(body, media_type, etag, last_modified, last_modified_ts)
+        with self._lock:
+            # Drop entries for the same path/query with an older signature
+            stale = [k for k in self._entries if k[:2] == key[:2] and k != key]
+            for k in stale:
+                del self._entries[k]
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _header(scope: Dict[str, Any], name: bytes) -> Optional[str]:
+    for k, v in scope.get("headers", []):
+        if k.lower() == name:
+            return v.decode("latin-1")
+    return None
+
+
+def _not_modified(scope: Dict[str, Any], etag: str, last_modified_ts: float) -> bool:
+    if_none_match = _header(scope, b"if-none-match")
+    if if_none_match is not None:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        return etag in tags or "*" in tags or f"W/{etag}" in tags
+    if_modified_since = _header(scope, b"if-modified-since")
+    if if_modified_since and last_modified_ts:
+        try:
+            return parsedate_to_datetime(if_modified_since).timestamp() >= last_modified_ts
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _accepts_gzip(scope: Dict[str, Any]) -> bool:
+    accept = _header(scope, b"accept-encoding") or ""
+    return any(part.split(";")[0].strip() == "gzip" for part in accept.split(","))
+
+
+# Replays a route's request-scoped dependencies; returns a response to send
+# instead of the cached one (e.g. 401 / 429), or None to continue.
+CacheGuard = Callable[[Request], Awaitable[Optional[Any]]]
+
+
+class HTTPCacheMiddleware:
+    """ASGI middleware serving cacheable GET/HEAD endpoints from a ResponseCache."""
+
+    def __init__(self, app: Any, cache: Optional[ResponseCache] = None, guard: Optional[CacheGuard] = None) -> None:
+        self.app = app
+        self.cache = cache or ResponseCache()
+        self.guard = guard
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        key = self.cache.key_for(scope["path"], scope.get("query_string", b"").decode("latin-1"))
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        if self.guard is not None:
+            rejection = await self.guard(Request(scope, receive))
+            if rejection is not None:
+                await rejection(scope, receive, send)
+                return
+
+        etag, last_modified, last_modified_ts = self.cache.validators(key)
+        if _not_modified(scope, etag, last_modified_ts):
+            await self._send(send, 304, etag, last_modified, None, b"", None)
+            return
+
+        entry = self.cache.get(key)
+        if entry is None:
+            # HEAD misses run the GET handler so the status and validators are real
+            status, media_type, body = await self._call_downstream({**scope, "method": "GET"}, receive)
+            if status != 200:
+                content_length = len(body)
+                if scope["method"] == "HEAD":
+                    body = b""
+                await self._send(send, status, None, None, media_type, body, None, cache=False, content_length=content_length)
+                return
+            entry = self.cache.put(key, body, media_type)
+
+        body, encoding = entry.body, None
+        if len(entry.body) >= GZIP_MIN_BYTES and _accepts_gzip(scope):
+            body, encoding = entry.gzipped(), "gzip"
+        content_length = len(body)
+        if scope["method"] == "HEAD":
+            body = b""
+        await self._send(send, 200, entry.etag, entry.last_modified, entry.media_type, body, encoding, content_length=content_length)
+
+    async def _call_downstream(self, scope: Dict[str, Any], receive: Any) -> Tuple[int, str, bytes]:
+        result: Dict[str, Any] = {"status": 500, "media_type": "application/json", "body": []}
+
+        async def capture(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                result["status"] = message["status"]
+                for k, v in message.get("headers", []):
+                    if k.lower() == b"content-type":
+                        result["media_type"] = v.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                result["body"].append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        return result["status"], result["media_type"], b"".join(result["body"])
+
+    @staticmethod
+    async def _send(
+        send: Any,
+        status: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        media_type: Optional[str],
+        body: bytes,
+        encoding: Optional[str],
+        cache: bool = True,
+        content_length: Optional[int] = None,
+    ) -> None:
+        headers: List[Tuple[bytes, bytes]] = []
+        if media_type and status != 304:
+            headers.append((b"content-type", media_type.encode("latin-1")))
+        if etag:
+            headers.append((b"etag", etag.encode("latin-1")))
+        if last_modified:
+            headers.append((b"last-modified", last_modified.encode("latin-1")))
+        if cache:
+            headers.append((b"cache-control", b"no-cache"))
+            headers.append((b"vary", b"Accept-Encoding"))
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+        if content_length is None:
+            content_length = len(body)
+        if status != 304:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+__all__ = [
+    "CacheGuard",
+    "CachedResponse",
+    "ENDPOINT_SOURCES",
+    "HTTPCacheMiddleware",
+    "ResponseCache",
+]
@@ -9,6 +9,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import dateutil.parser
 
+from .views import get_view, recent_trades_since
+
 
 # Repository root for absolute path resolution
 REPO_ROOT = Path(__file__).parent.parent.parent
@@ -156,19 +158,32 @@ def get_health_status() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     return None, "No health data available"
 
 
+def _view_data(name: str) -> Tuple[Optional[Any], Optional[str]]:
+    """(data, error) for a materialized view (see views.py)."""
+    snapshot = get_view(name)
+    if snapshot.data is None:
+        return None, snapshot.error or f"No data for view: {name}"
+    return snapshot.data, None
+
+
 def get_pf_data() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Get PF data."""
-    return SafeFileReader.read_json_file("reports/pf_local.json")
+    return _view_data("pf_local")
+
+
+def get_pf_windows() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Get PF per window (1D..90D, all) computed from trades.jsonl."""
+    return _view_data("pf_windows")
 
 
 def get_positions() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Get position state."""
-    return SafeFileReader.read_json_file("reports/position_state.json")
+    return _view_data("positions")
 
 
 def get_symbol_states() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """Get symbol states."""
-    return SafeFileReader.read_json_file("reports/risk/symbol_states.json")
+    return _view_data("symbol_states")
 
 
 def get_feature_audit() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
@@ -188,7 +203,10 @@ def get_promotion_queue() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
 
 def get_recent_trades(hours: int = 6, limit: int = 200) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
     """Get recent trades."""
-    return SafeFileReader.tail_jsonl_file("reports/trades.jsonl", hours, limit)
+    snapshot = get_view("recent_trades")
+    if snapshot.error:
+        return None, snapshot.error
+    return recent_trades_since(hours, limit), None
 
 
 def get_status_data() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
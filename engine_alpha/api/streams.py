@@ -0,0 +1,171 @@
+"""
+Live event streams for the read-only API (server-sent events).
+
+One shared follower polls the report files and fans new records out to
+every subscriber, so N connected dashboards cost one file watcher:
+- trades: records appended to reports/trades.jsonl
+- opportunity: records appended to reports/opportunity_events.jsonl
+- health: reports/loop_health.json (or reports/loop/loop_health.json) when it changes
+
+JSONL files are followed by byte offset (see codec.JsonlTail), starting at
+the current end, so subscribers only receive records written after the
+follower started. The follower task runs while at least one subscriber is
+connected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from engine_alpha.core.paths import REPORTS
+
+from .views import JsonlTail, _file_sig
+
+POLL_INTERVAL_SECONDS = 0.5
+HEARTBEAT_SECONDS = 15.0
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+TOPICS = ("trades", "opportunity", "health")
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One event pushed to subscribers."""
+    topic: str
+    data: Dict[str, Any]
+    event_id: str
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, separators=(",", ":"), default=str)
+        return f"id: {self.event_id}\nevent: {self.topic}\ndata: {payload}\n\n"
+
+
+class _Subscriber:
+    def __init__(self, topics: Set[str]) -> None:
+        self.topics = topics
+        self.queue: "asyncio.Queue[StreamEvent]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.dropped = 0
+
+    def offer(self, event: StreamEvent) -> None:
+        if event.topic not in self.topics:
+            return
+        if self.queue.full():
+            # Slow client: drop its oldest event rather than stall the follower
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class StreamHub:
+    """Shared file follower plus subscriber fan-out."""
+
+    def __init__(self, reports_root: Path = REPORTS, poll_interval: float = POLL_INTERVAL_SECONDS) -> None:
+        self.reports_root = reports_root
+        self.poll_interval = poll_interval
+        self._subscribers: List[_Subscriber] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._tails: Dict[str, JsonlTail] = {}
+        self._health_paths = (reports_root / "loop_health.json", reports_root / "loop" / "loop_health.json")
+        self._health_sig: Optional[Tuple[Any, ...]] = None
+        self._seq = 0
+        self.polls = 0
+
+    def _start_follow(self) -> None:
+        self._tails = {
+            "trades": JsonlTail(self.reports_root / "trades.jsonl", from_end=True),
+            "opportunity": JsonlTail(self.reports_root / "opportunity_events.jsonl", from_end=True),
+        }
+        self._health_sig = tuple(_file_sig(p) for p in self._health_paths)
+
+    def poll(self) -> List[StreamEvent]:
+        """Read everything new since the last poll (blocking file I/O)."""
+        self.polls += 1
+        events: List[StreamEvent] = []
+        for topic, tail in self._tails.items():
+            records, _ = tail.read_new()
+            for rec in records:
+                events.append(StreamEvent(topic, rec, f"{topic}:{tail.ino}:{tail.offset}:{self._next_seq()}"))
+
+        health_sig = tuple(_file_sig(p) for p in self._health_paths)
+        if health_sig != self._health_sig:
+            self._health_sig = health_sig
+            for path, sig in zip(self._health_paths, health_sig):
+                if sig is None:
+                    continue
+                try:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                except Exception:
+                    continue
+                if isinstance(data, dict):
+                    events.append(StreamEvent("health", data, f"health:{sig[2]}:{self._next_seq()}"))
+                break
+        return events
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def publish(self, events: Iterable[StreamEvent]) -> None:
+        for event in events:
+            for sub in list(self._subscribers):
+                sub.offer(event)
+
+    async def _follow(self) -> None:
+        while self._subscribers:
+            events = await asyncio.to_thread(self.poll)
+            self.publish(events)
+            await asyncio.sleep(self.poll_interval)
+
+    def subscribe(self, topics: Iterable[str]) -> _Subscriber:
+        sub = _Subscriber({t for t in topics if t in TOPICS} or set(TOPICS))
+        self._subscribers.append(sub)
+        if self._task is None or self._task.done():
+            self._start_follow()
+            self._task = asyncio.get_running_loop().create_task(self._follow())
+        return sub
+
+    def unsubscribe(self, sub: _Subscriber) -> None:
+        if sub in self._subscribers:
+            self._subscribers.remove(sub)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def events(self, topics: Iterable[str], heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+        """SSE text for one client: new events, with a comment heartbeat when idle."""
+        sub = self.subscribe(topics)
+        try:
+            yield f"retry: {int(self.poll_interval * 2000)}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield event.to_sse()
+        finally:
+            self.unsubscribe(sub)
+
+
+_HUB: Optional[StreamHub] = None
+
+
+def get_hub() -> StreamHub:
+    """Process-wide hub (one follower for all SSE clients)."""
+    global _HUB
+    if _HUB is None:
+        _HUB = StreamHub()
+    return _HUB
+
+
+__all__ = [
+    "StreamEvent",
+    "StreamHub",
+    "TOPICS",
+    "get_hub",
+]
@@ -0,0 +1,298 @@
+"""
+Materialized views for the dashboard and API.
+
+Precomputed views over report files, held in memory and refreshed
+incrementally when their source file changes:
+- recent_trades: last trade events from reports/trades.jsonl
+- pf_windows: PF per rolling window (1D/7D/14D/30D/90D/all), same buckets and
+  windows as research.pf_timeseries
+- pf_local: reports/pf_local.json
+- positions: reports/position_state.json
+- symbol_states: reports/risk/symbol_states.json
+- staleness: reports/research/staleness_overseer.json
+
+Reading a view costs one stat() of its source. trades.jsonl is tailed from
+the last byte offset, so reads stay constant-time as history grows (the
+file is re-read from the start only if it is truncated or replaced).
+Every view carries an ETag that changes only when its content does.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from engine_alpha.core.codec import JsonlTail, file_sig as _file_sig
+from engine_alpha.core.paths import REPORTS
+from engine_alpha.research.pf_timeseries import (
+    PFDayBuckets,
+    _bucket_stats,
+    _merge_bucket,
+    _new_bucket,
+    _safe_parse_ts,
+    window_starts,
+)
+
+RECENT_TRADES_LIMIT = 5000
+
+
+@dataclass(frozen=True)
+class ViewSnapshot:
+    """Current content of a view (data is None when the source is missing or invalid)."""
+    name: str
+    data: Any
+    etag: str
+    version: int
+    source: str
+    source_mtime: Optional[float]
+    error: Optional[str] = None
+
+
+def _etag(name: str, payload: Any) -> str:
+    digest = hashlib.blake2b(
+        json.dumps(payload, sort_keys=True, default=str).encode("utf-8"), digest_size=12
+    ).hexdigest()
+    return f'"{name}-{digest}"'
+
+
+def _relative(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPORTS.parent))
+    except ValueError:
+        return str(path)
+
+
+class JsonFileView:
+    """A JSON report file, re-parsed only when its stat signature changes."""
+
+    def __init__(self, name: str, path: Path) -> None:
+        self.name = name
+        self.path = path
+        self._lock = threading.Lock()
+        self._sig: Optional[Tuple[int, int, int]] = None
+        self._version = 0
+        self._snapshot = self._build(None, f"File not found: {_relative(path)}")
+
+    def _build(self, data: Any, error: Optional[str]) -> ViewSnapshot:
+        mtime = self._sig[2] / 1e9 if self._sig else None
+        return ViewSnapshot(
+            name=self.name,
+            data=data,
+            etag=_etag(self.name, {"data": data, "error": error}),
+            version=self._version,
+            source=_relative(self.path),
+            source_mtime=mtime,
+            error=error,
+        )
+
+    def get(self) -> ViewSnapshot:
+        sig = _file_sig(self.path)
+        with self._lock:
+            if sig == self._sig:
+                return self._snapshot
+            self._sig = sig
+            self._version += 1
+            if sig is None:
+                self._snapshot = self._build(None, f"File not found: {_relative(self.path)}")
+                return self._snapshot
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                error = None
+            except json.JSONDecodeError as e:
+                data, error = None, f"Invalid JSON in {_relative(self.path)}: {str(e)}"
+            except Exception as e:
+                data, error = None, f"Error reading {_relative(self.path)}: {str(e)}"
+            self._snapshot = self._build(data, error)
+            return self._snapshot
+
+
+def _event_time(rec: Dict[str, Any]) -> Optional[datetime]:
+    """Event time from its ts_ms (no datetime parsing); ISO fallback for older lines."""
+    ms = rec.get("ts_ms")
+    if isinstance(ms, int) and not isinstance(ms, bool):
+        return datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc)
+    return _safe_parse_ts(rec.get("ts") or rec.get("timestamp"))
+
+
+class TradesView:
+    """
+    trades.jsonl tailed incrementally into recent events and per-day PF buckets.
+
+    PF windows are the rolling `now - ts <= days` windows of PFTimeseriesEngine
+    (shared PFDayBuckets / window_starts), so /pf/windows and
+    pf_timeseries.json agree. They are recomputed at most once a minute when
+    no new trades arrive.
+    """
+
+    def __init__(self, path: Path, recent_limit: int = RECENT_TRADES_LIMIT) -> None:
+        self.path = path
+        self.recent_limit = recent_limit
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._tail = JsonlTail(self.path)
+        self._version = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=self.recent_limit)
+        self._pf = PFDayBuckets()
+        self._pf_cache: Optional[Tuple[int, int, ViewSnapshot]] = None
+        self._recent_cache: Optional[Tuple[int, ViewSnapshot]] = None
+
+    def _ingest(self, rec: Dict[str, Any]) -> None:
+        self._recent.append(rec)
+        self._pf.ingest(rec)
+
+    def refresh(self) -> None:
+        """Read records appended since the last refresh (full re-read after truncation/replacement)."""
+        with self._lock:
+            offset = self._tail.offset
+            records, reset = self._tail.read_new()
+            if reset:
+                self._clear()
+                self._version += 1
+            for rec in records:
+                self._ingest(rec)
+            if records or self._tail.offset != offset:
+                self._version += 1
+
+    def recent(self) -> ViewSnapshot:
+        self.refresh()
+        with self._lock:
+            if self._recent_cache is None or self._recent_cache[0] != self._version:
+                data = list(self._recent)
+                snap = ViewSnapshot(
+                    name="recent_trades",
+                    data=data,
+                    etag=f'"recent_trades-{self._tail.ino}-{self._tail.offset}-{self._version}"',
+                    version=self._version,
+                    source=_relative(self.path),
+                    source_mtime=self._tail.mtime_ns / 1e9 if self._tail.mtime_ns else None,
+                    error=None if self._tail.ino is not None else f"File not found: {_relative(self.path)}",
+                )
+                self._recent_cache = (self._version, snap)
+            return self._recent_cache[1]
+
+    def pf_windows(self, now: Optional[datetime] = None) -> ViewSnapshot:
+        self.refresh()
+        now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        minute = int(now.timestamp()) // 60
+        with self._lock:
+            cached = self._pf_cache
+            if cached is not None and cached[0] == self._version and cached[1] == minute:
+                return cached[2]
+            starts: Dict[str, Optional[int]] = {
+                label: since_ms for label, since_ms in window_starts(now).items() if label != "mtd"
+            }
+            starts["all"] = None
+            by_symbol: Dict[str, Dict[str, Any]] = {}
+            global_stats: Dict[str, Any] = {}
+            for label, since_ms in starts.items():
+                symbols: Dict[str, Dict[str, float]] = {}
+                overall = _new_bucket()
+                for (symbol, _lane), bucket in self._pf.window(since_ms).items():
+                    _merge_bucket(symbols.setdefault(symbol, _new_bucket()), bucket)
+                    _merge_bucket(overall, bucket)
+                global_stats[label] = _bucket_stats(overall)
+                for symbol, bucket in symbols.items():
+                    by_symbol.setdefault(symbol, {})[label] = bucket
+            data = {
+                "as_of": now.isoformat(),
+                "global": global_stats,
+                "symbols": {
+                    sym: {label: _bucket_stats(by_symbol[sym].get(label, _new_bucket())) for label in starts}
+                    for sym in sorted(by_symbol)
+                },
+            }
+            snap = ViewSnapshot(
+                name="pf_windows",
+                data=data,
+                etag=_etag("pf_windows", {k: v for k, v in data.items() if k != "as_of"}),
+                version=self._version,
+                source=_relative(self.path),
+                source_mtime=self._tail.mtime_ns / 1e9 if self._tail.mtime_ns else None,
+            )
+            self._pf_cache = (self._version, minute, snap)
+            return snap
+
+
+class ViewRegistry:
+    """Named materialized views over the report files under a reports root."""
+
+    def __init__(self, reports_root: Path = REPORTS) -> None:
+        self.reports_root = reports_root
+        self.trades = TradesView(reports_root / "trades.jsonl")
+        self._json_views = {
+            "pf_local": JsonFileView("pf_local", reports_root / "pf_local.json"),
+            "positions": JsonFileView("positions", reports_root / "position_state.json"),
+            "symbol_states": JsonFileView("symbol_states", reports_root / "risk" / "symbol_states.json"),
+            "staleness": JsonFileView("staleness", reports_root / "research" / "staleness_overseer.json"),
+        }
+
+    def names(self) -> List[str]:
+        return ["recent_trades", "pf_windows", *self._json_views]
+
+    def get(self, name: str) -> ViewSnapshot:
+        if name == "recent_trades":
+            return self.trades.recent()
+        if name == "pf_windows":
+            return self.trades.pf_windows()
+        if name in self._json_views:
+            return self._json_views[name].get()
+        raise KeyError(name)
+
+
+_REGISTRY: Optional[ViewRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> ViewRegistry:
+    """Process-wide registry (shared by every dashboard rerun / API request)."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = ViewRegistry()
+        return _REGISTRY
+
+
+def get_view(name: str) -> ViewSnapshot:
+    """Current snapshot of a named view (KeyError for unknown names)."""
+    return get_registry().get(name)
+
+
+def recent_trades_since(hours: int, limit: int) -> List[Dict[str, Any]]:
+    """
+    Trade events newer than `hours` ago, oldest first, at most `limit`.
+
+    Entries without a parseable timestamp are included (as before).
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    out: List[Dict[str, Any]] = []
+    for entry in get_view("recent_trades").data:
+        ts = _event_time(entry)
+        if ts is not None and ts < cutoff:
+            continue
+        out.append(entry)
+        if len(out) >= limit:
+            break
+    return out
+
+
+__all__ = [
+    "JsonFileView",
+    "JsonlTail",
+    "TradesView",
+    "ViewRegistry",
+    "ViewSnapshot",
+    "get_registry",
+    "get_view",
+    "recent_trades_since",
+]
@@ -8,19 +8,34 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Optional
 
+from engine_alpha.core.codec import append_jsonl
 
-def atomic_write_json(path: str | Path, obj: Dict[str, Any]) -> None:
+
+def atomic_write_json(
+    path: str | Path,
+    obj: Dict[str, Any],
+    *,
+    compact: bool = False,
+    fsync: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
     """
     Write JSON file atomically using temp file + os.replace.
     
-    Ensures parent directory exists.
+    Ensures parent directory exists. The temp file name is unique per process
+    and thread, so concurrent writers of the same path never share (or delete)
+    each other's temp file; the last os.replace wins.
     
     Args:
         path: Target file path
         obj: Dict to serialize as JSON
+        compact: Write without indentation or spaces after separators
+        fsync: Flush and fsync the temp file before the replace
+        default: json.dump fallback serializer for non-JSON values
     """
     path_obj = Path(path)
     
@@ -28,12 +43,18 @@ def atomic_write_json(path: str | Path, obj: Dict[str, Any]) -> None:
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     
     # Write to temp file first
-    temp_path = path_obj.with_suffix(path_obj.suffix + ".tmp")
+    temp_path = path_obj.with_name(f"{path_obj.name}.{os.getpid()}.{threading.get_ident()}.tmp")
     
     try:
-        # Write JSON with indentation for readability
+        # Write JSON with indentation for readability (unless compact)
         with temp_path.open("w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2, ensure_ascii=False)
+            if compact:
+                json.dump(obj, f, separators=(",", ":"), ensure_ascii=False, default=default)
+            else:
+                json.dump(obj, f, indent=2, ensure_ascii=False, default=default)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         
         # Atomic replace
         os.replace(str(temp_path), str(path_obj))
@@ -53,22 +74,13 @@ def atomic_append_jsonl(path: str | Path, obj: Dict[str, Any]) -> None:
     
     Note: Per-line append is not fully atomic, but we use best practices:
     - Open with append mode
-    - Flush immediately
-    - Keep entries as single-line JSON
+    - Flush and fsync immediately
+    - Keep entries as single-line JSON (encoded by core/codec.py, which
+      also adds ts_ms next to a "ts" / "timestamp" field)
     
     Args:
         path: Target JSONL file path
         obj: Dict to serialize as single-line JSON
     """
-    path_obj = Path(path)
-    
-    # Ensure parent directory exists
-    path_obj.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Append single-line JSON
-    with path_obj.open("a", encoding="utf-8") as f:
-        json_line = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
-        f.write(json_line + "\n")
-        f.flush()
-        os.fsync(f.fileno())  # Force write to disk
+    append_jsonl(path, obj, fsync=True)
 
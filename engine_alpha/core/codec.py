@@ -0,0 +1,438 @@
+"""
+Event codec - fast JSON encoding for JSONL event logs.
+
+Uses orjson or msgspec when installed and falls back to the stdlib json
+module, so every writer / reader goes through one pluggable layer:
+
+- dumps() / dumps_line() / loads() encode and decode with the active backend
+  (compact separators, UTF-8). Values the fast backend cannot encode, and
+  legacy lines it rejects (e.g. NaN literals), go through stdlib json, as do
+  objects holding NaN / Infinity (the fast backends would write null), so
+  output is identical across backends.
+- stamp() adds an integer "ts_ms" (epoch milliseconds) next to the ISO
+  "ts" / "timestamp" of an event, so readers filter on integers instead of
+  parsing datetimes per line; ts_ms_of() reads it back (parsing the ISO field
+  only for lines written before ts_ms existed).
+- iter_jsonl() / read_jsonl_range() read a log with [since_ms, until_ms)
+  filtering on ts_ms; JsonlTail follows a log by byte offset.
+- load_json_cached() parses a JSON report once per file version (file_sig).
+
+TradeEvent / DecisionEvent / XrayEvent document the event shapes written by
+execute_trade, the counterfactual ledger and the X-ray logger.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypedDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# ISO timestamp keys ts_ms can mirror, in priority order
+TS_KEYS: Tuple[str, ...] = ("ts", "timestamp")
+TS_MS_KEY = "ts_ms"
+
+
+class TradeEvent(TypedDict, total=False):
+    """trades.jsonl event (open / close / ...); extra keys are allowed."""
+    ts: str
+    ts_ms: int
+    type: str
+    symbol: str
+    timeframe: str
+    dir: int
+    pct: float
+    entry_px: float
+    exit_px: float
+    exit_reason: str
+    regime: str
+    trade_kind: str
+    logger_version: str
+
+
+class DecisionEvent(TypedDict, total=False):
+    """Counterfactual ledger decision record."""
+    ts: str
+    ts_ms: int
+    type: str
+    symbol: str
+    direction: int
+    confidence: float
+    regime: str
+    entry_price: Optional[float]
+    market_state: Dict[str, Any]
+    decision_type: str
+
+
+class XrayEvent(TypedDict, total=False):
+    """X-ray gate snapshot (reports/xray/latest.jsonl)."""
+    ts: str
+    ts_ms: int
+    symbol: str
+    timeframe: str
+    bar_ts: str
+    regime: str
+    direction: int
+    confidence: float
+    combined_edge: float
+    gates: Dict[str, bool]
+    can_open: bool
+    trade_kind: str
+    why_blocked: str
+    gate_stage: str
+    final_notional: float
+    size_factor: float
+    logger_version: str
+
+
+# -- backends ----------------------------------------------------------------
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        out = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        return _json_dumps(obj)
+    # orjson writes NaN / Infinity as null; only walk the object when a null appears
+    if b"null" in out and _has_nonfinite(obj):
+        return _json_dumps(obj)
+    return out
+
+
+def _orjson_loads(data: bytes | str) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _msgspec_dumps(obj: Any) -> bytes:
+    try:
+        out = msgspec.json.encode(obj)
+    except (TypeError, ValueError, OverflowError):
+        return _json_dumps(obj)
+    if b"null" in out and _has_nonfinite(obj):
+        return _json_dumps(obj)
+    return out
+
+
+def _msgspec_loads(data: bytes | str) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        return json.loads(data)
+
+
+_BACKENDS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes | str], Any]]] = {
+    "json": (_json_dumps, _json_loads),
+}
+if orjson is not None:
+    _BACKENDS["orjson"] = (_orjson_dumps, _orjson_loads)
+if msgspec is not None:
+    _BACKENDS["msgspec"] = (_msgspec_dumps, _msgspec_loads)
+
+BACKEND = next(name for name in ("orjson", "msgspec", "json") if name in _BACKENDS)
+_dumps, _loads = _BACKENDS[BACKEND]
+
+
+def available_backends() -> List[str]:
+    return list(_BACKENDS)
+
+
+def set_backend(name: str) -> str:
+    """Switch the active backend ("orjson", "msgspec" or "json"); returns the previous one."""
+    global BACKEND, _dumps, _loads
+    if name not in _BACKENDS:
+        raise ValueError(f"Codec backend not available: {name}")
+    previous = BACKEND
+    BACKEND = name
+    _dumps, _loads = _BACKENDS[name]
+    return previous
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes."""
+    return _dumps(obj)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """One JSONL line (compact JSON + newline)."""
+    return _dumps(obj) + b"\n"
+
+
+def loads(data: bytes | str) -> Any:
+    return _loads(data)
+
+
+# -- timestamps --------------------------------------------------------------
+
+def iso_to_ms(value: Any) -> Optional[int]:
+    """Epoch ms for an ISO string / datetime (naive = UTC) or epoch number; None if unparseable."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        # Epoch seconds or milliseconds
+        return int(value) if value > 1e11 else int(round(value * 1000))
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(round(dt.timestamp() * 1000))
+
+
+def now_iso_ms() -> Tuple[str, int]:
+    """(ISO timestamp, matching epoch ms) for now."""
+    now = datetime.now(timezone.utc)
+    return now.isoformat(), int(round(now.timestamp() * 1000))
+
+
+def _stamp_key(record: Dict[str, Any]) -> Optional[str]:
+    for key in TS_KEYS:
+        if record.get(key) is not None:
+            return key
+    return None
+
+
+def stamp(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The event with ts_ms mirroring its "ts" / "timestamp", if it has one.
+
+    Returns a shallow copy when ts_ms is added; the caller's dict is not modified.
+    """
+    if TS_MS_KEY in event:
+        return event
+    key = _stamp_key(event)
+    if key is None:
+        return event
+    ms = iso_to_ms(event[key])
+    if ms is None:
+        return event
+    return {**event, TS_MS_KEY: ms}
+
+
+def ts_ms_of(record: Dict[str, Any], key: Optional[str] = None) -> Optional[int]:
+    """
+    Epoch ms of record[key] (default: "ts", else "timestamp").
+
+    Uses the stored ts_ms when it mirrors that key; otherwise parses the field.
+    """
+    stamped = _stamp_key(record)
+    key = key or stamped
+    if key is None:
+        return None
+    ms = record.get(TS_MS_KEY)
+    if key == stamped and isinstance(ms, int) and not isinstance(ms, bool):
+        return ms
+    return iso_to_ms(record.get(key))
+
+
+# -- files -------------------------------------------------------------------
+
+def append_jsonl(path: str | Path, event: Dict[str, Any], fsync: bool = False) -> None:
+    """Stamp and append one event to a JSONL file (parent directory created)."""
+    path_obj = Path(path)
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+    line = dumps_line(stamp(event))
+    with path_obj.open("ab") as f:
+        f.write(line)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def file_sig(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+_json_files: Dict[Path, Tuple[Optional[Tuple[int, int, int]], Dict[str, Any]]] = {}
+
+
+def load_json_cached(path: str | Path) -> Dict[str, Any]:
+    """
+    JSON object in a file, parsed again only when its file_sig changes.
+
+    Missing, unreadable and non-object files give {}. The dict is shared by
+    every caller of the same path, so treat it as read-only.
+    """
+    path = Path(path)
+    sig = file_sig(path)
+    cached = _json_files.get(path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    data: Dict[str, Any] = {}
+    if sig is not None:
+        try:
+            parsed = loads(path.read_bytes())
+        except (OSError, ValueError, UnicodeDecodeError):
+            parsed = None
+        if isinstance(parsed, dict):
+            data = parsed
+    _json_files[path] = (sig, data)
+    return data
+
+
+class JsonlTail:
+    """
+    Byte-offset reader for an append-only JSONL file.
+
+    read_new() returns records appended since the previous call. Only complete
+    lines are consumed (a partially written last line is read next time); a
+    truncated or replaced file is re-read from the start (reset is True).
+    """
+
+    def __init__(self, path: Path, from_end: bool = False) -> None:
+        self.path = path
+        self.ino: Optional[int] = None
+        self.offset = 0
+        self.mtime_ns = 0
+        if from_end:
+            sig = file_sig(path)
+            if sig is not None:
+                self.ino, self.offset, self.mtime_ns = sig
+
+    def read_new(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """(new records, reset) - reset means the file was missing, truncated or replaced."""
+        sig = file_sig(self.path)
+        if sig is None:
+            reset = self.ino is not None
+            self.ino, self.offset, self.mtime_ns = None, 0, 0
+            return [], reset
+        ino, size, mtime_ns = sig
+        reset = False
+        if ino != self.ino or size < self.offset:
+            reset = self.ino is not None
+            self.ino, self.offset = ino, 0
+        if size == self.offset:
+            self.mtime_ns = mtime_ns
+            return [], reset
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            chunk = f.read(size - self.offset)
+        end = chunk.rfind(b"\n") + 1
+        records: List[Dict[str, Any]] = []
+        for raw in chunk[:end].splitlines():
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                rec = loads(raw)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if isinstance(rec, dict):
+                records.append(rec)
+        self.offset += end
+        self.mtime_ns = mtime_ns
+        return records, reset
+
+
+def iter_jsonl(
+    path: str | Path,
+    since_ms: Optional[int] = None,
+    until_ms: Optional[int] = None,
+    key: Optional[str] = None,
+    keep_undated: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Records of a JSONL file with since_ms <= ts < until_ms (bounds optional).
+
+    Malformed lines are skipped; records without a timestamp are yielded only
+    if keep_undated (or no bounds are given).
+    """
+    path_obj = Path(path)
+    if not path_obj.exists():
+        return
+    bounded = since_ms is not None or until_ms is not None
+    with path_obj.open("rb") as f:
+        for raw in f:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                record = loads(raw)
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if not isinstance(record, dict):
+                continue
+            if bounded:
+                ms = ts_ms_of(record, key)
+                if ms is None:
+                    if not keep_undated:
+                        continue
+                elif (since_ms is not None and ms < since_ms) or (until_ms is not None and ms >= until_ms):
+                    continue
+            yield record
+
+
+def read_jsonl_range(
+    path: str | Path,
+    since_ms: Optional[int] = None,
+    until_ms: Optional[int] = None,
+    key: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """List form of iter_jsonl; with limit, the last `limit` matching records."""
+    out = list(iter_jsonl(path, since_ms, until_ms, key))
+    return out[-limit:] if limit else out
+
+
+__all__ = [
+    "BACKEND",
+    "DecisionEvent",
+    "JsonlTail",
+    "TS_KEYS",
+    "TradeEvent",
+    "XrayEvent",
+    "append_jsonl",
+    "available_backends",
+    "dumps",
+    "dumps_line",
+    "file_sig",
+    "iso_to_ms",
+    "iter_jsonl",
+    "load_json_cached",
+    "loads",
+    "now_iso_ms",
+    "read_jsonl_range",
+    "set_backend",
+    "stamp",
+    "ts_ms_of",
+]
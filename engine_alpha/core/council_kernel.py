@@ -0,0 +1,333 @@
+"""
+Council kernel - batched confidence_engine.decide
+-------------------------------------------------
+
+Array-based equivalent of confidence_engine.decide() for callers that score
+many steps at once (dream mode, variant runner, weight learner, backtests).
+
+A CouncilLayout is compiled once from the signal registry, SIGNAL_BUCKETS,
+COUNCIL_WEIGHTS and REGIME_BUCKET_MASK. decide_batch() then takes an
+(N_steps x N_signals) matrix plus per-step regimes and returns final
+dir/conf/score/regime arrays in one vectorized call.
+
+Parity: bucket sums and council aggregation accumulate in the same order as
+the scalar path, so results match decide() for every regime / mask mode.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from engine_alpha.core import confidence_engine as ce
+
+REGISTRY_PATH = Path(ce.__file__).parent.parent / "signals" / "signal_registry.json"
+
+# Regimes that always get a precompiled weight row (others are compiled lazily)
+KNOWN_REGIMES = ("trend_up", "trend_down", "panic_down", "high_vol", "chop", "trend")
+
+
+def _is_paper_mode() -> bool:
+    return os.getenv("MODE", "PAPER").upper() == "PAPER"
+
+
+def _regime_weight_key(regime: str, weights: Dict[str, Dict[str, float]]) -> str:
+    """Same regime -> COUNCIL_WEIGHTS key mapping as _compute_council_aggregation."""
+    key = "trend_down" if regime == "panic_down" else regime
+    if key not in weights:
+        key = "trend" if key in ("trend_up", "trend_down") else "chop"
+    return key
+
+
+@dataclass
+class CouncilLayout:
+    """
+    Precompiled bucket / weight layout for the council kernel.
+
+    Attributes:
+        signal_names: Registry signal order (matrix column order)
+        bucket_names: BUCKET_ORDER
+        contributions: (signal_idx, bucket_idx, weight) in SIGNAL_BUCKETS order
+        council_weights: Council weights used to compile regime rows
+    """
+    signal_names: Tuple[str, ...]
+    bucket_names: Tuple[str, ...]
+    contributions: Tuple[Tuple[int, int, float], ...]
+    council_weights: Dict[str, Dict[str, float]]
+    _regime_rows: Dict[Tuple[str, bool], np.ndarray] = field(default_factory=dict)
+
+    @property
+    def n_signals(self) -> int:
+        return len(self.signal_names)
+
+    @property
+    def n_buckets(self) -> int:
+        return len(self.bucket_names)
+
+    def regime_weights(self, regime: str, is_paper_mode: bool) -> np.ndarray:
+        """
+        Effective per-bucket council weights for a regime.
+
+        Buckets removed by the PAPER regime mask get weight 0, which the
+        aggregation treats exactly like the scalar path treats a missing bucket.
+        """
+        key = (regime, bool(is_paper_mode))
+        row = self._regime_rows.get(key)
+        if row is None:
+            base = self.council_weights.get(
+                _regime_weight_key(regime, self.council_weights),
+                self.council_weights["chop"],
+            )
+            mask = ce.REGIME_BUCKET_MASK.get(regime, None) if is_paper_mode else None
+            row = np.array(
+                [
+                    float(base.get(b, 0.0)) if (mask is None or b in mask) else 0.0
+                    for b in self.bucket_names
+                ],
+                dtype=float,
+            )
+            self._regime_rows[key] = row
+        return row
+
+
+def compile_council_layout(
+    signal_registry: Optional[Dict[str, Any]] = None,
+    council_weights: Optional[Dict[str, Dict[str, float]]] = None,
+) -> CouncilLayout:
+    """
+    Compile a CouncilLayout from the signal registry and council weights.
+
+    Args:
+        signal_registry: Parsed signal_registry.json (loaded if None)
+        council_weights: Council weights by regime (COUNCIL_WEIGHTS, or the
+            COUNCIL_WEIGHTS_FILE override, if None)
+    """
+    if signal_registry is None:
+        signal_registry = ce._load_signal_registry()
+    if council_weights is None:
+        council_weights = (
+            ce._load_council_weights() if os.getenv("COUNCIL_WEIGHTS_FILE") else ce.COUNCIL_WEIGHTS
+        )
+
+    signals_list = signal_registry.get("signals", [])
+    signal_names = tuple(sig["name"] for sig in signals_list)
+    name_to_index = {name: i for i, name in enumerate(signal_names)}
+    bucket_index = {b: i for i, b in enumerate(ce.BUCKET_ORDER)}
+
+    contributions: List[Tuple[int, int, float]] = []
+    for signal_name, buckets in ce.SIGNAL_BUCKETS.items():
+        idx = name_to_index.get(signal_name)
+        if idx is None:
+            continue
+        weight = float(signals_list[idx].get("weight", 1.0))
+        for bucket in buckets:
+            contributions.append((idx, bucket_index[bucket], weight))
+
+    layout = CouncilLayout(
+        signal_names=signal_names,
+        bucket_names=tuple(ce.BUCKET_ORDER),
+        contributions=tuple(contributions),
+        council_weights=council_weights,
+    )
+    for regime in KNOWN_REGIMES:
+        layout.regime_weights(regime, True)
+        layout.regime_weights(regime, False)
+    return layout
+
+
+_LAYOUT_CACHE: Dict[str, Any] = {"key": None, "layout": None}
+
+
+def get_council_layout() -> CouncilLayout:
+    """Return the cached layout, recompiling when the registry or weights source changes."""
+    try:
+        mtime = REGISTRY_PATH.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (mtime, os.getenv("COUNCIL_WEIGHTS_FILE"), id(ce.COUNCIL_WEIGHTS))
+    if _LAYOUT_CACHE["key"] != key or _LAYOUT_CACHE["layout"] is None:
+        _LAYOUT_CACHE["layout"] = compile_council_layout()
+        _LAYOUT_CACHE["key"] = key
+    return _LAYOUT_CACHE["layout"]
+
+
+def signal_matrix(vectors: Sequence[Sequence[float]], n_signals: Optional[int] = None) -> np.ndarray:
+    """
+    Stack signal vectors into an (N x n_signals) matrix.
+
+    Short vectors are zero-padded, which matches decide() skipping signals
+    whose index is past the end of the vector.
+    """
+    width = n_signals if n_signals is not None else max((len(v) for v in vectors), default=0)
+    out = np.zeros((len(vectors), width), dtype=float)
+    for i, vec in enumerate(vectors):
+        n = min(len(vec), width)
+        if n:
+            out[i, :n] = np.asarray(vec[:n], dtype=float)
+    return out
+
+
+def compute_bucket_scores_batch(X: np.ndarray, layout: CouncilLayout) -> np.ndarray:
+    """Vectorized _compute_bucket_scores: returns an (N x n_buckets) score matrix."""
+    X = np.asarray(X, dtype=float)
+    scores = np.zeros((X.shape[0], layout.n_buckets), dtype=float)
+    for sig_idx, bucket_idx, weight in layout.contributions:
+        if sig_idx >= X.shape[1]:
+            continue
+        scores[:, bucket_idx] += weight * X[:, sig_idx]
+    return scores
+
+
+def _regime_array(regimes: Union[str, Sequence[str], None], n: int) -> np.ndarray:
+    if regimes is None:
+        # decide() without a classifier builds a fresh RegimeClassifier whose
+        # z-scores are 0 on a single observation -> always "chop".
+        return np.full(n, "chop", dtype=object)
+    if isinstance(regimes, str):
+        return np.full(n, regimes, dtype=object)
+    arr = np.asarray(list(regimes), dtype=object)
+    if arr.shape[0] != n:
+        raise ValueError(f"regimes length {arr.shape[0]} != steps {n}")
+    return arr
+
+
+def decide_batch(
+    X: Union[np.ndarray, Sequence[Sequence[float]]],
+    regimes: Union[str, Sequence[str], None] = None,
+    *,
+    layout: Optional[CouncilLayout] = None,
+    is_paper_mode: Optional[bool] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized confidence_engine.decide over many steps.
+
+    Args:
+        X: (N_steps x N_signals) normalized signal matrix in registry order
+        regimes: One regime for all steps, one per step, or None ("chop", as
+            decide() without a classifier)
+        layout: Precompiled CouncilLayout (cached layout if None)
+        is_paper_mode: Apply PAPER regime masks (MODE env if None)
+
+    Returns:
+        Dict of arrays: "dir" (int), "conf" (rounded), "score", "regime",
+        "bucket_scores", "bucket_dirs", "bucket_confs"
+    """
+    if layout is None:
+        layout = get_council_layout()
+    if is_paper_mode is None:
+        is_paper_mode = _is_paper_mode()
+    if not isinstance(X, np.ndarray):
+        X = signal_matrix(X, layout.n_signals)
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    n = X.shape[0]
+
+    regime_arr = _regime_array(regimes, n)
+    unique_regimes, inverse = np.unique(regime_arr.astype(str), return_inverse=True)
+    weight_table = np.vstack(
+        [layout.regime_weights(str(r), is_paper_mode) for r in unique_regimes]
+    ) if n else np.zeros((0, layout.n_buckets))
+    W = weight_table[inverse] if n else np.zeros((0, layout.n_buckets))
+
+    scores = compute_bucket_scores_batch(X, layout)
+    dirs = np.where(np.abs(scores) < ce.DIR_THRESHOLD, 0, np.sign(scores)).astype(int)
+    confs = np.clip(np.abs(scores), 0.0, 1.0)
+
+    # Accumulate bucket by bucket in BUCKET_ORDER (same summation order as the scalar path)
+    weighted_score = np.zeros(n, dtype=float)
+    weight_sum = np.zeros(n, dtype=float)
+    for b in range(layout.n_buckets):
+        w = W[:, b]
+        active = (dirs[:, b] != 0) & (w > 0.0) & (confs[:, b] > 0.0)
+        weighted_score += np.where(active, w * (dirs[:, b] * confs[:, b]), 0.0)
+        weight_sum += np.where(active, w, 0.0)
+
+    final_score = np.divide(
+        weighted_score, weight_sum, out=np.zeros(n, dtype=float), where=weight_sum > 0.0
+    )
+    final_dir = np.sign(final_score).astype(int)
+    final_conf = np.round(np.abs(final_score), ce.CONFIDENCE_DECIMALS)
+
+    return {
+        "dir": final_dir,
+        "conf": final_conf,
+        "score": final_score,
+        "regime": regime_arr,
+        "bucket_scores": scores,
+        "bucket_dirs": dirs,
+        "bucket_confs": confs,
+    }
+
+
+def classify_regimes_batch(
+    X: np.ndarray,
+    raw: Optional[np.ndarray] = None,
+    window_size: int = 100,
+    layout: Optional[CouncilLayout] = None,
+) -> np.ndarray:
+    """
+    Vectorized RegimeClassifier over a sequence of steps.
+
+    Equivalent to feeding each step, in order, through one RegimeClassifier
+    instance (as dream mode does): rolling z-scores of ATRp, BB_Width and
+    |Ret_G5| over the trailing window (including the current step).
+
+    Args:
+        X: (N x N_signals) normalized signal matrix
+        raw: Optional (N x N_signals) raw values (raw_registry "value"); zeros
+            fall back to the normalized value, as in the classifier
+        window_size: Classifier history length
+    """
+    if layout is None:
+        layout = get_council_layout()
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    n = X.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=object)
+    raw = np.zeros_like(X) if raw is None else np.atleast_2d(np.asarray(raw, dtype=float))
+    index = {name: i for i, name in enumerate(layout.signal_names)}
+
+    def _series(name: str, fallback_pos: int) -> np.ndarray:
+        idx = index.get(name)
+        values = raw[:, idx] if idx is not None and idx < raw.shape[1] else np.zeros(n)
+        if X.shape[1] > fallback_pos:
+            values = np.where(values == 0.0, X[:, fallback_pos], values)
+        return values
+
+    def _rolling_z(values: np.ndarray) -> np.ndarray:
+        padded = np.concatenate([np.full(window_size - 1, np.nan), values])
+        windows = np.lib.stride_tricks.sliding_window_view(padded, window_size)
+        counts = np.minimum(np.arange(1, n + 1), window_size)
+        z = np.zeros(n, dtype=float)
+        ok = counts >= 2
+        if ok.any():
+            mean = np.nanmean(windows[ok], axis=1)
+            std = np.nanstd(windows[ok], axis=1, ddof=1)
+            zz = np.divide(values[ok] - mean, std, out=np.zeros_like(mean), where=std != 0)
+            z[ok] = zz
+        return z
+
+    atrp_z = _rolling_z(_series("ATRp", 4))
+    bb_z = _rolling_z(_series("BB_Width", 5))
+    ret_z = _rolling_z(np.abs(_series("Ret_G5", 0)))
+
+    high_vol = (np.abs(bb_z) > 0.8) | (np.abs(atrp_z) > 0.8)
+    trend = ~high_vol & (np.abs(ret_z) > 0.6)
+    out = np.full(n, "chop", dtype=object)
+    out[trend] = "trend"
+    out[high_vol] = "high_vol"
+    return out
+
+
+__all__ = [
+    "CouncilLayout",
+    "compile_council_layout",
+    "get_council_layout",
+    "signal_matrix",
+    "compute_bucket_scores_batch",
+    "decide_batch",
+    "classify_regimes_batch",
+]
@@ -0,0 +1,162 @@
+"""
+Trade analytics pass - one scan per log for every engine that aggregates it.
+
+Engines that fold trades.jsonl or a lane log into windowed aggregates
+register a reducer for it at import time:
+
+    register("recovery_ramp.recent_closes", lambda: TRADES_PATH, RecentCloses)
+
+and read the aggregate through reduce(name, now). Inside analytics_pass()
+(opened once per FAST orchestrator run) the first reduce() on a log decodes
+it once and feeds every reducer registered for that log; later calls only
+read lines appended since (e.g. closes written by an earlier step). Outside
+a pass reduce() scans the log for that one reducer, so engines run on their
+own exactly as before.
+
+Reducers receive the decoded record dicts shared by all reducers of a log
+and must not mutate them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine_alpha.core.codec import JsonlTail
+
+
+class Reducer:
+    """Folds the records of one log into an aggregate."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def add(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def result(self) -> Any:
+        raise NotImplementedError
+
+
+ReducerFactory = Callable[[datetime], Reducer]
+
+# name -> (log path resolver, reducer factory)
+_REGISTRY: Dict[str, Tuple[Callable[[], Path], ReducerFactory]] = {}
+
+
+def register(name: str, path: Callable[[], Path], factory: ReducerFactory) -> None:
+    """
+    Register a reducer over the log at path() (resolved on every pass, so
+    module path constants can be repointed).
+    """
+    _REGISTRY[name] = (path, factory)
+
+
+class _LogScan:
+    """
+    Reducers of one log, each group fed from its own byte-offset tail.
+
+    Reducers known when the log is first read share one group; a reducer
+    added later gets a group of its own (one extra scan to backfill it).
+    """
+
+    def __init__(self, path: Path, now: datetime) -> None:
+        self.path = path
+        self.now = now
+        self.groups: List[Tuple[JsonlTail, Dict[str, Reducer]]] = []
+        self.scans = 0
+
+    def add(self, names: Iterable[str]) -> None:
+        known = {name for _, reducers in self.groups for name in reducers}
+        new = {name: _REGISTRY[name][1](self.now) for name in names if name not in known}
+        if new:
+            self.groups.append((JsonlTail(self.path), new))
+
+    def catch_up(self) -> None:
+        """Feed each group the lines appended since its last read (all lines after a rewrite)."""
+        for tail, reducers in self.groups:
+            offset = tail.offset
+            records, reset = tail.read_new()
+            if reset:
+                for name in reducers:
+                    reducers[name] = _REGISTRY[name][1](self.now)
+            if tail.offset != offset:
+                self.scans += 1
+            for record in records:
+                for reducer in reducers.values():
+                    reducer.add(record)
+
+    def result(self, name: str) -> Any:
+        for _, reducers in self.groups:
+            if name in reducers:
+                return reducers[name].result()
+        raise KeyError(name)
+
+
+class AnalyticsPass:
+    """Shared scans for one orchestrator run; every reducer sees the same `now`."""
+
+    def __init__(self, now: Optional[datetime] = None) -> None:
+        self.now = now or datetime.now(timezone.utc)
+        self._logs: Dict[Path, _LogScan] = {}
+
+    def reduce(self, name: str) -> Any:
+        path = Path(_REGISTRY[name][0]())
+        scan = self._logs.get(path)
+        if scan is None:
+            scan = self._logs[path] = _LogScan(path, self.now)
+            scan.add(n for n, (p, _) in _REGISTRY.items() if Path(p()) == path)
+        scan.add([name])
+        scan.catch_up()
+        return scan.result(name)
+
+    def scans(self) -> Dict[Path, int]:
+        """Reads per log so far (one per group catch-up that found new lines)."""
+        return {path: scan.scans for path, scan in self._logs.items()}
+
+
+_active: Optional[AnalyticsPass] = None
+
+
+@contextmanager
+def analytics_pass(now: Optional[datetime] = None, consumers: Iterable[str] = ()) -> Iterator[AnalyticsPass]:
+    """
+    Share log scans across engines until the block exits.
+
+    consumers are modules imported up front so their reducers are registered
+    before the first scan (a reducer registered later costs one backfill scan).
+    A consumer that fails to import is skipped; its own step reports the error.
+    """
+    global _active
+    for module in consumers:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            continue
+    previous = _active
+    _active = AnalyticsPass(now)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def reduce(name: str, now: Optional[datetime] = None) -> Any:
+    """
+    Aggregate of the reducer registered as `name`.
+
+    Served from the active pass (whose `now` wins) or, outside a pass, from a
+    scan of the log for this reducer alone.
+    """
+    if _active is not None:
+        return _active.reduce(name)
+    scan = _LogScan(Path(_REGISTRY[name][0]()), now or datetime.now(timezone.utc))
+    scan.add([name])
+    scan.catch_up()
+    return scan.result(name)
+
+
+__all__ = ["AnalyticsPass", "Reducer", "analytics_pass", "reduce", "register"]
@@ -9,26 +9,16 @@ import json
 import streamlit as st
 import pandas as pd
 
+from engine_alpha.api.views import get_view
+
 ROOT_DIR = Path(__file__).resolve().parents[2]
 REPORTS_DIR = ROOT_DIR / "reports"
 DATA_DIR = ROOT_DIR / "data"
 
 
-def _load_trades(path: Path) -> pd.DataFrame:
-    if not path.exists():
-        return pd.DataFrame()
-    
-    records = []
-    with path.open("r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    
+def _load_trades(limit: int = 50) -> pd.DataFrame:
+    # Served from the in-memory recent_trades view (trades.jsonl is tailed, not re-parsed)
+    records = get_view("recent_trades").data[-limit:]
     if not records:
         return pd.DataFrame()
     
@@ -41,8 +31,7 @@ def _load_trades(path: Path) -> pd.DataFrame:
 def render():
     st.title("Live Trading — Blotter")
     
-    trades_path = REPORTS_DIR / "trades.jsonl"
-    df = _load_trades(trades_path)
+    df = _load_trades()
     
     if df.empty:
         st.info("No trades recorded yet.")
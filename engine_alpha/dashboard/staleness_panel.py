@@ -1,22 +1,14 @@
 from __future__ import annotations
 
-import json
-from pathlib import Path
-
 import pandas as pd
 import streamlit as st
 
-REPORT_PATH = Path("reports/research/staleness_overseer.json")
+from engine_alpha.api.views import get_view
 
 
 def _load_report() -> dict:
-    if not REPORT_PATH.exists():
-        return {}
-    try:
-        data = REPORT_PATH.read_text().strip()
-        return json.loads(data) if data else {}
-    except Exception:
-        return {}
+    data = get_view("staleness").data
+    return data if isinstance(data, dict) else {}
 
 
 def render() -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import io
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -95,6 +96,60 @@ def load_ohlcv_csv(
     return candles
 
 
+def _tail_lines(path: Path, n: int, block_size: int = 65536) -> List[str]:
+    """Last n lines of a file, read backwards in blocks (no full-file parse)."""
+    with path.open("rb") as f:
+        f.seek(0, 2)
+        end = f.tell()
+        data = b""
+        pos = end
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    if pos > 0:
+        lines = lines[1:]  # first line may be partial
+    return [ln for ln in lines if ln.strip()][-n:]
+
+
+def load_ohlcv_csv_tail(
+    symbol: str,
+    timeframe: str,
+    max_bars: int,
+    csv_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Load only the last max_bars candles of an OHLCV CSV by reading from the end.
 
+    Same row format and file resolution as load_ohlcv_csv; assumes the CSV is
+    in ascending ts order (as the historical dumps are).
+    """
+    path = Path(csv_path) if csv_path else DATA_ROOT / f"{symbol}_{timeframe}_2019_2025.csv"
+    if not path.exists():
+        raise FileNotFoundError(f"CSV not found: {path}")
 
+    with path.open("r", newline="") as f:
+        header = f.readline()
+    lines = [ln for ln in _tail_lines(path, max_bars + 1) if ln.strip() != header.strip()]
+    reader = csv.DictReader(io.StringIO(header + "\n".join(lines[-max_bars:]) + "\n"))
 
+    candles: List[Dict[str, Any]] = []
+    for row in reader:
+        try:
+            dt = _parse_ts(row["ts"])
+            candles.append(
+                {
+                    "ts": dt.replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z"),
+                    "open": float(row["open"]),
+                    "high": float(row["high"]),
+                    "low": float(row["low"]),
+                    "close": float(row["close"]),
+                    "volume": float(row.get("volume", 0.0)),
+                }
+            )
+        except Exception:
+            continue
+    candles.sort(key=lambda c: c["ts"])
+    return candles
@@ -268,6 +268,9 @@ def _okx_candles(host: str, inst_id: str, bar: str, limit: int) -> Optional[List
     return rows
 
 
+# Bars one live request returns at most (Bybit, the default provider; OKX 300, Binance 1000)
+LIVE_MAX_BARS = 200
+
 BYBIT_INTERVALS = {
     "1m": "1",
     "3m": "3",
@@ -296,7 +299,7 @@ def _bybit_ohlcv(inst_id: str, timeframe: str, limit: int) -> Tuple[Optional[Lis
         "category": "spot",
         "symbol": inst_id,
         "interval": interval,
-        "limit": str(min(limit, 200)),
+        "limit": str(min(limit, LIVE_MAX_BARS)),
     }
 
     try:
@@ -0,0 +1,491 @@
+"""
+Market Snapshot (per-tick shared market view)
+---------------------------------------------
+
+Builds one immutable MarketSnapshot per loop tick (closed bars, last price,
+funding, regime and signal vector per symbol) so every lane reads the same
+view instead of fetching prices and candles on its own.
+
+Publishing:
+- In-process: the loop calls publish_market_snapshot(); lanes running in the
+  same process read it via get_market_snapshot().
+- Cross-process: the snapshot is also written to a memory-mapped file with a
+  small binary header (magic, version, payload length, created_at). Readers in
+  other orchestrator processes mmap the file, compare the version stamp and
+  only decode the payload when it changed.
+
+Safety:
+- Read-only with respect to trading state
+- Lanes fall back to their own fetch when no fresh snapshot is available
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from engine_alpha.core.paths import REPORTS
+
+SNAPSHOT_PATH = REPORTS / "loop" / "market_snapshot.bin"
+
+# Header: magic (8s), version (Q), payload length (Q), created_at epoch seconds (d)
+_HEADER = struct.Struct("<8sQQd")
+_MAGIC = b"CHLSNAP1"
+
+# Lanes run within the same tick as the builder; anything older is stale.
+DEFAULT_MAX_AGE_SECONDS = 120.0
+REGIME_WINDOW = 20
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts/lists into read-only equivalents."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: produce plain (mutable, JSON-friendly) containers."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class SymbolSnapshot:
+    """Immutable per-symbol market view for one tick."""
+    symbol: str
+    timeframe: str
+    bars: Tuple[Mapping[str, Any], ...] = ()
+    last_price: Optional[float] = None
+    last_bar_ts: Optional[str] = None
+    funding: Optional[float] = None
+    regime: Optional[str] = None
+    regime_metrics: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    signal: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    meta: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def signal_vector(self) -> Tuple[float, ...]:
+        return tuple(self.signal.get("signal_vector", ()))
+
+    def bar_rows(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return closed bars as plain OHLCV row dicts (most recent last)."""
+        bars = self.bars[-limit:] if limit else self.bars
+        return [dict(b) for b in bars]
+
+    def signal_output(self) -> Dict[str, Any]:
+        """Return a mutable copy of the signal processor output for this symbol."""
+        return _thaw(self.signal)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "bars": _thaw(self.bars),
+            "last_price": self.last_price,
+            "last_bar_ts": self.last_bar_ts,
+            "funding": self.funding,
+            "regime": self.regime,
+            "regime_metrics": _thaw(self.regime_metrics),
+            "signal": _thaw(self.signal),
+            "meta": _thaw(self.meta),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SymbolSnapshot":
+        return cls(
+            symbol=str(data.get("symbol", "")),
+            timeframe=str(data.get("timeframe", "")),
+            bars=_freeze(data.get("bars") or []),
+            last_price=data.get("last_price"),
+            last_bar_ts=data.get("last_bar_ts"),
+            funding=data.get("funding"),
+            regime=data.get("regime"),
+            regime_metrics=_freeze(data.get("regime_metrics") or {}),
+            signal=_freeze(data.get("signal") or {}),
+            meta=_freeze(data.get("meta") or {}),
+        )
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable market view for all symbols in one loop tick."""
+    version: int
+    created_at: float
+    timeframe: str
+    symbols: Mapping[str, SymbolSnapshot] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.created_at)
+
+    def get(self, symbol: str) -> Optional[SymbolSnapshot]:
+        return self.symbols.get(symbol.upper())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "created_at": self.created_at,
+            "created_at_iso": datetime.fromtimestamp(self.created_at, tz=timezone.utc).isoformat(),
+            "timeframe": self.timeframe,
+            "symbols": {sym: snap.to_dict() for sym, snap in self.symbols.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketSnapshot":
+        symbols = {
+            str(sym).upper(): SymbolSnapshot.from_dict(snap)
+            for sym, snap in (data.get("symbols") or {}).items()
+            if isinstance(snap, dict)
+        }
+        return cls(
+            version=int(data.get("version", 0)),
+            created_at=float(data.get("created_at", 0.0)),
+            timeframe=str(data.get("timeframe", "")),
+            symbols=MappingProxyType(symbols),
+        )
+
+
+def _build_symbol_snapshot(
+    symbol: str,
+    timeframe: str,
+    limit: int,
+    include_signals: bool,
+) -> SymbolSnapshot:
+    """Fetch bars once for a symbol and derive price, regime, signals and funding from them."""
+    from engine_alpha.data.live_prices import get_live_ohlcv, _ensure_completed
+
+    meta: Dict[str, Any] = {"limit": limit, "errors": []}
+    rows: List[Dict[str, Any]] = []
+    try:
+        rows, ohlcv_meta = get_live_ohlcv(symbol, timeframe, limit=limit, no_cache=True)
+        rows = _ensure_completed(rows or [], timeframe)
+        meta["source"] = ohlcv_meta.get("source")
+        meta["age_s"] = ohlcv_meta.get("age_s")
+        meta["is_stale"] = ohlcv_meta.get("is_stale", False)
+    except Exception as e:
+        meta["errors"].append(f"ohlcv:{type(e).__name__}")
+
+    last_price: Optional[float] = None
+    last_bar_ts: Optional[str] = None
+    if rows:
+        try:
+            px = float(rows[-1].get("close"))
+            last_price = px if px > 0 else None
+        except (TypeError, ValueError):
+            last_price = None
+        last_bar_ts = rows[-1].get("ts")
+
+    regime: Optional[str] = None
+    regime_metrics: Dict[str, Any] = {}
+    if rows:
+        try:
+            from engine_alpha.core.regime import classify_regime
+            regime_info = classify_regime(rows[-REGIME_WINDOW:])
+            regime = regime_info.get("regime")
+            regime_metrics = regime_info.get("metrics", {}) or {}
+        except Exception as e:
+            meta["errors"].append(f"regime:{type(e).__name__}")
+
+    signal: Dict[str, Any] = {}
+    if include_signals and rows:
+        try:
+            from engine_alpha.signals.signal_processor import get_signal_vector_live
+            signal = get_signal_vector_live(symbol=symbol, timeframe=timeframe, limit=limit, rows=rows)
+        except Exception as e:
+            meta["errors"].append(f"signals:{type(e).__name__}")
+
+    # Funding is already folded into the live signal registry; only hit the venue if it is missing.
+    funding: Optional[float] = None
+    fb = (signal.get("raw_registry") or {}).get("Funding_Bias") if signal else None
+    if isinstance(fb, dict) and isinstance(fb.get("value"), (int, float)):
+        funding = float(fb["value"])
+    else:
+        try:
+            from engine_alpha.data.funding_rates import get_funding_bias
+            funding = get_funding_bias(symbol)
+        except Exception as e:
+            meta["errors"].append(f"funding:{type(e).__name__}")
+
+    # Round-trip through JSON so the frozen view holds only plain serializable values.
+    signal = json.loads(json.dumps(signal, default=str)) if signal else {}
+
+    return SymbolSnapshot(
+        symbol=symbol.upper(),
+        timeframe=timeframe,
+        bars=_freeze(rows),
+        last_price=last_price,
+        last_bar_ts=last_bar_ts,
+        funding=funding,
+        regime=regime,
+        regime_metrics=_freeze(regime_metrics),
+        signal=_freeze(signal),
+        meta=_freeze(meta),
+    )
+
+
+def build_market_snapshot(
+    symbols: Iterable[str],
+    timeframe: str = "15m",
+    limit: int = 200,
+    *,
+    include_signals: bool = True,
+) -> MarketSnapshot:
+    """
+    Build one immutable MarketSnapshot for the given symbols (one fetch per symbol).
+
+    Args:
+        symbols: Symbols to include
+        timeframe: Bar timeframe for the snapshot
+        limit: Number of bars to fetch per symbol
+        include_signals: Compute the live signal vector from the fetched bars
+
+    Returns:
+        MarketSnapshot (version is assigned on publish)
+    """
+    per_symbol: Dict[str, SymbolSnapshot] = {}
+    for symbol in symbols:
+        sym = str(symbol).upper()
+        if sym in per_symbol:
+            continue
+        per_symbol[sym] = _build_symbol_snapshot(sym, timeframe, limit, include_signals)
+    return MarketSnapshot(
+        version=0,
+        created_at=time.time(),
+        timeframe=timeframe,
+        symbols=MappingProxyType(per_symbol),
+    )
+
+
+# Process-local published snapshot and the last one decoded from the mmap file.
+_CURRENT: Optional[MarketSnapshot] = None
+_MMAP_CACHE: Dict[str, Any] = {"path": None, "version": None, "snapshot": None}
+
+
+def _read_header(path: Path) -> Optional[Tuple[int, int, float]]:
+    """Return (version, payload_len, created_at) from the snapshot file header."""
+    try:
+        with path.open("rb") as f:
+            raw = f.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(raw) < _HEADER.size:
+        return None
+    magic, version, length, created_at = _HEADER.unpack(raw)
+    if magic != _MAGIC:
+        return None
+    return int(version), int(length), float(created_at)
+
+
+def write_snapshot_file(snapshot: MarketSnapshot, path: Path = SNAPSHOT_PATH) -> None:
+    """Write snapshot to the memory-mappable file atomically (temp file + os.replace)."""
+    payload = json.dumps(snapshot.to_dict(), separators=(",", ":"), default=str).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, snapshot.version, len(payload), snapshot.created_at))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    except Exception:
+        if tmp_path.exists():
+            try:
+                tmp_path.unlink()
+            except Exception:
+                pass
+        raise
+
+
+def read_snapshot_file(path: Path = SNAPSHOT_PATH) -> Optional[MarketSnapshot]:
+    """
+    Read a published snapshot via mmap.
+
+    The payload is only decoded when the header version differs from the
+    last one seen by this process; otherwise the cached object is returned.
+    """
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, length, _created_at = _HEADER.unpack_from(mm, 0)
+                if magic != _MAGIC or _HEADER.size + length > size:
+                    return None
+                if _MMAP_CACHE["path"] == str(path) and _MMAP_CACHE["version"] == version:
+                    return _MMAP_CACHE["snapshot"]
+                payload = mm[_HEADER.size:_HEADER.size + length]
+    except (OSError, ValueError, struct.error):
+        return None
+
+    try:
+        snapshot = MarketSnapshot.from_dict(json.loads(payload.decode("utf-8")))
+    except Exception:
+        return None
+    _MMAP_CACHE.update({"path": str(path), "version": version, "snapshot": snapshot})
+    return snapshot
+
+
+def publish_market_snapshot(
+    snapshot: MarketSnapshot,
+    path: Optional[Path] = SNAPSHOT_PATH,
+) -> MarketSnapshot:
+    """
+    Stamp a version on the snapshot and publish it in-process and (optionally) to the mmap file.
+
+    Returns:
+        The published snapshot carrying its version stamp
+    """
+    global _CURRENT
+    prev_versions = [_CURRENT.version if _CURRENT else 0]
+    if path is not None:
+        header = _read_header(path)
+        if header:
+            prev_versions.append(header[0])
+    stamped = MarketSnapshot(
+        version=max(prev_versions) + 1,
+        created_at=snapshot.created_at,
+        timeframe=snapshot.timeframe,
+        symbols=snapshot.symbols,
+    )
+    _CURRENT = stamped
+    if path is not None:
+        try:
+            write_snapshot_file(stamped, path)
+        except Exception:
+            # In-process consumers still get the snapshot
+            pass
+    return stamped
+
+
+def clear_market_snapshot() -> None:
+    """Drop the process-local snapshot (tests / shutdown)."""
+    global _CURRENT
+    _CURRENT = None
+    _MMAP_CACHE.update({"path": None, "version": None, "snapshot": None})
+
+
+def get_market_snapshot(
+    max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+    path: Optional[Path] = SNAPSHOT_PATH,
+) -> Optional[MarketSnapshot]:
+    """
+    Return the freshest published snapshot (in-process first, then the mmap file).
+
+    Returns None when nothing was published or the snapshot is older than max_age_seconds.
+    """
+    candidates = [_CURRENT]
+    if path is not None:
+        candidates.append(read_snapshot_file(path))
+    best: Optional[MarketSnapshot] = None
+    for snap in candidates:
+        if snap is None:
+            continue
+        if best is None or snap.version > best.version:
+            best = snap
+    if best is None:
+        return None
+    if max_age_seconds is not None and best.age_seconds > max_age_seconds:
+        return None
+    return best
+
+
+def get_symbol_snapshot(
+    symbol: str,
+    timeframe: Optional[str] = None,
+    max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+) -> Optional[SymbolSnapshot]:
+    """Return the fresh per-symbol view, or None if unavailable or built for another timeframe."""
+    snapshot = get_market_snapshot(max_age_seconds=max_age_seconds)
+    if snapshot is None:
+        return None
+    if timeframe is not None and snapshot.timeframe != timeframe:
+        return None
+    return snapshot.get(symbol)
+
+
+def get_snapshot_price(
+    symbol: str,
+    timeframe: Optional[str] = None,
+    max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+) -> Optional[float]:
+    """Return the snapshot last price for symbol, or None so callers can fall back to a fetch."""
+    snap = get_symbol_snapshot(symbol, timeframe=timeframe, max_age_seconds=max_age_seconds)
+    if snap is None or snap.last_price is None or snap.last_price <= 0:
+        return None
+    return float(snap.last_price)
+
+
+def get_snapshot_bars(
+    symbol: str,
+    timeframe: str,
+    limit: Optional[int] = None,
+    max_age_seconds: Optional[float] = DEFAULT_MAX_AGE_SECONDS,
+) -> Optional[List[Dict[str, Any]]]:
+    """Return snapshot closed bars for symbol/timeframe, or None so callers can fall back to a fetch."""
+    snap = get_symbol_snapshot(symbol, timeframe=timeframe, max_age_seconds=max_age_seconds)
+    if snap is None or not snap.bars:
+        return None
+    if limit and limit > int(snap.meta.get("limit") or 0):
+        # Caller needs more history than the snapshot was built with
+        return None
+    return snap.bar_rows(limit)
+
+
+def collect_symbol_bars(
+    symbols: Iterable[str],
+    timeframe: str,
+    limit: int,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Closed bars per symbol (most recent last) from the snapshot, fetching only the
+    symbols it cannot serve. Symbols without bars are left out.
+
+    Fetches are single live requests, so they return at most LIVE_MAX_BARS bars
+    whatever the limit.
+    """
+    from engine_alpha.data.live_prices import LIVE_MAX_BARS, get_live_ohlcv, _ensure_completed
+
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for symbol in symbols:
+        rows = get_snapshot_bars(symbol, timeframe, limit)
+        if rows is None:
+            try:
+                fetched, _meta = get_live_ohlcv(symbol, timeframe, limit=min(limit, LIVE_MAX_BARS))
+                rows = _ensure_completed(fetched or [], timeframe)
+            except Exception:
+                rows = []
+        if rows:
+            out[symbol] = rows
+    return out
+
+
+__all__ = [
+    "MarketSnapshot",
+    "SymbolSnapshot",
+    "build_market_snapshot",
+    "publish_market_snapshot",
+    "get_market_snapshot",
+    "get_symbol_snapshot",
+    "get_snapshot_price",
+    "get_snapshot_bars",
+    "collect_symbol_bars",
+    "read_snapshot_file",
+    "write_snapshot_file",
+    "clear_market_snapshot",
+]
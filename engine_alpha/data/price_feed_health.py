@@ -13,6 +13,7 @@ from typing import Dict, Any, Optional, Tuple
 
 from engine_alpha.data.live_prices import get_live_ohlcv
 from engine_alpha.data import live_prices
+from engine_alpha.data.market_snapshot import get_symbol_snapshot
 from engine_alpha.core.paths import DATA, REPORTS
 
 
@@ -36,6 +37,15 @@ def get_latest_price(symbol: str) -> Tuple[Optional[float], Dict[str, Any]]:
         "errors": [],
     }
     
+    # Per-tick market snapshot: one consistent price for every lane this tick
+    snap = get_symbol_snapshot(symbol, "15m")
+    if snap is not None and snap.last_price is not None and snap.last_price > 0:
+        meta["source_used"] = f"market_snapshot:{snap.meta.get('source', 'unknown')}"
+        meta["age_seconds"] = snap.meta.get("age_s")
+        meta["latest_ts"] = snap.last_bar_ts
+        meta["latest_price"] = float(snap.last_price)
+        return float(snap.last_price), meta
+
     try:
         rows, ohlcv_meta = get_live_ohlcv(symbol, "15m", limit=1)
         
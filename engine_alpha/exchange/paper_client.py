@@ -2,11 +2,13 @@
 Paper Exchange Client - Simulated exchange for paper trading.
 
 Mimics real exchange interface for seamless switching between paper and live.
+State is persisted through PaperStateStore: each change is appended to a
+journal, compacted periodically into an atomic snapshot, and closed orders
+are archived out of the hot order map.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
@@ -14,11 +16,15 @@ from decimal import Decimal
 from typing import Dict, Any, List, Optional
 
 from engine_alpha.core.models import ValidatedOrder, Venue, Side, OrderType
+from engine_alpha.exchange.paper_state_store import PaperStateStore
+from engine_alpha.exchanges.market_metadata import TickerCache
 
 logger = logging.getLogger(__name__)
 
 REPORTS_DIR = Path(__file__).resolve().parents[2] / "reports"
 PAPER_STATE_FILE = REPORTS_DIR / "paper_trading_state.json"
+PAPER_JOURNAL_FILE = REPORTS_DIR / "paper_trading_journal.jsonl"
+PAPER_ORDERS_ARCHIVE_FILE = REPORTS_DIR / "paper_orders_archive.jsonl"
 
 
 class PaperExchangeClient:
@@ -34,12 +40,14 @@ class PaperExchangeClient:
         initial_balance_usdt: float = 10000.0,
         simulated_fee_rate: float = 0.0004,  # 0.04% taker fee
         simulated_slippage_bps: float = 5.0,  # 5 bps slippage
+        store: Optional[PaperStateStore] = None,
     ):
         """
         Args:
             initial_balance_usdt: Starting paper balance
             simulated_fee_rate: Fee rate to simulate (decimal)
             simulated_slippage_bps: Slippage to simulate (basis points)
+            store: State store (defaults to the reports/ paper state files)
         """
         self.venue = Venue.BINANCE  # Paper mimics Binance
         self.name = "Paper"
@@ -47,38 +55,27 @@ class PaperExchangeClient:
         self.slippage_bps = simulated_slippage_bps
         
         # Load or initialize state
+        self.store = store or PaperStateStore(
+            PAPER_STATE_FILE,
+            journal_path=PAPER_JOURNAL_FILE,
+            archive_path=PAPER_ORDERS_ARCHIVE_FILE,
+        )
         self.state = self._load_state(initial_balance_usdt)
+        self._tickers = TickerCache()
         
         logger.info(
             f"[PAPER] Initialized: balance={self.state['balance_usdt']:.2f} USDT"
         )
 
     def _load_state(self, initial_balance: float) -> Dict[str, Any]:
-        """Load paper trading state from disk or initialize."""
-        try:
-            if PAPER_STATE_FILE.exists():
-                state = json.loads(PAPER_STATE_FILE.read_text())
-                logger.info(f"[PAPER] Loaded existing state")
-                return state
-        except Exception as e:
-            logger.warning(f"[PAPER] Could not load state: {e}")
-        
-        # Initialize new state
-        return {
+        """Load paper trading state (snapshot + journal replay) or initialize."""
+        return self.store.load({
             "balance_usdt": initial_balance,
             "positions": {},  # symbol -> position dict
-            "orders": {},  # order_id -> order dict
+            "orders": {},  # order_id -> open order dict
             "order_counter": 0,
             "created_at": datetime.now(timezone.utc).isoformat(),
-        }
-
-    def _save_state(self) -> None:
-        """Save paper trading state to disk."""
-        try:
-            REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-            PAPER_STATE_FILE.write_text(json.dumps(self.state, indent=2, default=str))
-        except Exception as e:
-            logger.error(f"[PAPER] Could not save state: {e}")
+        })
 
     def _get_next_order_id(self) -> str:
         """Generate next order ID."""
@@ -104,6 +101,7 @@ class PaperExchangeClient:
         """
         order_id = self._get_next_order_id()
         timestamp = datetime.now(timezone.utc)
+        change: Dict[str, Any] = {"order_counter": self.state["order_counter"]}
         
         # For market orders, simulate immediate fill
         if order.order_type == OrderType.MARKET:
@@ -118,6 +116,7 @@ class PaperExchangeClient:
             if order.side == Side.BUY:
                 cost = notional + fee
                 if cost > self.state["balance_usdt"]:
+                    self.store.record(change)
                     return {
                         "orderId": order_id,
                         "status": "REJECTED",
@@ -159,7 +158,9 @@ class PaperExchangeClient:
                     pos["entryPrice"] = 0.0
                 self.state["positions"][order.symbol] = pos
             
-            self._save_state()
+            change["balance_usdt"] = self.state["balance_usdt"]
+            change["positions"] = {order.symbol: pos}
+            self.store.record(change)
             
             logger.info(
                 f"[PAPER] Order filled: {order.side.value} {quantity} {order.symbol} @ {fill_price:.4f}"
@@ -190,11 +191,21 @@ class PaperExchangeClient:
             "status": "NEW",
             "time": int(timestamp.timestamp() * 1000),
         }
-        self.state["orders"][order_id] = order_record
-        self._save_state()
+        change["orders_put"] = {order_id: order_record}
+        self.store.record(change)
         
         return order_record
 
+    def place_orders(self, orders: List[ValidatedOrder]) -> List[Dict[str, Any]]:
+        """
+        Place several simulated orders in sequence.
+        
+        Same semantics as calling place_order for each, but all state
+        changes are persisted with a single journal write.
+        """
+        with self.store.batch():
+            return [self.place_order(order) for order in orders]
+
     def cancel_order(
         self,
         symbol: str,
@@ -204,9 +215,10 @@ class PaperExchangeClient:
         """Cancel a paper order."""
         order_id = ord_id or cl_ord_id
         if order_id and order_id in self.state["orders"]:
-            order = self.state["orders"].pop(order_id)
+            order = dict(self.state["orders"][order_id])
             order["status"] = "CANCELED"
-            self._save_state()
+            # Closed orders are archived and leave the hot order map
+            self.store.record({"orders_closed": {order_id: order}})
             return order
         
         return {"status": "UNKNOWN", "msg": "Order not found"}
@@ -293,7 +305,11 @@ class PaperExchangeClient:
         }
 
     def get_ticker_price(self, symbol: str) -> Dict[str, Any]:
-        """Get ticker price from live data feeds."""
+        """Get ticker price from live data feeds (cached for a few seconds)."""
+        cached = self._tickers.get(symbol)
+        if cached and cached.get("last"):
+            return {"symbol": symbol, "price": str(cached["last"])}
+        
         # Fetch real price from live prices module for realistic paper trading
         try:
             from engine_alpha.data.live_prices import get_live_ohlcv
@@ -301,6 +317,7 @@ class PaperExchangeClient:
             if rows and len(rows) > 0:
                 price = rows[-1].get("close", 0)
                 if price and price > 0:
+                    self._tickers.put_many({symbol: {"last": price, "bid": None, "ask": None, "mark": None}})
                     return {"symbol": symbol, "price": str(price)}
         except Exception:
             pass
@@ -310,6 +327,7 @@ class PaperExchangeClient:
             from engine_alpha.data.price_feed_health import get_latest_price
             price, meta = get_latest_price(symbol)
             if price and price > 0:
+                self._tickers.put_many({symbol: {"last": price, "bid": None, "ask": None, "mark": None}})
                 return {"symbol": symbol, "price": str(price)}
         except Exception:
             pass
@@ -332,14 +350,14 @@ class PaperExchangeClient:
             "order_counter": 0,
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
-        self._save_state()
+        self.store.replace(self.state)
         logger.info(f"[PAPER] State reset: balance={initial_balance} USDT")
         return {"success": True, "balance": initial_balance}
 
     def add_balance(self, amount: float) -> Dict[str, Any]:
         """Add balance to paper account (simulated deposit)."""
         self.state["balance_usdt"] += amount
-        self._save_state()
+        self.store.record({"balance_usdt": self.state["balance_usdt"]})
         return {
             "success": True,
             "added": amount,
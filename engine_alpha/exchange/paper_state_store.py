@@ -0,0 +1,213 @@
+"""
+Paper State Store - journaled, atomically snapshotted state for paper trading.
+
+State changes are appended to a JSONL journal (one compact line per change,
+or one line per batch) instead of rewriting the whole state file. The journal
+is periodically compacted into an atomic snapshot (temp file + os.replace) of
+the hot state only. Closed orders (filled / canceled) leave the hot order map
+and are appended to an archive file.
+
+Recovery: load the snapshot, then replay journal entries with a sequence
+number above the snapshot's journal_seq. A crash between snapshot and journal
+truncation therefore never double-applies a change.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from engine_alpha.core.atomic_io import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Compact after this many journal entries or seconds (whichever comes first)
+SNAPSHOT_EVERY_ENTRIES = 500
+SNAPSHOT_INTERVAL_SECONDS = 300.0
+
+CLOSED_ORDER_STATUSES = {"FILLED", "CANCELED", "REJECTED", "EXPIRED"}
+
+
+class PaperStateStore:
+    """
+    Journal + snapshot persistence for PaperExchangeClient state.
+
+    A state change is a dict with any of:
+        balance_usdt: float
+        order_counter: int
+        positions: {symbol: position dict}
+        orders_put: {order_id: order dict}
+        orders_closed: {order_id: final order dict}   (archived, removed from hot map)
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        journal_path: Optional[Path] = None,
+        archive_path: Optional[Path] = None,
+        snapshot_every: int = SNAPSHOT_EVERY_ENTRIES,
+        snapshot_interval_s: float = SNAPSHOT_INTERVAL_SECONDS,
+    ) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or snapshot_path.with_name(snapshot_path.stem + "_journal.jsonl")
+        self.archive_path = archive_path or snapshot_path.with_name(snapshot_path.stem + "_orders_archive.jsonl")
+        self.snapshot_every = snapshot_every
+        self.snapshot_interval_s = snapshot_interval_s
+        self.state: Dict[str, Any] = {}
+        self._seq = 0
+        self._entries_since_snapshot = 0
+        self._last_snapshot = time.monotonic()
+        self._pending: Optional[List[Dict[str, Any]]] = None
+
+    # ---------- Recovery ----------
+
+    def load(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Load snapshot + journal; return initial_state (not persisted) if neither exists."""
+        state: Optional[Dict[str, Any]] = None
+        if self.snapshot_path.exists():
+            try:
+                state = json.loads(self.snapshot_path.read_text())
+            except Exception as e:
+                logger.warning(f"[PAPER] Could not load state snapshot: {e}")
+        if state is None:
+            state = deepcopy(initial_state)
+        snapshot_seq = int(state.pop("journal_seq", 0) or 0)
+        self._seq = snapshot_seq
+
+        replayed = 0
+        if self.journal_path.exists():
+            with self.journal_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn last write
+                    seq = int(entry.get("seq", 0))
+                    if seq <= snapshot_seq:
+                        continue
+                    for change in entry.get("changes", []):
+                        self._apply(state, change, archive=False)
+                    self._seq = seq
+                    replayed += 1
+        # Orders closed before the archive existed (older state files) leave the hot map
+        legacy_closed = {
+            oid: o for oid, o in state.get("orders", {}).items()
+            if isinstance(o, dict) and str(o.get("status", "")).upper() in CLOSED_ORDER_STATUSES
+        }
+        if legacy_closed:
+            self._archive(legacy_closed.values())
+            for oid in legacy_closed:
+                state["orders"].pop(oid, None)
+        self.state = state
+        self._entries_since_snapshot = replayed
+        if replayed or legacy_closed:
+            self.snapshot()
+        return self.state
+
+    # ---------- Mutations ----------
+
+    def _apply(self, state: Dict[str, Any], change: Dict[str, Any], archive: bool) -> None:
+        if "balance_usdt" in change:
+            state["balance_usdt"] = change["balance_usdt"]
+        if "order_counter" in change:
+            state["order_counter"] = change["order_counter"]
+        for symbol, pos in (change.get("positions") or {}).items():
+            state.setdefault("positions", {})[symbol] = pos
+        for order_id, order in (change.get("orders_put") or {}).items():
+            state.setdefault("orders", {})[order_id] = order
+        closed = change.get("orders_closed") or {}
+        for order_id in closed:
+            state.setdefault("orders", {}).pop(order_id, None)
+        if archive and closed:
+            self._archive(closed.values())
+
+    def _archive(self, orders: Iterable[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(o, separators=(",", ":"), default=str) + "\n" for o in orders)
+        if not lines:
+            return
+        self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.archive_path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def record(self, change: Dict[str, Any]) -> None:
+        """Apply a change to the in-memory state and journal it (deferred inside batch())."""
+        self._apply(self.state, change, archive=True)
+        if self._pending is not None:
+            self._pending.append(change)
+            return
+        self._write_journal([change])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group the changes recorded inside the block into one journal write."""
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            if pending:
+                self._write_journal(pending)
+
+    def _write_journal(self, changes: List[Dict[str, Any]]) -> None:
+        self._seq += 1
+        entry = {"seq": self._seq, "ts": time.time(), "changes": changes}
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.journal_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+                f.flush()
+        except Exception as e:
+            logger.error(f"[PAPER] Could not append state journal: {e}")
+            return
+        self._entries_since_snapshot += 1
+        if (
+            self._entries_since_snapshot >= self.snapshot_every
+            or time.monotonic() - self._last_snapshot >= self.snapshot_interval_s
+        ):
+            self.snapshot()
+
+    # ---------- Compaction ----------
+
+    def snapshot(self) -> None:
+        """Atomically write the hot state, then truncate the journal it covers."""
+        try:
+            atomic_write_json(
+                self.snapshot_path, {**self.state, "journal_seq": self._seq},
+                compact=True, fsync=True, default=str,
+            )
+            with self.journal_path.open("w", encoding="utf-8"):
+                pass
+        except Exception as e:
+            logger.error(f"[PAPER] Could not write state snapshot: {e}")
+            return
+        self._entries_since_snapshot = 0
+        self._last_snapshot = time.monotonic()
+
+    def replace(self, state: Dict[str, Any]) -> None:
+        """Replace the whole state (e.g. reset) and snapshot it."""
+        self.state = state
+        self.snapshot()
+
+    def iter_archived_orders(self) -> Iterator[Dict[str, Any]]:
+        """Closed orders, oldest first."""
+        if not self.archive_path.exists():
+            return
+        with self.archive_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
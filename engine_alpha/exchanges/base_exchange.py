@@ -11,6 +11,15 @@ from decimal import Decimal
 from engine_alpha.core.models import ValidatedOrder, Venue
 
 
+def price_or_none(value: Any) -> Optional[float]:
+    """Positive float from a venue price field, or None if empty, zero or unparseable."""
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    return f if f > 0 else None
+
+
 class BaseExchange(ABC):
     """
     Generic exchange interface. Each venue (OKX, Bybit, Binance) implements this.
@@ -49,3 +58,19 @@ class BaseExchange(ABC):
         """
         raise NotImplementedError
 
+
+    def get_all_instruments(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return metadata for every instrument at this venue, keyed by symbol.
+
+        Optional bulk variant of get_instrument_meta; empty means unsupported.
+        """
+        return {}
+
+    def get_all_tickers(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Return {symbol: {"last", "bid", "ask", "mark"}} for every instrument.
+
+        Optional bulk ticker snapshot; empty means unsupported.
+        """
+        return {}
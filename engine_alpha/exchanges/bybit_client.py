@@ -16,9 +16,10 @@ from typing import Dict, Any, Optional, List
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from engine_alpha.core.models import ValidatedOrder, TdMode, Venue, OrderType, Side
-from engine_alpha.exchanges.base_exchange import BaseExchange
+from engine_alpha.exchanges.base_exchange import BaseExchange, price_or_none
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,13 @@ class BybitClient(BaseExchange):
         else:
             self.base_url = base_url.rstrip("/")
         
-        self.session = session or requests.Session()
+        if session is None:
+            # Keep-alive pool sized for concurrent callers; retries are handled in _request
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         
         # ---------- PROXY SETUP ----------
         proxy_host = os.environ.get("BYBIT_PROXY_HOST")
@@ -199,6 +206,49 @@ class BybitClient(BaseExchange):
             raise ValueError(f"Instrument not found on Bybit: {symbol}")
         return data[0]
 
+    def get_all_instruments(self) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for all linear instruments (paginated bulk listing)."""
+        instruments: Dict[str, Dict[str, Any]] = {}
+        cursor = ""
+        while True:
+            params: Dict[str, Any] = {"category": "linear", "limit": 1000}
+            if cursor:
+                params["cursor"] = cursor
+            resp = self._request(
+                "GET",
+                "/v5/market/instruments-info",
+                params=params,
+                body=None,
+                auth=False,
+            )
+            result = resp.get("result", {})
+            for item in result.get("list", []):
+                if item.get("symbol"):
+                    instruments[item["symbol"]] = item
+            cursor = result.get("nextPageCursor") or ""
+            if not cursor:
+                return instruments
+
+    def get_all_tickers(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Get last/bid/ask/mark for all linear instruments in one call."""
+        resp = self._request(
+            "GET",
+            "/v5/market/tickers",
+            params={"category": "linear"},
+            body=None,
+            auth=False,
+        )
+        return {
+            item["symbol"]: {
+                "last": price_or_none(item.get("lastPrice")),
+                "bid": price_or_none(item.get("bid1Price")),
+                "ask": price_or_none(item.get("ask1Price")),
+                "mark": price_or_none(item.get("markPrice")),
+            }
+            for item in resp.get("result", {}).get("list", [])
+            if item.get("symbol")
+        }
+
     # ---------- Internal REST plumbing ----------
 
     def _request(
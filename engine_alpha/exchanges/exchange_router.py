@@ -12,6 +12,7 @@ from typing import Dict, Any, Optional
 
 from engine_alpha.core.models import OrderIntent, ValidatedOrder, Venue
 from engine_alpha.exchanges.base_exchange import BaseExchange
+from engine_alpha.exchanges.market_metadata import ExchangeMetadataService
 from engine_alpha.risk.risk_engine import RiskEngine
 
 logger = logging.getLogger(__name__)
@@ -27,23 +28,62 @@ class ExchangeRouter:
         risk_engine: RiskEngine,
         okx_client: Optional[BaseExchange] = None,  # Deprecated - kept for compatibility
         bybit_client: Optional[BaseExchange] = None,
+        bybit_metadata: Optional[ExchangeMetadataService] = None,
+        okx_metadata: Optional[ExchangeMetadataService] = None,
     ):
         """
         Args:
             risk_engine: Risk engine for order validation
             okx_client: OKX client instance (deprecated, not used)
             bybit_client: Bybit client instance
+            bybit_metadata: Instrument/ticker cache for Bybit (built from bybit_client if None)
+            okx_metadata: Instrument/ticker cache for OKX (built from okx_client if None)
         """
         self.risk_engine = risk_engine
         self.okx_client = okx_client  # Deprecated
         self.bybit_client = bybit_client
+        self.bybit_metadata = bybit_metadata or (ExchangeMetadataService(bybit_client) if bybit_client else None)
+        self.okx_metadata = okx_metadata or (ExchangeMetadataService(okx_client) if okx_client else None)
+        self._warmed = False
+
+    def warm_metadata(self) -> None:
+        """
+        Bulk-load instruments and tickers for configured venues and start the
+        background ticker refresh. Runs once; the first routed order calls it
+        if startup did not.
+        """
+        for metadata in (self.bybit_metadata, self.okx_metadata):
+            if metadata is not None:
+                metadata.warm()
+        self._warmed = True
+
+    @staticmethod
+    def _known_price(intent: OrderIntent, metadata: Optional[ExchangeMetadataService]) -> Optional[float]:
+        """Limit price, else cached ticker price, else None."""
+        if intent.price is not None:
+            return float(intent.price)
+        if metadata is not None:
+            return metadata.get_price(intent.symbol)
+        return None
+
+    @classmethod
+    def _estimate_price(cls, intent: OrderIntent, metadata: Optional[ExchangeMetadataService]) -> float:
+        """Known price, else a rough per-asset estimate for risk sizing."""
+        price = cls._known_price(intent, metadata)
+        if price:
+            return price
+        if "BTC" in intent.symbol:
+            return 50000.0
+        elif "ETH" in intent.symbol:
+            return 3000.0
+        return 1.0  # Fallback
 
     def route_and_execute(self, intent: OrderIntent) -> Dict[str, Any]:
         """
         Route an order intent to the appropriate exchange and execute it.
         
         Steps:
-        1. Get instrument meta from exchange
+        1. Get instrument meta (from the metadata cache)
         2. Round quantity to lotSz, check minSz
         3. Estimate price for risk calculation
         4. Validate via risk engine
@@ -72,6 +112,8 @@ class ExchangeRouter:
         # ---- END SHADOW MODE ----
         
         venue = intent.venue
+        if not self._warmed:
+            self.warm_metadata()
         
         if venue == Venue.BYBIT:
             return self._route_bybit(intent)
@@ -86,19 +128,15 @@ class ExchangeRouter:
         if not self.bybit_client:
             raise ValueError("Bybit client not configured")
         
-        # 1. Get instrument metadata
+        # 1. Get instrument metadata (served from memory after the bulk load)
         try:
-            meta = self.bybit_client.get_instrument_meta(intent.symbol)
+            spec = self.bybit_metadata.get_spec(intent.symbol)
         except Exception as e:
             raise ValueError(f"Failed to get instrument meta for {intent.symbol}: {e}")
         
-        # Extract lotSizeFilter and priceFilter
-        lot_size_filter = meta.get("lotSizeFilter", {})
-        price_filter = meta.get("priceFilter", {})
-        
-        lot_size = Decimal(lot_size_filter.get("qtyStep", "1"))
-        min_qty = Decimal(lot_size_filter.get("minQty", "0"))
-        tick_size = Decimal(price_filter.get("tickSize", "0.01"))
+        lot_size = spec.qty_step
+        min_qty = spec.min_qty
+        tick_size = spec.tick_size
         
         # 2. Round quantity to lot size
         rounded_qty = (intent.quantity / lot_size) * lot_size
@@ -117,18 +155,16 @@ class ExchangeRouter:
             rounded_price = (intent.price / tick_size) * tick_size
             intent.price = rounded_price.quantize(Decimal("0.00000001"))
         
-        # 3. Get mark price for risk estimation
-        price_usd = None
-        if intent.price is not None:
-            price_usd = float(intent.price)
-        else:
-            # Estimate from symbol (stub - would fetch mark price)
-            if "BTC" in intent.symbol:
-                price_usd = 50000.0
-            elif "ETH" in intent.symbol:
-                price_usd = 3000.0
-            else:
-                price_usd = 1.0  # Fallback
+        # 3. Get price for risk estimation (ticker cache, never a round-trip)
+        known_price = self._known_price(intent, self.bybit_metadata)
+        price_usd = self._estimate_price(intent, self.bybit_metadata)
+        # Min-notional needs a real price; without one the exchange enforces it
+        if known_price and spec.min_notional > 0:
+            notional = rounded_qty * Decimal(str(known_price))
+            if notional < spec.min_notional:
+                raise ValueError(
+                    f"Notional {notional} below minimum {spec.min_notional} for {intent.symbol}"
+                )
         
         # 4. Validate via risk engine
         try:
@@ -170,13 +206,12 @@ class ExchangeRouter:
         
         # 1. Get instrument metadata
         try:
-            meta = self.okx_client.get_instrument_meta(intent.symbol)
+            spec = self.okx_metadata.get_spec(intent.symbol)
         except Exception as e:
             raise ValueError(f"Failed to get instrument meta for {intent.symbol}: {e}")
         
-        # Extract lotSz and minSz
-        lot_sz = Decimal(meta.get("lotSz", "1"))
-        min_sz = Decimal(meta.get("minSz", "0"))
+        lot_sz = spec.qty_step
+        min_sz = spec.min_qty
         
         # 2. Round quantity to lotSz
         rounded_qty = (intent.quantity / lot_sz) * lot_sz
@@ -190,19 +225,8 @@ class ExchangeRouter:
         # Update intent with rounded quantity
         intent.quantity = rounded_qty
         
-        # 3. Get mark price for risk estimation
-        # For now, use a simple estimate (would normally fetch from exchange)
-        price_usd = None
-        if intent.price is not None:
-            price_usd = float(intent.price)
-        else:
-            # Estimate from symbol (stub - would fetch mark price)
-            if "BTC" in intent.symbol:
-                price_usd = 50000.0
-            elif "ETH" in intent.symbol:
-                price_usd = 3000.0
-            else:
-                price_usd = 1.0  # Fallback
+        # 3. Get price for risk estimation
+        price_usd = self._estimate_price(intent, self.okx_metadata)
         
         # 4. Validate via risk engine
         try:
@@ -0,0 +1,242 @@
+"""
+Exchange market metadata - cached instrument specs and tickers per venue.
+
+Instrument metadata (lot size, tick size, min quantity, min notional) is
+bulk-loaded for the whole venue in one paginated call and refreshed on a
+TTL, so the order path reads it from memory instead of making a REST call per
+symbol. Tickers are fed by the venue's bulk ticker endpoint from a background
+refresher; the order path only reads the cache and treats a ticker older than
+the TTL as unknown (callers then fall back, no request is made).
+
+A failed refresh keeps serving the previous data; a symbol missing from the
+bulk load falls back to the client's single-symbol lookup and is cached.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTS_TTL_SECONDS = 3600.0
+TICKERS_REFRESH_SECONDS = 2.0
+# Tolerate a few missed refreshes before a cached price counts as unknown
+TICKERS_TTL_SECONDS = 10.0
+# Don't re-run a bulk instrument load for unknown symbols more often than this
+MISS_REFRESH_COOLDOWN_SECONDS = 60.0
+
+
+def _dec(value: Any, default: str = "0") -> Decimal:
+    try:
+        if value is None or value == "":
+            return Decimal(default)
+        return Decimal(str(value))
+    except Exception:
+        return Decimal(default)
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """Normalized trading rules for one instrument."""
+    symbol: str
+    qty_step: Decimal
+    min_qty: Decimal
+    tick_size: Decimal
+    min_notional: Decimal
+    raw: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_meta(cls, symbol: str, meta: Dict[str, Any]) -> "InstrumentSpec":
+        """Parse Bybit (lotSizeFilter/priceFilter), OKX (lotSz/minSz/tickSz) or paper (filters) metadata."""
+        if "lotSizeFilter" in meta or "priceFilter" in meta:
+            lot = meta.get("lotSizeFilter", {}) or {}
+            price = meta.get("priceFilter", {}) or {}
+            return cls(
+                symbol=symbol,
+                qty_step=_dec(lot.get("qtyStep"), "1"),
+                min_qty=_dec(lot.get("minOrderQty", lot.get("minQty")), "0"),
+                tick_size=_dec(price.get("tickSize"), "0.01"),
+                min_notional=_dec(lot.get("minNotionalValue"), "0"),
+                raw=meta,
+            )
+        if "lotSz" in meta or "tickSz" in meta:
+            return cls(
+                symbol=symbol,
+                qty_step=_dec(meta.get("lotSz"), "1"),
+                min_qty=_dec(meta.get("minSz"), "0"),
+                tick_size=_dec(meta.get("tickSz"), "0.01"),
+                min_notional=Decimal("0"),
+                raw=meta,
+            )
+        filters = meta.get("filters", {}) or {}
+        lot = filters.get("lotSize", {}) or {}
+        return cls(
+            symbol=symbol,
+            qty_step=_dec(lot.get("stepSize"), "1"),
+            min_qty=_dec(lot.get("minQty"), "0"),
+            tick_size=_dec((filters.get("priceFilter", {}) or {}).get("tickSize"), "0.01"),
+            min_notional=_dec(filters.get("minNotional"), "0"),
+            raw=meta,
+        )
+
+
+class TickerCache:
+    """Short-TTL map of symbol -> ticker dict (last/bid/ask/mark)."""
+
+    def __init__(self, ttl: float = TICKERS_TTL_SECONDS, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self.clock = clock
+        self._tickers: Dict[str, Dict[str, Optional[float]]] = {}
+        self._stamps: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def put_many(self, tickers: Dict[str, Dict[str, Optional[float]]]) -> None:
+        now = self.clock()
+        with self._lock:
+            self._tickers.update(tickers)
+            for symbol in tickers:
+                self._stamps[symbol] = now
+
+    def get(self, symbol: str) -> Optional[Dict[str, Optional[float]]]:
+        """Fresh ticker for symbol, or None if missing or older than the TTL."""
+        with self._lock:
+            stamp = self._stamps.get(symbol)
+            if stamp is None or self.clock() - stamp > self.ttl:
+                return None
+            return self._tickers.get(symbol)
+
+
+class ExchangeMetadataService:
+    """
+    Instrument + ticker cache for one exchange client.
+
+    The client may implement get_all_instruments() -> {symbol: meta} and
+    get_all_tickers() -> {symbol: {"last", "bid", "ask", "mark"}} (see
+    BaseExchange); without them the service falls back to per-symbol calls.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        instruments_ttl: float = INSTRUMENTS_TTL_SECONDS,
+        tickers_ttl: float = TICKERS_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.instruments_ttl = instruments_ttl
+        self.clock = clock
+        self.tickers = TickerCache(ttl=tickers_ttl, clock=clock)
+        self._specs: Dict[str, InstrumentSpec] = {}
+        self._loaded_at: Optional[float] = None
+        self._last_attempt: Optional[float] = None
+        self._lock = threading.Lock()
+        self._ticker_thread: Optional[threading.Thread] = None
+        self._ticker_stop = threading.Event()
+
+    # ---------- Instruments ----------
+
+    def refresh_instruments(self) -> int:
+        """Bulk-load every instrument for the venue; returns the number loaded (0 on failure)."""
+        self._last_attempt = self.clock()
+        try:
+            metas = self.client.get_all_instruments()
+        except Exception as e:
+            logger.warning(f"[META] Bulk instrument load failed for {getattr(self.client, 'name', '?')}: {e}")
+            return 0
+        if not metas:
+            return 0
+        specs = {symbol: InstrumentSpec.from_meta(symbol, meta) for symbol, meta in metas.items()}
+        with self._lock:
+            self._specs = specs
+            self._loaded_at = self.clock()
+        return len(specs)
+
+    def _instruments_stale(self) -> bool:
+        return self._loaded_at is None or self.clock() - self._loaded_at > self.instruments_ttl
+
+    def _attempt_allowed(self) -> bool:
+        return self._last_attempt is None or self.clock() - self._last_attempt > MISS_REFRESH_COOLDOWN_SECONDS
+
+    def get_spec(self, symbol: str) -> InstrumentSpec:
+        """Trading rules for symbol, served from memory when loaded (raises ValueError if unknown)."""
+        if self._instruments_stale() and self._attempt_allowed():
+            self.refresh_instruments()
+        spec = self._specs.get(symbol)
+        if spec is None and self._attempt_allowed():
+            self.refresh_instruments()
+            spec = self._specs.get(symbol)
+        if spec is None:
+            # Not in the bulk listing (or bulk unsupported): single lookup, then cache it
+            meta = self.client.get_instrument_meta(symbol)
+            spec = InstrumentSpec.from_meta(symbol, meta)
+            with self._lock:
+                self._specs[symbol] = spec
+        return spec
+
+    def get_instrument_meta(self, symbol: str) -> Dict[str, Any]:
+        """Raw venue metadata for symbol (same shape as client.get_instrument_meta)."""
+        return self.get_spec(symbol).raw
+
+    # ---------- Tickers ----------
+
+    def refresh_tickers(self) -> int:
+        """Bulk-load tickers for the venue; returns the number loaded (0 on failure)."""
+        try:
+            tickers = self.client.get_all_tickers()
+        except Exception as e:
+            logger.warning(f"[META] Bulk ticker load failed for {getattr(self.client, 'name', '?')}: {e}")
+            return 0
+        if tickers:
+            self.tickers.put_many(tickers)
+        return len(tickers or {})
+
+    def start_ticker_refresh(self, interval: float = TICKERS_REFRESH_SECONDS) -> None:
+        """Refresh tickers every interval seconds on a daemon thread (no-op if already running)."""
+        with self._lock:
+            if self._ticker_thread is not None and self._ticker_thread.is_alive():
+                return
+            self._ticker_stop.clear()
+            self._ticker_thread = threading.Thread(
+                target=self._ticker_loop, args=(interval,), name="ticker-refresh", daemon=True,
+            )
+            self._ticker_thread.start()
+
+    def stop_ticker_refresh(self) -> None:
+        self._ticker_stop.set()
+        thread = self._ticker_thread
+        if thread is not None:
+            thread.join(timeout=5.0)
+
+    def _ticker_loop(self, interval: float) -> None:
+        while not self._ticker_stop.wait(interval):
+            self.refresh_tickers()
+
+    def get_ticker(self, symbol: str) -> Optional[Dict[str, Optional[float]]]:
+        """Cached ticker for symbol, or None if missing or stale (never fetches)."""
+        return self.tickers.get(symbol)
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """Last (or mark) price from the ticker cache, or None if unavailable."""
+        ticker = self.get_ticker(symbol)
+        if not ticker:
+            return None
+        return ticker.get("last") or ticker.get("mark")
+
+    def warm(self, refresh_tickers: bool = True) -> None:
+        """Load instruments and tickers up front, then keep tickers fresh in the background."""
+        self.refresh_instruments()
+        self.refresh_tickers()
+        if refresh_tickers:
+            self.start_ticker_refresh()
+
+
+__all__ = [
+    "ExchangeMetadataService",
+    "InstrumentSpec",
+    "TickerCache",
+]
@@ -19,7 +19,7 @@ import requests
 import base64
 
 from engine_alpha.core.models import ValidatedOrder, TdMode, Venue, OrderType, Side
-from engine_alpha.exchanges.base_exchange import BaseExchange
+from engine_alpha.exchanges.base_exchange import BaseExchange, price_or_none
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +179,37 @@ class OkxClient(BaseExchange):
             raise ValueError(f"Instrument not found on OKX: {symbol}")
         return data[0]
 
+    def get_all_instruments(self) -> Dict[str, Dict[str, Any]]:
+        """Get metadata for all SWAP instruments in one call."""
+        resp = self._request(
+            "GET",
+            "/api/v5/public/instruments",
+            params={"instType": "SWAP"},
+            body=None,
+            auth=False,
+        )
+        return {item["instId"]: item for item in resp.get("data", []) if item.get("instId")}
+
+    def get_all_tickers(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Get last/bid/ask for all SWAP instruments in one call."""
+        resp = self._request(
+            "GET",
+            "/api/v5/market/tickers",
+            params={"instType": "SWAP"},
+            body=None,
+            auth=False,
+        )
+        return {
+            item["instId"]: {
+                "last": price_or_none(item.get("last")),
+                "bid": price_or_none(item.get("bidPx")),
+                "ask": price_or_none(item.get("askPx")),
+                "mark": None,
+            }
+            for item in resp.get("data", [])
+            if item.get("instId")
+        }
+
     # ---------- Internal REST plumbing ----------
 
     def _request(
@@ -15,6 +15,7 @@ from engine_alpha.signals.signal_processor import get_signal_vector, get_signal_
 from engine_alpha.core.confidence_engine import decide, COUNCIL_WEIGHTS, apply_bucket_mask, REGIME_BUCKET_MASK
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.data.market_snapshot import MarketSnapshot, build_market_snapshot, publish_market_snapshot
 from engine_alpha.core.regime import classify_regime
 from engine_alpha.core.profit_amplifier import evaluate as pa_evaluate, risk_multiplier as pa_rmult
 from engine_alpha.core.risk_adapter import evaluate as risk_eval
@@ -841,9 +842,10 @@ def run_step(entry_min_conf: float = 0.70, exit_min_conf: float = 0.30, reverse_
         # Analyze edge strength using recent performance
         if len(recent_trades) >= 10:
             recent_returns = [t["pct"] for t in recent_trades[-30:]]
-            if recent_returns:
-                from engine_alpha.research.pf_timeseries import _compute_pf_for_window
-                current_pf = _compute_pf_for_window(recent_returns)
+            from engine_alpha.research.pf_timeseries import _compute_pf_for_window
+            current_pf = _compute_pf_for_window([(r, 1.0) for r in recent_returns]).pf
+            # PF is undefined without both wins and losses; nothing to analyze yet
+            if current_pf is not None:
                 wins = sum(1 for r in recent_returns if r > 0)
                 win_rate = wins / len(recent_returns)
                 expectancy = sum(recent_returns) / len(recent_returns)
@@ -1144,7 +1146,8 @@ def run_step_live(symbol: str = "ETHUSDT",
                   exit_min_conf: float = 0.30,
                   reverse_min_conf: float = 0.60,
                   bar_ts: str | None = None,
-                  now: Optional[datetime] = None):
+                  now: Optional[datetime] = None,
+                  market_snapshot: Optional[MarketSnapshot] = None):
     """
     Run one step of the trading loop.
 
@@ -1152,6 +1155,8 @@ def run_step_live(symbol: str = "ETHUSDT",
         symbol: Trading symbol (e.g., "ETHUSDT")
         timeframe: Timeframe (e.g., "1h")
         limit: Number of bars to fetch for signals
+        market_snapshot: Per-tick MarketSnapshot; when it covers symbol/timeframe,
+            its bars and signal vector are used instead of fetching again
     """
     print(f"RUN_STEP_LIVE_START: {symbol}_{timeframe}")
     # Phase 51: Anti-Thrash Guardrails - Reset per-bar state
@@ -1196,7 +1201,13 @@ def run_step_live(symbol: str = "ETHUSDT",
 
     # Phase 52.5: Price-based regime detection
     # Get OHLCV rows for price-based regime classification
-    rows = get_live_ohlcv(symbol, timeframe, limit=limit, no_cache=True)
+    symbol_snap = market_snapshot.get(symbol) if market_snapshot is not None else None
+    if symbol_snap is not None and (symbol_snap.timeframe != timeframe or not symbol_snap.bars):
+        symbol_snap = None
+    if symbol_snap is not None:
+        rows = symbol_snap.bar_rows(limit)
+    else:
+        rows, _ = get_live_ohlcv(symbol, timeframe, limit=limit, no_cache=True)
     # Use last 20 bars for regime detection (or all if fewer available)
     window = rows[-20:] if len(rows) >= 20 else rows
     
@@ -1404,7 +1415,10 @@ def run_step_live(symbol: str = "ETHUSDT",
     # Regime is determined purely from price data, same for all modes
 
     try:
-        out = get_signal_vector_live(symbol=symbol, timeframe=timeframe, limit=limit)
+        if symbol_snap is not None and symbol_snap.signal_vector:
+            out = symbol_snap.signal_output()
+        else:
+            out = get_signal_vector_live(symbol=symbol, timeframe=timeframe, limit=limit)
         print(f"SIGNAL_VECTOR_GOT: {symbol} signals={len(out.get('signal_vector', []))}")
         # Pass price-based regime to decide() so council aggregation uses correct regime
         decision = decide(out["signal_vector"], out["raw_registry"], regime_override=price_based_regime)
@@ -2850,13 +2864,40 @@ def run_step_live_scheduled():
 
     print(f"MULTI_SYMBOL_PROCESSING: Processing {len(active_symbols)} symbols: {active_symbols[:5]}{'...' if len(active_symbols) > 5 else ''}")
 
+    # Build the per-tick market snapshot once; lanes (in-process or via mmap) reuse it
+    market_snapshot = None
+    try:
+        market_snapshot = publish_market_snapshot(
+            build_market_snapshot(active_symbols, timeframe=timeframe, limit=200)
+        )
+        print(f"MARKET_SNAPSHOT_PUBLISHED: version={market_snapshot.version} symbols={len(market_snapshot.symbols)}")
+    except Exception as e:
+        print(f"MARKET_SNAPSHOT_ERROR: {e}")
+
+    # Fold the snapshot's new bars into the EW correlation matrix (O(S^2) per new bar)
+    if market_snapshot is not None:
+        try:
+            from engine_alpha.research.correlation_engine import update_from_snapshot
+            update_from_snapshot(market_snapshot)
+        except Exception as e:
+            print(f"CORRELATION_UPDATE_ERROR: {e}")
+
     # Process each active symbol
     for symbol in active_symbols:
         try:
             print(f"PROCESSING_SYMBOL: {symbol}")
             # TEMPORARY: Lower entry threshold for chop regime testing
-            run_step_live(symbol=symbol, timeframe=timeframe, entry_min_conf=0.30)
+            run_step_live(symbol=symbol, timeframe=timeframe, entry_min_conf=0.30, market_snapshot=market_snapshot)
         except Exception as e:
             print(f"ERROR_PROCESSING_SYMBOL: {symbol} - {e}")
             # Continue processing other symbols even if one fails
 
+    # Fold this tick's closes into the PF time-series once per tick (incremental,
+    # reads only new lines, rewrites the report only when it changed)
+    try:
+        from engine_alpha.research.pf_timeseries import compute_pf_timeseries
+        compute_pf_timeseries()
+    except Exception as e:
+        # PF refresh failure shouldn't stop trading
+        print(f"PF_TIMESERIES_REFRESH_ERROR: {e}")
+
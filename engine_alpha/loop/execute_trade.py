@@ -3,6 +3,7 @@ import json, os, time, yaml
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 from datetime import datetime, timezone
+from engine_alpha.core import codec
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.core.config_loader import load_engine_config
 from engine_alpha.risk.symbol_state import load_symbol_states
@@ -259,11 +260,10 @@ def _get_trades_path() -> Path:
 def log_trade_event(event: dict):
     """
     Single source of truth for writing trade events to trades.jsonl.
-    Ensures all events include symbol, timeframe, and version marker.
+    Ensures all events include symbol, timeframe, and version marker
+    (plus ts_ms next to ts, see core/codec.py).
     """
     path = _get_trades_path()
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
     
     # Tag with version marker
     event.setdefault("logger_version", "trades_v2")
@@ -274,8 +274,7 @@ def log_trade_event(event: dict):
     if "timeframe" not in event:
         event["timeframe"] = _get_default_timeframe()
     
-    with path.open("a") as f:
-        f.write(json.dumps(event) + "\n")
+    codec.append_jsonl(path, event)
 
 
 def _append_trade(event: dict):
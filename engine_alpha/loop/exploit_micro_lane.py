@@ -32,6 +32,7 @@ from engine_alpha.risk.exploit_lane_gate import apply_exploit_lane_gate, is_read
 from engine_alpha.loop.position_manager import get_open_position, count_open_positions
 from engine_alpha.loop.execute_trade import open_if_allowed
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.data.market_snapshot import get_symbol_snapshot
 from engine_alpha.signals.signal_processor import get_signal_vector
 from engine_alpha.core.confidence_engine import decide
 
@@ -43,6 +44,7 @@ MICRO_COOLDOWN_SECONDS = 3600  # 1 hour
 MICRO_MIN_WEIGHT = 0.15
 MICRO_REQUIRE_READY_NOW = True
 MICRO_REQUIRE_CAPITAL_MODE_NORMAL = True
+MICRO_TIMEFRAME = "15m"
 
 # Paths
 CAPITAL_PLAN_PATH = REPORTS / "risk" / "capital_plan.json"
@@ -327,7 +329,7 @@ def run_once(reason: str = "scheduled") -> Dict[str, Any]:
     
     # Verify the position still exists in position manager
     if open_micro_pos and open_micro_symbol:
-        existing_pos = get_open_position(symbol=open_micro_symbol, timeframe="15m")
+        existing_pos = get_open_position(symbol=open_micro_symbol, timeframe=MICRO_TIMEFRAME)
         if not existing_pos or existing_pos.get("dir", 0) == 0:
             # Position was closed, clear our state
             state["open_position"] = False
@@ -404,7 +406,7 @@ def run_once(reason: str = "scheduled") -> Dict[str, Any]:
     weight = symbol_data["weight"]
     
     # Check if symbol already has an open position
-    existing_pos = get_open_position(symbol=symbol, timeframe="15m")
+    existing_pos = get_open_position(symbol=symbol, timeframe=MICRO_TIMEFRAME)
     if existing_pos and existing_pos.get("dir", 0) != 0:
         event = MicroLaneEvent(
             ts=ts,
@@ -423,7 +425,13 @@ def run_once(reason: str = "scheduled") -> Dict[str, Any]:
     
     # Get signal for entry decision
     try:
-        signal_result = get_signal_vector(symbol=symbol)
+        # Prefer the live signal vector the main loop already computed this tick
+        # for the lane's timeframe; otherwise fall back to get_signal_vector
+        snap = get_symbol_snapshot(symbol, timeframe=MICRO_TIMEFRAME)
+        if snap is not None and snap.signal_vector:
+            signal_result = snap.signal_output()
+        else:
+            signal_result = get_signal_vector(symbol=symbol)
         decision = decide(signal_result["signal_vector"], signal_result["raw_registry"])
         final = decision.get("final", {})
         direction = final.get("dir", 0)
@@ -471,7 +479,7 @@ def run_once(reason: str = "scheduled") -> Dict[str, Any]:
             entry_min_conf=0.55,
             risk_mult=1.0,
             symbol=symbol,
-            timeframe="15m",
+            timeframe=MICRO_TIMEFRAME,
             exploration_pass=False,
         )
         
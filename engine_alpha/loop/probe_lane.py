@@ -34,6 +34,7 @@ from engine_alpha.loop.exploit_executor_paper import (
 )
 from engine_alpha.loop.exploit_intent import compute_exploit_intent
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.data.market_snapshot import get_snapshot_price
 from engine_alpha.risk.position_sizer import size_notional_usd
 
 # Paths
@@ -449,13 +450,15 @@ def run_probe_lane(now_iso: Optional[str] = None) -> Dict[str, Any]:
         
         # Get current price
         try:
-            rows = get_live_ohlcv(selected_symbol, "15m", limit=1)
-            if not rows:
-                result["action"] = "blocked"
-                result["reason"] = "no_price_data"
-                _append_log(result)
-                return result
-            current_price = float(rows[-1].get("close", 0))
+            current_price = get_snapshot_price(selected_symbol, "15m")
+            if current_price is None:
+                rows, _ = get_live_ohlcv(selected_symbol, "15m", limit=1)
+                if not rows:
+                    result["action"] = "blocked"
+                    result["reason"] = "no_price_data"
+                    _append_log(result)
+                    return result
+                current_price = float(rows[-1].get("close", 0))
             if current_price <= 0:
                 result["action"] = "blocked"
                 result["reason"] = "invalid_price"
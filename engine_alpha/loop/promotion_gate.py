@@ -21,6 +21,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS
 
 # Paths
@@ -107,67 +108,61 @@ def _is_probe_trade(trade: Dict[str, Any]) -> bool:
     )
 
 
+class _ProbeTrades(trade_analytics.Reducer):
+    """(time, trade) of every timestamped probe trade in a trade log."""
+
+    def __init__(self, now: datetime) -> None:
+        super().__init__(now)
+        self.trades: List[Tuple[datetime, Dict[str, Any]]] = []
+
+    def add(self, trade: Dict[str, Any]) -> None:
+        try:
+            ts_str = trade.get("ts") or trade.get("timestamp")
+            if ts_str and _is_probe_trade(trade):
+                self.trades.append((_parse_timestamp(ts_str), trade))
+        except Exception:
+            return
+
+    def result(self) -> List[Tuple[datetime, Dict[str, Any]]]:
+        return self.trades
+
+
+class _ProbeOpens(_ProbeTrades):
+    """(time, synthetic open trade) for every probe lane "opened" entry."""
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        try:
+            ts_str = entry.get("ts")
+            if entry.get("action") == "opened" and ts_str:
+                self.trades.append((_parse_timestamp(ts_str), {
+                    "ts": ts_str,
+                    "event": "open",
+                    "symbol": entry.get("selected_symbol"),
+                    "intent": "probe",
+                    "reason": entry.get("reason", "probe_lane"),
+                }))
+        except Exception:
+            return
+
+
+trade_analytics.register("promotion_gate.probe_trades.exploit", lambda: EXPLOIT_TRADES_PATH, _ProbeTrades)
+trade_analytics.register("promotion_gate.probe_trades.core", lambda: TRADES_PATH, _ProbeTrades)
+trade_analytics.register("promotion_gate.probe_opens", lambda: PROBE_LOG_PATH, _ProbeOpens)
+
+
 def _load_probe_trades(now: datetime, window_days: int = 7) -> List[Dict[str, Any]]:
-    """Load probe trades from trade logs."""
+    """Load probe trades from trade logs (plus probe lane opens)."""
     probe_trades = []
     cutoff = now - timedelta(days=window_days)
-    
-    # Try exploit trades log first (most likely for probe)
-    for log_path in [EXPLOIT_TRADES_PATH, TRADES_PATH]:
-        if not log_path.exists():
-            continue
-        
+
+    # Exploit trades log first (most likely for probe), then core trades, then probe lane opens
+    for name in ("promotion_gate.probe_trades.exploit", "promotion_gate.probe_trades.core", "promotion_gate.probe_opens"):
         try:
-            with log_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        trade = json.loads(line)
-                        ts_str = trade.get("ts") or trade.get("timestamp")
-                        if not ts_str:
-                            continue
-                        
-                        trade_time = _parse_timestamp(ts_str)
-                        if trade_time < cutoff:
-                            continue
-                        
-                        if _is_probe_trade(trade):
-                            probe_trades.append(trade)
-                    except Exception:
-                        continue
+            timed = trade_analytics.reduce(name, now)
         except Exception:
             continue
-    
-    # Also check probe lane log for opened trades
-    if PROBE_LOG_PATH.exists():
-        try:
-            with PROBE_LOG_PATH.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("action") == "opened":
-                            ts_str = entry.get("ts")
-                            if ts_str:
-                                entry_time = _parse_timestamp(ts_str)
-                                if entry_time >= cutoff:
-                                    # Create a synthetic trade entry
-                                    probe_trades.append({
-                                        "ts": ts_str,
-                                        "event": "open",
-                                        "symbol": entry.get("selected_symbol"),
-                                        "intent": "probe",
-                                        "reason": entry.get("reason", "probe_lane"),
-                                    })
-                    except Exception:
-                        continue
-        except Exception:
-            pass
-    
+        probe_trades.extend(trade for trade_time, trade in timed if trade_time >= cutoff)
+
     # Sort by timestamp
     probe_trades.sort(key=lambda t: _parse_timestamp(t.get("ts", "") or t.get("timestamp", "")))
     return probe_trades
@@ -21,8 +21,10 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.data.market_snapshot import get_snapshot_price
 from engine_alpha.loop.execute_trade import open_if_allowed
 from engine_alpha.loop.recovery_intent import compute_recovery_intent
 from engine_alpha.loop.recovery_lane_v2_trades import (
@@ -65,6 +67,10 @@ IS_PAPER_MODE = os.getenv("MODE", "PAPER").upper() == "PAPER"
 
 def _get_current_price(symbol: str, timeframe: str = "15m") -> Optional[float]:
     """Get current price for symbol (robust helper)."""
+    # Per-tick market snapshot (shared with the main loop) avoids a refetch
+    snap_price = get_snapshot_price(symbol, timeframe)
+    if snap_price is not None:
+        return snap_price
     try:
         # Try recovery intent first
         intent_dict = compute_recovery_intent(symbol, timeframe=timeframe)
@@ -96,51 +102,59 @@ def _load_json(path: Path) -> Dict[str, Any]:
         return {}
 
 
+class _RecoveryCloses7d(trade_analytics.Reducer):
+    """Gross profit / loss and count of recovery_v2 closes in the last 7 days."""
+
+    def __init__(self, now: datetime) -> None:
+        super().__init__(now)
+        self.cutoff = now - timedelta(days=7)
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.n = 0
+
+    def add(self, evt: Dict[str, Any]) -> None:
+        if (evt.get("type") or "").lower() != "close":
+            return
+        tk = (evt.get("trade_kind") or evt.get("strategy") or "").lower()
+        if tk != "recovery_v2":
+            return
+        ts = evt.get("ts") or evt.get("timestamp")
+        if not ts:
+            return
+        try:
+            ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc)
+        except Exception:
+            return
+        if ts_dt < self.cutoff:
+            return
+        pct = evt.get("pct")
+        if pct is None:
+            pct = evt.get("pnl_pct")
+        try:
+            pct_val = float(pct)
+        except Exception:
+            pct_val = 0.0
+        self.n += 1
+        if pct_val >= 0:
+            self.gross_profit += pct_val
+        else:
+            self.gross_loss += abs(pct_val)
+
+    def result(self) -> tuple[float, float, int]:
+        return self.gross_profit, self.gross_loss, self.n
+
+
+trade_analytics.register("recovery_lane_v2.closes_7d", lambda: TRADES_PATH, _RecoveryCloses7d)
+
+
 def _compute_recovery_pf_7d(now: Optional[datetime] = None) -> tuple[Optional[float], int]:
     """
     Compute PF over recovery_v2 closes in the last 7 days.
     PF = gross_profit / gross_loss (loss as positive). If loss==0 and profit>0 -> inf.
     """
     now = now or datetime.now(timezone.utc)
-    cutoff = now - timedelta(days=7)
-    gross_profit = 0.0
-    gross_loss = 0.0
-    n = 0
-    if not TRADES_PATH.exists():
-        return None, 0
     try:
-        with TRADES_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    evt = json.loads(line)
-                except Exception:
-                    continue
-                if (evt.get("type") or "").lower() != "close":
-                    continue
-                tk = (evt.get("trade_kind") or evt.get("strategy") or "").lower()
-                if tk != "recovery_v2":
-                    continue
-                ts = evt.get("ts") or evt.get("timestamp")
-                if not ts:
-                    continue
-                try:
-                    ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc)
-                except Exception:
-                    continue
-                if ts_dt < cutoff:
-                    continue
-                pct = evt.get("pct")
-                if pct is None:
-                    pct = evt.get("pnl_pct")
-                try:
-                    pct_val = float(pct)
-                except Exception:
-                    pct_val = 0.0
-                n += 1
-                if pct_val >= 0:
-                    gross_profit += pct_val
-                else:
-                    gross_loss += abs(pct_val)
+        gross_profit, gross_loss, n = trade_analytics.reduce("recovery_lane_v2.closes_7d", now)
     except Exception:
         return None, 0
 
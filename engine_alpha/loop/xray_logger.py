@@ -7,11 +7,10 @@ for real-time introspection of trading decisions.
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from engine_alpha.core import codec
 from engine_alpha.core.paths import REPORTS
 
 XRAY_DIR = REPORTS / "xray"
@@ -66,8 +65,10 @@ def write_xray_snapshot(
     """
     _ensure_xray_dir()  # Ensure directory exists before writing
     
-    snapshot = {
-        "ts": datetime.now(timezone.utc).isoformat(),
+    ts, ts_ms = codec.now_iso_ms()
+    snapshot: codec.XrayEvent = {
+        "ts": ts,
+        "ts_ms": ts_ms,
         "symbol": symbol,
         "timeframe": timeframe,
         "bar_ts": bar_ts,
@@ -97,17 +98,17 @@ def write_xray_snapshot(
     
     # Append to X-ray log
     try:
-        with XRAY_PATH.open("a") as f:
-            f.write(json.dumps(snapshot) + "\n")
+        with XRAY_PATH.open("ab") as f:
+            f.write(codec.dumps_line(snapshot))
         
         # Rotate if file gets too large (keep last N lines)
         try:
-            with XRAY_PATH.open("r") as f:
+            with XRAY_PATH.open("r", encoding="utf-8") as f:
                 lines = f.readlines()
             if len(lines) > MAX_XRAY_LINES:
                 # Keep last MAX_XRAY_LINES entries
                 keep_lines = lines[-MAX_XRAY_LINES:]
-                with XRAY_PATH.open("w") as f:
+                with XRAY_PATH.open("w", encoding="utf-8") as f:
                     f.writelines(keep_lines)
         except Exception:
             pass  # Non-critical: rotation failed, continue
@@ -129,7 +130,7 @@ def load_recent_xray(limit: int = 200) -> list[Dict[str, Any]]:
         return []
     
     try:
-        with XRAY_PATH.open("r") as f:
+        with XRAY_PATH.open("r", encoding="utf-8") as f:
             lines = f.readlines()[-limit:]
         
         entries = []
@@ -138,7 +139,7 @@ def load_recent_xray(limit: int = 200) -> list[Dict[str, Any]]:
             if not line:
                 continue
             try:
-                entry = json.loads(line)
+                entry = codec.loads(line)
                 entries.append(entry)
             except Exception:
                 continue
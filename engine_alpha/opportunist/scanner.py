@@ -2,18 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import requests
 
 from engine_alpha.core.paths import REPORTS
 from engine_alpha.data.live_prices import get_live_ohlcv
 from engine_alpha.opportunist.universe_manager import (
     get_active_universe,
-    update_universe_stats,
+    update_universe_stats_batch,
 )
 
 BYBIT_BASE_URL = "https://api.bybit.com"
@@ -22,6 +24,12 @@ OPPORTUNIST_DIR.mkdir(parents=True, exist_ok=True)
 
 EXCLUDED_SUBSTRINGS = ("UPUSDT", "DOWNUSDT", "BEARUSDT", "BULLUSDT", "3LUSDT", "3SUSDT")
 
+# Bars a symbol needs to be scored; scoring reads the last SCORE_WINDOW bars
+MIN_BARS = 8
+SCORE_WINDOW = 7
+# Concurrent kline fetches (bounded so a large universe does not trip rate limits)
+DEFAULT_MAX_WORKERS = 16
+
 _logger = logging.getLogger("opportunist.scanner")
 
 
@@ -125,38 +133,112 @@ def _rows_to_numeric(rows: List[Dict[str, float]]) -> List[Dict[str, float]]:
     return numeric_rows
 
 
-def _compute_candidate(symbol: str, timeframe: str, limit: int) -> Optional[Candidate]:
-    rows = get_live_ohlcv(symbol, timeframe, limit=limit, no_cache=True)
-    if len(rows) < 8:
-        return None
-    numeric_rows = _rows_to_numeric(rows)
-    if len(numeric_rows) < 8:
-        return None
-    closes = [r["close"] for r in numeric_rows]
-    volumes = [r["volume"] for r in numeric_rows]
-
-    pct_change_15m = _safe_pct_change(closes[-1], closes[-2])
-    pct_change_1h = _safe_pct_change(closes[-1], closes[-5])
-    atr_rel = _compute_atr_rel(numeric_rows, period=6)
-    liquidity_usd = closes[-1] * volumes[-1]
-    volume_ratio = _compute_volume_ratio(volumes)
+def _fetch_numeric_rows(symbol: str, timeframe: str, limit: int) -> List[Dict[str, float]]:
+    rows, _ = get_live_ohlcv(symbol, timeframe, limit=limit, no_cache=True)
+    if not rows or len(rows) < MIN_BARS:
+        return []
+    return _rows_to_numeric(rows)
+
+
+def fetch_universe_rows(
+    symbols: List[str],
+    timeframe: str,
+    limit: int = 32,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, List[Dict[str, float]]]:
+    """
+    Fetch klines for every symbol through a bounded thread pool.
+
+    Symbols whose fetch fails or returns too few bars are left out (and logged).
+    """
+    if not symbols:
+        return {}
+
+    def _fetch(symbol: str) -> List[Dict[str, float]]:
+        try:
+            return _fetch_numeric_rows(symbol, timeframe, limit)
+        except Exception as exc:
+            _logger.warning("Opportunist scanner fetch failed for %s: %r", symbol, exc)
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+        fetched = list(pool.map(_fetch, symbols))
+    rows_by_symbol = {sym: rows for sym, rows in zip(symbols, fetched) if len(rows) >= MIN_BARS}
+    dropped = [sym for sym in symbols if sym not in rows_by_symbol]
+    if dropped:
+        _logger.info(
+            "Opportunist scanner dropped %s/%s symbols without %s usable bars: %s",
+            len(dropped), len(symbols), MIN_BARS, ", ".join(dropped[:20]) + (" ..." if len(dropped) > 20 else ""),
+        )
+    return rows_by_symbol
+
+
+def _pct_change(new: np.ndarray, old: np.ndarray) -> np.ndarray:
+    return np.divide(new - old, old, out=np.zeros_like(new), where=old != 0)
+
+
+def score_candidates(rows_by_symbol: Dict[str, List[Dict[str, float]]]) -> List[Candidate]:
+    """
+    Score every symbol in one vectorized pass over its last SCORE_WINDOW bars.
+
+    Same metrics as the per-row helpers (_safe_pct_change, _compute_atr_rel
+    with period 6, _compute_volume_ratio); sums are accumulated left to right
+    so scores match them exactly.
+    """
+    symbols = [sym for sym, rows in rows_by_symbol.items() if len(rows) >= MIN_BARS]
+    if not symbols:
+        return []
+    window = np.array(
+        [
+            [(r["high"], r["low"], r["close"], r["volume"]) for r in rows_by_symbol[sym][-SCORE_WINDOW:]]
+            for sym in symbols
+        ],
+        dtype=float,
+    )
+    high, low, close, volume = window[:, :, 0], window[:, :, 1], window[:, :, 2], window[:, :, 3]
+    last_close = close[:, -1]
+
+    pct_change_15m = _pct_change(last_close, close[:, -2])
+    pct_change_1h = _pct_change(last_close, close[:, -5])
+
+    # ATR over the last 6 bars (true range uses the previous close)
+    prev_close = close[:, :-1]
+    true_range = np.maximum(
+        high[:, 1:] - low[:, 1:],
+        np.maximum(np.abs(high[:, 1:] - prev_close), np.abs(low[:, 1:] - prev_close)),
+    )
+    atr = np.cumsum(true_range, axis=1)[:, -1] / true_range.shape[1]
+    atr_rel = np.divide(atr, last_close, out=np.zeros_like(atr), where=last_close > 0)
+
+    liquidity_usd = last_close * volume[:, -1]
+    avg_prior = np.cumsum(volume[:, -5:-1], axis=1)[:, -1] / 4
+    volume_ratio = np.divide(volume[:, -1], avg_prior, out=np.zeros_like(avg_prior), where=avg_prior != 0)
 
     impulse_score = (
-        abs(pct_change_15m) * 0.6
-        + abs(pct_change_1h) * 0.3
-        + max(0.0, volume_ratio - 1.0) * 0.05
+        np.abs(pct_change_15m) * 0.6
+        + np.abs(pct_change_1h) * 0.3
+        + np.maximum(0.0, volume_ratio - 1.0) * 0.05
         + atr_rel * 0.25
     )
 
-    return Candidate(
-        symbol=symbol,
-        pct_change_15m=pct_change_15m,
-        pct_change_1h=pct_change_1h,
-        atr_rel=atr_rel,
-        liquidity_usd=liquidity_usd,
-        volume_ratio=volume_ratio,
-        impulse_score=impulse_score,
-    )
+    return [
+        Candidate(
+            symbol=sym,
+            pct_change_15m=float(pct_change_15m[i]),
+            pct_change_1h=float(pct_change_1h[i]),
+            atr_rel=float(atr_rel[i]),
+            liquidity_usd=float(liquidity_usd[i]),
+            volume_ratio=float(volume_ratio[i]),
+            impulse_score=float(impulse_score[i]),
+        )
+        for i, sym in enumerate(symbols)
+    ]
+
+
+def _compute_candidate(symbol: str, timeframe: str, limit: int) -> Optional[Candidate]:
+    numeric_rows = _fetch_numeric_rows(symbol, timeframe, limit)
+    scored = score_candidates({symbol: numeric_rows})
+    return scored[0] if scored else None
 
 
 def scan_opportunist_candidates(
@@ -165,31 +247,34 @@ def scan_opportunist_candidates(
     min_liquidity_usd: float = 100_000.0,
     top_n: int = 3,
     exclude_symbols: Optional[List[str]] = None,
+    max_symbols: int = 80,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> Dict[str, object]:
     """
     Scan the Bybit USDT spot universe and return the strongest movers.
+
+    Klines are fetched concurrently (max_workers), scored in one vectorized
+    pass, and the universe state is updated with a single atomic write.
     """
-    exclude_symbols = [s.upper() for s in (exclude_symbols or [])]
-    universe = _resolve_symbol_universe()
-    candidates: List[Candidate] = []
-    for symbol in universe:
-        if symbol in exclude_symbols:
-            continue
-        try:
-            candidate = _compute_candidate(symbol, timeframe, limit=32)
-        except Exception:
-            continue
-        if not candidate:
-            continue
-        if candidate.liquidity_usd < min_liquidity_usd:
-            continue
-        update_universe_stats(
-            candidate.symbol,
-            realized_vol_15m=abs(candidate.pct_change_15m),
-            realized_vol_1h=abs(candidate.pct_change_1h),
-            liquidity_usd=candidate.liquidity_usd,
-        )
-        candidates.append(candidate)
+    exclude = {s.upper() for s in (exclude_symbols or [])}
+    universe = _resolve_symbol_universe(max_symbols=max_symbols)
+    rows_by_symbol = fetch_universe_rows(
+        [symbol for symbol in universe if symbol not in exclude],
+        timeframe,
+        limit=32,
+        max_workers=max_workers,
+    )
+    candidates = [c for c in score_candidates(rows_by_symbol) if c.liquidity_usd >= min_liquidity_usd]
+    update_universe_stats_batch(
+        {
+            c.symbol: {
+                "realized_vol_15m": abs(c.pct_change_15m),
+                "realized_vol_1h": abs(c.pct_change_1h),
+                "liquidity_usd": c.liquidity_usd,
+            }
+            for c in candidates
+        }
+    )
 
     candidates.sort(key=lambda c: c.impulse_score, reverse=True)
     selected = candidates[:top_n]
@@ -234,6 +319,8 @@ def _resolve_symbol_universe(max_symbols: int = 80) -> List[str]:
 __all__ = [
     "Candidate",
     "fetch_bybit_spot_usdt_symbols",
+    "fetch_universe_rows",
     "scan_opportunist_candidates",
+    "score_candidates",
 ]
 
@@ -4,8 +4,9 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.core.paths import CONFIG, REPORTS
 
 _OPPORTUNIST_DIR = REPORTS / "opportunist"
@@ -91,7 +92,7 @@ def save_universe_state(entries: Dict[str, UniverseEntry]) -> None:
             for symbol, entry in entries.items()
         },
     }
-    UNIVERSE_STATE_PATH.write_text(json.dumps(snapshot, indent=2))
+    atomic_write_json(UNIVERSE_STATE_PATH, snapshot)
 
 
 def get_active_universe(max_symbols: int = 50) -> List[str]:
@@ -130,25 +131,44 @@ def update_universe_stats(
     realized_vol_1h: float,
     liquidity_usd: float,
 ) -> None:
+    update_universe_stats_batch(
+        {
+            symbol: {
+                "realized_vol_15m": realized_vol_15m,
+                "realized_vol_1h": realized_vol_1h,
+                "liquidity_usd": liquidity_usd,
+            }
+        }
+    )
+
+
+def update_universe_stats_batch(updates: Mapping[str, Mapping[str, float]]) -> None:
+    """
+    Apply per-symbol stat updates (realized_vol_15m, realized_vol_1h, liquidity_usd)
+    with one state load and one atomic write.
+    """
+    if not updates:
+        return
     entries = load_universe_state()
     now = datetime.now(timezone.utc).isoformat()
-    entry = entries.get(symbol)
-    if entry is None:
-        entry = UniverseEntry(
-            symbol=symbol,
-            realized_vol_15m=0.0,
-            realized_vol_1h=0.0,
-            avg_liquidity_usd=0.0,
-            last_seen_ts=now,
-            active=True,
-        )
     alpha = 0.3
-    entry.realized_vol_15m = (1 - alpha) * entry.realized_vol_15m + alpha * max(realized_vol_15m, 0.0)
-    entry.realized_vol_1h = (1 - alpha) * entry.realized_vol_1h + alpha * max(realized_vol_1h, 0.0)
-    entry.avg_liquidity_usd = (1 - alpha) * entry.avg_liquidity_usd + alpha * max(liquidity_usd, 0.0)
-    entry.last_seen_ts = now
-    entry.active = True
-    entries[symbol] = entry
+    for symbol, stats in updates.items():
+        entry = entries.get(symbol)
+        if entry is None:
+            entry = UniverseEntry(
+                symbol=symbol,
+                realized_vol_15m=0.0,
+                realized_vol_1h=0.0,
+                avg_liquidity_usd=0.0,
+                last_seen_ts=now,
+                active=True,
+            )
+        entry.realized_vol_15m = (1 - alpha) * entry.realized_vol_15m + alpha * max(stats["realized_vol_15m"], 0.0)
+        entry.realized_vol_1h = (1 - alpha) * entry.realized_vol_1h + alpha * max(stats["realized_vol_1h"], 0.0)
+        entry.avg_liquidity_usd = (1 - alpha) * entry.avg_liquidity_usd + alpha * max(stats["liquidity_usd"], 0.0)
+        entry.last_seen_ts = now
+        entry.active = True
+        entries[symbol] = entry
     save_universe_state(entries)
 
 
@@ -159,5 +179,6 @@ __all__ = [
     "load_universe_state",
     "save_universe_state",
     "update_universe_stats",
+    "update_universe_stats_batch",
 ]
 
@@ -0,0 +1,468 @@
+"""
+Counterfactual Engine - bar-level forward-path simulation for CounterfactualLedger
+
+Resolves recorded decisions against cached OHLCV:
+- Forward paths for many decisions are evaluated at once (N x H arrays built
+  with a sliding window over the bar series)
+- Configurable horizons and exit rules (take-profit / stop-loss / time stop)
+- Decisions are indexed by (symbol, ts) with file offsets, so lookups are a
+  binary search instead of a full ledger rescan
+- A whole day of decisions can be batch-resolved (nightly)
+
+Returns are fractional (0.01 = +1%), direction-adjusted. Decisions with
+direction 0 (skips / holds) are evaluated as a passive long, i.e. the plain
+market move they sat out.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from engine_alpha.core import codec
+from engine_alpha.core.paths import DATA
+from engine_alpha.core.timeframe_utils import timeframe_to_seconds
+
+OHLCV_DIR = DATA / "ohlcv"
+LIVE_BARS_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class ExitRules:
+    """Forward evaluation rules for a counterfactual position."""
+    horizons: Tuple[int, ...] = (4, 16, 60)  # bars
+    take_profit_pct: Optional[float] = 0.02
+    stop_loss_pct: Optional[float] = 0.01
+    max_bars: int = 60  # time stop
+
+    @property
+    def window(self) -> int:
+        return max([self.max_bars, *self.horizons])
+
+
+@dataclass(frozen=True)
+class BarSeries:
+    """OHLCV bars as parallel arrays (ts = bar open, epoch seconds, ascending)."""
+    symbol: str
+    timeframe: str
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @classmethod
+    def from_rows(cls, symbol: str, timeframe: str, rows: Sequence[Dict[str, Any]]) -> "BarSeries":
+        parsed = []
+        for row in rows:
+            ts = _row_epoch(row)
+            if ts is None:
+                continue
+            try:
+                parsed.append((ts, float(row["open"]), float(row["high"]), float(row["low"]), float(row["close"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+        parsed.sort(key=lambda r: r[0])
+        arr = np.array(parsed, dtype=float).reshape(-1, 5)
+        return cls(symbol, timeframe, arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3], arr[:, 4])
+
+    def bar_index(self, ts_seconds: Sequence[float]) -> np.ndarray:
+        """
+        Index of the last bar that had closed at each timestamp (-1 if none).
+
+        A decision at time t is filled at the close of the latest completed bar.
+        """
+        tf_s = timeframe_to_seconds(self.timeframe) or 0
+        closes_at = self.ts + tf_s
+        return np.searchsorted(closes_at, np.asarray(ts_seconds, dtype=float), side="right") - 1
+
+
+def _row_epoch(row: Dict[str, Any]) -> Optional[float]:
+    raw = row.get("ts") or row.get("timestamp") or row.get("open_time") or row.get("t")
+    if raw is None:
+        return None
+    if isinstance(raw, (int, float)):
+        return float(raw) / 1000.0 if raw > 1e11 else float(raw)
+    try:
+        return _to_epoch(raw)
+    except ValueError:
+        return None
+
+
+def _to_epoch(ts: Any) -> float:
+    if isinstance(ts, datetime):
+        dt = ts
+    else:
+        dt = datetime.fromisoformat(str(ts).strip().replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _forward(values: np.ndarray, idx: np.ndarray, n: int) -> np.ndarray:
+    """Rows idx+1 .. idx+n of values for each idx (NaN past the end)."""
+    padded = np.concatenate([values, np.full(n, np.nan)])
+    return sliding_window_view(padded, n + 1)[idx][:, 1:]
+
+
+def simulate_forward_paths(
+    series: BarSeries,
+    entry_idx: Sequence[int],
+    directions: Sequence[int],
+    rules: ExitRules = ExitRules(),
+    entry_prices: Optional[Sequence[Optional[float]]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate forward paths for many entries at once.
+
+    Args:
+        series: Bar series
+        entry_idx: Bar index each position is entered at (close of that bar)
+        directions: 1=long, -1=short, 0=passive long
+        rules: Horizons and exit rules
+        entry_prices: Optional entry price overrides (None/NaN = bar close)
+
+    Returns:
+        Dict of arrays (length N unless noted):
+            horizon_returns (N x len(horizons)), exit_return, exit_bars,
+            exit_reason ("tp" / "sl" / "time" / "no_data"), mfe, mae
+    """
+    idx = np.asarray(entry_idx, dtype=int)
+    sign = np.where(np.asarray(directions, dtype=int) < 0, -1.0, 1.0)
+    n = rules.window
+    k = len(idx)
+
+    entry = series.close[idx].astype(float) if k else np.zeros(0)
+    if entry_prices is not None:
+        override = np.array([np.nan if p is None else float(p) for p in entry_prices], dtype=float)
+        entry = np.where(np.isfinite(override) & (override > 0), override, entry)
+
+    closes = _forward(series.close, idx, n) if k else np.zeros((0, n))
+    highs = _forward(series.high, idx, n) if k else np.zeros((0, n))
+    lows = _forward(series.low, idx, n) if k else np.zeros((0, n))
+
+    e = entry[:, None]
+    close_ret = (closes / e - 1.0) * sign[:, None]
+    # Favorable / adverse excursion per bar in the position's direction
+    fav = np.where(sign[:, None] > 0, highs / e - 1.0, 1.0 - lows / e)
+    adv = np.where(sign[:, None] > 0, lows / e - 1.0, 1.0 - highs / e)
+
+    horizon_returns = np.stack(
+        [close_ret[:, h - 1] if 0 < h <= n else np.full(k, np.nan) for h in rules.horizons], axis=1
+    ) if rules.horizons else np.zeros((k, 0))
+
+    m = rules.max_bars
+    available = np.minimum(np.sum(np.isfinite(closes[:, :m]), axis=1), m)
+    never = m  # sentinel: rule not hit inside the window
+
+    def _first_hit(mask: np.ndarray) -> np.ndarray:
+        hit = mask[:, :m]
+        return np.where(hit.any(axis=1), hit.argmax(axis=1), never)
+
+    with np.errstate(invalid="ignore"):
+        tp_bar = _first_hit(fav >= rules.take_profit_pct) if rules.take_profit_pct is not None else np.full(k, never)
+        sl_bar = _first_hit(adv <= -rules.stop_loss_pct) if rules.stop_loss_pct is not None else np.full(k, never)
+
+    last_bar = np.maximum(available - 1, 0)
+    time_ret = close_ret[np.arange(k), last_bar] if k else np.zeros(0)
+    # Stop wins ties: intra-bar ordering is unknown, so be conservative
+    is_sl = (sl_bar < never) & (sl_bar <= tp_bar)
+    is_tp = (tp_bar < never) & ~is_sl
+    no_data = available == 0
+
+    exit_return = np.where(
+        is_sl, -(rules.stop_loss_pct or 0.0),
+        np.where(is_tp, rules.take_profit_pct or 0.0, time_ret),
+    )
+    exit_bars = np.where(is_sl, sl_bar + 1, np.where(is_tp, tp_bar + 1, available))
+    exit_reason = np.where(no_data, "no_data", np.where(is_sl, "sl", np.where(is_tp, "tp", "time")))
+    exit_return = np.where(no_data, np.nan, exit_return)
+
+    window_mask = np.arange(n)[None, :] < available[:, None]
+    with np.errstate(invalid="ignore"):
+        mfe = np.where(no_data, np.nan, np.nanmax(np.where(window_mask, fav, -np.inf), axis=1, initial=-np.inf))
+        mae = np.where(no_data, np.nan, np.nanmin(np.where(window_mask, adv, np.inf), axis=1, initial=np.inf))
+
+    return {
+        "entry_price": entry,
+        "horizon_returns": horizon_returns,
+        "exit_return": exit_return,
+        "exit_bars": exit_bars,
+        "exit_reason": exit_reason,
+        "mfe": mfe,
+        "mae": mae,
+    }
+
+
+_SERIES_CACHE: Dict[Tuple[str, str], Tuple[Any, BarSeries]] = {}
+
+
+def load_bar_series(symbol: str, timeframe: str = "15m") -> Optional[BarSeries]:
+    """
+    Cached OHLCV for a symbol: merged / historical CSV under data/ohlcv,
+    falling back to the live feed. CSV series are revalidated on file mtime.
+    """
+    from engine_alpha.data.historical_prices import load_ohlcv_csv
+
+    key = (symbol, timeframe)
+    for name in (f"{symbol}_{timeframe}_merged.csv", f"{symbol}_{timeframe}_2019_2025.csv"):
+        path = OHLCV_DIR / name
+        if not path.exists():
+            continue
+        stamp = ("csv", path.stat().st_mtime_ns)
+        cached = _SERIES_CACHE.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        try:
+            series = BarSeries.from_rows(symbol, timeframe, load_ohlcv_csv(symbol, timeframe, csv_path=str(path)))
+        except Exception:
+            continue
+        if len(series):
+            _SERIES_CACHE[key] = (stamp, series)
+            return series
+
+    cached = _SERIES_CACHE.get(key)
+    if cached and cached[0][0] == "live" and time.monotonic() - cached[0][1] < LIVE_BARS_TTL_SECONDS:
+        return cached[1]
+    try:
+        from engine_alpha.data.live_prices import LIVE_MAX_BARS, get_live_ohlcv
+        # One live request: only the last LIVE_MAX_BARS bars are covered without a cached CSV
+        rows, _ = get_live_ohlcv(symbol, timeframe, limit=LIVE_MAX_BARS)
+    except Exception:
+        return None
+    series = BarSeries.from_rows(symbol, timeframe, rows or [])
+    if not len(series):
+        return None
+    _SERIES_CACHE[key] = (("live", time.monotonic()), series)
+    return series
+
+
+def resolve_decisions(
+    decisions: Sequence[Dict[str, Any]],
+    rules: ExitRules = ExitRules(),
+    timeframe: str = "15m",
+    loader=load_bar_series,
+) -> List[Dict[str, Any]]:
+    """
+    Batch-resolve decision records (ledger "decision" dicts) against OHLCV.
+
+    Decisions are grouped per symbol and each group is evaluated in one
+    vectorized pass. Decisions without bar coverage get exit_reason "no_data".
+    """
+    by_symbol: Dict[str, List[int]] = {}
+    for i, rec in enumerate(decisions):
+        by_symbol.setdefault(rec.get("symbol", ""), []).append(i)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(decisions)
+    for symbol, positions in by_symbol.items():
+        series = loader(symbol, timeframe) if symbol else None
+        recs = [decisions[p] for p in positions]
+        if series is None or not len(series):
+            for p, rec in zip(positions, recs):
+                results[p] = _empty_result(rec, rules, "no_data")
+            continue
+
+        ts = np.array([_to_epoch(r["ts"]) for r in recs], dtype=float)
+        idx = series.bar_index(ts)
+        valid = idx >= 0
+        paths = simulate_forward_paths(
+            series,
+            idx[valid],
+            [int(r.get("direction", 0) or 0) for r, v in zip(recs, valid) if v],
+            rules,
+            [r.get("entry_price") for r, v in zip(recs, valid) if v],
+        )
+        j = 0
+        for p, rec, ok in zip(positions, recs, valid):
+            if not ok:
+                results[p] = _empty_result(rec, rules, "no_data")
+                continue
+            results[p] = {
+                "type": "cf_resolution",
+                "decision_ts": rec["ts"],
+                "symbol": symbol,
+                "direction": rec.get("direction", 0),
+                "decision_type": rec.get("decision_type"),
+                "regime": rec.get("regime"),
+                "confidence": rec.get("confidence"),
+                "entry_price": _num(paths["entry_price"][j]),
+                "horizon_returns": {
+                    str(h): _num(paths["horizon_returns"][j, c]) for c, h in enumerate(rules.horizons)
+                },
+                "exit_return": _num(paths["exit_return"][j]),
+                "exit_bars": int(paths["exit_bars"][j]),
+                "exit_reason": str(paths["exit_reason"][j]),
+                "mfe": _num(paths["mfe"][j]),
+                "mae": _num(paths["mae"][j]),
+            }
+            j += 1
+    return [r for r in results if r is not None]
+
+
+def market_return(symbol: str, start_ts: datetime, end_ts: datetime,
+                  timeframe: str = "15m", loader=load_bar_series) -> Optional[float]:
+    """Passive (long) market return between the bars closed at start_ts and end_ts."""
+    series = loader(symbol, timeframe)
+    if series is None or not len(series):
+        return None
+    i0, i1 = series.bar_index([_to_epoch(start_ts), _to_epoch(end_ts)])
+    if i0 < 0 or i1 < i0:
+        return None
+    return float(series.close[i1] / series.close[i0] - 1.0)
+
+
+def _num(x: Any) -> Optional[float]:
+    x = float(x)
+    return x if np.isfinite(x) else None
+
+
+def _empty_result(rec: Dict[str, Any], rules: ExitRules, reason: str) -> Dict[str, Any]:
+    return {
+        "type": "cf_resolution",
+        "decision_ts": rec.get("ts"),
+        "symbol": rec.get("symbol"),
+        "direction": rec.get("direction", 0),
+        "decision_type": rec.get("decision_type"),
+        "regime": rec.get("regime"),
+        "confidence": rec.get("confidence"),
+        "entry_price": rec.get("entry_price"),
+        "horizon_returns": {str(h): None for h in rules.horizons},
+        "exit_return": None,
+        "exit_bars": 0,
+        "exit_reason": reason,
+        "mfe": None,
+        "mae": None,
+    }
+
+
+@dataclass
+class DecisionIndex:
+    """
+    (symbol, ts) index over the "decision" records of a ledger JSONL.
+
+    Keeps per-symbol sorted timestamps with byte offsets into the file and
+    extends itself incrementally from the last indexed offset, so each lookup
+    is a binary search plus one seek.
+    """
+    ledger_file: Path
+    _ts: Dict[str, List[float]] = field(default_factory=dict, init=False, repr=False)
+    _entries: Dict[str, List[Tuple[int, str]]] = field(default_factory=dict, init=False, repr=False)
+    _offset: int = field(default=0, init=False, repr=False)
+
+    def refresh(self) -> None:
+        """Index records appended since the last refresh (rebuild if the file shrank)."""
+        if not self.ledger_file.exists():
+            self._reset()
+            return
+        size = self.ledger_file.stat().st_size
+        if size < self._offset:
+            self._reset()
+        if size == self._offset:
+            return
+        with self.ledger_file.open("rb") as f:
+            f.seek(self._offset)
+            while True:
+                pos = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if not line.endswith(b"\n"):
+                    # Partial trailing write; pick it up next refresh
+                    f.seek(pos)
+                    break
+                if b'"decision"' not in line:
+                    continue
+                try:
+                    record = codec.loads(line)
+                    if record.get("type") != "decision":
+                        continue
+                    ms = codec.ts_ms_of(record, "ts")
+                    if ms is None:
+                        continue
+                    self._insert(record["symbol"], ms / 1000.0, pos, record.get("decision_type", ""))
+                except (KeyError, ValueError):
+                    continue
+            self._offset = f.tell()
+
+    def _reset(self) -> None:
+        self._ts.clear()
+        self._entries.clear()
+        self._offset = 0
+
+    def _insert(self, symbol: str, ts: float, offset: int, decision_type: str) -> None:
+        ts_list = self._ts.setdefault(symbol, [])
+        entries = self._entries.setdefault(symbol, [])
+        if not ts_list or ts >= ts_list[-1]:
+            ts_list.append(ts)
+            entries.append((offset, decision_type))
+        else:
+            i = bisect.bisect_right(ts_list, ts)
+            ts_list.insert(i, ts)
+            entries.insert(i, (offset, decision_type))
+
+    def _read(self, offset: int) -> Optional[Dict[str, Any]]:
+        try:
+            with self.ledger_file.open("rb") as f:
+                f.seek(offset)
+                return codec.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    def latest(self, symbol: str, before: datetime, since: Optional[datetime] = None,
+               decision_types: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """Most recent decision record for symbol with since <= ts <= before."""
+        self.refresh()
+        ts_list = self._ts.get(symbol)
+        if not ts_list:
+            return None
+        types = set(decision_types) if decision_types is not None else None
+        lo = _to_epoch(since) if since is not None else float("-inf")
+        i = bisect.bisect_right(ts_list, _to_epoch(before)) - 1
+        entries = self._entries[symbol]
+        while i >= 0 and ts_list[i] >= lo:
+            offset, dtype = entries[i]
+            if types is None or dtype in types:
+                return self._read(offset)
+            i -= 1
+        return None
+
+    def range(self, start: datetime, end: datetime, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Decision records with start <= ts < end (one symbol or all), oldest first."""
+        self.refresh()
+        lo, hi = _to_epoch(start), _to_epoch(end)
+        hits: List[Tuple[float, int]] = []
+        for sym in ([symbol] if symbol else list(self._ts)):
+            ts_list = self._ts.get(sym, [])
+            a = bisect.bisect_left(ts_list, lo)
+            b = bisect.bisect_left(ts_list, hi)
+            hits.extend((ts_list[i], self._entries[sym][i][0]) for i in range(a, b))
+        hits.sort()
+        if not hits:
+            return []
+        records = []
+        with self.ledger_file.open("rb") as f:
+            for _, offset in hits:
+                f.seek(offset)
+                try:
+                    records.append(codec.loads(f.readline()))
+                except ValueError:
+                    continue
+        return records
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._ts.values())
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
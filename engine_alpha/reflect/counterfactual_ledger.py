@@ -14,19 +14,32 @@ beyond just participating in market movements.
 
 from __future__ import annotations
 from typing import Dict, List, Any, Optional, Tuple, NamedTuple
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import math
 from dateutil import parser
 
+from engine_alpha.core import codec
 from engine_alpha.research.pf_timeseries import _compute_pf_for_window
 from engine_alpha.reflect.regime_uncertainty import RegimeUncertaintyMetrics, assess_regime_uncertainty
 from engine_alpha.reflect.edge_half_life import EdgeStrength, analyze_edge_strength
 from engine_alpha.reflect.inaction_performance import InactionOutcome, analyze_inaction_outcome
 from engine_alpha.reflect.fair_value_gaps import FairValueGap, fvg_detector
+from engine_alpha.reflect.meta_windows import CounterfactualWindow
 from engine_alpha.config.feature_flags import get_feature_registry
+from engine_alpha.reflect.counterfactual_engine import (
+    DecisionIndex,
+    ExitRules,
+    day_bounds,
+    market_return,
+    resolve_decisions,
+)
+
+
+def _resolution_key(rec: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    return (rec.get("symbol"), rec.get("decision_ts"), rec.get("decision_type"))
 
 
 class CounterfactualDecision(NamedTuple):
@@ -76,9 +89,16 @@ class CounterfactualLedger:
 
     ledger_file: Path = field(default_factory=lambda: Path("reports/counterfactual_ledger.jsonl"))
     simulation_window_bars: int = 60  # How far ahead to simulate counterfactuals (15m bars)
+    timeframe: str = "15m"
 
     def __post_init__(self):
         self.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        self._index = DecisionIndex(self.ledger_file)
+        self.window = CounterfactualWindow(self.ledger_file)
+
+    @property
+    def resolutions_file(self) -> Path:
+        return self.ledger_file.with_name("counterfactual_resolutions.jsonl")
 
     def record_decision(self, decision: CounterfactualDecision) -> None:
         """Record a trading decision for later counterfactual analysis"""
@@ -116,13 +136,14 @@ class CounterfactualLedger:
                 "freshness_score": decision.edge_strength.freshness_score,
             }
 
-        with self.ledger_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.window.append(record)
 
     def resolve_counterfactual(self, symbol: str, exit_ts: datetime,
                              actual_pnl_pct: float, exit_reason: str,
-                             regime_at_exit: str) -> None:
+                             regime_at_exit: str, lane_id: Optional[str] = None) -> None:
         """Resolve a counterfactual by finding the matching decision and computing outcome"""
+        if isinstance(exit_ts, str):
+            exit_ts = parser.isoparse(exit_ts)
 
         # Find the most recent decision for this symbol before exit_ts
         decision = self._find_matching_decision(symbol, exit_ts)
@@ -146,50 +167,69 @@ class CounterfactualLedger:
         self._record_outcome(outcome)
 
     def _find_matching_decision(self, symbol: str, exit_ts: datetime) -> Optional[CounterfactualDecision]:
-        """Find the decision that led to this trade"""
-        if not self.ledger_file.exists():
+        """Find the decision that led to this trade (latest entry within 24h, via the (symbol, ts) index)"""
+        record = self._index.latest(
+            symbol,
+            before=exit_ts,
+            since=exit_ts - timedelta(hours=24),  # Look back up to 24h
+            decision_types=("entry", "entry_attempt"),
+        )
+        if not record:
+            return None
+        try:
+            return CounterfactualDecision(
+                ts=parser.isoparse(record["ts"]),
+                symbol=record["symbol"],
+                direction=record["direction"],
+                confidence=record["confidence"],
+                regime=record["regime"],
+                entry_price=record.get("entry_price"),
+                market_state=record.get("market_state", {}),
+                decision_type=record["decision_type"]
+            )
+        except (KeyError, ValueError):
             return None
-
-        recent_decisions = []
-        cutoff = exit_ts - timedelta(hours=24)  # Look back up to 24h
-
-        with self.ledger_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("type") != "decision":
-                        continue
-
-                    record_ts = parser.isoparse(record["ts"])
-                    if record_ts < cutoff or record_ts > exit_ts:
-                        continue
-
-                    if record["symbol"] == symbol and record.get("decision_type") in ("entry", "entry_attempt"):
-                        recent_decisions.append(CounterfactualDecision(
-                            ts=record_ts,
-                            symbol=record["symbol"],
-                            direction=record["direction"],
-                            confidence=record["confidence"],
-                            regime=record["regime"],
-                            entry_price=record.get("entry_price"),
-                            market_state=record.get("market_state", {}),
-                            decision_type=record["decision_type"]
-                        ))
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        # Return the most recent matching decision
-        return max(recent_decisions, key=lambda d: d.ts) if recent_decisions else None
 
     def _simulate_counterfactual(self, decision: CounterfactualDecision, exit_ts: datetime) -> Optional[float]:
         """Simulate what would have happened if we didn't take the trade"""
-        # This is a simplified simulation - in reality you'd need OHLCV data
-        # For now, return a baseline (market return over the period)
-        # TODO: Implement proper OHLCV-based simulation
-
-        # Placeholder: assume neutral counterfactual (0% return)
-        # Real implementation would track actual market movement
-        return 0.0
+        # Null behaviour = sitting in the market passively over the same window
+        # (bar closes from decision to exit). Neutral 0.0 if no bars cover it.
+        try:
+            cf = market_return(decision.symbol, decision.ts, exit_ts, timeframe=self.timeframe)
+        except Exception:
+            cf = None
+        return cf if cf is not None else 0.0
+
+    def resolve_decisions_for_day(self, day: date, rules: Optional[ExitRules] = None,
+                                  write: bool = True) -> List[Dict[str, Any]]:
+        """
+        Batch-resolve every decision recorded on a UTC day against cached OHLCV.
+
+        Each decision gets forward returns at the rule horizons plus a TP/SL/time
+        exit outcome; results are appended to counterfactual_resolutions.jsonl.
+        Decisions already resolved there (same symbol, decision ts and type) are
+        not appended again, so re-running a day is idempotent.
+        """
+        rules = rules or ExitRules(max_bars=self.simulation_window_bars)
+        start, end = day_bounds(day)
+        decisions = self._index.range(start, end)
+        results = resolve_decisions(decisions, rules, timeframe=self.timeframe)
+        if write and results:
+            done = self._resolved_keys(start, end)
+            with self.resolutions_file.open("a", encoding="utf-8") as f:
+                for rec in results:
+                    if _resolution_key(rec) not in done:
+                        f.write(json.dumps(rec) + "\n")
+        return results
+
+    def _resolved_keys(self, start: datetime, end: datetime) -> set:
+        """Keys of resolutions already written for decisions in [start, end)."""
+        return {
+            _resolution_key(rec)
+            for rec in codec.iter_jsonl(
+                self.resolutions_file, codec.iso_to_ms(start), codec.iso_to_ms(end), key="decision_ts",
+            )
+        }
 
     def _calculate_hold_duration(self, entry_ts: datetime, exit_ts: datetime) -> int:
         """Calculate how long the position was held in bars (15m)"""
@@ -212,8 +252,7 @@ class CounterfactualLedger:
             "confidence_at_decision": outcome.confidence_at_decision
         }
 
-        with self.ledger_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.window.append(record)
 
     def analyze_inaction_outcome(self, symbol: str, decision_ts: datetime,
                                actual_market_movement: float) -> None:
@@ -233,8 +272,7 @@ class CounterfactualLedger:
                 "market_development": outcome.market_development
             }
 
-            with self.ledger_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record) + "\n")
+            self.window.append(record)
         except Exception as e:
             # Don't fail the main flow if inaction analysis fails
             pass
@@ -284,12 +322,21 @@ class CounterfactualLedger:
             "beneficial_trade_rate": len(beneficial_trades) / len(outcomes) if outcomes else 0,
             "total_opportunity_gain": sum(c for c in opportunity_costs if c > 0),
             "total_opportunity_loss": abs(sum(c for c in opportunity_costs if c < 0)),
-            "counterfactual_pf": _compute_pf_for_window([o.actual_pnl_pct for o in outcomes if o.actual_pnl_pct is not None]),
-            "null_pf": _compute_pf_for_window([o.counterfactual_pnl_pct for o in outcomes if o.counterfactual_pnl_pct is not None]),
+            "counterfactual_pf": _compute_pf_for_window([(o.actual_pnl_pct, 1.0) for o in outcomes if o.actual_pnl_pct is not None]),
+            "null_pf": _compute_pf_for_window([(o.counterfactual_pnl_pct, 1.0) for o in outcomes if o.counterfactual_pnl_pct is not None]),
             "by_regime": self._group_by_regime(outcomes),
             "by_confidence_quartile": self._group_by_confidence_quartile(outcomes)
         }
 
+    def get_window_metrics(self, lookback_days: int = 7) -> Dict[str, Any]:
+        """
+        Counterfactual metrics from the in-memory window (no ledger scan).
+
+        Same fields as get_counterfactual_metrics except by_confidence_quartile,
+        which needs the full outcome list.
+        """
+        return self.window.metrics(lookback_days)
+
     def _group_by_regime(self, outcomes: List[CounterfactualOutcome]) -> Dict[str, Dict[str, Any]]:
         """Group counterfactual metrics by regime"""
         regimes = {}
@@ -400,13 +447,21 @@ def record_trading_decision(symbol: str, direction: int, confidence: float,
 
 def resolve_trade_counterfactual(symbol: str, exit_ts: datetime,
                                actual_pnl_pct: float, exit_reason: str,
-                               regime_at_exit: str) -> None:
+                               regime_at_exit: str, lane_id: Optional[str] = None) -> None:
     """Convenience function to resolve a counterfactual after trade exit"""
     counterfactual_ledger.resolve_counterfactual(
-        symbol, exit_ts, actual_pnl_pct, exit_reason, regime_at_exit
+        symbol, exit_ts, actual_pnl_pct, exit_reason, regime_at_exit, lane_id=lane_id
     )
 
 
+def resolve_counterfactuals_for_day(day: Optional[date] = None,
+                                    rules: Optional[ExitRules] = None) -> List[Dict[str, Any]]:
+    """Nightly batch: resolve all decisions of a UTC day (default: yesterday)"""
+    if day is None:
+        day = (datetime.now(timezone.utc) - timedelta(days=1)).date()
+    return counterfactual_ledger.resolve_decisions_for_day(day, rules)
+
+
 if __name__ == "__main__":
     # Example usage and testing
     print("Counterfactual PnL Ledger initialized")
@@ -9,17 +9,22 @@ import json
 import os
 import math
 from datetime import datetime, timezone
-from itertools import product
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import yaml
 
 from engine_alpha.core.gpt_client import load_prompt, query_gpt
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.signals.signal_processor import get_signal_vector
-from engine_alpha.core.confidence_engine import decide
-from engine_alpha.core.regime import RegimeClassifier
+from engine_alpha.reflect.dream_sim import (
+    DreamSteps,
+    best_by_regime,
+    build_gate_grid,
+    collect_dream_steps,
+    simulate_gate_grid,
+)
 
 REFLECTION_QUEUE_PATH = REPORTS / "reflection_queue.jsonl"
 REFLECTION_QUEUE_SEEN = REPORTS / "dream_queue_seen.json"
@@ -84,71 +89,23 @@ def _baseline_flip(gates: Dict[str, Any]) -> float:
 
 
 def _simulate_pf(
-    steps: List[Dict[str, float]],
+    steps: Union[DreamSteps, List[Dict[str, float]]],
     entry_min: float,
     exit_min: float,
     flip_min: float,
 ) -> float:
-    position = 0  # -1, 0, +1
-    wins = 0.0
-    losses = 0.0
-
-    for step in steps:
-        direction = step["dir"]
-        conf = step["conf"]
-        ret = step["ret"]
-
-        if position == 0:
-            if direction != 0 and conf >= entry_min:
-                position = direction
-        else:
-            pnl = position * ret
-            if pnl > 0:
-                wins += pnl
-            elif pnl < 0:
-                losses += -pnl
-
-            if conf < exit_min:
-                position = 0
-            elif direction != 0 and direction != position and conf >= flip_min:
-                position = direction
-
-    if losses <= 0:
-        return wins if wins > 0 else 1.0
-    return wins / losses
-
-
-def _collect_steps(window_steps: int) -> List[Dict[str, float]]:
-    classifier = RegimeClassifier()
-    steps: List[Dict[str, float]] = []
-    for _ in range(window_steps):
-        signal_result = get_signal_vector()
-        decision = decide(signal_result["signal_vector"], signal_result["raw_registry"], classifier)
-        steps.append(
-            {
-                "dir": decision["final"]["dir"],
-                "conf": float(decision["final"]["conf"]),
-                "ret": float(
-                    signal_result["raw_registry"].get("Ret_G5", {}).get("value", 0.0)
-                ),
-            }
-        )
-    return steps
+    if not isinstance(steps, DreamSteps):
+        steps = DreamSteps.from_records(steps)
+    sim = simulate_gate_grid(steps, np.array([[entry_min, exit_min, flip_min]]))
+    return float(sim["pf"][0])
 
 
-def _build_combos(entry: float, exit_: float, flip: float) -> List[Tuple[float, float, float]]:
-    offsets = [-0.02, 0.0, 0.02]
+def _collect_steps(window_steps: int) -> DreamSteps:
+    return collect_dream_steps(window_steps, signal_fn=get_signal_vector)
 
-    def clamp(val: float) -> float:
-        return max(0.01, min(0.99, val))
 
-    entry_opts = sorted({clamp(entry + d) for d in offsets})
-    exit_opts = sorted({clamp(exit_ + d) for d in offsets})
-    flip_opts = sorted({clamp(flip + d) for d in offsets})
-    combos: List[Tuple[float, float, float]] = []
-    for e, x, f in product(entry_opts, exit_opts, flip_opts):
-        combos.append((e, x, f))
-    return combos
+def _build_combos(entry: float, exit_: float, flip: float) -> List[Tuple[float, float, float]]:
+    return [tuple(row) for row in build_gate_grid(entry, exit_, flip).tolist()]
 
 
 def _load_equity_tail(limit: int = 200) -> List[float]:
@@ -335,19 +292,27 @@ def run_dream(window_steps: int = 200) -> Dict[str, Any]:
     steps = _collect_steps(window_steps)
     combos = _build_combos(entry_base, exit_base, flip_base)
 
-    pf_results: List[Dict[str, Any]] = []
-    for entry_min, exit_min, flip_min in combos:
-        pf = _simulate_pf(steps, entry_min, exit_min, flip_min)
-        pf_results.append(
-            {
-                "entry_min": entry_min,
-                "exit_min": exit_min,
-                "flip_min": flip_min,
-                "pf_cf": pf,
-            }
-        )
-
-    baseline_pf = _simulate_pf(steps, entry_base, exit_base, flip_base)
+    # Whole gate grid plus the baseline in one pass (baseline is the last row)
+    grid = np.array(combos + [(entry_base, exit_base, flip_base)], dtype=float)
+    sim = simulate_gate_grid(steps, grid, by_regime=True)
+    pf_results: List[Dict[str, Any]] = [
+        {
+            "entry_min": entry_min,
+            "exit_min": exit_min,
+            "flip_min": flip_min,
+            "pf_cf": float(pf),
+        }
+        for (entry_min, exit_min, flip_min), pf in zip(combos, sim["pf"][:-1])
+    ]
+    baseline_pf = float(sim["pf"][-1])
+    regime_best = best_by_regime(grid[:-1], {
+        "regimes": sim["regimes"],
+        "pf_by_regime": sim["pf_by_regime"][:-1],
+        "trades_by_regime": sim["trades_by_regime"][:-1],
+    })
+    for j, regime in enumerate(sim["regimes"]):
+        if regime in regime_best:
+            regime_best[regime]["baseline_pf_cf"] = float(sim["pf_by_regime"][-1, j])
 
     pf_local_data = _read_json(REPORTS / "pf_local.json") or {"pf": baseline_pf}
     try:
@@ -460,6 +425,8 @@ def run_dream(window_steps: int = 200) -> Dict[str, Any]:
         "baseline_pf_cf": baseline_pf,
         "best_combo": best,
         "best_delta": delta,
+        "combos_tested": len(combos),
+        "best_by_regime": regime_best,
         "proposal_kind": proposal_kind,
         "pf_adj_trend": pf_adj_trend,
         "council": council_summary,
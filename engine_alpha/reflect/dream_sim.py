@@ -0,0 +1,248 @@
+"""
+Dream simulation engine - batched gate sweeps for dream mode.
+
+Dream mode replays a window of council decisions and asks which entry / exit /
+flip confidence gates would have produced the best PF. This module does that
+in two array passes:
+
+1. collect_dream_steps(): the signal vectors for the window are stacked into
+   one matrix and scored with the council kernel (classify_regimes_batch +
+   decide_batch), giving dir / conf / ret / regime arrays for every step.
+2. simulate_gate_grid(): the position state machine of dream_mode runs once
+   over the steps, vectorized across every gate combination, so a sweep of
+   hundreds of combos costs about as much as one scalar replay.
+
+Wins / losses accumulate step by step per combo, in the same order as the
+scalar replay, so PF values match it exactly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine_alpha.core.council_kernel import (
+    classify_regimes_batch,
+    decide_batch,
+    get_council_layout,
+    signal_matrix,
+)
+
+# Offsets around each baseline gate: 9 values per gate -> up to 729 combos
+GRID_OFFSETS: Tuple[float, ...] = tuple(round(i * 0.02, 2) for i in range(-4, 5))
+GATE_MIN = 0.01
+GATE_MAX = 0.99
+
+
+@dataclass
+class DreamSteps:
+    """Step matrix for one dream window (one entry per replayed step)."""
+    dir: np.ndarray
+    conf: np.ndarray
+    ret: np.ndarray
+    regime: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.dir.shape[0])
+
+    @classmethod
+    def from_records(cls, steps: Sequence[Dict[str, Any]]) -> "DreamSteps":
+        """Build from [{"dir", "conf", "ret", optional "regime"}] records."""
+        return cls(
+            dir=np.asarray([int(s["dir"]) for s in steps], dtype=np.int64),
+            conf=np.asarray([float(s["conf"]) for s in steps], dtype=float),
+            ret=np.asarray([float(s["ret"]) for s in steps], dtype=float),
+            regime=np.asarray([str(s.get("regime", "unknown")) for s in steps], dtype=object),
+        )
+
+
+def _raw_value(raw_registry: Dict[str, Any], name: str) -> float:
+    entry = raw_registry.get(name, {})
+    value = entry.get("value", 0.0) if isinstance(entry, dict) else 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def collect_dream_steps(
+    window_steps: int,
+    signal_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> DreamSteps:
+    """
+    Gather window_steps signal vectors and score them with the council kernel.
+
+    Equivalent to calling decide() per step with one shared RegimeClassifier.
+    """
+    if signal_fn is None:
+        from engine_alpha.signals.signal_processor import get_signal_vector
+        signal_fn = get_signal_vector
+
+    layout = get_council_layout()
+    vectors: List[Sequence[float]] = []
+    raws: List[List[float]] = []
+    rets: List[float] = []
+    for _ in range(window_steps):
+        signal_result = signal_fn()
+        raw_registry = signal_result.get("raw_registry", {}) or {}
+        vectors.append(signal_result["signal_vector"])
+        raws.append([_raw_value(raw_registry, name) for name in layout.signal_names])
+        rets.append(_raw_value(raw_registry, "Ret_G5"))
+
+    X = signal_matrix(vectors, layout.n_signals)
+    raw = np.asarray(raws, dtype=float).reshape(len(raws), layout.n_signals)
+    regimes = classify_regimes_batch(X, raw, layout=layout)
+    decision = decide_batch(X, regimes, layout=layout)
+    return DreamSteps(
+        dir=decision["dir"].astype(np.int64),
+        conf=decision["conf"].astype(float),
+        ret=np.asarray(rets, dtype=float),
+        regime=regimes,
+    )
+
+
+def _clamp_gate(value: float) -> float:
+    return max(GATE_MIN, min(GATE_MAX, value))
+
+
+def build_gate_grid(
+    entry: float,
+    exit_: float,
+    flip: float,
+    offsets: Sequence[float] = GRID_OFFSETS,
+) -> np.ndarray:
+    """
+    (G x 3) grid of (entry_min, exit_min, flip_min) around the baseline gates.
+
+    Each gate's options are clamped to [0.01, 0.99], de-duplicated and sorted;
+    rows follow itertools.product order.
+    """
+    entry_opts = sorted({_clamp_gate(entry + d) for d in offsets})
+    exit_opts = sorted({_clamp_gate(exit_ + d) for d in offsets})
+    flip_opts = sorted({_clamp_gate(flip + d) for d in offsets})
+    combos = list(product(entry_opts, exit_opts, flip_opts))
+    return np.asarray(combos, dtype=float).reshape(len(combos), 3)
+
+
+def _profit_factor(wins: np.ndarray, losses: np.ndarray) -> np.ndarray:
+    """PF with dream mode's conventions: no losses -> wins (or 1.0 if no wins)."""
+    no_losses = losses <= 0
+    ratio = np.divide(wins, losses, out=np.zeros_like(wins), where=~no_losses)
+    return np.where(no_losses, np.where(wins > 0, wins, 1.0), ratio)
+
+
+def simulate_gate_grid(
+    steps: DreamSteps,
+    grid: np.ndarray,
+    by_regime: bool = False,
+) -> Dict[str, Any]:
+    """
+    Replay the dream position state machine for every gate combo at once.
+
+    Per step: flat combos enter when dir != 0 and conf >= entry_min; held
+    combos book position * ret, then exit when conf < exit_min or flip when
+    the direction reverses with conf >= flip_min.
+
+    Args:
+        steps: Step matrix from collect_dream_steps
+        grid: (G x 3) array of (entry_min, exit_min, flip_min)
+        by_regime: Also attribute wins / losses to the regime of each step
+
+    Returns:
+        Dict with "pf", "wins", "losses", "trades" (G arrays) and, if by_regime,
+        "regimes" (names) and "pf_by_regime" / "trades_by_regime" (G x R)
+    """
+    grid = np.atleast_2d(np.asarray(grid, dtype=float))
+    entry, exit_min, flip = grid[:, 0], grid[:, 1], grid[:, 2]
+    g = grid.shape[0]
+
+    position = np.zeros(g, dtype=np.int64)
+    wins = np.zeros(g, dtype=float)
+    losses = np.zeros(g, dtype=float)
+    trades = np.zeros(g, dtype=np.int64)
+
+    regime_names: Tuple[str, ...] = ()
+    if by_regime:
+        regime_names, regime_idx = np.unique(steps.regime.astype(str), return_inverse=True)
+        regime_names = tuple(str(r) for r in regime_names)
+        wins_r = np.zeros((g, len(regime_names)), dtype=float)
+        losses_r = np.zeros((g, len(regime_names)), dtype=float)
+        trades_r = np.zeros((g, len(regime_names)), dtype=np.int64)
+
+    dirs, confs, rets = steps.dir, steps.conf, steps.ret
+    for t in range(len(steps)):
+        d = int(dirs[t])
+        c = float(confs[t])
+        r = float(rets[t])
+
+        flat = position == 0
+        held = ~flat
+        # Flat combos have pnl 0 and add exactly 0.0 to both sums
+        pnl = position * r
+        gain = np.where(pnl > 0, pnl, 0.0)
+        loss = np.where(pnl < 0, -pnl, 0.0)
+        wins += gain
+        losses += loss
+        if by_regime:
+            col = regime_idx[t]
+            wins_r[:, col] += gain
+            losses_r[:, col] += loss
+
+        if d != 0:
+            enter = flat & (c >= entry)
+            trades += enter
+            if by_regime:
+                trades_r[:, col] += enter
+        else:
+            enter = np.zeros(g, dtype=bool)
+        exit_now = held & (c < exit_min)
+        flip_now = held & ~exit_now & (d != 0) & (position != d) & (c >= flip)
+        if by_regime:
+            trades_r[:, col] += flip_now
+        trades += flip_now
+        position[enter | flip_now] = d
+        position[exit_now] = 0
+
+    result: Dict[str, Any] = {
+        "pf": _profit_factor(wins, losses),
+        "wins": wins,
+        "losses": losses,
+        "trades": trades,
+    }
+    if by_regime:
+        result["regimes"] = regime_names
+        result["pf_by_regime"] = _profit_factor(wins_r, losses_r)
+        result["trades_by_regime"] = trades_r
+    return result
+
+
+def best_by_regime(grid: np.ndarray, sim: Dict[str, Any], min_trades: int = 1) -> Dict[str, Dict[str, Any]]:
+    """Best combo per regime (highest regime PF among combos with >= min_trades entries there)."""
+    out: Dict[str, Dict[str, Any]] = {}
+    for j, regime in enumerate(sim.get("regimes", ())):
+        eligible = sim["trades_by_regime"][:, j] >= min_trades
+        if not eligible.any():
+            continue
+        pf = np.where(eligible, sim["pf_by_regime"][:, j], -np.inf)
+        i = int(np.argmax(pf))
+        out[regime] = {
+            "entry_min": float(grid[i, 0]),
+            "exit_min": float(grid[i, 1]),
+            "flip_min": float(grid[i, 2]),
+            "pf_cf": float(sim["pf_by_regime"][i, j]),
+            "trades": int(sim["trades_by_regime"][i, j]),
+        }
+    return out
+
+
+__all__ = [
+    "DreamSteps",
+    "GRID_OFFSETS",
+    "best_by_regime",
+    "build_gate_grid",
+    "collect_dream_steps",
+    "simulate_gate_grid",
+]
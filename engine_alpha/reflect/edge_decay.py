@@ -0,0 +1,266 @@
+"""
+Edge decay engine - vectorized half-life fitting for all symbols at once.
+
+The close returns of every symbol are stacked into one zero-padded matrix
+(CloseSeries, one row per symbol). Rolling trade-window PFs come from
+cumulative sums of gross wins / losses along each row, so every window of
+every symbol is evaluated in a few array operations:
+
+- rolling_pf(): unit-weight PF (avg win / avg loss, the rules of
+  pf_timeseries._compute_pf_for_window) per window start and symbol.
+- fit_edge_decay(): mean rolling PF per decay window (7..90 "days" of about
+  two trades a day), then a least-squares fit of ln(PF / peak PF) against the
+  distance from the peak window for every symbol together, giving decay rate
+  and half-life.
+- relative_strength(): sigmoid z-score of the current PF against the
+  symbol's 30-trade window PFs.
+
+Windows whose PF is undefined (no wins or no losses) are left out of the
+averages.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from engine_alpha.core import codec
+
+DECAY_WINDOW_DAYS: Sequence[int] = (7, 14, 30, 60, 90)
+TRADES_PER_DAY = 2  # Rough estimate used to turn days into trade windows
+MIN_WINDOW_TRADES = 10
+RELATIVE_WINDOW_TRADES = 30
+DECAY_PF_FLOOR = 0.8  # Only decent windows take part in the decay fit
+MIN_DECAY_POINTS = 3
+
+
+@dataclass
+class CloseSeries:
+    """
+    Close returns per symbol, as one zero-padded (symbols x trades) matrix.
+
+    ts_ms holds the matching close times when the series was loaded from a log.
+    """
+    symbols: List[str]
+    returns: np.ndarray
+    lengths: np.ndarray
+    ts_ms: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @classmethod
+    def from_returns(cls, by_symbol: Mapping[str, Sequence[float]],
+                     ts_ms: Optional[Mapping[str, Sequence[int]]] = None) -> "CloseSeries":
+        symbols = list(by_symbol)
+        lengths = np.asarray([len(by_symbol[s]) for s in symbols], dtype=np.int64)
+        width = int(lengths.max()) if len(symbols) else 0
+        returns = np.zeros((len(symbols), width), dtype=float)
+        times = np.zeros((len(symbols), width), dtype=np.int64) if ts_ms is not None else None
+        for row, symbol in enumerate(symbols):
+            returns[row, : lengths[row]] = np.asarray(by_symbol[symbol], dtype=float)
+            if times is not None:
+                times[row, : lengths[row]] = np.asarray(ts_ms[symbol], dtype=np.int64)
+        return cls(symbols=symbols, returns=returns, lengths=lengths, ts_ms=times)
+
+    def _slice(self, bounds: Sequence[tuple]) -> "CloseSeries":
+        rows = [(symbol, row, lo, hi) for row, (symbol, (lo, hi)) in enumerate(zip(self.symbols, bounds)) if hi > lo]
+        return CloseSeries.from_returns(
+            {symbol: self.returns[row, lo:hi] for symbol, row, lo, hi in rows},
+            {symbol: self.ts_ms[row, lo:hi] for symbol, row, lo, hi in rows} if self.ts_ms is not None else None,
+        )
+
+    def last(self, n: int) -> "CloseSeries":
+        """The last n closes of every symbol."""
+        return self._slice([(max(0, int(length) - n), int(length)) for length in self.lengths])
+
+    def since(self, ts_ms: int) -> "CloseSeries":
+        """Closes at or after ts_ms (symbols left without closes are dropped)."""
+        if self.ts_ms is None:
+            raise ValueError("series has no close times")
+        return self._slice([
+            (int(np.searchsorted(self.ts_ms[row, :length], ts_ms, side="left")), int(length))
+            for row, length in enumerate(self.lengths)
+        ])
+
+    def select(self, symbols: Iterable[str]) -> "CloseSeries":
+        """Rows of the given symbols, in that order (unknown symbols get no closes)."""
+        index = {symbol: row for row, symbol in enumerate(self.symbols)}
+        picked = [(s, index.get(s)) for s in symbols]
+        return CloseSeries.from_returns(
+            {s: self.returns[row, : self.lengths[row]] if row is not None else [] for s, row in picked},
+            {s: self.ts_ms[row, : self.lengths[row]] if row is not None else [] for s, row in picked}
+            if self.ts_ms is not None else None,
+        )
+
+
+def load_close_series(path: Path, symbols: Optional[Iterable[str]] = None) -> CloseSeries:
+    """Close pct series of every symbol in a trades.jsonl file (time-ordered)."""
+    wanted = set(symbols) if symbols is not None else None
+    rows: Dict[str, List[tuple]] = {}
+    for rec in codec.iter_jsonl(path):
+        if rec.get("type") != "close" or rec.get("pct") is None or not rec.get("symbol"):
+            continue
+        symbol = str(rec["symbol"])
+        if wanted is not None and symbol not in wanted:
+            continue
+        try:
+            pct = float(rec["pct"])
+        except (TypeError, ValueError):
+            continue
+        rows.setdefault(symbol, []).append((codec.ts_ms_of(rec) or 0, pct))
+    ordered = {symbol: sorted(items, key=lambda item: item[0]) for symbol, items in sorted(rows.items())}
+    return CloseSeries.from_returns(
+        {symbol: [pct for _, pct in items] for symbol, items in ordered.items()},
+        {symbol: [ts for ts, _ in items] for symbol, items in ordered.items()},
+    )
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    return np.concatenate([np.zeros((values.shape[0], 1)), np.cumsum(values, axis=1)], axis=1)
+
+
+def rolling_pf(series: CloseSeries, size: int, step: int) -> np.ndarray:
+    """
+    Unit-weight PF of trade windows [start, start + size) for start = 0, step, ...
+
+    Shape (symbols, window starts); NaN where a symbol has no such window or
+    the window PF is undefined.
+    """
+    n_trades = series.returns.shape[1]
+    if size < 1 or n_trades < size:
+        return np.full((len(series), 0), np.nan)
+    r = series.returns
+    starts = np.arange(0, n_trades - size + 1, max(1, step))
+    ends = starts + size
+    sums = {}
+    for name, values in (
+        ("win", np.where(r > 0.0, r, 0.0)),
+        ("loss", np.where(r < 0.0, -r, 0.0)),
+        ("wins", (r > 0.0).astype(float)),
+        ("losses", (r < 0.0).astype(float)),
+    ):
+        cum = _prefix(values)
+        sums[name] = cum[:, ends] - cum[:, starts]
+    valid = (ends[None, :] <= series.lengths[:, None]) & (sums["wins"] > 0) & (sums["losses"] > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pf = (sums["win"] / sums["wins"]) / (sums["loss"] / sums["losses"])
+    return np.where(valid & np.isfinite(pf), pf, np.nan)
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    counts = np.sum(~np.isnan(values), axis=1)
+    totals = np.nansum(values, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+
+
+def decay_window_pfs(series: CloseSeries) -> np.ndarray:
+    """Mean rolling PF per decay window, shape (symbols, len(DECAY_WINDOW_DAYS))."""
+    cols = []
+    for days in DECAY_WINDOW_DAYS:
+        size = days * TRADES_PER_DAY
+        pf = rolling_pf(series, size, size // 4) if size >= MIN_WINDOW_TRADES else np.full((len(series), 0), np.nan)
+        cols.append(_nanmean(pf) if pf.shape[1] else np.full(len(series), np.nan))
+    return np.stack(cols, axis=1) if cols else np.zeros((len(series), 0))
+
+
+def fit_edge_decay(series: CloseSeries, min_samples: int = 20) -> List[Dict[str, Any]]:
+    """Decay model (half-life, daily decay rate, fit quality) for every symbol of the series."""
+    windows = np.asarray(DECAY_WINDOW_DAYS, dtype=float)
+    pfs = decay_window_pfs(series)
+    has_pf = ~np.isnan(pfs)
+    any_pf = has_pf.any(axis=1)
+
+    filled = np.where(has_pf, pfs, -np.inf)
+    peak_idx = np.argmax(filled, axis=1)  # first maximum, like max() over the windows
+    peak_pf = np.where(any_pf, filled[np.arange(len(series)), peak_idx], np.nan)
+    peak_window = windows[peak_idx]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where((peak_pf > 0)[:, None], pfs / peak_pf[:, None], 0.0)
+    points = has_pf & (pfs > DECAY_PF_FLOOR) & (ratio > 0)
+    t = np.where(points, np.abs(windows[None, :] - peak_window[:, None]), 0.0)
+    log_ratio = np.where(points, np.log(np.maximum(np.where(points, ratio, 1.0), 0.01)), 0.0)
+
+    # Least squares slope of ln(ratio) on distance from the peak, per symbol
+    n = points.sum(axis=1).astype(float)
+    sum_t = t.sum(axis=1)
+    sum_lr = log_ratio.sum(axis=1)
+    sum_t_lr = (t * log_ratio).sum(axis=1)
+    sum_t2 = (t * t).sum(axis=1)
+    den = n * sum_t2 - sum_t * sum_t
+    fitted = (n >= MIN_DECAY_POINTS) & (den != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        decay_rate = np.clip(-(n * sum_t_lr - sum_t * sum_lr) / den, 0.001, 0.1)
+    half_life = np.clip(math.log(0.5) / -decay_rate, 7, 180)
+
+    models: List[Dict[str, Any]] = []
+    for row in range(len(series)):
+        if series.lengths[row] < min_samples:
+            models.append({
+                'half_life_days': 30.0,  # Default assumption
+                'decay_rate': 0.02,  # 2% daily decay
+                'model_type': 'default_assumption',
+                'confidence': 0.3
+            })
+        elif not any_pf[row]:
+            models.append({
+                'half_life_days': 30.0,
+                'decay_rate': 0.02,
+                'model_type': 'insufficient_data',
+                'confidence': 0.3
+            })
+        elif fitted[row]:
+            models.append({
+                'half_life_days': float(half_life[row]),
+                'decay_rate': float(decay_rate[row]),
+                'model_type': 'exponential_decay_fit',
+                'confidence': min(0.9, n[row] / 10.0),
+                'peak_pf': float(peak_pf[row]),
+                'data_points': int(n[row])
+            })
+        else:
+            models.append({
+                'half_life_days': 45.0,  # Conservative estimate
+                'decay_rate': 0.015,  # 1.5% daily decay
+                'model_type': 'empirical_fallback',
+                'confidence': 0.5
+            })
+    return models
+
+
+def relative_strength(series: CloseSeries, current_pf: Sequence[float]) -> np.ndarray:
+    """
+    Strength of each symbol's current PF against its own 30-trade window PFs
+    (sigmoid of the z-score; 0.5 without history or spread).
+    """
+    current = np.asarray(current_pf, dtype=float)
+    size = RELATIVE_WINDOW_TRADES
+    pfs = rolling_pf(series, size, size // 2)
+    if not pfs.shape[1]:
+        return np.full(len(series), 0.5)
+    counts = np.sum(~np.isnan(pfs), axis=1)
+    mean = _nanmean(pfs)
+    with np.errstate(invalid="ignore"):
+        std = np.sqrt(_nanmean((pfs - mean[:, None]) ** 2))
+    ok = (counts > 0) & (std > 0) & np.isfinite(current)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        z = (current - mean) / std
+        strength = 1.0 / (1.0 + np.exp(-z))
+    return np.where(ok, strength, 0.5)
+
+
+__all__ = [
+    "CloseSeries",
+    "DECAY_WINDOW_DAYS",
+    "decay_window_pfs",
+    "fit_edge_decay",
+    "load_close_series",
+    "relative_strength",
+    "rolling_pf",
+]
@@ -10,6 +10,12 @@ Models how long trading edges remain valid over time. Enables:
 
 Key insight: Edges are perishable. Knowing when they expire is as important
 as knowing when they exist.
+
+Decay is fitted for all symbols at once by edge_decay (vectorized over a
+symbols x trades matrix). Each symbol's latest analysis, its last 10 analyses
+and daily analysis counts live in one compact state file
+(reports/edge_half_life_state.json), which stays the same size however often
+the analysis runs.
 """
 
 from __future__ import annotations
@@ -21,10 +27,19 @@ import json
 import math
 from collections import defaultdict
 
-from engine_alpha.research.pf_timeseries import _compute_pf_for_window
+import numpy as np
+
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_write_json
+from engine_alpha.core.paths import REPORTS
+from engine_alpha.reflect.edge_decay import CloseSeries, fit_edge_decay, load_close_series, relative_strength
 from engine_alpha.reflect.fair_value_gaps import fvg_detector
 from engine_alpha.config.feature_flags import get_feature_registry
 
+TRADES_PATH = REPORTS / "trades.jsonl"
+CURRENT_WINDOW_TRADES = 30  # Closes behind the "current" edge metrics
+MIN_CURRENT_TRADES = 10
+
 
 class EdgeMetrics(NamedTuple):
     """Core metrics for a trading edge at a point in time"""
@@ -53,10 +68,13 @@ class EdgeHalfLifeTracker:
 
     analysis_window_days: int = 90  # How far back to analyze edge decay
     min_samples_for_modeling: int = 20  # Minimum trades to build decay model
-    edge_history_file: Path = field(default_factory=lambda: Path("reports/edge_half_life_history.jsonl"))
+    state_file: Path = field(default_factory=lambda: Path("reports/edge_half_life_state.json"))
+    recent_analyses_kept: int = 10
+    _state: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _state_sig: Optional[Tuple[int, int, int]] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
-        self.edge_history_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
 
     def analyze_edge_half_life(self, symbol: str, current_metrics: EdgeMetrics,
                               historical_trades: List[Dict[str, Any]]) -> EdgeStrength:
@@ -98,11 +116,62 @@ class EdgeHalfLifeTracker:
             freshness_score=freshness_score
         )
 
-        # Log the analysis for future modeling
-        self._log_edge_analysis(symbol, current_metrics, edge_strength, decay_model)
+        # Record the analysis in the per-symbol state
+        self._record_analyses([(symbol, current_metrics, edge_strength, decay_model)])
 
         return edge_strength
 
+    def analyze_all_symbols(self, trades_path: Optional[Path] = None,
+                            now: Optional[datetime] = None) -> Dict[str, EdgeStrength]:
+        """
+        Analyze every symbol with closes in trades.jsonl in one batch.
+
+        Current metrics come from each symbol's last 30 closes; decay and
+        relative strength are fitted on the closes of the last
+        analysis_window_days for all symbols at once. One state write.
+        """
+        now = now or datetime.now(timezone.utc)
+        since_ms = codec.iso_to_ms(now - timedelta(days=self.analysis_window_days))
+        history = load_close_series(trades_path or TRADES_PATH)
+        recent = history.last(CURRENT_WINDOW_TRADES)
+        keep = recent.lengths >= MIN_CURRENT_TRADES
+        if not keep.any():
+            return {}
+
+        r = recent.returns[keep]
+        n = recent.lengths[keep].astype(float)
+        wins, losses = (r > 0).sum(axis=1), (r < 0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pf = ((np.where(r > 0, r, 0).sum(axis=1) / wins) /
+                  (np.where(r < 0, -r, 0).sum(axis=1) / losses))
+        pf = np.where((wins > 0) & (losses > 0) & np.isfinite(pf), pf, 1.0)
+        symbols = [sym for sym, k in zip(recent.symbols, keep) if k]
+        metrics = [
+            EdgeMetrics(timestamp=now, symbol=sym, pf=float(pf[i]), win_rate=float(wins[i] / n[i]),
+                        expectancy=float(r[i].sum() / n[i]), total_trades=int(n[i]), time_window_days=7)
+            for i, sym in enumerate(symbols)
+        ]
+
+        window = history.since(since_ms).select(symbols)
+        models = fit_edge_decay(window, self.min_samples_for_modeling)
+        rel = relative_strength(window, pf)
+
+        results: Dict[str, EdgeStrength] = {}
+        entries = []
+        for i, m in enumerate(metrics):
+            strength = EdgeStrength(
+                absolute_strength=self._calculate_absolute_strength(m),
+                relative_strength=float(rel[i]),
+                confidence=self._calculate_edge_confidence(m),
+                half_life_days=models[i].get('half_life_days', 30.0),
+                decay_rate=models[i].get('decay_rate', 0.02),
+                freshness_score=self._calculate_freshness_score(m),
+            )
+            results[m.symbol] = strength
+            entries.append((m.symbol, m, strength, models[i]))
+        self._record_analyses(entries, now)
+        return results
+
     def _calculate_absolute_strength(self, metrics: EdgeMetrics) -> float:
         """Calculate absolute edge strength based on performance metrics"""
         pf_score = min(1.0, max(0.0, (metrics.pf - 0.8) / 0.4))  # 0.8-1.2 maps to 0-1
@@ -125,132 +194,14 @@ class EdgeHalfLifeTracker:
         """Calculate strength relative to symbol's historical performance"""
         if not historical_trades:
             return 0.5  # Neutral if no history
-
-        # Calculate historical baseline (long-term average)
-        historical_pfs = []
-        window_size = 30  # 30-day windows
-
-        # Group trades by time windows
-        sorted_trades = sorted(historical_trades, key=lambda x: x.get('ts', ''))
-        for i in range(0, len(sorted_trades) - window_size + 1, window_size // 2):
-            window_trades = sorted_trades[i:i + window_size]
-            if len(window_trades) >= 10:  # Minimum sample
-                returns = [t.get('pct', 0) for t in window_trades if t.get('pct') is not None]
-                if returns:
-                    pf = _compute_pf_for_window(returns)
-                    historical_pfs.append(pf)
-
-        if not historical_pfs:
-            return 0.5
-
-        historical_avg_pf = sum(historical_pfs) / len(historical_pfs)
-        historical_std_pf = math.sqrt(sum((pf - historical_avg_pf) ** 2 for pf in historical_pfs) / len(historical_pfs))
-
-        if historical_std_pf == 0:
-            return 0.5
-
-        # Z-score of current PF vs historical
-        z_score = (current_metrics.pf - historical_avg_pf) / historical_std_pf
-
-        # Convert z-score to 0-1 scale (clip extreme values)
-        relative_strength = 1.0 / (1.0 + math.exp(-z_score))  # Sigmoid
-
-        return relative_strength
+        return float(relative_strength(_series_of(symbol, historical_trades), [current_metrics.pf])[0])
 
     def _model_edge_decay(self, symbol: str, historical_trades: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Model how edges decay over time using historical data"""
+        # Sample size is judged on all trades passed in, as before
         if len(historical_trades) < self.min_samples_for_modeling:
-            return {
-                'half_life_days': 30.0,  # Default assumption
-                'decay_rate': 0.02,  # 2% daily decay
-                'model_type': 'default_assumption',
-                'confidence': 0.3
-            }
-
-        # Group trades by time windows to see performance decay
-        sorted_trades = sorted(historical_trades, key=lambda x: x.get('ts', ''))
-
-        # Calculate rolling PF over different time windows
-        window_sizes = [7, 14, 30, 60, 90]  # Days
-        rolling_pfs = {}
-
-        for window_days in window_sizes:
-            window_pfs = []
-            window_size_trades = window_days * 2  # Rough estimate of trades per day
-
-            for i in range(0, len(sorted_trades) - window_size_trades + 1, window_size_trades // 4):
-                window_trades = sorted_trades[i:i + window_size_trades]
-                if len(window_trades) >= 10:
-                    returns = [t.get('pct', 0) for t in window_trades if t.get('pct') is not None]
-                    if returns:
-                        pf = _compute_pf_for_window(returns)
-                        window_pfs.append(pf)
-
-            if window_pfs:
-                rolling_pfs[window_days] = sum(window_pfs) / len(window_pfs)
-
-        if not rolling_pfs:
-            return {
-                'half_life_days': 30.0,
-                'decay_rate': 0.02,
-                'model_type': 'insufficient_data',
-                'confidence': 0.3
-            }
-
-        # Model decay: assume exponential decay from peak performance
-        # Find the peak PF and model decay from there
-        peak_pf = max(rolling_pfs.values())
-        peak_window = max(rolling_pfs.keys(), key=lambda k: rolling_pfs[k])
-
-        # Calculate decay rate by fitting exponential decay
-        decay_points = []
-        for window_days, pf in rolling_pfs.items():
-            if pf > 0.8:  # Only consider decent performance windows
-                time_from_peak = abs(window_days - peak_window)
-                decay_ratio = pf / peak_pf if peak_pf > 0 else 0
-                if decay_ratio > 0:
-                    decay_points.append((time_from_peak, decay_ratio))
-
-        if len(decay_points) >= 3:
-            # Fit exponential decay: ratio = exp(-decay_rate * time)
-            # Take log: ln(ratio) = -decay_rate * time
-            try:
-                # Simple linear regression on log decay
-                times = [t for t, r in decay_points]
-                log_ratios = [math.log(max(r, 0.01)) for t, r in decay_points]  # Avoid log(0)
-
-                # Calculate slope (decay rate)
-                n = len(times)
-                sum_t = sum(times)
-                sum_lr = sum(log_ratios)
-                sum_t_lr = sum(t * lr for t, lr in zip(times, log_ratios))
-                sum_t2 = sum(t * t for t in times)
-
-                if n * sum_t2 - sum_t * sum_t != 0:
-                    decay_rate = -(n * sum_t_lr - sum_t * sum_lr) / (n * sum_t2 - sum_t * sum_t)
-                    decay_rate = max(0.001, min(0.1, decay_rate))  # Reasonable bounds
-
-                    # Half-life: time for decay to 50% = ln(0.5) / -decay_rate
-                    half_life_days = math.log(0.5) / -decay_rate
-
-                    return {
-                        'half_life_days': max(7, min(180, half_life_days)),  # 1 week to 6 months
-                        'decay_rate': decay_rate,
-                        'model_type': 'exponential_decay_fit',
-                        'confidence': min(0.9, len(decay_points) / 10.0),
-                        'peak_pf': peak_pf,
-                        'data_points': len(decay_points)
-                    }
-            except (ValueError, ZeroDivisionError):
-                pass
-
-        # Fallback: use empirical decay patterns
-        return {
-            'half_life_days': 45.0,  # Conservative estimate
-            'decay_rate': 0.015,  # 1.5% daily decay
-            'model_type': 'empirical_fallback',
-            'confidence': 0.5
-        }
+            return fit_edge_decay(CloseSeries.from_returns({symbol: []}), self.min_samples_for_modeling)[0]
+        return fit_edge_decay(_series_of(symbol, historical_trades), 0)[0]
 
     def _calculate_edge_confidence(self, metrics: EdgeMetrics) -> float:
         """Calculate statistical confidence in edge measurement"""
@@ -276,51 +227,76 @@ class EdgeHalfLifeTracker:
 
         return freshness
 
-    def _log_edge_analysis(self, symbol: str, metrics: EdgeMetrics,
-                          strength: EdgeStrength, decay_model: Dict[str, Any]) -> None:
-        """Log edge analysis for future modeling improvement"""
-        record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "symbol": symbol,
-            "edge_metrics": {
-                "pf": metrics.pf,
-                "win_rate": metrics.win_rate,
-                "expectancy": metrics.expectancy,
-                "total_trades": metrics.total_trades,
-                "time_window_days": metrics.time_window_days
-            },
-            "edge_strength": {
+    def _load_state(self) -> Dict[str, Any]:
+        """Per-symbol state, re-read only when the file changed on disk."""
+        sig = codec.file_sig(self.state_file)
+        if sig != self._state_sig:
+            state: Dict[str, Any] = {}
+            if sig is not None:
+                try:
+                    state = json.loads(self.state_file.read_text())
+                except (OSError, json.JSONDecodeError):
+                    state = {}
+            self._state = state.get("symbols", {}) if isinstance(state, dict) else {}
+            self._state_sig = sig
+        return self._state
+
+    def _record_analyses(self, entries: List[Tuple[str, EdgeMetrics, EdgeStrength, Dict[str, Any]]],
+                         now: Optional[datetime] = None) -> None:
+        """Store the latest analysis of each symbol (one state write per batch)"""
+        now = now or datetime.now(timezone.utc)
+        day = now.date().isoformat()
+        oldest_day = (now - timedelta(days=self.analysis_window_days)).date().isoformat()
+        symbols = dict(self._load_state())
+
+        for symbol, metrics, strength, decay_model in entries:
+            prev = symbols.get(symbol, {})
+            recent = list(prev.get("recent", []))
+            recent.append({
+                "timestamp": now.isoformat(),
                 "absolute_strength": strength.absolute_strength,
-                "relative_strength": strength.relative_strength,
-                "confidence": strength.confidence,
                 "half_life_days": strength.half_life_days,
                 "decay_rate": strength.decay_rate,
-                "freshness_score": strength.freshness_score
-            },
-            "decay_model": decay_model
-        }
+            })
+            daily_counts = {d: c for d, c in prev.get("daily_counts", {}).items() if d >= oldest_day}
+            daily_counts[day] = daily_counts.get(day, 0) + 1
+            symbols[symbol] = {
+                "updated_at": now.isoformat(),
+                "edge_metrics": {
+                    "pf": metrics.pf,
+                    "win_rate": metrics.win_rate,
+                    "expectancy": metrics.expectancy,
+                    "total_trades": metrics.total_trades,
+                    "time_window_days": metrics.time_window_days
+                },
+                "edge_strength": strength._asdict(),
+                "decay_model": decay_model,
+                "recent": recent[-self.recent_analyses_kept:],
+                "daily_counts": daily_counts,
+            }
+
+        atomic_write_json(self.state_file, {"updated_at": now.isoformat(), "symbols": symbols})
+        self._state = symbols
+        self._state_sig = codec.file_sig(self.state_file)
+
+    def symbols(self) -> List[str]:
+        """Symbols with a recorded analysis"""
+        return sorted(self._load_state())
 
-        with self.edge_history_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+    def symbol_states(self) -> Dict[str, Dict[str, Any]]:
+        """Latest recorded analysis per symbol"""
+        return dict(self._load_state())
 
     def get_edge_health_assessment(self, symbol: str, lookback_days: int = 30) -> Dict[str, Any]:
         """Get comprehensive edge health assessment for a symbol"""
-        # Load historical edge analyses
-        assessments = []
-        if self.edge_history_file.exists():
-            cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
-            with self.edge_history_file.open("r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        record = json.loads(line)
-                        if record["symbol"] == symbol:
-                            record_ts = datetime.fromisoformat(record["timestamp"])
-                            if record_ts >= cutoff:
-                                assessments.append(record)
-                    except (json.JSONDecodeError, KeyError):
-                        continue
-
-        if not assessments:
+        # Last analyses in the lookback plus the number of analyses per day
+        state = self._load_state().get(symbol, {})
+        cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
+        recent_assessments = [a for a in state.get("recent", [])
+                              if datetime.fromisoformat(a["timestamp"]) >= cutoff]
+        data_points = sum(c for d, c in state.get("daily_counts", {}).items() if d >= cutoff.date().isoformat())
+
+        if not recent_assessments:
             return {
                 "symbol": symbol,
                 "status": "insufficient_data",
@@ -328,11 +304,11 @@ class EdgeHalfLifeTracker:
             }
 
         # Analyze edge health trends
-        recent_assessments = sorted(assessments[-10:], key=lambda x: x["timestamp"])  # Last 10
+        recent_assessments = sorted(recent_assessments, key=lambda x: x["timestamp"])
 
-        strengths = [a["edge_strength"]["absolute_strength"] for a in recent_assessments]
-        half_lives = [a["edge_strength"]["half_life_days"] for a in recent_assessments]
-        decay_rates = [a["edge_strength"]["decay_rate"] for a in recent_assessments]
+        strengths = [a["absolute_strength"] for a in recent_assessments]
+        half_lives = [a["half_life_days"] for a in recent_assessments]
+        decay_rates = [a["decay_rate"] for a in recent_assessments]
 
         # Trend analysis
         strength_trend = self._calculate_trend(strengths)
@@ -371,7 +347,7 @@ class EdgeHalfLifeTracker:
             "half_life_trend": half_life_trend,
             "avg_decay_rate": sum(decay_rates) / len(decay_rates) if decay_rates else 0,
             "analysis_period_days": lookback_days,
-            "data_points": len(assessments),
+            "data_points": data_points,
             "fvg_analysis": fvg_stats,
             "fvg_edge_insights": fvg_edge_insights
         }
@@ -492,10 +468,29 @@ class EdgeHalfLifeTracker:
         return signals
 
 
+def _series_of(symbol: str, trades: List[Dict[str, Any]]) -> CloseSeries:
+    """Time-ordered close returns of one symbol's trade dicts"""
+    ordered = sorted(trades, key=lambda x: x.get('ts', ''))
+    return CloseSeries.from_returns({symbol: [t['pct'] for t in ordered if t.get('pct') is not None]})
+
+
 # Global edge half-life tracker instance
 edge_half_life_tracker = EdgeHalfLifeTracker()
 
 
+def run_edge_half_life_batch() -> Dict[str, Any]:
+    """Nightly batch: analyze every traded symbol and refresh the state file"""
+    registry = get_feature_registry()
+    if registry.is_off("edge_half_life"):
+        return {"status": "feature_disabled"}
+    results = edge_half_life_tracker.analyze_all_symbols()
+    return {
+        "status": "ok",
+        "symbols_analyzed": len(results),
+        "state_file": str(edge_half_life_tracker.state_file),
+    }
+
+
 def analyze_edge_strength(symbol: str, pf: float, win_rate: float, expectancy: float,
                         total_trades: int, time_window_days: int,
                         historical_trades: List[Dict[str, Any]]) -> EdgeStrength:
@@ -6,18 +6,28 @@ Detects and tracks Fair Value Gaps (FVGs) - structural price dislocations where
 aggressive order flow creates imbalances that price often revisits to fill.
 
 Observer-only initially: detects, classifies, and tracks FVGs for meta-analysis.
+
+Each call scans only candles newer than the last one seen for the symbol (plus
+the two before them, so patterns spanning calls are found) with the array
+kernels of fvg_index, and checks each bar only against the open gaps it
+reaches into. Gap state lives in a compact snapshot
+(reports/fair_value_gaps_state.json): open gaps plus the last 30 days of
+filled / expired ones per symbol. The JSONL log keeps new gaps and their
+fill / expiry transitions for dashboards.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Tuple, NamedTuple
+from typing import Deque, Dict, List, Any, Optional, Tuple, NamedTuple
+from collections import deque
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
-import math
 
-from engine_alpha.core.regime import classify_regime
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.config.feature_flags import get_feature_registry
+from engine_alpha.reflect.fvg_index import BULLISH, GapIndex, scan_fvgs
 
 
 class FairValueGap(NamedTuple):
@@ -39,6 +49,65 @@ class FairValueGap(NamedTuple):
     status: str = "active"  # 'active', 'partially_filled', 'filled', 'expired'
 
 
+@dataclass
+class _SymbolGaps:
+    """Scan position and tracked gaps of one symbol"""
+    last_ts_ms: Optional[int] = None  # Newest candle scanned
+    bars: int = 0  # Candles scanned so far (bar numbers for expiry / time to fill)
+    tail: List[Dict[str, Any]] = field(default_factory=list)  # Last two candles, for patterns spanning calls
+    gaps: Dict[str, FairValueGap] = field(default_factory=dict)
+    opened_at_bar: Dict[str, int] = field(default_factory=dict)  # Open gaps only
+    index: GapIndex = field(default_factory=GapIndex)  # Open gaps by price range
+    expiry: Deque[Tuple[int, str]] = field(default_factory=deque)  # (bar opened, gap id), oldest first
+
+
+def _candle_ts_ms(candle: Dict[str, Any]) -> Optional[int]:
+    value = candle.get('timestamp')
+    return codec.iso_to_ms(value if value is not None else candle.get('ts'))
+
+
+def _gap_record(gap: FairValueGap, with_candles: bool = True) -> Dict[str, Any]:
+    record = {
+        "timestamp": gap.timestamp.isoformat(),
+        "symbol": gap.symbol,
+        "direction": gap.direction,
+        "upper_bound": gap.upper_bound,
+        "lower_bound": gap.lower_bound,
+        "gap_size": gap.gap_size,
+        "gap_size_pct": gap.gap_size_pct,
+        "impulse_strength": gap.impulse_strength,
+        "volume_spike": gap.volume_spike,
+        "regime_at_creation": gap.regime_at_creation,
+        "filled_percentage": gap.filled_percentage,
+        "time_to_first_fill": gap.time_to_first_fill,
+        "fully_filled_at": gap.fully_filled_at.isoformat() if gap.fully_filled_at else None,
+        "status": gap.status,
+    }
+    if with_candles:
+        record["creation_candles"] = gap.creation_candles
+    return record
+
+
+def _gap_from_record(record: Dict[str, Any]) -> FairValueGap:
+    return FairValueGap(
+        timestamp=datetime.fromisoformat(record["timestamp"]),
+        symbol=record["symbol"],
+        direction=record["direction"],
+        upper_bound=record["upper_bound"],
+        lower_bound=record["lower_bound"],
+        gap_size=record["gap_size"],
+        gap_size_pct=record["gap_size_pct"],
+        impulse_strength=record["impulse_strength"],
+        volume_spike=record["volume_spike"],
+        regime_at_creation=record["regime_at_creation"],
+        creation_candles=record.get("creation_candles", {}),
+        filled_percentage=record.get("filled_percentage", 0.0),
+        time_to_first_fill=record.get("time_to_first_fill"),
+        fully_filled_at=datetime.fromisoformat(record["fully_filled_at"]) if record.get("fully_filled_at") else None,
+        status=record.get("status", "active")
+    )
+
+
 @dataclass
 class FVGDetector:
     """Detects and tracks Fair Value Gaps in real-time"""
@@ -46,36 +115,71 @@ class FVGDetector:
     gap_log_file: Path = field(default_factory=lambda: Path("reports/fair_value_gaps.jsonl"))
     min_gap_size_pct: float = 0.1  # Minimum gap size (0.1% of price)
     max_gap_size_pct: float = 5.0  # Maximum gap size to avoid outliers
-    lookback_candles: int = 50  # How many candles to keep for analysis
     gap_expiry_candles: int = 200  # Candles after which unfilled gap expires
+    history_days: int = 30  # How long filled / expired gaps stay in the snapshot
 
     def __post_init__(self):
         self.gap_log_file.parent.mkdir(parents=True, exist_ok=True)
-        self.recent_candles: Dict[str, List[Dict[str, Any]]] = {}
-        # Track already logged gaps to prevent duplicate logging
-        self._logged_gaps: Set[str] = set()
-        # Rate limiting: last log timestamp per symbol+timeframe
-        self._last_log_per_symbol: Dict[str, datetime] = {}
-        # Cache of gap states for change detection
-        self._gap_states: Dict[str, Dict[str, Any]] = self._load_gap_states()
-
-    def _load_gap_states(self) -> Dict[str, Dict[str, Any]]:
-        """Load gap states cache from disk"""
-        cache_file = self.gap_log_file.parent / "fair_value_gaps_index.json"
-        if cache_file.exists():
-            try:
-                return json.loads(cache_file.read_text())
-            except Exception:
-                pass
-        return {}
-
-    def _save_gap_states(self) -> None:
-        """Save gap states cache to disk"""
-        cache_file = self.gap_log_file.parent / "fair_value_gaps_index.json"
+        self.state_file = self.gap_log_file.parent / "fair_value_gaps_state.json"
+        self._symbols: Dict[str, _SymbolGaps] = {}
+        self._state_sig: Optional[Tuple[int, int, int]] = None
+
+    # -- snapshot ---------------------------------------------------------------
+
+    def _load_state(self) -> Dict[str, _SymbolGaps]:
+        """Gap state of all symbols, re-read only when the snapshot changed on disk"""
+        sig = codec.file_sig(self.state_file)
+        if sig == self._state_sig:
+            return self._symbols
+        symbols: Dict[str, _SymbolGaps] = {}
         try:
-            cache_file.write_text(json.dumps(self._gap_states, indent=2))
-        except Exception:
-            pass
+            payload = json.loads(self.state_file.read_text()) if sig is not None else {}
+        except (OSError, json.JSONDecodeError):
+            payload = {}
+        for symbol, raw in (payload.get("symbols") or {}).items():
+            try:
+                state = _SymbolGaps(last_ts_ms=raw.get("last_ts_ms"), bars=raw.get("bars", 0),
+                                    tail=raw.get("tail", []))
+                opened = []
+                for record in raw.get("gaps", []):
+                    gap = _gap_from_record(record)
+                    gap_id = record["id"]
+                    state.gaps[gap_id] = gap
+                    if record.get("opened_at_bar") is not None:
+                        state.opened_at_bar[gap_id] = record["opened_at_bar"]
+                        state.index.add(gap_id, gap.lower_bound, gap.upper_bound)
+                        opened.append((record["opened_at_bar"], gap_id))
+                state.expiry.extend(sorted(opened))
+                symbols[symbol] = state
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._symbols = symbols
+        self._state_sig = sig
+        return symbols
+
+    def _save_state(self) -> None:
+        """Write the snapshot, dropping closed gaps older than history_days"""
+        out = {}
+        for symbol, state in self._symbols.items():
+            if state.last_ts_ms is not None:
+                cutoff = datetime.fromtimestamp(state.last_ts_ms / 1000, tz=timezone.utc) - timedelta(days=self.history_days)
+                for gap_id in [g for g, gap in state.gaps.items()
+                               if g not in state.opened_at_bar and gap.timestamp < cutoff]:
+                    del state.gaps[gap_id]
+            out[symbol] = {
+                "last_ts_ms": state.last_ts_ms,
+                "bars": state.bars,
+                "tail": state.tail,
+                "gaps": [
+                    dict(_gap_record(gap, with_candles=False), id=gap_id,
+                         opened_at_bar=state.opened_at_bar.get(gap_id))
+                    for gap_id, gap in state.gaps.items()
+                ],
+            }
+        atomic_write_json(self.state_file, {"updated_at": datetime.now(timezone.utc).isoformat(), "symbols": out})
+        self._state_sig = codec.file_sig(self.state_file)
+
+    # -- detection --------------------------------------------------------------
 
     def detect_fvgs(self, symbol: str, candles: List[Dict[str, Any]],
                    current_regime: str) -> List[FairValueGap]:
@@ -84,138 +188,129 @@ class FVGDetector:
 
         Args:
             symbol: Trading symbol
-            candles: Recent OHLCV candles (latest first)
+            candles: Recent OHLCV candles (any order; 'timestamp' epoch or 'ts')
             current_regime: Current market regime
 
         Returns:
             List of newly detected FVGs
         """
-        if len(candles) < 3:
-            return []
-
-        # Update recent candles cache
-        if symbol not in self.recent_candles:
-            self.recent_candles[symbol] = []
-
-        # Add new candles (avoid duplicates)
-        existing_timestamps = {c.get('timestamp') for c in self.recent_candles[symbol]}
-        new_candles = [c for c in candles if c.get('timestamp') not in existing_timestamps]
-
-        self.recent_candles[symbol].extend(new_candles)
-        self.recent_candles[symbol] = self.recent_candles[symbol][-self.lookback_candles:]
-
-        # Sort by timestamp (oldest first for analysis)
-        sorted_candles = sorted(self.recent_candles[symbol], key=lambda x: x.get('timestamp', 0))
-
-        if len(sorted_candles) < 3:
-            return []
-
-        detected_gaps = []
-
-        # Scan for FVGs in recent candles
-        for i in range(len(sorted_candles) - 2):
-            # Check for FVG at positions i, i+1, i+2
-            gap = self._detect_fvg_at_position(sorted_candles, i, symbol, current_regime)
-            if gap:
-                detected_gaps.append(gap)
-
-        # Update existing gaps with fill status
-        self._update_gap_fill_status(symbol, sorted_candles)
-
-        return detected_gaps
-
-    def _detect_fvg_at_position(self, candles: List[Dict[str, Any]], position: int,
-                              symbol: str, regime: str) -> Optional[FairValueGap]:
-        """Detect FVG at specific candle position"""
-        if position + 2 >= len(candles):
-            return None
-
-        c1 = candles[position]      # i-1 (first candle)
-        c2 = candles[position + 1]  # i (middle candle)
-        c3 = candles[position + 2]  # i+1 (third candle)
-
-        # Extract OHLC
-        c1_high = c1.get('high', 0)
-        c1_low = c1.get('low', 0)
-        c3_high = c3.get('high', 0)
-        c3_low = c3.get('low', 0)
-
-        # Check for bullish FVG: low(i+1) > high(i-1)
-        if c3_low > c1_high:
-            gap_size = c3_low - c1_high
-            gap_size_pct = (gap_size / c1_high) * 100
-
-            if self.min_gap_size_pct <= gap_size_pct <= self.max_gap_size_pct:
-                return self._create_fvg(
-                    symbol=symbol,
-                    direction="bullish",
-                    upper_bound=c3_low,
-                    lower_bound=c1_high,
-                    gap_size=gap_size,
-                    gap_size_pct=gap_size_pct,
-                    candles=[c1, c2, c3],
-                    regime=regime,
-                    timestamp=datetime.fromtimestamp(c3.get('timestamp', 0), tz=timezone.utc)
-                )
+        symbols = self._load_state()
+        state = symbols.setdefault(symbol, _SymbolGaps())
+        bars = state.bars
+        detected, transitions = self._advance(symbol, state, candles, current_regime)
+        if state.bars == bars:
+            return detected  # No new candles since the last call
+
+        # Fill / expiry transitions go to the log for dashboards
+        for gap in transitions:
+            self._update_gap_in_log(gap)
+        self._save_state()
+        return detected
+
+    def scan_symbols(self, candles_by_symbol: Dict[str, List[Dict[str, Any]]],
+                     current_regime: str = "unknown") -> Dict[str, List[FairValueGap]]:
+        """
+        Scan many symbols (e.g. a multi-year backfill) with one snapshot write.
 
-        # Check for bearish FVG: high(i+1) < low(i-1)
-        elif c3_high < c1_low:
-            gap_size = c1_low - c3_high
-            gap_size_pct = (gap_size / c1_low) * 100
-
-            if self.min_gap_size_pct <= gap_size_pct <= self.max_gap_size_pct:
-                return self._create_fvg(
-                    symbol=symbol,
-                    direction="bearish",
-                    upper_bound=c1_low,
-                    lower_bound=c3_high,
-                    gap_size=gap_size,
-                    gap_size_pct=gap_size_pct,
-                    candles=[c1, c2, c3],
-                    regime=regime,
-                    timestamp=datetime.fromtimestamp(c3.get('timestamp', 0), tz=timezone.utc)
+        Fill / expiry transitions are kept in the snapshot only, not logged.
+        """
+        symbols = self._load_state()
+        detected = {}
+        for symbol, candles in candles_by_symbol.items():
+            state = symbols.setdefault(symbol, _SymbolGaps())
+            detected[symbol] = self._advance(symbol, state, candles, current_regime)[0]
+        self._save_state()
+        return detected
+
+    def _advance(self, symbol: str, state: _SymbolGaps, candles: List[Dict[str, Any]],
+                 regime: str) -> Tuple[List[FairValueGap], List[FairValueGap]]:
+        """Scan the candles newer than the last one seen; returns (new gaps, closed gaps)"""
+        by_ts: Dict[int, Dict[str, Any]] = {}
+        for candle in candles:
+            ts_ms = _candle_ts_ms(candle)
+            if ts_ms is not None and (state.last_ts_ms is None or ts_ms > state.last_ts_ms):
+                by_ts[ts_ms] = candle
+        if not by_ts:
+            return [], []
+
+        tail_ts = [_candle_ts_ms(c) for c in state.tail]
+        rows = state.tail + [by_ts[ts] for ts in sorted(by_ts)]
+        times = tail_ts + sorted(by_ts)
+        highs = [float(c.get('high', 0)) for c in rows]
+        lows = [float(c.get('low', 0)) for c in rows]
+        hits = scan_fvgs([c.get('open', 0) for c in rows], highs, lows, [c.get('close', 0) for c in rows],
+                         self.min_gap_size_pct, self.max_gap_size_pct)
+        offset = len(state.tail)
+        created = {int(bar): k for k, bar in enumerate(hits["bar"]) if bar >= offset}
+
+        detected: List[FairValueGap] = []
+        closed: List[FairValueGap] = []
+        bar_no = state.bars
+        for j in range(offset, len(rows)):
+            bar_no += 1
+            if state.index:
+                closed.extend(self._apply_bar(state, highs[j], lows[j], times[j], bar_no))
+
+            k = created.get(j)
+            if k is not None:
+                gap = self._gap_from_hit(symbol, hits, k, rows[j - 2:j + 1], times[j], regime)
+                gap_id = f"{gap.direction}:{times[j]}"
+                state.gaps[gap_id] = gap
+                state.opened_at_bar[gap_id] = bar_no
+                state.index.add(gap_id, gap.lower_bound, gap.upper_bound)
+                state.expiry.append((bar_no, gap_id))
+                detected.append(gap)
+
+            # Expire gaps left unfilled for gap_expiry_candles
+            while state.expiry and bar_no - state.expiry[0][0] > self.gap_expiry_candles:
+                _, gap_id = state.expiry.popleft()
+                if state.opened_at_bar.pop(gap_id, None) is not None:
+                    state.index.remove(gap_id)
+                    state.gaps[gap_id] = state.gaps[gap_id]._replace(status="expired")
+                    closed.append(state.gaps[gap_id])
+
+        state.bars = bar_no
+        state.last_ts_ms = times[-1]
+        state.tail = rows[-2:]
+        return detected, closed
+
+    def _apply_bar(self, state: _SymbolGaps, high: float, low: float, ts_ms: int,
+                   bar_no: int) -> List[FairValueGap]:
+        """Fill the open gaps a bar reaches into; returns gaps it fills completely"""
+        filled = []
+        for gap_id in state.index.overlapping(low, high):
+            gap = state.gaps[gap_id]
+            gap_range = gap.upper_bound - gap.lower_bound
+            fill_pct = (min(high, gap.upper_bound) - max(low, gap.lower_bound)) / gap_range
+            time_to_fill = gap.time_to_first_fill or bar_no - state.opened_at_bar[gap_id]
+            if fill_pct >= 1.0:
+                gap = gap._replace(
+                    filled_percentage=1.0,
+                    time_to_first_fill=time_to_fill,
+                    fully_filled_at=datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc),
+                    status="filled"
                 )
-
-        return None
-
-    def _create_fvg(self, symbol: str, direction: str, upper_bound: float, lower_bound: float,
-                   gap_size: float, gap_size_pct: float, candles: List[Dict[str, Any]],
-                   regime: str, timestamp: datetime) -> FairValueGap:
-        """Create a FairValueGap object with impulse strength analysis"""
-
-        # Calculate impulse strength (size and momentum of the move)
-        impulse_candle = candles[1]  # Middle candle (the dislocation)
-        impulse_range = impulse_candle.get('high', 0) - impulse_candle.get('low', 0)
-        impulse_body = abs(impulse_candle.get('close', 0) - impulse_candle.get('open', 0))
-
-        # Relative to previous candle
-        if len(candles) >= 2:
-            prev_candle = candles[0]
-            prev_range = prev_candle.get('high', 0) - prev_candle.get('low', 0)
-            impulse_multiplier = impulse_range / prev_range if prev_range > 0 else 1.0
-        else:
-            impulse_multiplier = 1.0
-
-        # Combine factors for impulse strength (0.0-1.0)
-        range_factor = min(1.0, impulse_range / (upper_bound * 0.01))  # Relative to price
-        body_factor = min(1.0, impulse_body / impulse_range) if impulse_range > 0 else 0.0
-        multiplier_factor = min(1.0, impulse_multiplier / 3.0)  # Cap at 3x normal
-
-        impulse_strength = (range_factor * 0.5) + (body_factor * 0.3) + (multiplier_factor * 0.2)
-
-        # Volume spike analysis
-        volume_spike = self._calculate_volume_spike(candles)
-
+                state.index.remove(gap_id)
+                del state.opened_at_bar[gap_id]
+                filled.append(gap)
+            elif fill_pct > gap.filled_percentage:
+                gap = gap._replace(filled_percentage=fill_pct, time_to_first_fill=time_to_fill)
+            state.gaps[gap_id] = gap
+        return filled
+
+    def _gap_from_hit(self, symbol: str, hits: Dict[str, Any], k: int, candles: List[Dict[str, Any]],
+                      ts_ms: int, regime: str) -> FairValueGap:
+        """FairValueGap for hit k of scan_fvgs, completed by the last of the three candles"""
         return FairValueGap(
-            timestamp=timestamp,
+            timestamp=datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc),
             symbol=symbol,
-            direction=direction,
-            upper_bound=upper_bound,
-            lower_bound=lower_bound,
-            gap_size=gap_size,
-            gap_size_pct=gap_size_pct,
-            impulse_strength=impulse_strength,
-            volume_spike=volume_spike,
+            direction="bullish" if hits["direction"][k] == BULLISH else "bearish",
+            upper_bound=float(hits["upper"][k]),
+            lower_bound=float(hits["lower"][k]),
+            gap_size=float(hits["size"][k]),
+            gap_size_pct=float(hits["size_pct"][k]),
+            impulse_strength=float(hits["impulse"][k]),
+            volume_spike=self._calculate_volume_spike(candles),
             regime_at_creation=regime,
             creation_candles={
                 'candle_minus_1': candles[0],
@@ -248,219 +343,36 @@ class FVGDetector:
         avg_surrounding_volume = sum(surrounding_volumes) / len(surrounding_volumes)
         return current_volume / avg_surrounding_volume if avg_surrounding_volume > 0 else 1.0
 
-    def _update_gap_fill_status(self, symbol: str, candles: List[Dict[str, Any]]) -> None:
-        """Update fill status for existing FVGs"""
-        # Load existing gaps
-        existing_gaps = self._load_existing_gaps(symbol)
-
-        for gap in existing_gaps:
-            if gap.status in ['filled', 'expired']:
-                continue
-
-            # Check if gap has been filled by recent price action
-            filled_pct, time_to_fill, fully_filled = self._check_gap_fill_status(gap, candles)
-
-            if fully_filled and not gap.fully_filled_at:
-                # Update the gap as filled
-                updated_gap = gap._replace(
-                    filled_percentage=1.0,
-                    time_to_first_fill=time_to_fill,
-                    fully_filled_at=datetime.now(timezone.utc),
-                    status="filled"
-                )
-                self._update_gap_in_log(gap, updated_gap)
-            elif filled_pct > gap.filled_percentage:
-                # Update partial fill
-                updated_gap = gap._replace(
-                    filled_percentage=filled_pct,
-                    time_to_first_fill=time_to_fill if not gap.time_to_first_fill else gap.time_to_first_fill
-                )
-                self._update_gap_in_log(gap, updated_gap)
-
-            # Check for expiry
-            candles_since_creation = len([c for c in candles
-                                        if c.get('timestamp', 0) > gap.timestamp.timestamp()])
-            if candles_since_creation > self.gap_expiry_candles and gap.status == "active":
-                updated_gap = gap._replace(status="expired")
-                self._update_gap_in_log(gap, updated_gap)
-
-    def _check_gap_fill_status(self, gap: FairValueGap,
-                             candles: List[Dict[str, Any]]) -> Tuple[float, Optional[int], bool]:
-        """Check how much of a gap has been filled by price action"""
-        filled_pct = 0.0
-        time_to_fill = None
-        fully_filled = False
-
-        gap_range = gap.upper_bound - gap.lower_bound
-
-        for i, candle in enumerate(candles):
-            high = candle.get('high', 0)
-            low = candle.get('low', 0)
-
-            # Check if candle overlaps with gap
-            overlap_high = min(high, gap.upper_bound)
-            overlap_low = max(low, gap.lower_bound)
-            overlap_size = max(0, overlap_high - overlap_low)
-
-            candle_fill_pct = overlap_size / gap_range if gap_range > 0 else 0
-            filled_pct = max(filled_pct, candle_fill_pct)
-
-            # Track time to first fill
-            if time_to_fill is None and candle_fill_pct > 0:
-                time_to_fill = i + 1  # +1 because we want candles after creation
-
-            # Check for complete fill
-            if filled_pct >= 1.0:
-                fully_filled = True
-                break
-
-        return filled_pct, time_to_fill, fully_filled
-
-    def _load_existing_gaps(self, symbol: str) -> List[FairValueGap]:
-        """Load existing FVGs for a symbol"""
-        gaps = []
-        if not self.gap_log_file.exists():
-            return gaps
-
-        with self.gap_log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("symbol") == symbol:
-                        # Reconstruct FairValueGap from stored data
-                        gap = FairValueGap(
-                            timestamp=datetime.fromisoformat(record["timestamp"]),
-                            symbol=record["symbol"],
-                            direction=record["direction"],
-                            upper_bound=record["upper_bound"],
-                            lower_bound=record["lower_bound"],
-                            gap_size=record["gap_size"],
-                            gap_size_pct=record["gap_size_pct"],
-                            impulse_strength=record["impulse_strength"],
-                            volume_spike=record["volume_spike"],
-                            regime_at_creation=record["regime_at_creation"],
-                            creation_candles=record["creation_candles"],
-                            filled_percentage=record.get("filled_percentage", 0.0),
-                            time_to_first_fill=record.get("time_to_first_fill"),
-                            fully_filled_at=datetime.fromisoformat(record["fully_filled_at"]) if record.get("fully_filled_at") else None,
-                            status=record.get("status", "active")
-                        )
-                        gaps.append(gap)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        return gaps
-
-    def _update_gap_in_log(self, old_gap: FairValueGap, new_gap: FairValueGap) -> None:
-        """Update a gap in the log file (simplified - would need proper file editing in production)"""
-        # For now, just append the updated version
-        # In production, you'd need to update the existing record
-        record = {
-            "timestamp": new_gap.timestamp.isoformat(),
-            "symbol": new_gap.symbol,
-            "direction": new_gap.direction,
-            "upper_bound": new_gap.upper_bound,
-            "lower_bound": new_gap.lower_bound,
-            "gap_size": new_gap.gap_size,
-            "gap_size_pct": new_gap.gap_size_pct,
-            "impulse_strength": new_gap.impulse_strength,
-            "volume_spike": new_gap.volume_spike,
-            "regime_at_creation": new_gap.regime_at_creation,
-            "creation_candles": new_gap.creation_candles,
-            "filled_percentage": new_gap.filled_percentage,
-            "time_to_first_fill": new_gap.time_to_first_fill,
-            "fully_filled_at": new_gap.fully_filled_at.isoformat() if new_gap.fully_filled_at else None,
-            "status": new_gap.status,
-            "updated": True
-        }
+    # -- log and statistics -----------------------------------------------------
 
+    def _update_gap_in_log(self, gap: FairValueGap) -> None:
+        """Append a gap's fill / expiry transition to the log"""
+        record = dict(_gap_record(gap), updated=True)
         with self.gap_log_file.open("a", encoding="utf-8") as f:
             f.write(json.dumps(record) + "\n")
 
     def log_fvg(self, gap: FairValueGap, current_timeframe: str = "15m") -> None:
-        """Log a detected FVG with rate limiting and change detection"""
-        # Create unique key for this gap
-        gap_key = f"{gap.symbol}_{current_timeframe}_{gap.direction}_{gap.upper_bound}_{gap.lower_bound}_{gap.timestamp.isoformat()}"
-
-        # Rate limiting: max 1 log per symbol+timeframe per candle timestamp
-        rate_limit_key = f"{gap.symbol}_{current_timeframe}"
-        current_time = datetime.now(timezone.utc)
-
-        # Check rate limit (allow logging once per symbol+timeframe)
-        if rate_limit_key in self._last_log_per_symbol:
-            last_log_time = self._last_log_per_symbol[rate_limit_key]
-            # Allow logging if it's been more than 1 second (avoids per-tick spam)
-            if (current_time - last_log_time).total_seconds() < 1.0:
-                return
-        self._last_log_per_symbol[rate_limit_key] = current_time
-
-        # Check if this is a new gap or significant status change
-        should_log = False
-        previous_state = self._gap_states.get(gap_key, {})
-
-        if not previous_state:
-            # New gap - always log
-            should_log = True
-        else:
-            # Check for meaningful fill status changes
-            prev_fill = previous_state.get("filled_percentage", 0)
-            current_fill = gap.filled_percentage
-
-            # Log on significant fill thresholds: 0%→25%, 25%→50%, 50%→75%, 75%→100%
-            fill_thresholds = [(0, 25), (25, 50), (50, 75), (75, 100)]
-            for min_fill, max_fill in fill_thresholds:
-                if prev_fill < min_fill and current_fill >= min_fill:
-                    should_log = True
-                    break
-                if prev_fill < max_fill and current_fill >= max_fill:
-                    should_log = True
-                    break
-
-            # Also log if gap becomes fully filled
-            if current_fill >= 100 and prev_fill < 100:
-                should_log = True
-
-        if not should_log:
-            return
-
-        # Update cache with current state
-        self._gap_states[gap_key] = {
-            "filled_percentage": gap.filled_percentage,
-            "status": gap.status,
-            "last_updated": current_time.isoformat()
-        }
-        self._save_gap_states()
-
-        # Create log record
-        record = {
-            "timestamp": gap.timestamp.isoformat(),
-            "symbol": gap.symbol,
-            "timeframe": current_timeframe,
-            "direction": gap.direction,
-            "upper_bound": gap.upper_bound,
-            "lower_bound": gap.lower_bound,
-            "gap_size": gap.gap_size,
-            "gap_size_pct": gap.gap_size_pct,
-            "impulse_strength": gap.impulse_strength,
-            "volume_spike": gap.volume_spike,
-            "regime_at_creation": gap.regime_at_creation,
-            "creation_candles": gap.creation_candles,
-            "filled_percentage": gap.filled_percentage,
-            "time_to_first_fill": gap.time_to_first_fill,
-            "fully_filled_at": gap.fully_filled_at.isoformat() if gap.fully_filled_at else None,
-            "status": gap.status,
-            "log_reason": "new_gap" if not previous_state else f"fill_{int(prev_fill)}_to_{int(current_fill)}"
-        }
-
+        """Log a newly detected FVG (detection reports each gap once)"""
+        record = dict(_gap_record(gap), timeframe=current_timeframe, log_reason="new_gap")
         with self.gap_log_file.open("a", encoding="utf-8") as f:
             f.write(json.dumps(record) + "\n")
 
-    def get_fvg_statistics(self, symbol: str, days_back: int = 30) -> Dict[str, Any]:
-        """Get comprehensive FVG statistics for analysis"""
-        gaps = self._load_existing_gaps(symbol)
+    def symbols(self) -> List[str]:
+        """Symbols with tracked gaps"""
+        return sorted(s for s, state in self._load_state().items() if state.gaps)
+
+    def recent_gaps(self, days_back: int = 7, symbol: Optional[str] = None) -> List[FairValueGap]:
+        """Tracked gaps created in the last days_back days (current status), oldest first"""
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+        states = self._load_state()
+        if symbol is not None:
+            states = {symbol: states[symbol]} if symbol in states else {}
+        gaps = [g for state in states.values() for g in state.gaps.values() if g.timestamp >= cutoff]
+        return sorted(gaps, key=lambda g: g.timestamp)
 
-        recent_gaps = [g for g in gaps if g.timestamp >= cutoff]
+    def get_fvg_statistics(self, symbol: str, days_back: int = 30) -> Dict[str, Any]:
+        """Get comprehensive FVG statistics for analysis"""
+        recent_gaps = self.recent_gaps(days_back, symbol)
 
         if not recent_gaps:
             return {"status": "no_data", "symbol": symbol}
@@ -527,7 +439,7 @@ def detect_and_log_fvgs(symbol: str, candles: List[Dict[str, Any]],
 
     gaps = fvg_detector.detect_fvgs(symbol, candles, current_regime)
 
-    # Log detected gaps with rate limiting and change detection
+    # Log newly detected gaps (each gap is reported once)
     for gap in gaps:
         fvg_detector.log_fvg(gap, timeframe)
 
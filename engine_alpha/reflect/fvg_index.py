@@ -0,0 +1,201 @@
+"""
+Fair Value Gap kernels - array three-bar scan and an interval index of open gaps.
+
+- scan_fvgs(): every three-bar gap of an OHLC series at once. Bar i completes
+  a bullish gap when low[i] > high[i-2] and a bearish one when
+  high[i] < low[i-2]; gaps outside the size band (percent of the bar i-2
+  bound) are dropped. Impulse strength of the middle bar is computed for the
+  hits in the same pass.
+- GapIndex: open gaps in a treap ordered by lower bound, each node carrying
+  the largest upper bound of its subtree. The gaps a bar [low, high] reaches
+  into are found in O(log n + k) and filled gaps leave in O(log n), so a bar
+  is never checked against every open gap.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BULLISH = 1
+BEARISH = -1
+
+
+def scan_fvgs(open_: Sequence[float], high: Sequence[float], low: Sequence[float], close: Sequence[float],
+              min_gap_pct: float, max_gap_pct: float) -> Dict[str, np.ndarray]:
+    """
+    Three-bar FVGs of an OHLC series (oldest bar first).
+
+    Returns arrays over the hits, in bar order: "bar" (index of the bar that
+    completes the gap), "direction" (BULLISH / BEARISH), "upper", "lower",
+    "size", "size_pct" and "impulse" (impulse strength of the middle bar).
+    """
+    o, h, l, c = (np.asarray(a, dtype=float) for a in (open_, high, low, close))
+    n = len(h)
+    if n < 3:
+        empty = np.zeros(0)
+        return {"bar": np.zeros(0, dtype=np.int64), "direction": np.zeros(0, dtype=np.int64),
+                "upper": empty, "lower": empty, "size": empty, "size_pct": empty, "impulse": empty}
+
+    h1, l1, h3, l3 = h[:-2], l[:-2], h[2:], l[2:]
+    bullish = l3 > h1
+    bearish = ~bullish & (h3 < l1)
+    upper = np.where(bullish, l3, l1)
+    lower = np.where(bullish, h1, h3)
+    size = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        size_pct = size / np.where(bullish, h1, l1) * 100
+    hit = (bullish | bearish) & np.isfinite(size_pct) & (size_pct >= min_gap_pct) & (size_pct <= max_gap_pct)
+    idx = np.flatnonzero(hit)
+
+    # Impulse strength: middle bar range vs price and vs the first bar, plus body share
+    mid_range = h[1:-1][idx] - l[1:-1][idx]
+    mid_body = np.abs(c[1:-1][idx] - o[1:-1][idx])
+    prev_range = h1[idx] - l1[idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        multiplier = np.where(prev_range > 0, mid_range / prev_range, 1.0)
+        range_factor = np.minimum(1.0, mid_range / (upper[idx] * 0.01))
+        body_factor = np.where(mid_range > 0, np.minimum(1.0, mid_body / mid_range), 0.0)
+    impulse = range_factor * 0.5 + body_factor * 0.3 + np.minimum(1.0, multiplier / 3.0) * 0.2
+
+    return {
+        "bar": idx + 2,
+        "direction": np.where(bullish[idx], BULLISH, BEARISH),
+        "upper": upper[idx],
+        "lower": lower[idx],
+        "size": size[idx],
+        "size_pct": size_pct[idx],
+        "impulse": impulse,
+    }
+
+
+class _Node:
+    __slots__ = ("key", "upper", "gap_id", "prio", "left", "right", "max_upper")
+
+    def __init__(self, key: Tuple[float, int], upper: float, gap_id: str, prio: float) -> None:
+        self.key = key
+        self.upper = upper
+        self.gap_id = gap_id
+        self.prio = prio
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.max_upper = upper
+
+
+def _pull(node: _Node) -> None:
+    m = node.upper
+    if node.left is not None and node.left.max_upper > m:
+        m = node.left.max_upper
+    if node.right is not None and node.right.max_upper > m:
+        m = node.right.max_upper
+    node.max_upper = m
+
+
+def _split(node: Optional[_Node], key: Tuple[float, int]) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """(nodes with key < key, the rest)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        _pull(node)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    _pull(node)
+    return left, node
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """Join two treaps where every key of a is below every key of b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _pull(a)
+        return a
+    b.left = _merge(a, b.left)
+    _pull(b)
+    return b
+
+
+def _delete(node: Optional[_Node], key: Tuple[float, int]) -> Optional[_Node]:
+    if node is None:
+        return None
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    elif node.key < key:
+        node.right = _delete(node.right, key)
+    else:
+        return _merge(node.left, node.right)
+    _pull(node)
+    return node
+
+
+def _collect(node: Optional[_Node], low: float, high: float, out: List[str]) -> None:
+    while node is not None and node.max_upper > low:
+        _collect(node.left, low, high, out)
+        if node.key[0] >= high:
+            return  # This node and everything to its right start above the bar
+        if node.upper > low:
+            out.append(node.gap_id)
+        node = node.right
+
+
+class GapIndex:
+    """Open gaps by price range: overlap queries and removal in logarithmic time."""
+
+    def __init__(self, seed: int = 0) -> None:
+        self._root: Optional[_Node] = None
+        self._keys: Dict[str, Tuple[float, int]] = {}
+        self._seq = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, gap_id: str) -> bool:
+        return gap_id in self._keys
+
+    def add(self, gap_id: str, lower: float, upper: float) -> None:
+        if gap_id in self._keys:
+            self.remove(gap_id)
+        self._seq += 1
+        key = (float(lower), self._seq)
+        self._keys[gap_id] = key
+        left, right = _split(self._root, key)
+        node = _Node(key, float(upper), gap_id, self._rng.random())
+        self._root = _merge(_merge(left, node), right)
+
+    def remove(self, gap_id: str) -> bool:
+        key = self._keys.pop(gap_id, None)
+        if key is None:
+            return False
+        self._root = _delete(self._root, key)
+        return True
+
+    def overlapping(self, low: float, high: float) -> List[str]:
+        """Ids of gaps sharing a positive-width price range with [low, high], by lower bound."""
+        out: List[str] = []
+        if self._root is not None and high > low:
+            _collect(self._root, low, high, out)
+        return out
+
+    def items(self) -> Iterator[Tuple[str, float, float]]:
+        """(gap id, lower, upper) in lower-bound order."""
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.gap_id, node.key[0], node.upper
+            node = node.right
+
+
+__all__ = ["BEARISH", "BULLISH", "GapIndex", "scan_fvgs"]
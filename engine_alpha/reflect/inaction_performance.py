@@ -12,7 +12,7 @@ The best traders are often defined by what they don't do.
 """
 
 from __future__ import annotations
-from typing import Dict, List, Any, Optional, Tuple, NamedTuple
+from typing import Dict, Any, Optional, Tuple, NamedTuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -22,6 +22,7 @@ import math
 from engine_alpha.research.pf_timeseries import _compute_pf_for_window
 from engine_alpha.reflect.fair_value_gaps import fvg_detector
 from engine_alpha.config.feature_flags import get_feature_registry
+from engine_alpha.reflect.meta_windows import InactionWindow
 
 
 class InactionDecision(NamedTuple):
@@ -56,9 +57,11 @@ class InactionPerformanceTracker:
     inaction_log_file: Path = field(default_factory=lambda: Path("reports/inaction_performance_log.jsonl"))
     analysis_window_hours: int = 24  # How long to track counterfactual outcomes
     min_counterfactual_samples: int = 10  # Minimum samples for reliable scoring
+    window: InactionWindow = field(init=False, repr=False)
 
     def __post_init__(self):
         self.inaction_log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.window = InactionWindow(self.inaction_log_file)
 
     def record_inaction_decision(self, decision: InactionDecision) -> None:
         """Record a decision not to trade for later performance analysis"""
@@ -74,8 +77,7 @@ class InactionPerformanceTracker:
             "market_state": decision.market_state
         }
 
-        with self.inaction_log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.window.append(record)
 
     def analyze_inaction_outcome(self, symbol: str, decision_ts: datetime,
                                actual_market_movement: float) -> InactionOutcome:
@@ -303,149 +305,11 @@ class InactionPerformanceTracker:
             }
         }
 
-        with self.inaction_log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.window.append(record)
 
     def get_inaction_performance_metrics(self, lookback_hours: int = 24) -> Dict[str, Any]:
-        """Get comprehensive inaction performance metrics"""
-        if not self.inaction_log_file.exists():
-            return {"status": "no_data", "message": "No inaction data available yet"}
-
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=lookback_hours)
-        outcomes = []
-
-        with self.inaction_log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("type") == "inaction_outcome":
-                        record_ts = datetime.fromisoformat(record["decision_timestamp"])
-                        if record_ts >= cutoff:
-                            outcomes.append(record)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        if not outcomes:
-            return {"status": "insufficient_data", "message": "No recent inaction outcomes"}
-
-        # Aggregate metrics
-        quality_scores = [o["inaction_quality_score"] for o in outcomes]
-        opportunity_costs = [o["opportunity_cost"] for o in outcomes]
-        discipline_values = [o["discipline_value"] for o in outcomes]
-        regret_values = [o["hindsight_regret"] for o in outcomes]
-
-        # Categorize outcomes
-        excellent_inaction = sum(1 for o in outcomes if o["inaction_quality_score"] > 0.8)
-        good_inaction = sum(1 for o in outcomes if 0.6 <= o["inaction_quality_score"] <= 0.8)
-        poor_inaction = sum(1 for o in outcomes if o["inaction_quality_score"] < 0.4)
-
-        # Barrier type analysis
-        barrier_performance = {}
-        for outcome in outcomes:
-            barrier = outcome["decision_context"]["barrier_type"]
-            quality = outcome["inaction_quality_score"]
-            if barrier not in barrier_performance:
-                barrier_performance[barrier] = []
-            barrier_performance[barrier].append(quality)
-
-        barrier_summary = {}
-        for barrier, qualities in barrier_performance.items():
-            barrier_summary[barrier] = {
-                "count": len(qualities),
-                "avg_quality": sum(qualities) / len(qualities),
-                "excellent_rate": sum(1 for q in qualities if q > 0.8) / len(qualities)
-            }
-
-        return {
-            "status": "success",
-            "time_period_hours": lookback_hours,
-            "total_inaction_decisions": len(outcomes),
-            "performance_summary": {
-                "avg_inaction_quality": sum(quality_scores) / len(quality_scores),
-                "excellent_inactions": excellent_inaction,
-                "good_inactions": good_inaction,
-                "poor_inactions": poor_inactions,
-                "net_discipline_value": sum(discipline_values) - sum(regret_values),
-                "total_opportunity_cost": sum(opportunity_costs)
-            },
-            "barrier_analysis": barrier_summary,
-            "market_development_breakdown": self._analyze_market_developments(outcomes),
-            "recommendations": self._generate_inaction_recommendations(outcomes)
-        }
-
-    def _analyze_market_developments(self, outcomes: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze how markets developed after inaction decisions"""
-        developments = [o["market_development"] for o in outcomes]
-        development_counts = {}
-
-        for dev in developments:
-            development_counts[dev] = development_counts.get(dev, 0) + 1
-
-        # Calculate success rates by market development
-        success_by_development = {}
-        for outcome in outcomes:
-            dev = outcome["market_development"]
-            quality = outcome["inaction_quality_score"]
-            if dev not in success_by_development:
-                success_by_development[dev] = []
-            success_by_development[dev].append(quality)
-
-        success_rates = {}
-        for dev, qualities in success_by_development.items():
-            success_rates[dev] = {
-                "count": len(qualities),
-                "avg_quality": sum(qualities) / len(qualities),
-                "excellent_rate": sum(1 for q in qualities if q > 0.8) / len(qualities)
-            }
-
-        return {
-            "development_counts": development_counts,
-            "success_rates_by_development": success_rates
-        }
-
-    def _generate_inaction_recommendations(self, outcomes: List[Dict[str, Any]]) -> List[str]:
-        """Generate recommendations based on inaction performance analysis"""
-        recommendations = []
-
-        if not outcomes:
-            return ["Need more inaction data for recommendations"]
-
-        # Analyze barrier performance
-        barrier_qualities = {}
-        for outcome in outcomes:
-            barrier = outcome["decision_context"]["barrier_type"]
-            quality = outcome["inaction_quality_score"]
-            if barrier not in barrier_qualities:
-                barrier_qualities[barrier] = []
-            barrier_qualities[barrier].append(quality)
-
-        # Find best and worst performing barriers
-        barrier_avg_quality = {}
-        for barrier, qualities in barrier_qualities.items():
-            if len(qualities) >= 3:  # Only consider barriers with enough samples
-                barrier_avg_quality[barrier] = sum(qualities) / len(qualities)
-
-        if barrier_avg_quality:
-            best_barrier = max(barrier_avg_quality.items(), key=lambda x: x[1])
-            worst_barrier = min(barrier_avg_quality.items(), key=lambda x: x[1])
-
-            if best_barrier[1] > 0.7:
-                recommendations.append(f"Trust {best_barrier[0]} barriers more (avg quality: {best_barrier[1]:.2f})")
-
-            if worst_barrier[1] < 0.5:
-                recommendations.append(f"Review {worst_barrier[0]} barriers (avg quality: {worst_barrier[1]:.2f})")
-
-        # Overall performance assessment
-        avg_quality = sum(o["inaction_quality_score"] for o in outcomes) / len(outcomes)
-
-        if avg_quality > 0.7:
-            recommendations.append("Inaction discipline is excellent - continue current approach")
-        elif avg_quality > 0.5:
-            recommendations.append("Inaction performance is good but could be improved")
-        else:
-            recommendations.append("Review inaction criteria - current discipline may be too restrictive")
-
-        return recommendations
+        """Get comprehensive inaction performance metrics (served from the in-memory window)"""
+        return self.window.metrics(lookback_hours)
 
     def get_patience_score(self, symbol: str, lookback_hours: int = 168) -> Dict[str, Any]:
         """Calculate a 'patience score' for a symbol based on inaction quality"""
@@ -63,6 +63,9 @@ class MetaIntelligenceOrchestrator:
         """
         Provide comprehensive meta-intelligence assessment for a decision.
 
+        Component metrics are read from the trackers' in-memory log windows
+        (see reflect/meta_windows.py), so an assessment does not re-scan the logs.
+
         Args:
             symbol: Trading symbol
             decision_type: Type of decision (entry, exit, hold, inaction)
@@ -75,7 +78,7 @@ class MetaIntelligenceOrchestrator:
         insights = []
 
         # 1. Counterfactual Analysis
-        cf_metrics = counterfactual_ledger.get_counterfactual_metrics(self.analysis_window_days)
+        cf_metrics = counterfactual_ledger.get_window_metrics(self.analysis_window_days)
         cf_score = self._extract_counterfactual_score(cf_metrics, symbol)
         component_scores["counterfactual"] = cf_score
 
@@ -294,7 +297,9 @@ class MetaIntelligenceOrchestrator:
 
     def _get_aggregate_edge_health(self) -> Dict[str, Any]:
         """Get aggregate edge health across all tracked symbols"""
-        symbols = ["ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"]
+        symbols = edge_half_life_tracker.symbols() or [
+            "ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"
+        ]
         edge_scores = []
 
         for symbol in symbols:
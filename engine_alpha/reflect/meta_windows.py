@@ -0,0 +1,576 @@
+"""
+Meta Windows - in-memory sliding-window aggregates over second-order intelligence logs.
+
+The meta-intelligence trackers (counterfactual ledger, regime uncertainty,
+inaction performance) append to JSONL logs and used to answer
+every query by re-reading and re-parsing the whole log. A LogWindow keeps the
+aggregates those queries need in memory instead:
+
+- BucketRing: a fixed ring of time buckets, each holding running sums / counts
+  (category counts are just more keys), so a windowed total costs one pass
+  over at most n_buckets buckets regardless of log size.
+- LogWindow: tails one log by byte offset. On first use it restores from the
+  log tail (only the bytes that can fall inside the horizon are parsed), then
+  extends itself from the last offset whenever the file grows; records written
+  through append() are fed directly without being read back.
+
+Windows are resolved to one bucket: a lookback includes the whole bucket its
+cutoff falls in. Lookbacks longer than the horizon fall back to a full scan
+with the same aggregation, so results keep one shape either way.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from engine_alpha.core import codec
+from engine_alpha.research.pf_timeseries import PFStats
+
+Totals = Dict[Hashable, float]
+Entry = Tuple[Hashable, float, Totals]
+
+_TAIL_BLOCK = 1 << 16
+
+
+def record_ts(record: Dict[str, Any], key: Optional[str] = None) -> Optional[float]:
+    """Epoch seconds of record[key] (ts_ms when stored, else the ISO field; naive = UTC)."""
+    ms = codec.ts_ms_of(record, key)
+    return ms / 1000.0 if ms is not None else None
+
+
+def _merge(into: Totals, values: Totals) -> None:
+    for key, value in values.items():
+        into[key] = into.get(key, 0.0) + value
+
+
+class BucketRing:
+    """
+    Ring of n_buckets time buckets of width bucket_seconds.
+
+    Each bucket is a dict of running sums. Buckets are recycled lazily as time
+    advances; values older than the ring are dropped on add().
+    """
+
+    def __init__(self, bucket_seconds: float, n_buckets: int) -> None:
+        self.bucket_seconds = float(bucket_seconds)
+        self.n_buckets = int(n_buckets)
+        self._index: List[Optional[int]] = [None] * self.n_buckets
+        self._buckets: List[Totals] = [{} for _ in range(self.n_buckets)]
+        self._head: Optional[int] = None
+
+    @property
+    def horizon_seconds(self) -> float:
+        return self.bucket_seconds * (self.n_buckets - 1)
+
+    def clear(self) -> None:
+        self._index = [None] * self.n_buckets
+        self._buckets = [{} for _ in range(self.n_buckets)]
+        self._head = None
+
+    def add(self, ts: float, values: Totals) -> bool:
+        """Accumulate values into the bucket of ts; False if ts is older than the ring."""
+        idx = int(ts // self.bucket_seconds)
+        if self._head is not None and idx <= self._head - self.n_buckets:
+            return False
+        if self._head is None or idx > self._head:
+            self._head = idx
+        slot = idx % self.n_buckets
+        if self._index[slot] != idx:
+            self._index[slot] = idx
+            self._buckets[slot] = {}
+        _merge(self._buckets[slot], values)
+        return True
+
+    def totals(self, since: float) -> Totals:
+        """Sum of every live bucket whose span ends after since (oldest bucket first)."""
+        out: Totals = {}
+        if self._head is None:
+            return out
+        lo = max(int(since // self.bucket_seconds), self._head - self.n_buckets + 1)
+        for idx in range(lo, self._head + 1):
+            slot = idx % self.n_buckets
+            if self._index[slot] == idx:
+                _merge(out, self._buckets[slot])
+        return out
+
+
+class LogWindow:
+    """
+    Offset-tracked tail of one append-only JSONL log feeding BucketRings.
+
+    Subclasses implement _entries() (record -> (partition, ts, values)) and
+    may extend _observe() / _reset() for state that is not a sum.
+    """
+
+    bucket_seconds: float = 3600.0
+    horizon_seconds: float = 7 * 86400.0
+    # Extra history parsed on restore, for records logged after their bucket time
+    restore_slack_seconds: float = 86400.0
+
+    def __init__(self, path: Path, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._rings: Dict[Hashable, BucketRing] = {}
+        self._sig: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._loaded = False
+
+    # -- aggregation hooks -------------------------------------------------
+
+    def _entries(self, record: Dict[str, Any]) -> Iterable[Entry]:
+        raise NotImplementedError
+
+    def _position_ts(self, record: Dict[str, Any]) -> Optional[float]:
+        """Approximate append time of a record (used to find the restore offset)."""
+        for _, ts, _ in self._entries(record):
+            return ts
+        return None
+
+    def _observe(self, record: Dict[str, Any]) -> None:
+        for partition, ts, values in self._entries(record):
+            ring = self._rings.get(partition)
+            if ring is None:
+                ring = self._rings[partition] = BucketRing(
+                    self.bucket_seconds, int(math.ceil(self.horizon_seconds / self.bucket_seconds)) + 1
+                )
+            ring.add(ts, values)
+
+    def _reset(self) -> None:
+        self._rings.clear()
+
+    # -- log tailing -------------------------------------------------------
+
+    @property
+    def exists(self) -> bool:
+        self.refresh()
+        return self._sig is not None
+
+    def refresh(self) -> None:
+        """Fold in records appended since the last refresh (restore from the tail if needed)."""
+        with self._lock:
+            try:
+                st = self.path.stat()
+            except OSError:
+                if self._sig is not None or not self._loaded:
+                    self._reset()
+                self._sig, self._offset, self._loaded = None, 0, True
+                return
+            ino, size = st.st_ino, st.st_size
+            if not self._loaded or self._sig is None or ino != self._sig[0] or size < self._offset:
+                self._reset()
+                self._offset = self._tail_offset(size)
+                self._loaded = True
+            self._sig = (ino, size)
+            if size > self._offset:
+                self._read_from(self._offset)
+
+    def _read_from(self, offset: int) -> None:
+        with self.path.open("rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        end = chunk.rfind(b"\n") + 1
+        for raw in chunk[:end].splitlines():
+            record = self._parse(raw)
+            if record is not None:
+                self._observe(record)
+        self._offset = offset + end
+
+    @staticmethod
+    def _parse(raw: bytes) -> Optional[Dict[str, Any]]:
+        raw = raw.strip()
+        if not raw:
+            return None
+        try:
+            record = codec.loads(raw)
+        except (ValueError, UnicodeDecodeError):
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _tail_offset(self, size: int) -> int:
+        """Offset of the first line that can still fall inside the horizon."""
+        cutoff = self.clock() - self.horizon_seconds - self.restore_slack_seconds
+        pos = size
+        with self.path.open("rb") as f:
+            while pos > 0:
+                start = max(0, pos - _TAIL_BLOCK)
+                if start == 0:
+                    return 0
+                f.seek(start)
+                data = f.read(pos - start)
+                nl = data.find(b"\n")
+                line_begin = start + nl + 1
+                if nl < 0 or line_begin >= pos:
+                    pos = start
+                    continue
+                line_end = data.find(b"\n", nl + 1)
+                if line_end >= 0:
+                    record = self._parse(data[nl + 1:line_end])
+                    ts = self._position_ts(record) if record is not None else None
+                    if ts is not None and ts < cutoff:
+                        return line_begin
+                pos = line_begin
+        return 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the log and feed it to the window."""
+        line = codec.dumps_line(codec.stamp(record))
+        with self._lock:
+            self.refresh()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as f:
+                f.write(line)
+                f.flush()
+                end = f.tell()
+                ino = os.fstat(f.fileno()).st_ino
+            if end == self._offset + len(line) and (self._sig is None or ino == self._sig[0]):
+                # Nobody else wrote since our last refresh: no need to read it back
+                self._offset = end
+                self._sig = (ino, end)
+                self._observe(record)
+            else:
+                self.refresh()
+
+    # -- queries -----------------------------------------------------------
+
+    def scan(self) -> Iterator[Dict[str, Any]]:
+        """Every record in the log (full read; used for lookbacks beyond the horizon)."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as f:
+            for raw in f:
+                record = self._parse(raw)
+                if record is not None:
+                    yield record
+
+    def totals(self, lookback_seconds: float, partition: Hashable = None) -> Totals:
+        """Sums over the last lookback_seconds for one partition."""
+        now = self.clock()
+        since = now - lookback_seconds
+        if lookback_seconds <= self.horizon_seconds:
+            with self._lock:
+                self.refresh()
+                ring = self._rings.get(partition)
+                return ring.totals(since) if ring is not None else {}
+        out: Totals = {}
+        for record in self.scan():
+            for part, ts, values in self._entries(record):
+                if part == partition and ts >= since:
+                    _merge(out, values)
+        return out
+
+
+def _mean(total: float, count: float) -> float:
+    return total / count if count else 0.0
+
+
+def _groups(totals: Totals, group: str) -> Dict[str, Dict[str, float]]:
+    """{label: {field: value}} for tuple keys (group, label, field), in first-seen order."""
+    out: Dict[str, Dict[str, float]] = {}
+    for key, value in totals.items():
+        if isinstance(key, tuple) and key[0] == group:
+            out.setdefault(key[1], {})[key[2]] = value
+    return out
+
+
+def _pf_values(prefix: str, r: Optional[float]) -> Totals:
+    """PF bucket sums for one unit-weight return (see pf_timeseries._compute_pf_for_window)."""
+    if r is None:
+        return {}
+    values: Totals = {(prefix, "trades"): 1.0}
+    if r > 0.0:
+        values.update({(prefix, "wins"): 1.0, (prefix, "win_num"): r})
+    elif r < 0.0:
+        values.update({(prefix, "losses"): 1.0, (prefix, "loss_num"): abs(r)})
+    return values
+
+
+def _pf_stats(totals: Totals, prefix: str) -> PFStats:
+    wins = int(totals.get((prefix, "wins"), 0))
+    losses = int(totals.get((prefix, "losses"), 0))
+    avg_win = totals.get((prefix, "win_num"), 0.0) / wins if wins else None
+    avg_loss = totals.get((prefix, "loss_num"), 0.0) / losses if losses else None
+    pf = None
+    if losses and avg_loss not in (None, 0.0) and avg_win is not None:
+        pf = float(avg_win / avg_loss)
+    return PFStats(pf=pf, wins=wins, losses=losses, avg_win=avg_win, avg_loss=avg_loss,
+                   trades=int(totals.get((prefix, "trades"), 0)))
+
+
+class RegimeUncertaintyWindow(LogWindow):
+    """Minute buckets over 24h of regime uncertainty assessments, plus recent labels."""
+
+    bucket_seconds = 60.0
+    horizon_seconds = 24 * 3600.0
+    restore_slack_seconds = 0.0
+
+    def __init__(self, path: Path, history_minutes: int = 60,
+                 clock: Callable[[], float] = time.time) -> None:
+        super().__init__(path, clock)
+        self.history_seconds = history_minutes * 60.0
+        self._history: Deque[Tuple[float, str]] = deque()
+        self._newest: Optional[float] = None
+
+    def _entries(self, record: Dict[str, Any]) -> Iterable[Entry]:
+        ts = record_ts(record, "timestamp")
+        if ts is None or "regime_label" not in record:
+            return ()
+        try:
+            conf = float(record["confidence_score"])
+            stab = float(record["stability_score"])
+            trans = float(record["transition_probability"])
+            ent = float(record["entropy"])
+        except (KeyError, TypeError, ValueError):
+            return ()
+        label = record["regime_label"]
+        return ((None, ts, {
+            "count": 1.0, "confidence": conf, "stability": stab, "transition": trans, "entropy": ent,
+            ("regime", label, "count"): 1.0,
+            ("regime", label, "confidence"): conf,
+            ("regime", label, "stability"): stab,
+            ("regime", label, "entropy"): ent,
+        }),)
+
+    def _observe(self, record: Dict[str, Any]) -> None:
+        super()._observe(record)
+        ts = record_ts(record, "timestamp")
+        if ts is None or "regime_label" not in record:
+            return
+        self._history.append((ts, record["regime_label"]))
+        if self._newest is None or ts > self._newest:
+            self._newest = ts
+        while self._history[0][0] < self._newest - self.history_seconds:
+            self._history.popleft()
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._history.clear()
+        self._newest = None
+
+    def recent_labels(self, until: float, minutes_back: float) -> Optional[List[str]]:
+        """Labels logged in [until - minutes_back, until], or None if not held in memory."""
+        with self._lock:
+            self.refresh()
+            cutoff = until - minutes_back * 60.0
+            if self._newest is not None and cutoff < self._newest - self.history_seconds:
+                return None
+            return [label for ts, label in self._history if cutoff <= ts <= until]
+
+    def metrics(self, lookback_minutes: int, classify: Callable[[float, float], str]) -> Dict[str, Any]:
+        """Same shape as RegimeUncertaintyTracker.get_uncertainty_metrics."""
+        if not self.exists:
+            return {}
+        totals = self.totals(lookback_minutes * 60.0)
+        count = totals.get("count", 0.0)
+        if not count:
+            return {}
+        regime_stats = {
+            label: {
+                "count": int(v["count"]),
+                "avg_confidence": v["confidence"] / v["count"],
+                "avg_stability": v["stability"] / v["count"],
+                "avg_entropy": v["entropy"] / v["count"],
+            }
+            for label, v in _groups(totals, "regime").items()
+        }
+        avg_conf = totals["confidence"] / count
+        avg_stab = totals["stability"] / count
+        return {
+            "total_assessments": int(count),
+            "time_range_minutes": lookback_minutes,
+            "aggregate_metrics": {
+                "avg_confidence": avg_conf,
+                "avg_stability": avg_stab,
+                "avg_transition_probability": totals["transition"] / count,
+                "avg_entropy": totals["entropy"] / count,
+            },
+            "regime_breakdown": regime_stats,
+            "current_uncertainty_level": classify(avg_conf, avg_stab),
+        }
+
+
+class InactionWindow(LogWindow):
+    """Hourly buckets over 7 days of inaction outcomes (bucketed by decision time)."""
+
+    bucket_seconds = 3600.0
+    horizon_seconds = 7 * 86400.0
+
+    def _position_ts(self, record: Dict[str, Any]) -> Optional[float]:
+        if record.get("analysis_timestamp"):
+            return record_ts(record, "analysis_timestamp")
+        return record_ts(record)
+
+    def _entries(self, record: Dict[str, Any]) -> Iterable[Entry]:
+        if record.get("type") != "inaction_outcome":
+            return ()
+        ts = record_ts(record, "decision_timestamp")
+        if ts is None:
+            return ()
+        try:
+            q = float(record["inaction_quality_score"])
+            values: Totals = {
+                "count": 1.0,
+                "quality": q,
+                "opportunity_cost": float(record["opportunity_cost"]),
+                "discipline": float(record["discipline_value"]),
+                "regret": float(record["hindsight_regret"]),
+                "excellent": float(q > 0.8),
+                "good": float(0.6 <= q <= 0.8),
+                "poor": float(q < 0.4),
+            }
+            barrier = record["decision_context"]["barrier_type"]
+            development = record["market_development"]
+        except (KeyError, TypeError, ValueError):
+            return ()
+        for group, label in (("barrier", barrier), ("development", development)):
+            values[(group, label, "count")] = 1.0
+            values[(group, label, "quality")] = q
+            values[(group, label, "excellent")] = float(q > 0.8)
+        return ((None, ts, values),)
+
+    def metrics(self, lookback_hours: int) -> Dict[str, Any]:
+        """Same shape as InactionPerformanceTracker.get_inaction_performance_metrics."""
+        if not self.exists:
+            return {"status": "no_data", "message": "No inaction data available yet"}
+        totals = self.totals(lookback_hours * 3600.0)
+        count = totals.get("count", 0.0)
+        if not count:
+            return {"status": "insufficient_data", "message": "No recent inaction outcomes"}
+
+        def _summary(group: str) -> Dict[str, Dict[str, Any]]:
+            return {
+                label: {
+                    "count": int(v["count"]),
+                    "avg_quality": v["quality"] / v["count"],
+                    "excellent_rate": v["excellent"] / v["count"],
+                }
+                for label, v in _groups(totals, group).items()
+            }
+
+        barrier_summary = _summary("barrier")
+        development = _summary("development")
+        avg_quality = totals["quality"] / count
+        return {
+            "status": "success",
+            "time_period_hours": lookback_hours,
+            "total_inaction_decisions": int(count),
+            "performance_summary": {
+                "avg_inaction_quality": avg_quality,
+                "excellent_inactions": int(totals["excellent"]),
+                "good_inactions": int(totals["good"]),
+                "poor_inactions": int(totals["poor"]),
+                "net_discipline_value": totals["discipline"] - totals["regret"],
+                "total_opportunity_cost": totals["opportunity_cost"],
+            },
+            "barrier_analysis": barrier_summary,
+            "market_development_breakdown": {
+                "development_counts": {label: v["count"] for label, v in development.items()},
+                "success_rates_by_development": development,
+            },
+            "recommendations": inaction_recommendations(
+                {b: s["avg_quality"] for b, s in barrier_summary.items() if s["count"] >= 3}, avg_quality
+            ),
+        }
+
+
+def inaction_recommendations(barrier_avg_quality: Dict[str, float], avg_quality: float) -> List[str]:
+    """Recommendations from per-barrier average quality (barriers with >= 3 samples) and overall quality."""
+    recommendations = []
+    if barrier_avg_quality:
+        best_barrier = max(barrier_avg_quality.items(), key=lambda x: x[1])
+        worst_barrier = min(barrier_avg_quality.items(), key=lambda x: x[1])
+
+        if best_barrier[1] > 0.7:
+            recommendations.append(f"Trust {best_barrier[0]} barriers more (avg quality: {best_barrier[1]:.2f})")
+
+        if worst_barrier[1] < 0.5:
+            recommendations.append(f"Review {worst_barrier[0]} barriers (avg quality: {worst_barrier[1]:.2f})")
+
+    if avg_quality > 0.7:
+        recommendations.append("Inaction discipline is excellent - continue current approach")
+    elif avg_quality > 0.5:
+        recommendations.append("Inaction performance is good but could be improved")
+    else:
+        recommendations.append("Review inaction criteria - current discipline may be too restrictive")
+    return recommendations
+
+
+class CounterfactualWindow(LogWindow):
+    """Hourly buckets over 7 days of resolved counterfactual outcomes."""
+
+    bucket_seconds = 3600.0
+    horizon_seconds = 7 * 86400.0
+
+    def _position_ts(self, record: Dict[str, Any]) -> Optional[float]:
+        ts = record_ts(record)
+        return ts if ts is not None else record_ts(record, "decision_ts")
+
+    def _entries(self, record: Dict[str, Any]) -> Iterable[Entry]:
+        if record.get("type") != "outcome":
+            return ()
+        ts = record_ts(record, "decision_ts")
+        if ts is None or "symbol" not in record:
+            return ()
+        actual = record.get("actual_pnl_pct")
+        null = record.get("counterfactual_pnl_pct")
+        values: Totals = {"count": 1.0}
+        values.update(_pf_values("actual", actual))
+        values.update(_pf_values("null", null))
+        if actual is not None and null is not None:
+            cost = actual - null
+            regime = record.get("regime_at_decision") or "unknown"
+            values.update({
+                "cost_count": 1.0,
+                "cost": cost,
+                "gain": cost if cost > 0 else 0.0,
+                "loss": cost if cost < 0 else 0.0,
+                "beneficial": float(cost > 0),
+                ("regime", regime, "count"): 1.0,
+                ("regime", regime, "cost"): cost,
+                ("regime", regime, "beneficial"): float(cost > 0),
+            })
+        return ((None, ts, values),)
+
+    def metrics(self, lookback_days: int) -> Dict[str, Any]:
+        """CounterfactualLedger.get_counterfactual_metrics without the confidence quartiles."""
+        if not self.exists:
+            return {}
+        totals = self.totals(lookback_days * 86400.0)
+        count = totals.get("count", 0.0)
+        if not count:
+            return {}
+        cost_count = totals.get("cost_count", 0.0)
+        return {
+            "total_decisions": int(count),
+            "avg_opportunity_cost": totals["cost"] / cost_count if cost_count else None,
+            "beneficial_trade_rate": totals.get("beneficial", 0.0) / count,
+            "total_opportunity_gain": totals.get("gain", 0.0),
+            "total_opportunity_loss": abs(totals.get("loss", 0.0)),
+            "counterfactual_pf": _pf_stats(totals, "actual"),
+            "null_pf": _pf_stats(totals, "null"),
+            "by_regime": {
+                label: {
+                    "count": int(v["count"]),
+                    "avg_opportunity_cost": v["cost"] / v["count"],
+                    "beneficial_rate": v["beneficial"] / v["count"],
+                }
+                for label, v in _groups(totals, "regime").items()
+            },
+        }
+
+
+__all__ = [
+    "BucketRing",
+    "CounterfactualWindow",
+    "InactionWindow",
+    "LogWindow",
+    "RegimeUncertaintyWindow",
+    "inaction_recommendations",
+    "record_ts",
+]
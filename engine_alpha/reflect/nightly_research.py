@@ -365,6 +365,15 @@ def run_nightly_research(
         import traceback
         traceback.print_exc()
     
+    # Counterfactual resolution (yesterday's decisions vs cached OHLCV)
+    print("\n🔁 Resolving counterfactual decisions...")
+    try:
+        from engine_alpha.reflect.counterfactual_ledger import resolve_counterfactuals_for_day
+        resolved = resolve_counterfactuals_for_day()
+        print(f"  ✅ Resolved {len(resolved)} decision(s)")
+    except Exception as e:
+        print(f"  ⚠️  Counterfactual resolution failed (non-fatal): {e}")
+
     # Meta-strategy reflection (runs once, uses aggregate context)
     print("\n🧭 Meta-strategy reflection...")
     try:
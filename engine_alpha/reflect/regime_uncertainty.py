@@ -21,6 +21,7 @@ import math
 from dateutil import parser
 
 from engine_alpha.core.regime import classify_regime
+from engine_alpha.reflect.meta_windows import RegimeUncertaintyWindow
 
 
 class RegimeUncertaintyMetrics(NamedTuple):
@@ -42,9 +43,11 @@ class RegimeUncertaintyTracker:
     history_window_minutes: int = 60  # How far back to look for stability
     min_samples_for_stability: int = 10  # Minimum samples to calculate stability
     uncertainty_log_file: Path = field(default_factory=lambda: Path("reports/regime_uncertainty_log.jsonl"))
+    window: RegimeUncertaintyWindow = field(init=False, repr=False)
 
     def __post_init__(self):
         self.uncertainty_log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.window = RegimeUncertaintyWindow(self.uncertainty_log_file, history_minutes=self.history_window_minutes)
 
     def assess_uncertainty(self, market_data: Dict[str, Any],
                           current_regime: str,
@@ -211,7 +214,12 @@ class RegimeUncertaintyTracker:
             return 0.5, 0.5
 
     def _get_recent_regime_history(self, timestamp: datetime, minutes_back: int) -> List[str]:
-        """Get recent regime classifications from log"""
+        """Get recent regime classifications (in-memory window, log scan if older than it)"""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        labels = self.window.recent_labels(timestamp.timestamp(), minutes_back)
+        if labels is not None:
+            return labels
         if not self.uncertainty_log_file.exists():
             return []
 
@@ -251,68 +259,11 @@ class RegimeUncertaintyTracker:
             }
         }
 
-        with self.uncertainty_log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        self.window.append(record)
 
     def get_uncertainty_metrics(self, lookback_minutes: int = 60) -> Dict[str, Any]:
-        """Get aggregated uncertainty metrics over the lookback period"""
-        if not self.uncertainty_log_file.exists():
-            return {}
-
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=lookback_minutes)
-        assessments = []
-
-        with self.uncertainty_log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    record_ts = parser.isoparse(record["timestamp"])
-                    if record_ts >= cutoff:
-                        assessments.append(record)
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        if not assessments:
-            return {}
-
-        # Aggregate metrics
-        confidence_scores = [a["confidence_score"] for a in assessments]
-        stability_scores = [a["stability_score"] for a in assessments]
-        transition_probs = [a["transition_probability"] for a in assessments]
-        entropies = [a["entropy"] for a in assessments]
-
-        # Group by regime
-        regime_groups = {}
-        for assessment in assessments:
-            regime = assessment["regime_label"]
-            if regime not in regime_groups:
-                regime_groups[regime] = []
-            regime_groups[regime].append(assessment)
-
-        regime_stats = {}
-        for regime, regs in regime_groups.items():
-            regime_stats[regime] = {
-                "count": len(regs),
-                "avg_confidence": sum(r["confidence_score"] for r in regs) / len(regs),
-                "avg_stability": sum(r["stability_score"] for r in regs) / len(regs),
-                "avg_entropy": sum(r["entropy"] for r in regs) / len(regs),
-            }
-
-        return {
-            "total_assessments": len(assessments),
-            "time_range_minutes": lookback_minutes,
-            "aggregate_metrics": {
-                "avg_confidence": sum(confidence_scores) / len(confidence_scores),
-                "avg_stability": sum(stability_scores) / len(stability_scores),
-                "avg_transition_probability": sum(transition_probs) / len(transition_probs),
-                "avg_entropy": sum(entropies) / len(entropies),
-            },
-            "regime_breakdown": regime_stats,
-            "current_uncertainty_level": self._classify_uncertainty_level(
-                sum(confidence_scores) / len(confidence_scores),
-                sum(stability_scores) / len(stability_scores)
-            )
-        }
+        """Get aggregated uncertainty metrics over the lookback period (served from the in-memory window)"""
+        return self.window.metrics(lookback_minutes, self._classify_uncertainty_level)
 
     def _classify_uncertainty_level(self, avg_confidence: float, avg_stability: float) -> str:
         """Classify overall uncertainty level"""
@@ -29,6 +29,7 @@ from typing import Dict, Any, Optional, List, Tuple
 
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.data.market_snapshot import get_snapshot_price
 import yaml
 
 # Paths
@@ -145,9 +146,12 @@ def _log_event(event: ShadowEvent) -> None:
 
 
 def _get_current_price(symbol: str, timeframe: str = "15m") -> Optional[float]:
-    """Get current price from OHLCV data."""
+    """Get current price from the per-tick market snapshot, falling back to OHLCV data."""
+    snap_price = get_snapshot_price(symbol, timeframe)
+    if snap_price is not None:
+        return snap_price
     try:
-        rows = get_live_ohlcv(symbol, timeframe, limit=1)
+        rows, _ = get_live_ohlcv(symbol, timeframe, limit=1)
         if rows and len(rows) > 0:
             return float(rows[-1].get("close", 0))
     except Exception:
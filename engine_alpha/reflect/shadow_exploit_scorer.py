@@ -22,6 +22,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS
 
 LOG_PATH = REPORTS / "reflect" / "shadow_exploit_log.jsonl"
@@ -62,30 +63,32 @@ class SymbolMetrics:
         return asdict(self)
 
 
+class _Events(trade_analytics.Reducer):
+    """Every shadow exploit event, in log order."""
+
+    def __init__(self, now: datetime) -> None:
+        super().__init__(now)
+        self.events: List[Dict[str, Any]] = []
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+
+    def result(self) -> List[Dict[str, Any]]:
+        return self.events
+
+
+trade_analytics.register("shadow_exploit_scorer.events", lambda: LOG_PATH, _Events)
+
+
 def _load_events() -> List[Dict[str, Any]]:
     """Load all shadow exploit events from JSONL."""
     # Ensure directory exists
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
-    if not LOG_PATH.exists():
-        return []
-    
-    events = []
+
     try:
-        with LOG_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                    events.append(event)
-                except Exception:
-                    continue
+        return list(trade_analytics.reduce("shadow_exploit_scorer.events"))
     except Exception:
-        pass
-    
-    return events
+        return []
 
 
 def _parse_timestamp(ts_str: str) -> datetime:
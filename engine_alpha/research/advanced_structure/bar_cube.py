@@ -0,0 +1,249 @@
+"""
+Bar Cube - one fetch per symbol, every ASE timeframe derived from it.
+
+The finest timeframe (5m) is fetched once; 15m and 1h are derived by
+vectorized resampling (first open / max high / min low / last close /
+summed volume per bucket). Cubes are memoized per scan run, so the three
+ASE engines (liquidity sweeps, volume imbalance, market structure) share
+one set of fetches per symbol instead of one per engine and timeframe.
+
+A live request returns at most LIVE_MAX_BARS bars, so the 5m base only
+spans a few coarse bars (200 x 5m = 16h = 16 x 1h). A coarser view that the
+base cannot fill is fetched natively at its own timeframe instead (also
+capped at LIVE_MAX_BARS bars).
+
+Historical fallback tail-reads the CSV from the end instead of parsing the
+whole 2019-2025 file.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from engine_alpha.core.timeframe_utils import timeframe_to_seconds
+from engine_alpha.data.historical_prices import load_ohlcv_csv_tail
+from engine_alpha.data.live_prices import LIVE_MAX_BARS, get_live_ohlcv
+
+BASE_TIMEFRAME = "5m"
+
+# Memo lifetime outside an explicit scan_run() (covers engines called back to back)
+CUBE_TTL_SECONDS = 60.0
+
+
+def _epoch(ts: Any) -> Optional[float]:
+    if isinstance(ts, (int, float)):
+        return float(ts) / 1000.0 if ts > 1e11 else float(ts)
+    if not ts:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _rows_to_arrays(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    parsed = []
+    for row in rows:
+        ts = _epoch(row.get("ts") or row.get("timestamp"))
+        if ts is None:
+            continue
+        try:
+            parsed.append((
+                ts, float(row["open"]), float(row["high"]), float(row["low"]),
+                float(row["close"]), float(row.get("volume", 0.0) or 0.0),
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+    arr = np.array(sorted(parsed), dtype=float).reshape(-1, 6)
+    return {k: arr[:, i] for i, k in enumerate(("ts", "open", "high", "low", "close", "volume"))}
+
+
+def _arrays_to_rows(a: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "ts": datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(),
+            "open": float(o), "high": float(h), "low": float(lo),
+            "close": float(c), "volume": float(v),
+        }
+        for ts, o, h, lo, c, v in zip(a["ts"], a["open"], a["high"], a["low"], a["close"], a["volume"])
+    ]
+
+
+def candle_arrays(candles: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    open/high/low/close/volume arrays for a candle list (missing fields -> 0.0,
+    like float(candle.get(field, 0)) in the per-candle detectors).
+    """
+    return {
+        k: np.array([float(c.get(k, 0) or 0) for c in candles], dtype=float)
+        for k in ("open", "high", "low", "close", "volume")
+    }
+
+
+def resample_arrays(a: Dict[str, np.ndarray], base_seconds: int, target_seconds: int,
+                    keep_partial: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Resample OHLCV arrays to a coarser timeframe.
+
+    Buckets are aligned to epoch multiples of the target timeframe. A leading
+    bucket missing its first base bars is dropped (its open would be wrong).
+    A trailing bucket whose last base bar does not close it is still forming
+    and is dropped too, matching get_live_ohlcv (which drops forming bars via
+    _ensure_completed); keep_partial=True keeps it.
+    """
+    ts = a["ts"]
+    if len(ts) == 0 or target_seconds <= base_seconds:
+        return a
+    bucket = np.floor(ts / target_seconds).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    out = {
+        "ts": bucket[starts].astype(float) * target_seconds,
+        "open": a["open"][starts],
+        "high": np.maximum.reduceat(a["high"], starts),
+        "low": np.minimum.reduceat(a["low"], starts),
+        "close": a["close"][np.r_[starts[1:] - 1, len(ts) - 1]],
+        "volume": np.add.reduceat(a["volume"], starts),
+    }
+    if ts[0] > out["ts"][0]:
+        out = {k: v[1:] for k, v in out.items()}
+    if not keep_partial and len(out["ts"]) and ts[-1] + base_seconds < out["ts"][-1] + target_seconds:
+        out = {k: v[:-1] for k, v in out.items()}
+    return out
+
+
+@dataclass
+class BarCube:
+    """Finest-timeframe bars for one symbol plus lazily derived coarser views."""
+    symbol: str
+    base: Dict[str, np.ndarray]
+    base_timeframe: str = BASE_TIMEFRAME
+    source: str = "live"
+    requested: Dict[str, int] = field(default_factory=dict)
+    _views: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, repr=False)
+
+    def get(self, timeframe: str, max_bars: int) -> List[Dict[str, Any]]:
+        """Last max_bars candles of a timeframe (resampled from the base bars)."""
+        if timeframe not in self._views:
+            base_s = timeframe_to_seconds(self.base_timeframe) or 300
+            target_s = timeframe_to_seconds(timeframe) or base_s
+            self._views[timeframe] = _arrays_to_rows(resample_arrays(self.base, base_s, target_s))
+        return self._views[timeframe][-max_bars:]
+
+
+def _live_rows(symbol: str, timeframe: str, limit: int) -> List[Dict[str, Any]]:
+    try:
+        rows, _ = get_live_ohlcv(symbol, timeframe, limit=min(limit, LIVE_MAX_BARS))
+    except Exception:
+        rows = []
+    return rows or []
+
+
+def build_bar_cube(symbol: str, max_bars: Dict[str, int]) -> BarCube:
+    """
+    Fetch the finest timeframe once and derive the coarser views from it.
+
+    Views the (capped) live base fetch is too short for are fetched natively.
+    If the live fetch returns nothing, the base is tail-read from the historical
+    CSV; if no base CSV exists, each timeframe view is tail-read from its own CSV.
+    """
+    base_s = timeframe_to_seconds(BASE_TIMEFRAME) or 300
+    needed = max(
+        n * max(1, (timeframe_to_seconds(tf) or base_s) // base_s) for tf, n in max_bars.items()
+    )
+    rows = _live_rows(symbol, BASE_TIMEFRAME, needed)
+    if rows:
+        cube = BarCube(symbol, _rows_to_arrays(rows), requested=dict(max_bars))
+        for tf, n in max_bars.items():
+            have = len(cube.get(tf, n))
+            if tf == BASE_TIMEFRAME or have >= min(n, LIVE_MAX_BARS):
+                continue
+            native = _live_rows(symbol, tf, n)
+            if len(native) > have:
+                cube._views[tf] = native
+        return cube
+
+    try:
+        rows = load_ohlcv_csv_tail(symbol, BASE_TIMEFRAME, needed)
+    except Exception:
+        rows = []
+    if rows:
+        return BarCube(symbol, _rows_to_arrays(rows), source="csv", requested=dict(max_bars))
+
+    cube = BarCube(symbol, _rows_to_arrays([]), source="csv_per_tf", requested=dict(max_bars))
+    for tf, n in max_bars.items():
+        try:
+            cube._views[tf] = load_ohlcv_csv_tail(symbol, tf, n)
+        except Exception:
+            cube._views[tf] = []
+    return cube
+
+
+_SCAN_MEMO: Optional[Dict[str, BarCube]] = None
+_TTL_MEMO: Dict[str, tuple] = {}
+
+
+@contextmanager
+def scan_run() -> Iterator[Dict[str, BarCube]]:
+    """Memoize bar cubes for the duration of one scan (nested runs share the outer memo)."""
+    global _SCAN_MEMO
+    outer = _SCAN_MEMO
+    if outer is None:
+        _SCAN_MEMO = {}
+    try:
+        yield _SCAN_MEMO
+    finally:
+        if outer is None:
+            _SCAN_MEMO = None
+
+
+def get_bar_cube(symbol: str, max_bars: Dict[str, int]) -> BarCube:
+    """
+    Return the memoized cube for symbol, building it if needed.
+
+    Inside scan_run() the cube lives for the whole run; it is also kept for
+    CUBE_TTL_SECONDS so scans run back to back reuse it.
+    A memoized cube is rebuilt if a caller asks for more bars than it covers.
+    """
+    memo_key = symbol.upper()
+    if _SCAN_MEMO is not None:
+        cube = _SCAN_MEMO.get(memo_key)
+        if cube is not None and _covers(cube, max_bars):
+            return cube
+
+    now = time.monotonic()
+    cached = _TTL_MEMO.get(memo_key)
+    if cached and now - cached[0] < CUBE_TTL_SECONDS and _covers(cached[1], max_bars):
+        cube = cached[1]
+    else:
+        cube = build_bar_cube(symbol, _merge(cached[1] if cached else None, max_bars))
+        _TTL_MEMO[memo_key] = (now, cube)
+    if _SCAN_MEMO is not None:
+        _SCAN_MEMO[memo_key] = cube
+    return cube
+
+
+def _merge(cube: Optional[BarCube], max_bars: Dict[str, int]) -> Dict[str, int]:
+    merged = dict(cube.requested) if cube is not None else {}
+    for tf, n in max_bars.items():
+        merged[tf] = max(n, merged.get(tf, 0))
+    return merged
+
+
+def _covers(cube: BarCube, max_bars: Dict[str, int]) -> bool:
+    return all(cube.requested.get(tf, 0) >= n for tf, n in max_bars.items())
+
+
+def clear_bar_cubes() -> None:
+    """Drop memoized cubes (tests / forced refresh)."""
+    _TTL_MEMO.clear()
+    if _SCAN_MEMO is not None:
+        _SCAN_MEMO.clear()
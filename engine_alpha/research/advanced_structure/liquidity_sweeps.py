@@ -13,6 +13,9 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from collections import defaultdict
 
+import numpy as np
+
+from engine_alpha.research.advanced_structure.bar_cube import candle_arrays
 from engine_alpha.research.advanced_structure.multi_timeframe_loader import load_all_timeframes
 
 
@@ -89,33 +92,22 @@ def _detect_sweep(
     if len(candles_ltf) < lookback:
         return False
     
-    recent = candles_ltf[-lookback:]
+    bars = candle_arrays(candles_ltf[-lookback:])
+    close = bars["close"]
     
-    for i, candle in enumerate(recent):
-        high = float(candle.get("high", 0))
-        low = float(candle.get("low", 0))
-        close = float(candle.get("close", 0))
-        
-        if pool_type == "above":
-            # Sweep above: wick goes above pool, close below pool
-            if high > pool_level and close < pool_level:
-                # Check for displacement candle (next candle moves away)
-                if i + 1 < len(recent):
-                    next_candle = recent[i + 1]
-                    next_close = float(next_candle.get("close", 0))
-                    if next_close < pool_level:
-                        return True
-        elif pool_type == "below":
-            # Sweep below: wick goes below pool, close above pool
-            if low < pool_level and close > pool_level:
-                # Check for displacement candle
-                if i + 1 < len(recent):
-                    next_candle = recent[i + 1]
-                    next_close = float(next_candle.get("close", 0))
-                    if next_close > pool_level:
-                        return True
+    if pool_type == "above":
+        # Sweep above: wick goes above pool, close below pool
+        swept = (bars["high"] > pool_level) & (close < pool_level)
+        # Displacement candle: next candle still closes below the pool
+        displaced = close[1:] < pool_level
+    elif pool_type == "below":
+        # Sweep below: wick goes below pool, close above pool
+        swept = (bars["low"] < pool_level) & (close > pool_level)
+        displaced = close[1:] > pool_level
+    else:
+        return False
     
-    return False
+    return bool(np.any(swept[:-1] & displaced))
 
 
 def _detect_breaker_block(
@@ -180,6 +172,7 @@ def _detect_breaker_block(
 def compute_liquidity_sweeps(
     symbol: str,
     volume_imbalance_data: Optional[Dict[str, Any]] = None,
+    tf_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Compute liquidity sweep signals for a symbol.
@@ -187,6 +180,7 @@ def compute_liquidity_sweeps(
     Args:
         symbol: Symbol ID (e.g., "ETHUSDT")
         volume_imbalance_data: Optional volume imbalance data for strength scoring
+        tf_data: Preloaded {"5m", "15m", "1h"} candles (loaded if None)
     
     Returns:
         {
@@ -210,7 +204,8 @@ def compute_liquidity_sweeps(
     
     try:
         # Load multi-timeframe data
-        tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
+        if tf_data is None:
+            tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
         
         candles_5m = tf_data.get("5m", [])
         candles_15m = tf_data.get("15m", [])
@@ -362,3 +357,36 @@ def compute_liquidity_sweeps(
     
     return result
 
+
+def write_liquidity_sweeps_report(all_results: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Write reports/research/liquidity_sweeps.json (with health) for per-symbol results.
+    """
+    from engine_alpha.core.paths import REPORTS
+    import json
+    
+    RESEARCH_DIR = REPORTS / "research"
+    RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH = RESEARCH_DIR / "liquidity_sweeps.json"
+    
+    # Compute health
+    health_status = "ok"
+    health_reasons = []
+    
+    unknown_sessions = sum(1 for r in all_results.values() if r.get("session") == "Unknown" or r.get("session") == "unknown")
+    if unknown_sessions == len(all_results) and len(all_results) > 0:
+        health_status = "degraded"
+        health_reasons.append("unknown_session_for_all")
+    
+    # Write output
+    output_data = {
+        "version": "v2.1",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "health": {
+            "status": health_status,
+            "reasons": health_reasons,
+        },
+        "symbols": all_results,
+    }
+    
+    OUTPUT_PATH.write_text(json.dumps(output_data, indent=2))
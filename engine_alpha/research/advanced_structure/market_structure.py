@@ -15,6 +15,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from collections import defaultdict
 
+from engine_alpha.research.advanced_structure.bar_cube import candle_arrays, scan_run
 from engine_alpha.research.advanced_structure.multi_timeframe_loader import load_all_timeframes
 
 
@@ -54,28 +55,15 @@ def _find_swing_points(candles: List[Dict[str, Any]], lookback: int = 100) -> Tu
         return [], []
     
     recent = candles[-lookback:] if len(candles) > lookback else candles
+    bars = candle_arrays(recent)
+    h = bars["high"]
+    l = bars["low"]
     
-    swing_highs: List[float] = []
-    swing_lows: List[float] = []
+    # Swing high: higher than neighbors / swing low: lower than neighbors
+    swing_highs = h[1:-1][(h[1:-1] > h[:-2]) & (h[1:-1] > h[2:])]
+    swing_lows = l[1:-1][(l[1:-1] < l[:-2]) & (l[1:-1] < l[2:])]
     
-    for i in range(1, len(recent) - 1):
-        prev_high = float(recent[i-1].get("high", 0))
-        curr_high = float(recent[i].get("high", 0))
-        next_high = float(recent[i+1].get("high", 0))
-        
-        prev_low = float(recent[i-1].get("low", 0))
-        curr_low = float(recent[i].get("low", 0))
-        next_low = float(recent[i+1].get("low", 0))
-        
-        # Swing high: higher than neighbors
-        if curr_high > prev_high and curr_high > next_high:
-            swing_highs.append(curr_high)
-        
-        # Swing low: lower than neighbors
-        if curr_low < prev_low and curr_low < next_low:
-            swing_lows.append(curr_low)
-    
-    return swing_highs, swing_lows
+    return swing_highs.tolist(), swing_lows.tolist()
 
 
 def _determine_structure(swing_highs: List[float], swing_lows: List[float]) -> str:
@@ -232,6 +220,7 @@ def _detect_fvg(candles: List[Dict[str, Any]], lookback: int = 20) -> str:
 def compute_market_structure(
     symbol: str,
     liquidity_sweeps_data: Optional[Dict[str, Any]] = None,
+    tf_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Compute market structure and session classification for a symbol.
@@ -239,6 +228,7 @@ def compute_market_structure(
     Args:
         symbol: Symbol ID (e.g., "ETHUSDT")
         liquidity_sweeps_data: Optional liquidity sweeps data for confidence scoring
+        tf_data: Preloaded {"5m", "15m", "1h"} candles (loaded if None)
     
     Returns:
         {
@@ -259,7 +249,8 @@ def compute_market_structure(
     
     try:
         # Load multi-timeframe data (focus on 1h)
-        tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
+        if tf_data is None:
+            tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
         
         candles_1h = tf_data.get("1h", [])
         
@@ -417,22 +408,23 @@ def run_market_structure_scan() -> Dict[str, Dict[str, Any]]:
     # Compute for each symbol
     all_results: Dict[str, Dict[str, Any]] = {}
     
-    for symbol in symbols:
-        try:
-            symbol_result = compute_market_structure(symbol, liquidity_sweeps_data)
-            all_results.update(symbol_result)
-        except Exception as e:
-            # Continue on error, add empty entry
-            all_results[symbol] = {
-                "session": "unknown",
-                "structure_1h": "neutral",
-                "equal_highs_1h": False,
-                "equal_lows_1h": False,
-                "order_block_1h": "none",
-                "fvg_1h": "none",
-                "structure_confidence": None,
-                "notes": [f"Error processing {symbol}: {str(e)}"],
-            }
+    with scan_run():
+        for symbol in symbols:
+            try:
+                symbol_result = compute_market_structure(symbol, liquidity_sweeps_data)
+                all_results.update(symbol_result)
+            except Exception as e:
+                # Continue on error, add empty entry
+                all_results[symbol] = {
+                    "session": "unknown",
+                    "structure_1h": "neutral",
+                    "equal_highs_1h": False,
+                    "equal_lows_1h": False,
+                    "order_block_1h": "none",
+                    "fvg_1h": "none",
+                    "structure_confidence": None,
+                    "notes": [f"Error processing {symbol}: {str(e)}"],
+                }
     
     # Write output
     output_data = {
@@ -10,10 +10,13 @@ Analyzes OHLCV data to detect:
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from collections import defaultdict
 
+import numpy as np
+
+from engine_alpha.research.advanced_structure.bar_cube import candle_arrays, scan_run
 from engine_alpha.research.advanced_structure.multi_timeframe_loader import load_all_timeframes
 
 
@@ -137,6 +140,42 @@ def _detect_exhaustion(candle: Dict[str, Any], rolling_volume_mean: float) -> bo
     return volume_spike and small_body
 
 
+def _seq_sum(values: np.ndarray) -> float:
+    """Left-to-right sum (same rounding as sum() over a list, unlike pairwise np.sum)."""
+    return float(np.cumsum(values)[-1]) if len(values) else 0.0
+
+
+def _delta_arrays(bars: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Vectorized _compute_delta_approximation over candle arrays (delta, imbalance)."""
+    volume = bars["volume"]
+    has_volume = volume > 0
+    delta = np.where(has_volume, (bars["close"] - bars["open"]) * volume, 0.0)
+    imbalance = np.divide(delta, volume, out=np.zeros_like(delta), where=has_volume)
+    return {"delta": delta, "imbalance": imbalance}
+
+
+def _absorption_exhaustion_counts(
+    bars: Dict[str, np.ndarray],
+    delta: np.ndarray,
+    rolling_volume_mean: float,
+) -> Tuple[int, int]:
+    """Vectorized _detect_absorption / _detect_exhaustion counts over candle arrays."""
+    o, h, l, c = bars["open"], bars["high"], bars["low"], bars["close"]
+    range_size = h - l
+    has_range = range_size > 0
+    safe_range = np.where(has_range, range_size, 1.0)
+    upper_wick_ratio = (h - np.maximum(o, c)) / safe_range
+    lower_wick_ratio = (np.minimum(o, c) - l) / safe_range
+    absorption = has_range & (
+        ((upper_wick_ratio > 0.4) & (delta < 0)) | ((lower_wick_ratio > 0.4) & (delta > 0))
+    )
+    if rolling_volume_mean <= 0:
+        return int(absorption.sum()), 0
+    body_ratio = np.abs(c - o) / safe_range
+    exhaustion = has_range & (bars["volume"] > 2.0 * rolling_volume_mean) & (body_ratio <= 0.25)
+    return int(absorption.sum()), int(exhaustion.sum())
+
+
 def _compute_cvd_trend(deltas: List[float], threshold: float = 0.1) -> str:
     """
     Compute CVD-style trend from cumulative delta.
@@ -167,6 +206,7 @@ def _compute_cvd_trend(deltas: List[float], threshold: float = 0.1) -> str:
 def compute_volume_imbalance(
     symbol: str,
     lookback: int = 20,
+    tf_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Compute volume imbalance metrics for a symbol.
@@ -174,6 +214,7 @@ def compute_volume_imbalance(
     Args:
         symbol: Symbol ID (e.g., "ETHUSDT")
         lookback: Number of recent candles to analyze
+        tf_data: Preloaded {"5m", "15m", "1h"} candles (loaded if None)
     
     Returns:
         {
@@ -195,7 +236,8 @@ def compute_volume_imbalance(
     
     try:
         # Load multi-timeframe data
-        tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
+        if tf_data is None:
+            tf_data = load_all_timeframes(symbol, max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
         
         candles_5m = tf_data.get("5m", [])
         candles_15m = tf_data.get("15m", [])
@@ -218,60 +260,38 @@ def compute_volume_imbalance(
             }
             return result
         
-        # Analyze primary timeframe (15m)
-        recent = primary_candles[-lookback:]
+        # Analyze primary timeframe (15m) as arrays
+        recent = candle_arrays(primary_candles[-lookback:])
+        n_recent = len(recent["close"])
         
         # Compute deltas and imbalances
-        deltas: List[float] = []
-        imbalances: List[float] = []
-        absorption_count = 0
-        exhaustion_count = 0
+        delta_info = _delta_arrays(recent)
+        deltas = delta_info["delta"]
         
         # Compute rolling volume mean
-        volumes = [float(c.get("volume", 0)) for c in recent]
-        rolling_volume_mean = sum(volumes) / len(volumes) if volumes else 0.0
+        rolling_volume_mean = _seq_sum(recent["volume"]) / n_recent
         
-        for candle in recent:
-            delta_info = _compute_delta_approximation(candle)
-            deltas.append(delta_info["delta"])
-            imbalances.append(delta_info["imbalance"])
-            
-            # Detect absorption
-            absorption = _detect_absorption(candle, delta_info)
-            if absorption:
-                absorption_count += 1
-            
-            # Detect exhaustion
-            if _detect_exhaustion(candle, rolling_volume_mean):
-                exhaustion_count += 1
+        # Detect absorption / exhaustion
+        absorption_count, exhaustion_count = _absorption_exhaustion_counts(recent, deltas, rolling_volume_mean)
         
         # Aggregate metrics
-        avg_imbalance = sum(imbalances) / len(imbalances) if imbalances else 0.0
+        avg_imbalance = _seq_sum(delta_info["imbalance"]) / n_recent
         imbalance_strength_raw = abs(avg_imbalance)
         imbalance_strength = max(0.0, min(1.0, imbalance_strength_raw))  # Clamp to [0, 1]
         
         # CVD trend
-        cvd_trend = _compute_cvd_trend(deltas, threshold=0.1)
+        cvd_trend = _compute_cvd_trend(deltas.tolist(), threshold=0.1)
         
         # Compute delta for other timeframes if available
-        delta_5m = None
-        delta_15m = None
-        delta_1h = None
-        
-        if candles_5m and len(candles_5m) >= lookback:
-            recent_5m = candles_5m[-lookback:]
-            deltas_5m = [_compute_delta_approximation(c)["delta"] for c in recent_5m]
-            delta_5m = sum(deltas_5m) / len(deltas_5m) if deltas_5m else 0.0
+        def _avg_delta(candles: List[Dict[str, Any]]) -> Optional[float]:
+            if not candles or len(candles) < lookback:
+                return None
+            tf_deltas = _delta_arrays(candle_arrays(candles[-lookback:]))["delta"]
+            return _seq_sum(tf_deltas) / len(tf_deltas)
         
-        if candles_15m and len(candles_15m) >= lookback:
-            recent_15m = candles_15m[-lookback:]
-            deltas_15m = [_compute_delta_approximation(c)["delta"] for c in recent_15m]
-            delta_15m = sum(deltas_15m) / len(deltas_15m) if deltas_15m else 0.0
-        
-        if candles_1h and len(candles_1h) >= lookback:
-            recent_1h = candles_1h[-lookback:]
-            deltas_1h = [_compute_delta_approximation(c)["delta"] for c in recent_1h]
-            delta_1h = sum(deltas_1h) / len(deltas_1h) if deltas_1h else 0.0
+        delta_5m = _avg_delta(candles_5m)
+        delta_15m = _avg_delta(candles_15m)
+        delta_1h = _avg_delta(candles_1h)
         
         # Build notes
         notes: List[str] = []
@@ -328,16 +348,6 @@ def run_volume_imbalance_scan() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict mapping symbol to volume imbalance data
     """
-    from engine_alpha.core.paths import REPORTS
-    from pathlib import Path
-    import json
-    from datetime import datetime, timezone
-    
-    RESEARCH_DIR = REPORTS / "research"
-    RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
-    
-    OUTPUT_PATH = RESEARCH_DIR / "volume_imbalance.json"
-    
     # Get enabled symbols (use same pattern as other research modules)
     try:
         from tools.intel_dashboard import load_symbol_registry
@@ -359,34 +369,58 @@ def run_volume_imbalance_scan() -> Dict[str, Dict[str, Any]]:
     # Compute for each symbol
     all_results: Dict[str, Dict[str, Any]] = {}
     
-    for symbol in symbols:
-        try:
-            symbol_result = compute_volume_imbalance(symbol, lookback=20)
-            all_results.update(symbol_result)
-        except Exception as e:
-            # Continue on error, add empty entry
-            all_results[symbol] = {
-                "delta_5m": None,
-                "delta_15m": None,
-                "delta_1h": None,
-                "avg_imbalance": None,
-                "imbalance_strength": 0.0,
-                "absorption_count": 0,
-                "exhaustion_count": 0,
-                "cvd_trend": "neutral",
-                "notes": [f"Error processing {symbol}: {str(e)}"],
-            }
+    with scan_run():
+        for symbol in symbols:
+            try:
+                symbol_result = compute_volume_imbalance(symbol, lookback=20)
+                all_results.update(symbol_result)
+            except Exception as e:
+                # Continue on error, add empty entry
+                all_results[symbol] = {
+                    "delta_5m": None,
+                    "delta_15m": None,
+                    "delta_1h": None,
+                    "avg_imbalance": None,
+                    "imbalance_strength": 0.0,
+                    "absorption_count": 0,
+                    "exhaustion_count": 0,
+                    "cvd_trend": "neutral",
+                    "notes": [f"Error processing {symbol}: {str(e)}"],
+                }
+    
+    return write_volume_imbalance_report(all_results)
+
+
+def normalize_volume_imbalance_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Artifact shape of one compute_volume_imbalance entry (as stored in volume_imbalance.json)."""
+    return {
+        "avg_imbalance": data.get("avg_imbalance", 0.0) if data.get("avg_imbalance") is not None else 0.0,
+        "strength": max(0.0, min(1.0, data.get("imbalance_strength", 0.0))),  # Clamp to [0, 1]
+        "cvd_trend": data.get("cvd_trend", "neutral"),
+        "absorb_count": data.get("absorption_count", 0),
+        "exhaust_count": data.get("exhaustion_count", 0),
+    }
+
+
+def write_volume_imbalance_report(all_results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Normalize per-symbol results and write reports/research/volume_imbalance.json.
+    
+    Returns:
+        Dict mapping symbol to normalized volume imbalance data
+    """
+    from engine_alpha.core.paths import REPORTS
+    import json
+    
+    RESEARCH_DIR = REPORTS / "research"
+    RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
+    
+    OUTPUT_PATH = RESEARCH_DIR / "volume_imbalance.json"
     
     # Normalize output structure and compute health
-    normalized_results: Dict[str, Dict[str, Any]] = {}
-    for symbol, data in all_results.items():
-        normalized_results[symbol] = {
-            "avg_imbalance": data.get("avg_imbalance", 0.0) if data.get("avg_imbalance") is not None else 0.0,
-            "strength": max(0.0, min(1.0, data.get("imbalance_strength", 0.0))),  # Clamp to [0, 1]
-            "cvd_trend": data.get("cvd_trend", "neutral"),
-            "absorb_count": data.get("absorption_count", 0),
-            "exhaust_count": data.get("exhaustion_count", 0),
-        }
+    normalized_results: Dict[str, Dict[str, Any]] = {
+        symbol: normalize_volume_imbalance_entry(data) for symbol, data in all_results.items()
+    }
     
     # Compute health
     health_status = "ok"
@@ -2,176 +2,242 @@
 Alpha/Beta Decomposition - Phase 5
 Decomposes symbol returns into alpha (idiosyncratic) and beta (market-driven) components.
 
-Uses BTCUSDT as the market benchmark and computes linear regression:
-pct_symbol ~ alpha + beta * pct_btc
+Bar log returns of every symbol are aligned by bar time into one
+(time x symbol) matrix and regressed on the benchmark returns:
+
+    r_symbol ~ alpha + beta * r_btc                 (beta, BTCUSDT benchmark)
+    r_symbol ~ alpha + b1 * r_btc + b2 * r_eth      (betas, BTC/ETH factors)
+
+All symbols are solved together: the normal equations of every symbol
+(Gram matrix over the bars where both sides exist) are built with one einsum
+and solved as one batched system. Rolling windows use prefix sums of the same
+per-bar terms, so each window costs a subtraction, not a rescan.
+
+alpha is per bar (log return); alpha_bps is the same in basis points.
 """
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+import math
 from datetime import datetime, timezone
-from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.core.paths import REPORTS
+from engine_alpha.data.live_prices import LIVE_MAX_BARS
 
-TRADES_PATH = REPORTS / "trades.jsonl"
 RESEARCH_DIR = REPORTS / "research"
 ALPHA_BETA_PATH = RESEARCH_DIR / "alpha_beta.json"
 
 BENCHMARK_SYMBOL = "BTCUSDT"
+FACTOR_SYMBOLS: Tuple[str, ...] = ("BTCUSDT", "ETHUSDT")
+DEFAULT_TIMEFRAME = "15m"
+HISTORY_BARS = LIVE_MAX_BARS  # What one live request (or the snapshot) can serve
+MIN_OBS = 30
+ROLLING_WINDOW_BARS = 96  # One day of 15m bars
+ROLLING_STEP_BARS = 24
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Read JSONL file, return empty list if missing or invalid."""
-    if not path.exists():
-        return []
-    entries = []
-    try:
-        with path.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except Exception:
-                    continue
-    except Exception:
-        pass
-    return entries
-
-
-def _linear_regression(x: List[float], y: List[float]) -> Tuple[Optional[float], Optional[float]]:
+def aligned_returns(
+    bars_by_symbol: Mapping[str, Sequence[Mapping[str, Any]]],
+) -> Tuple[np.ndarray, List[str], np.ndarray]:
     """
-    Compute linear regression: y = alpha + beta * x
-    
-    Returns:
-        Tuple of (alpha, beta) or (None, None) if insufficient data
+    Log close-to-close returns aligned by bar time.
+
+    Closes are aligned first, so a return only exists between consecutive bar
+    times (a missing bar leaves NaN on both sides instead of a two-bar return).
+    Returns (ts_ms, symbols, returns): bar times ascending (the first bar time
+    has no return and is dropped), sorted symbols and a (time x symbol) matrix
+    with NaN where a symbol has no return for that bar.
     """
-    if len(x) != len(y) or len(x) < 2:
-        return None, None
-    
-    n = len(x)
-    
-    # Compute means
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
-    
-    # Compute beta (slope)
-    numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-    denominator = sum((x[i] - mean_x) ** 2 for i in range(n))
-    
-    if denominator == 0:
-        return None, None
-    
-    beta = numerator / denominator
-    
-    # Compute alpha (intercept)
-    alpha = mean_y - beta * mean_x
-    
-    return alpha, beta
-
-
-def compute_alpha_beta() -> Dict[str, Any]:
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    for symbol, rows in bars_by_symbol.items():
+        points = sorted(
+            (ts, close) for ts, close in (
+                (codec.iso_to_ms(row.get("ts") or row.get("timestamp")), row.get("close")) for row in rows
+            ) if ts is not None and isinstance(close, (int, float)) and close > 0
+        )
+        if len(points) >= 2:
+            series[str(symbol).upper()] = (np.asarray([p[0] for p in points], dtype=np.int64),
+                                           np.asarray([p[1] for p in points], dtype=float))
+
+    symbols = sorted(series)
+    if not symbols:
+        return np.zeros(0, dtype=np.int64), [], np.zeros((0, 0))
+    times = np.unique(np.concatenate([series[s][0] for s in symbols]))
+    log_close = np.full((len(times), len(symbols)), np.nan)
+    for col, symbol in enumerate(symbols):
+        ts, closes = series[symbol]
+        log_close[np.searchsorted(times, ts), col] = np.log(closes)
+    return times[1:], symbols, np.diff(log_close, axis=0)
+
+
+def _design(returns: np.ndarray, factors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Design rows [1, factors], the (time x symbol) usable-bar mask and zero-filled returns."""
+    factors = np.asarray(factors, dtype=float).reshape(len(returns), -1)
+    factors_ok = np.isfinite(factors).all(axis=1)
+    z = np.column_stack([np.ones(len(returns)), np.where(factors_ok[:, None], factors, 0.0)])
+    mask = (np.isfinite(returns) & factors_ok[:, None]).astype(float)
+    return z, mask, np.where(mask > 0, returns, 0.0)
+
+
+def _solve(gram: np.ndarray, xty: np.ndarray, yty: np.ndarray, n: np.ndarray,
+           min_obs: int) -> Dict[str, np.ndarray]:
+    """Batched least squares from summed normal-equation terms (leading axes are the batch)."""
+    k = gram.shape[-1]
+    coef = np.einsum("...ij,...j->...i", np.linalg.pinv(gram), xty)
+    ssr = np.maximum(yty - np.einsum("...i,...i->...", coef, xty), 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = xty[..., 0] / n
+        sst = yty - n * mean * mean
+        r2 = np.where(sst > 0, 1.0 - ssr / sst, np.nan)
+        resid_vol = np.sqrt(ssr / np.maximum(n - k, 1))
+    ok = n >= max(min_obs, k + 1)
+    return {
+        "alpha": np.where(ok, coef[..., 0], np.nan),
+        "beta": np.where(ok[..., None], coef[..., 1:], np.nan),
+        "r2": np.where(ok, r2, np.nan),
+        "residual_vol": np.where(ok, resid_vol, np.nan),
+        "n": n.astype(np.int64),
+    }
+
+
+def fit_alpha_beta(returns: np.ndarray, factors: np.ndarray, min_obs: int = MIN_OBS) -> Dict[str, np.ndarray]:
     """
-    Compute alpha/beta decomposition for all symbols vs BTCUSDT benchmark.
-    
-    Returns:
-        Dict with per-symbol alpha and beta
+    Regress every column of returns (time x symbol, NaN = missing) on the factor
+    columns (time x k) in one batched solve.
+
+    Returns "alpha" (symbols,), "beta" (symbols, k), "r2", "residual_vol" and
+    "n" (bars used); NaN where a symbol has fewer than min_obs usable bars.
+    """
+    z, mask, y = _design(returns, factors)
+    gram = np.einsum("ts,ti,tj->sij", mask, z, z)
+    xty = np.einsum("ts,ti->si", y, z)
+    return _solve(gram, xty, (y * y).sum(axis=0), mask.sum(axis=0), min_obs)
+
+
+def rolling_alpha_beta(returns: np.ndarray, factors: np.ndarray, window: int = ROLLING_WINDOW_BARS,
+                       step: int = ROLLING_STEP_BARS, min_obs: int = MIN_OBS) -> Dict[str, np.ndarray]:
+    """
+    fit_alpha_beta over bar windows [end - window, end) for end = T, T - step, ...
+
+    Arrays gain a leading window axis (oldest window first); "end" holds the
+    window end indices.
     """
-    trades = _read_jsonl(TRADES_PATH)
-    
-    # Build time series: symbol -> list of (timestamp, pct) tuples
-    symbol_returns: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
-    
-    for trade in trades:
-        if trade.get("type") != "close":
-            continue
-        if trade.get("trade_kind") != "exploration":
-            continue
-        
-        symbol = trade.get("symbol")
-        ts = trade.get("ts") or trade.get("time")
-        try:
-            pct = float(trade.get("pct", 0.0))
-        except (ValueError, TypeError):
-            continue
-        
-        if symbol and ts:
-            symbol_returns[symbol].append((ts, pct))
-    
-    # Get benchmark returns (BTCUSDT)
-    benchmark_returns = symbol_returns.get(BENCHMARK_SYMBOL, [])
-    
-    if not benchmark_returns:
+    t = len(returns)
+    if window < 1 or t < window:
+        ends = np.zeros(0, dtype=np.int64)
+    else:
+        ends = np.arange(t, window - 1, -max(1, step))[::-1]
+    starts = ends - window
+    z, mask, y = _design(returns, factors)
+
+    def windowed(per_bar: np.ndarray) -> np.ndarray:
+        prefix = np.concatenate([np.zeros((1,) + per_bar.shape[1:]), np.cumsum(per_bar, axis=0)])
+        return prefix[ends] - prefix[starts]
+
+    out = _solve(
+        windowed(np.einsum("ts,ti,tj->tsij", mask, z, z)),
+        windowed(np.einsum("ts,ti->tsi", y, z)),
+        windowed(y * y),
+        windowed(mask),
+        min_obs,
+    )
+    out["end"] = ends
+    return out
+
+
+def _num(value: Any, digits: int = 6) -> Optional[float]:
+    return round(float(value), digits) if value is not None and math.isfinite(value) else None
+
+
+def decompose(ts_ms: np.ndarray, symbols: List[str], returns: np.ndarray,
+              factor_symbols: Sequence[str] = FACTOR_SYMBOLS) -> Dict[str, Any]:
+    """Alpha/beta report for an aligned return matrix (see aligned_returns)."""
+    now = datetime.now(timezone.utc).isoformat()
+    if BENCHMARK_SYMBOL not in symbols:
         return {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": now,
             "benchmark": BENCHMARK_SYMBOL,
             "symbols": {},
-            "notes": [f"Benchmark symbol {BENCHMARK_SYMBOL} has no trades"],
+            "notes": [f"Benchmark symbol {BENCHMARK_SYMBOL} has no bars"],
         }
-    
-    # Build aligned return series
-    timestamp_returns: Dict[str, Dict[str, float]] = defaultdict(dict)
-    
-    for symbol in symbol_returns.keys():
-        for ts, pct in symbol_returns[symbol]:
-            timestamp_returns[ts][symbol] = pct
-    
-    # Find timestamps where benchmark has data
-    benchmark_timestamps = {ts for ts, pct in benchmark_returns}
-    
-    # Compute alpha/beta for each symbol
-    alpha_beta_data: Dict[str, Dict[str, Any]] = {}
-    
-    for symbol in sorted(symbol_returns.keys()):
-        if symbol == BENCHMARK_SYMBOL:
-            # Benchmark has beta=1, alpha=0 by definition
-            alpha_beta_data[symbol] = {
-                "alpha": 0.0,
-                "beta": 1.0,
-                "sample_size": len(benchmark_returns),
-            }
-            continue
-        
-        # Extract aligned returns
-        x = []  # Benchmark returns
-        y = []  # Symbol returns
-        
-        for ts in benchmark_timestamps:
-            if ts in timestamp_returns:
-                if BENCHMARK_SYMBOL in timestamp_returns[ts] and symbol in timestamp_returns[ts]:
-                    x.append(timestamp_returns[ts][BENCHMARK_SYMBOL])
-                    y.append(timestamp_returns[ts][symbol])
-        
-        if len(x) < 2:
-            alpha_beta_data[symbol] = {
-                "alpha": None,
-                "beta": None,
-                "sample_size": len(x),
-                "notes": "Insufficient overlapping data",
-            }
-            continue
-        
-        alpha, beta = _linear_regression(x, y)
-        
-        alpha_beta_data[symbol] = {
-            "alpha": alpha,
-            "beta": beta,
-            "sample_size": len(x),
+    column = {s: i for i, s in enumerate(symbols)}
+    factors = [s for s in factor_symbols if s in column]
+    bench = returns[:, column[BENCHMARK_SYMBOL]]
+
+    single = fit_alpha_beta(returns, bench)
+    multi = fit_alpha_beta(returns, returns[:, [column[s] for s in factors]])
+    rolling = rolling_alpha_beta(returns, bench)
+
+    per_symbol: Dict[str, Dict[str, Any]] = {}
+    for i, symbol in enumerate(symbols):
+        entry: Dict[str, Any] = {
+            "alpha": _num(single["alpha"][i], 8),
+            "alpha_bps": _num(single["alpha"][i] * 1e4, 3),
+            "beta": _num(single["beta"][i, 0], 4),
+            "betas": {f: _num(multi["beta"][i, k], 4) for k, f in enumerate(factors)},
+            "r2": _num(single["r2"][i], 4),
+            "residual_vol": _num(single["residual_vol"][i]),
+            "sample_size": int(single["n"][i]),
+            "rolling_beta": [_num(b, 4) for b in rolling["beta"][:, i, 0]],
+            "rolling_alpha_bps": [_num(a * 1e4, 3) for a in rolling["alpha"][:, i]],
         }
-    
-    report = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        if entry["beta"] is None:
+            entry["notes"] = "Insufficient overlapping data"
+        per_symbol[symbol] = entry
+
+    def _iso(ms: int) -> str:
+        return datetime.fromtimestamp(int(ms) / 1000, tz=timezone.utc).isoformat()
+
+    return {
+        "generated_at": now,
         "benchmark": BENCHMARK_SYMBOL,
-        "symbols": alpha_beta_data,
+        "factors": factors,
+        "bars": int(len(ts_ms)),
+        "first_bar_ts": _iso(ts_ms[0]) if len(ts_ms) else None,
+        "last_bar_ts": _iso(ts_ms[-1]) if len(ts_ms) else None,
+        "rolling": {
+            "window_bars": ROLLING_WINDOW_BARS,
+            "step_bars": ROLLING_STEP_BARS,
+            "end_ts": [_iso(ts_ms[e - 1]) for e in rolling["end"]],
+        },
+        "symbols": per_symbol,
     }
-    
-    # Write report
-    RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
-    ALPHA_BETA_PATH.write_text(json.dumps(report, indent=2))
-    
+
+
+def compute_alpha_beta(symbols: Optional[Iterable[str]] = None, timeframe: str = DEFAULT_TIMEFRAME,
+                       limit: int = HISTORY_BARS) -> Dict[str, Any]:
+    """
+    Compute alpha/beta decomposition for all symbols vs BTCUSDT benchmark.
+
+    Bars come from the market snapshot when it holds enough history, else they
+    are fetched (registry symbols by default, benchmarks always included).
+
+    Returns:
+        Dict with per-symbol alpha and beta
+    """
+    from engine_alpha.core.symbol_registry import load_symbol_registry
+    from engine_alpha.data.market_snapshot import collect_symbol_bars
+
+    wanted = list(symbols) if symbols is not None else load_symbol_registry()
+    wanted += [s for s in FACTOR_SYMBOLS if s not in wanted]
+    report = decompose(*aligned_returns(collect_symbol_bars(wanted, timeframe, limit)))
+    report["timeframe"] = timeframe
+
+    atomic_write_json(ALPHA_BETA_PATH, report)
     return report
 
+
+__all__ = [
+    "ALPHA_BETA_PATH",
+    "BENCHMARK_SYMBOL",
+    "aligned_returns",
+    "compute_alpha_beta",
+    "decompose",
+    "fit_alpha_beta",
+    "rolling_alpha_beta",
+]
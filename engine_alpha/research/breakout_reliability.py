@@ -247,6 +247,13 @@ def run_breakout_reliability_scan() -> Dict[str, Dict[str, Any]]:
         exec_quality=exec_quality,
     )
     
+    write_breakout_reliability_report(results)
+    
+    return results
+
+
+def write_breakout_reliability_report(results: Dict[str, Dict[str, Any]]) -> Path:
+    """Write reports/research/breakout_reliability.json (with health) for per-symbol results."""
     # Compute health
     health_status = "ok"
     health_reasons = []
@@ -271,4 +278,4 @@ def run_breakout_reliability_scan() -> Dict[str, Dict[str, Any]]:
     RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
     BREAKOUT_RELIABILITY_PATH.write_text(json.dumps(output, indent=2))
     
-    return results
+    return BREAKOUT_RELIABILITY_PATH
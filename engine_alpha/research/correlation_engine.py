@@ -1,170 +1,342 @@
 """
 Correlation Engine - Phase 5
-Computes correlation matrix between symbol returns.
+Exponentially weighted correlation of aligned bar returns across symbols.
 
-Aligns returns by timestamp and computes Pearson correlation
-between all symbol pairs for diversification analysis.
+Each loop tick hands the closed bars of the per-tick MarketSnapshot (the
+shared bar store) to one EWCovariance. Log close-to-close returns are aligned
+by bar open time, and every bar not applied before updates the mean vector
+and covariance matrix of the symbols that have it:
+
+    d = r - mean;  mean += a * d;  cov = (1 - a) * (cov + a * d d')
+
+so a tick costs O(S^2) per new bar, whatever the history length. A pair is
+only reported once it shares MIN_PAIR_OBS bars; symbols whose correlation
+reaches CLUSTER_THRESHOLD are grouped (connected components) for the
+capital allocator and the multi-asset risk engine.
+
+reports/research/correlation_matrix.json is the public view (matrix,
+clusters, EW volatility, covariance); correlation_state.json lets the engine
+resume after a restart. Both are rewritten only when new bars were applied.
 """
 
 from __future__ import annotations
 
 import json
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+import math
 from datetime import datetime, timezone
-from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence
 
+import numpy as np
+
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.core.paths import REPORTS
 
-TRADES_PATH = REPORTS / "trades.jsonl"
 RESEARCH_DIR = REPORTS / "research"
 CORRELATION_MATRIX_PATH = RESEARCH_DIR / "correlation_matrix.json"
+CORRELATION_STATE_PATH = RESEARCH_DIR / "correlation_state.json"
 
+DEFAULT_TIMEFRAME = "15m"
+HALFLIFE_BARS = 192  # Two days of 15m bars
+MIN_PAIR_OBS = 30
+CLUSTER_THRESHOLD = 0.7
+HISTORY_BARS = 500  # Warm start when no snapshot is available
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Read JSONL file, return empty list if missing or invalid."""
-    if not path.exists():
-        return []
-    entries = []
-    try:
-        with path.open("r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+
+class EWCovariance:
+    """Exponentially weighted mean / covariance of per-bar returns, updated bar by bar."""
+
+    def __init__(self, halflife_bars: float = HALFLIFE_BARS, timeframe: str = DEFAULT_TIMEFRAME) -> None:
+        self.halflife_bars = float(halflife_bars)
+        self.alpha = 1.0 - 0.5 ** (1.0 / self.halflife_bars)
+        self.timeframe = timeframe
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.mean = np.zeros(0)
+        self.cov = np.zeros((0, 0))
+        self.obs = np.zeros((0, 0), dtype=np.int64)
+        self.last_bar_ms: Optional[int] = None
+
+    def _ensure(self, symbols: Iterable[str]) -> None:
+        new = [s for s in symbols if s not in self._index]
+        if not new:
+            return
+        n, m = len(self.symbols), len(self.symbols) + len(new)
+        for symbol in new:
+            self._index[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        self.mean = np.concatenate([self.mean, np.zeros(m - n)])
+        cov, obs = np.zeros((m, m)), np.zeros((m, m), dtype=np.int64)
+        cov[:n, :n], obs[:n, :n] = self.cov, self.obs
+        self.cov, self.obs = cov, obs
+
+    def update(self, returns: np.ndarray) -> None:
+        """Fold one bar of returns (aligned with self.symbols, NaN where missing)."""
+        present = np.flatnonzero(~np.isnan(returns))
+        if not len(present):
+            return
+        r = returns[present]
+        block = np.ix_(present, present)
+        fresh = self.obs[present, present] == 0
+        self.mean[present[fresh]] = r[fresh]  # First observation seeds the mean
+        d = r - self.mean[present]
+        a = self.alpha
+        self.mean[present] += a * d
+        self.cov[block] = (1.0 - a) * (self.cov[block] + a * np.outer(d, d))
+        self.obs[block] += 1
+
+    def apply_bars(self, bars_by_symbol: Mapping[str, Sequence[Mapping[str, Any]]]) -> int:
+        """
+        Fold the bars newer than the last applied one (oldest first, rows per symbol
+        most recent last). Returns the number of bar times applied.
+        """
+        since = self.last_bar_ms
+        by_time: Dict[int, Dict[str, float]] = {}
+        for symbol, rows in bars_by_symbol.items():
+            prev_close: Optional[float] = None
+            # Walk back only as far as the last applied bar (plus one for its close)
+            tail: List[tuple] = []
+            for row in reversed(rows):
+                ts = codec.iso_to_ms(row.get("ts") or row.get("timestamp"))
                 try:
-                    entries.append(json.loads(line))
-                except Exception:
+                    close = float(row.get("close"))
+                except (TypeError, ValueError):
+                    continue
+                if ts is None or not close > 0:
                     continue
-    except Exception:
-        pass
-    return entries
+                tail.append((ts, close))
+                if since is not None and ts <= since:
+                    break
+            for ts, close in reversed(tail):
+                if prev_close is not None and (since is None or ts > since):
+                    by_time.setdefault(ts, {})[str(symbol).upper()] = math.log(close / prev_close)
+                prev_close = close
 
+        if not by_time:
+            return 0
+        self._ensure(sorted({s for rets in by_time.values() for s in rets}))
+        for ts in sorted(by_time):
+            row = np.full(len(self.symbols), np.nan)
+            for symbol, value in by_time[ts].items():
+                row[self._index[symbol]] = value
+            self.update(row)
+        self.last_bar_ms = max(by_time)
+        return len(by_time)
 
-def _compute_correlation(x: List[float], y: List[float]) -> Optional[float]:
-    """
-    Compute Pearson correlation coefficient.
-    
-    Returns:
-        Correlation coefficient in [-1, 1] or None if insufficient data
-    """
-    if len(x) != len(y) or len(x) < 2:
-        return None
-    
-    n = len(x)
-    
-    # Compute means
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
-    
-    # Compute covariance and variances
-    covariance = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-    var_x = sum((x[i] - mean_x) ** 2 for i in range(n))
-    var_y = sum((y[i] - mean_y) ** 2 for i in range(n))
-    
-    # Compute correlation
-    denominator = (var_x * var_y) ** 0.5
-    if denominator == 0:
-        return None
-    
-    correlation = covariance / denominator
-    return max(-1.0, min(1.0, correlation))  # Clamp to [-1, 1]
+    def volatility(self) -> np.ndarray:
+        """EW standard deviation of per-bar log returns (NaN before MIN_PAIR_OBS bars)."""
+        var = np.diag(self.cov).copy()
+        var[np.diag(self.obs) < MIN_PAIR_OBS] = np.nan
+        return np.sqrt(np.maximum(var, 0.0))
 
+    def correlation(self) -> np.ndarray:
+        """EW correlation matrix; NaN for pairs with fewer than MIN_PAIR_OBS shared bars."""
+        vol = np.sqrt(np.maximum(np.diag(self.cov), 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.cov / np.outer(vol, vol)
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[(self.obs < MIN_PAIR_OBS) | ~np.isfinite(corr)] = np.nan
+        np.fill_diagonal(corr, 1.0)
+        return corr
 
-def compute_correlation_matrix() -> Dict[str, Any]:
-    """
-    Compute correlation matrix for all symbol pairs.
-    
-    Returns:
-        Dict with correlation matrix and metadata
-    """
-    trades = _read_jsonl(TRADES_PATH)
-    
-    # Build time series: symbol -> list of (timestamp, pct) tuples
-    symbol_returns: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
-    
-    for trade in trades:
-        if trade.get("type") != "close":
-            continue
-        if trade.get("trade_kind") != "exploration":
-            continue
-        
-        symbol = trade.get("symbol")
-        ts = trade.get("ts") or trade.get("time")
-        try:
-            pct = float(trade.get("pct", 0.0))
-        except (ValueError, TypeError):
-            continue
-        
-        if symbol and ts:
-            symbol_returns[symbol].append((ts, pct))
-    
-    # Get all symbols
-    symbols = sorted(symbol_returns.keys())
-    
-    if len(symbols) < 2:
+    def clusters(self, threshold: float = CLUSTER_THRESHOLD) -> List[List[str]]:
+        """Groups of symbols linked by correlation >= threshold, largest first."""
+        return cluster_symbols(self.symbols, self.correlation(), threshold)
+
+    def to_state(self) -> Dict[str, Any]:
         return {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "symbols": [],
-            "matrix": {},
-            "notes": ["Insufficient symbols for correlation analysis"],
+            "timeframe": self.timeframe,
+            "halflife_bars": self.halflife_bars,
+            "last_bar_ms": self.last_bar_ms,
+            "symbols": list(self.symbols),
+            "mean": self.mean.tolist(),
+            "cov": self.cov.tolist(),
+            "obs": self.obs.tolist(),
+        }
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, Any]) -> "EWCovariance":
+        engine = cls(
+            halflife_bars=float(state.get("halflife_bars") or HALFLIFE_BARS),
+            timeframe=str(state.get("timeframe") or DEFAULT_TIMEFRAME),
+        )
+        symbols = [str(s) for s in state.get("symbols") or []]
+        n = len(symbols)
+        try:
+            mean = np.asarray(state.get("mean"), dtype=float).reshape(n)
+            cov = np.asarray(state.get("cov"), dtype=float).reshape(n, n)
+            obs = np.asarray(state.get("obs"), dtype=np.int64).reshape(n, n)
+        except (TypeError, ValueError):
+            return engine
+        engine.symbols = symbols
+        engine._index = {s: i for i, s in enumerate(symbols)}
+        engine.mean, engine.cov, engine.obs = mean, cov, obs
+        engine.last_bar_ms = state.get("last_bar_ms")
+        return engine
+
+    def to_report(self, threshold: float = CLUSTER_THRESHOLD) -> Dict[str, Any]:
+        corr = self.correlation()
+        vol = self.volatility()
+        clusters = cluster_symbols(self.symbols, corr, threshold)
+        matrix = {
+            a: {b: (round(float(corr[i, j]), 4) if np.isfinite(corr[i, j]) else 0.0)
+                for j, b in enumerate(self.symbols)}
+            for i, a in enumerate(self.symbols)
         }
-    
-    # Build aligned return series by timestamp
-    # For each timestamp, collect returns from all symbols
-    timestamp_returns: Dict[str, Dict[str, float]] = defaultdict(dict)
-    
-    for symbol in symbols:
-        for ts, pct in symbol_returns[symbol]:
-            timestamp_returns[ts][symbol] = pct
-    
-    # Find common timestamps (where at least 2 symbols have data)
-    common_timestamps = [
-        ts for ts, returns in timestamp_returns.items()
-        if len(returns) >= 2
-    ]
-    
-    if len(common_timestamps) < 2:
+        notes = []
+        if len(self.symbols) < 2:
+            notes.append("Insufficient symbols for correlation analysis")
+        elif not np.isfinite(corr[~np.eye(len(self.symbols), dtype=bool)]).any():
+            notes.append(f"Fewer than {MIN_PAIR_OBS} shared bars for every pair")
         return {
             "generated_at": datetime.now(timezone.utc).isoformat(),
-            "symbols": symbols,
-            "matrix": {},
-            "notes": ["Insufficient overlapping timestamps for correlation"],
+            "timeframe": self.timeframe,
+            "halflife_bars": self.halflife_bars,
+            "last_bar_ts": (datetime.fromtimestamp(self.last_bar_ms / 1000, tz=timezone.utc).isoformat()
+                            if self.last_bar_ms is not None else None),
+            "symbols": list(self.symbols),
+            "matrix": matrix,
+            "observations": {s: int(self.obs[i, i]) for i, s in enumerate(self.symbols)},
+            "volatility": {s: (float(vol[i]) if np.isfinite(vol[i]) else None) for i, s in enumerate(self.symbols)},
+            "covariance": self.cov.tolist(),
+            "clusters": clusters,
+            "cluster_of": {s: k for k, group in enumerate(clusters) for s in group},
+            "cluster_threshold": threshold,
+            "notes": notes,
         }
-    
-    # Build correlation matrix
-    matrix: Dict[str, Dict[str, float]] = {}
-    
-    for i, sym1 in enumerate(symbols):
-        matrix[sym1] = {}
-        for sym2 in symbols:
-            if sym1 == sym2:
-                matrix[sym1][sym2] = 1.0
-            elif sym2 in matrix and sym1 in matrix[sym2]:
-                # Use symmetry: corr(A, B) = corr(B, A)
-                matrix[sym1][sym2] = matrix[sym2][sym1]
-            else:
-                # Extract aligned return series
-                x = []
-                y = []
-                for ts in common_timestamps:
-                    if sym1 in timestamp_returns[ts] and sym2 in timestamp_returns[ts]:
-                        x.append(timestamp_returns[ts][sym1])
-                        y.append(timestamp_returns[ts][sym2])
-                
-                corr = _compute_correlation(x, y)
-                matrix[sym1][sym2] = corr if corr is not None else 0.0
-    
-    report = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "symbols": symbols,
-        "matrix": matrix,
-        "common_timestamps_count": len(common_timestamps),
-    }
-    
-    # Write report
-    RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
-    CORRELATION_MATRIX_PATH.write_text(json.dumps(report, indent=2))
-    
+
+
+def cluster_symbols(symbols: Sequence[str], corr: np.ndarray, threshold: float = CLUSTER_THRESHOLD) -> List[List[str]]:
+    """Connected components of the graph linking pairs with correlation >= threshold."""
+    n = len(symbols)
+    linked = np.nan_to_num(np.asarray(corr, dtype=float), nan=-1.0) >= threshold
+    label = np.full(n, -1)
+    for start in range(n):
+        if label[start] >= 0:
+            continue
+        label[start] = start
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            for j in np.flatnonzero(linked[i] & (label < 0)):
+                label[j] = start
+                stack.append(int(j))
+    groups: Dict[int, List[str]] = {}
+    for i, symbol in enumerate(symbols):
+        groups.setdefault(int(label[i]), []).append(symbol)
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: (-len(g), g[0]))
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+_engine: Optional[EWCovariance] = None
+_engine_path: Optional[Path] = None
+
+
+def get_engine() -> EWCovariance:
+    """Process-wide engine, resumed from CORRELATION_STATE_PATH."""
+    global _engine, _engine_path
+    if _engine is None or _engine_path != CORRELATION_STATE_PATH:
+        state = _read_json(CORRELATION_STATE_PATH)
+        _engine = EWCovariance.from_state(state) if state is not None else EWCovariance()
+        _engine_path = CORRELATION_STATE_PATH
+    return _engine
+
+
+def _save(engine: EWCovariance) -> Dict[str, Any]:
+    report = engine.to_report()
+    atomic_write_json(CORRELATION_STATE_PATH, engine.to_state())
+    atomic_write_json(CORRELATION_MATRIX_PATH, report)
     return report
 
+
+def update_from_snapshot(snapshot: Any = None) -> Optional[Dict[str, Any]]:
+    """
+    Fold the new closed bars of a MarketSnapshot (default: the published one).
+
+    Returns the refreshed report, or None when the snapshot held no new bar.
+    Cheap enough to call every tick.
+    """
+    if snapshot is None:
+        from engine_alpha.data.market_snapshot import get_market_snapshot
+        snapshot = get_market_snapshot()
+    if snapshot is None:
+        return None
+    global _engine
+    engine = get_engine()
+    if snapshot.timeframe and snapshot.timeframe != engine.timeframe:
+        # Returns of different bar sizes do not mix; start over on the new timeframe
+        engine = _engine = EWCovariance(engine.halflife_bars, timeframe=snapshot.timeframe)
+    applied = engine.apply_bars({sym: snap.bars for sym, snap in snapshot.symbols.items()})
+    return _save(engine) if applied else None
+
+
+def compute_correlation_matrix(symbols: Optional[Iterable[str]] = None,
+                               timeframe: str = DEFAULT_TIMEFRAME) -> Dict[str, Any]:
+    """
+    Bring the correlation matrix up to date and write the report.
+
+    Uses the published market snapshot when there is one; otherwise fetches
+    HISTORY_BARS bars per symbol (registry symbols by default).
+
+    Returns:
+        Dict with correlation matrix, clusters and metadata
+    """
+    from engine_alpha.data.market_snapshot import collect_symbol_bars, get_market_snapshot
+
+    snapshot = get_market_snapshot()
+    if snapshot is not None and snapshot.timeframe == get_engine().timeframe:
+        update_from_snapshot(snapshot)
+    else:
+        from engine_alpha.core.symbol_registry import load_symbol_registry
+
+        global _engine
+        engine = get_engine()
+        if engine.timeframe != timeframe:
+            engine = _engine = EWCovariance(engine.halflife_bars, timeframe=timeframe)
+        wanted = list(symbols) if symbols is not None else load_symbol_registry()
+        engine.apply_bars(collect_symbol_bars(wanted, timeframe, HISTORY_BARS))
+    return _save(get_engine())
+
+
+def load_correlation_view(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    The last written report (empty dict if none), reloaded only when the file
+    changes. Consumers in other processes read the matrix and clusters here.
+    """
+    return codec.load_json_cached(path or CORRELATION_MATRIX_PATH)
+
+
+def view_clusters(view: Mapping[str, Any], symbols: Optional[Iterable[str]] = None) -> List[List[str]]:
+    """Clusters of a report restricted to symbols (groups left empty are dropped)."""
+    wanted = set(symbols) if symbols is not None else None
+    groups = [[s for s in group if wanted is None or s in wanted] for group in view.get("clusters") or []]
+    return [g for g in groups if g]
+
+
+def view_matrix(view: Mapping[str, Any], symbols: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """Correlation sub-matrix of a report for the symbols it covers."""
+    matrix = view.get("matrix") or {}
+    known = [s for s in symbols if s in matrix]
+    return {a: {b: matrix[a].get(b, 0.0) for b in known} for a in known}
+
+
+__all__ = [
+    "CLUSTER_THRESHOLD",
+    "CORRELATION_MATRIX_PATH",
+    "EWCovariance",
+    "cluster_symbols",
+    "compute_correlation_matrix",
+    "get_engine",
+    "load_correlation_view",
+    "update_from_snapshot",
+    "view_clusters",
+    "view_matrix",
+]
@@ -66,7 +66,7 @@ def load_ohlcv(symbol: str, timeframe: str = "1h", limit: int = 150) -> List[Dic
     
     # Try live OHLCV first
     try:
-        live_candles = get_live_ohlcv(symbol, timeframe, limit=limit)
+        live_candles, _ = get_live_ohlcv(symbol, timeframe, limit=limit)
         if live_candles and isinstance(live_candles, list):
             candles = live_candles[-limit:]
             if candles:
@@ -101,6 +101,14 @@ def detect_swings(bars: List[Dict[str, Any]]) -> Tuple[List[int], List[int]]:
     if len(bars) < 3:
         return swing_highs, swing_lows
     
+    if np is not None:
+        # Vectorized neighbour comparison over the whole bar array
+        h = np.array([float(b.get("high", 0)) for b in bars])
+        l = np.array([float(b.get("low", 0)) for b in bars])
+        hi = np.flatnonzero((h[1:-1] > h[:-2]) & (h[1:-1] > h[2:])) + 1
+        lo = np.flatnonzero((l[1:-1] < l[:-2]) & (l[1:-1] < l[2:])) + 1
+        return hi.tolist(), lo.tolist()
+    
     for i in range(1, len(bars) - 1):
         h_prev = float(bars[i-1].get("high", 0))
         h = float(bars[i].get("high", 0))
@@ -402,87 +410,79 @@ def compute_structure_conf(
     return float(max(0.0, min(score, 1.0)))
 
 
-def run_market_structure_scan() -> Dict[str, Dict[str, Any]]:
+def compute_symbol_structure(bars: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Loads 1h (and optionally 15m/5m if needed), computes market structure
-    and session classification per symbol, and writes JSON to
-    reports/research/market_structure.json
+    Market structure entry for one symbol from its 1h bars (newest last).
     """
-    symbols = load_symbol_registry()
+    # Determine session from latest bar timestamp or current time
+    latest_bar_ts = None
+    if bars:
+        try:
+            latest_bar_ts_str = bars[-1].get("ts", "")
+            if latest_bar_ts_str:
+                # Try parsing ISO format
+                latest_bar_ts = datetime.fromisoformat(latest_bar_ts_str.replace("Z", "+00:00"))
+        except Exception:
+            pass
     
-    results: Dict[str, Dict[str, Any]] = {}
-    session = classify_session()
+    ts = latest_bar_ts or datetime.now(timezone.utc)
+    session = _detect_session(ts)
     
-    for sym in symbols:
-        bars = load_ohlcv(sym, "1h", limit=150)
-        
-        # Determine session from latest bar timestamp or current time
-        latest_bar_ts = None
-        if bars:
-            try:
-                latest_bar_ts_str = bars[-1].get("ts", "")
-                if latest_bar_ts_str:
-                    # Try parsing ISO format
-                    latest_bar_ts = datetime.fromisoformat(latest_bar_ts_str.replace("Z", "+00:00"))
-            except Exception:
-                pass
-        
-        ts = latest_bar_ts or datetime.now(timezone.utc)
-        session = _detect_session(ts)
-        
-        if len(bars) < 20:
-            results[sym] = {
-                "session": "unknown",
-                "structure_1h": "neutral",
-                "equal_highs_1h": False,
-                "equal_lows_1h": False,
-                "order_block_1h": "none",
-                "fvg_1h": "none",
-                "structure_confidence": None,
-                "notes": ["Insufficient 1h data to determine structure."],
-            }
-            continue
-        
-        structure, swings_h, swings_l = classify_structure(bars)
-        eqh, eql = detect_equal_levels(bars, swings_h, swings_l)
-        ob = detect_simple_order_block(bars)
-        fvg = detect_fvg(bars)
-        
-        # v2: Detect CHoCH
-        choch_recent, choch_quality = detect_choch(bars, swings_h, swings_l)
-        
-        conf = compute_structure_conf(structure, eqh, eql, ob, fvg, session, choch_recent, choch_quality, bars)
-        
-        note_list: List[str] = []
-        if structure == "bullish":
-            note_list.append("HH/HL bullish structure.")
-        elif structure == "bearish":
-            note_list.append("LH/LL bearish structure.")
-        else:
-            note_list.append("Neutral or choppy structure.")
-        
-        if ob != "none":
-            note_list.append(f"Detected {ob} order block.")
-        if fvg != "none":
-            note_list.append(f"Detected {fvg} FVG.")
-        if eqh:
-            note_list.append("Equal highs present.")
-        if eql:
-            note_list.append("Equal lows present.")
-        
-        results[sym] = {
-            "session": session,
-            "structure_1h": structure,
-            "equal_highs_1h": eqh,
-            "equal_lows_1h": eql,
-            "order_block_1h": ob,
-            "fvg_1h": fvg,
-            "structure_confidence": round(conf, 2),
-            "choch_recent": choch_recent,  # v2 field
-            "choch_quality": round(choch_quality, 2) if choch_recent else None,  # v2 field
-            "notes": note_list,
+    if len(bars) < 20:
+        return {
+            "session": "unknown",
+            "structure_1h": "neutral",
+            "equal_highs_1h": False,
+            "equal_lows_1h": False,
+            "order_block_1h": "none",
+            "fvg_1h": "none",
+            "structure_confidence": None,
+            "notes": ["Insufficient 1h data to determine structure."],
         }
     
+    structure, swings_h, swings_l = classify_structure(bars)
+    eqh, eql = detect_equal_levels(bars, swings_h, swings_l)
+    ob = detect_simple_order_block(bars)
+    fvg = detect_fvg(bars)
+    
+    # v2: Detect CHoCH
+    choch_recent, choch_quality = detect_choch(bars, swings_h, swings_l)
+    
+    conf = compute_structure_conf(structure, eqh, eql, ob, fvg, session, choch_recent, choch_quality, bars)
+    
+    note_list: List[str] = []
+    if structure == "bullish":
+        note_list.append("HH/HL bullish structure.")
+    elif structure == "bearish":
+        note_list.append("LH/LL bearish structure.")
+    else:
+        note_list.append("Neutral or choppy structure.")
+    
+    if ob != "none":
+        note_list.append(f"Detected {ob} order block.")
+    if fvg != "none":
+        note_list.append(f"Detected {fvg} FVG.")
+    if eqh:
+        note_list.append("Equal highs present.")
+    if eql:
+        note_list.append("Equal lows present.")
+    
+    return {
+        "session": session,
+        "structure_1h": structure,
+        "equal_highs_1h": eqh,
+        "equal_lows_1h": eql,
+        "order_block_1h": ob,
+        "fvg_1h": fvg,
+        "structure_confidence": round(conf, 2),
+        "choch_recent": choch_recent,  # v2 field
+        "choch_quality": round(choch_quality, 2) if choch_recent else None,  # v2 field
+        "notes": note_list,
+    }
+
+
+def write_market_structure_report(results: Dict[str, Dict[str, Any]]) -> Path:
+    """Write reports/research/market_structure.json (with health) for per-symbol results."""
     # Compute health
     health_status = "ok"
     health_reasons = []
@@ -504,6 +504,23 @@ def run_market_structure_scan() -> Dict[str, Dict[str, Any]]:
     
     output_path = REPORTS_DIR / "market_structure.json"
     output_path.write_text(json.dumps(out, indent=2))
+    return output_path
+
+
+def run_market_structure_scan() -> Dict[str, Dict[str, Any]]:
+    """
+    Loads 1h (and optionally 15m/5m if needed), computes market structure
+    and session classification per symbol, and writes JSON to
+    reports/research/market_structure.json
+    """
+    symbols = load_symbol_registry()
+    
+    results: Dict[str, Dict[str, Any]] = {}
+    
+    for sym in symbols:
+        bars = load_ohlcv(sym, "1h", limit=150)
+        results[sym] = compute_symbol_structure(bars)
+    
+    write_market_structure_report(results)
     
     return results
-
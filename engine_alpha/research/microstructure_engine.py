@@ -229,7 +229,7 @@ def load_ohlcv_for_symbol(
     
     # Try live OHLCV first (returns list of dicts, not DataFrame)
     try:
-        live_candles = get_live_ohlcv(symbol, timeframe, limit=max_bars)
+        live_candles, _ = get_live_ohlcv(symbol, timeframe, limit=max_bars)
         if live_candles and isinstance(live_candles, list):
             candles = live_candles[-max_bars:]  # Take last N bars
             if candles:
@@ -254,6 +254,7 @@ def compute_microstructure_for_symbol(
     symbol: str,
     timeframe: str = "15m",
     max_bars: int = 500,
+    candles: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Compute microstructure features for a symbol.
@@ -262,6 +263,7 @@ def compute_microstructure_for_symbol(
         symbol: Symbol ID (e.g., "ETHUSDT")
         timeframe: Timeframe (default: "15m")
         max_bars: Maximum number of bars to process (default: 500)
+        candles: Preloaded candles (loaded if None; not mutated)
     
     Returns:
         Dict mapping timestamp -> microstructure features
@@ -269,13 +271,14 @@ def compute_microstructure_for_symbol(
     features_by_ts: Dict[str, Dict[str, Any]] = {}
     
     # Load OHLCV data
-    candles = load_ohlcv_for_symbol(symbol, timeframe, max_bars)
+    if candles is None:
+        candles = load_ohlcv_for_symbol(symbol, timeframe, max_bars)
     
     if not candles:
         return features_by_ts
     
     # Sort by timestamp (ensure chronological order)
-    candles.sort(key=lambda c: c.get("ts", ""))
+    candles = sorted(candles[-max_bars:], key=lambda c: c.get("ts", ""))
     
     # Compute features for each bar
     prev_close = None
@@ -534,6 +537,7 @@ def _compute_summary_metrics(
 def compute_microstructure_snapshot(
     symbols: Optional[List[str]] = None,
     timeframe: str = "15m",
+    candles_by_symbol: Optional[Dict[str, List[Dict[str, Any]]]] = None,
 ) -> Dict[str, Any]:
     """
     Compute microstructure snapshot for all enabled symbols.
@@ -541,6 +545,7 @@ def compute_microstructure_snapshot(
     Args:
         symbols: List of symbols to process (if None, load from symbol registry)
         timeframe: Timeframe (default: "15m")
+        candles_by_symbol: Preloaded candles per symbol (others are loaded once each)
     
     Returns:
         Dict with structure:
@@ -585,12 +590,14 @@ def compute_microstructure_snapshot(
     }
     
     for symbol in symbols:
-        # Load OHLCV data
-        candles = load_ohlcv_for_symbol(symbol, timeframe)
+        # Load OHLCV data (once; the same bars feed features and summary)
+        candles = (candles_by_symbol or {}).get(symbol)
+        if candles is None:
+            candles = load_ohlcv_for_symbol(symbol, timeframe)
         
         if candles:
             # Compute bar-level features
-            features_by_ts = compute_microstructure_for_symbol(symbol, timeframe)
+            features_by_ts = compute_microstructure_for_symbol(symbol, timeframe, candles=candles)
             
             if features_by_ts:
                 # Compute summary metrics (pass candles for close prices)
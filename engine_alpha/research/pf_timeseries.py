@@ -5,37 +5,51 @@ PF Time-Series Engine
 Pro-quant PF time-series calculator for Chloe.
 
 Responsibilities:
-  * Read trade history from reports/trades.jsonl
+  * Follow trade history in reports/trades.jsonl (tailed by byte offset)
   * Compute rolling PF statistics over multiple windows:
         - 1D, 7D, 14D, 30D, 90D
     plus:
         - month-to-date (MTD)
   * Compute:
         - per-symbol PF per window
+        - per-lane (trade_kind) PF per window
         - global PF per window (trade-weighted)
   * Persist results to:
         reports/pf/pf_timeseries.json
 
+Closes are folded into per-day, per-symbol, per-lane buckets of gross wins,
+gross losses and counts as they are appended (PFDayBuckets). A window is the
+sum of the whole days after its start plus the closes of the day it starts
+in, so a refresh costs a read of the new lines and is cheap enough to run
+every tick. The API's /pf/windows view uses the same buckets and windows.
+
 All outputs are ADVISORY-ONLY and PAPER-SAFE.
 No configs, executions, or capital are modified.
 """
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.core.paths import REPORTS
-from engine_alpha.reflect.trade_sanity import filter_corrupted
+from engine_alpha.reflect.trade_sanity import is_corrupted_trade_event
 
 TRADES_PATH = REPORTS / "trades.jsonl"
 OUT_PATH = REPORTS / "pf" / "pf_timeseries.json"
 
 WINDOW_DAYS = [1, 7, 14, 30, 90]
 
+DAY_MS = 86_400_000
+DEFAULT_LANE = "normal"
+
 
 @dataclass
 class PFStats:
@@ -141,34 +155,6 @@ def _extract_return(trade: Dict[str, Any]) -> Optional[Tuple[float, float]]:
     return None
 
 
-def _load_trades() -> List[Dict[str, Any]]:
-    if not TRADES_PATH.exists():
-        return []
-    trades: List[Dict[str, Any]] = []
-    with TRADES_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except Exception:
-                continue
-            # Only process "close" events for PF calculation
-            event_type = rec.get("type", "").lower()
-            if event_type != "close":
-                continue
-            ts = _safe_parse_ts(rec.get("ts") or rec.get("timestamp"))
-            if ts is None:
-                continue
-            rec["_ts_dt"] = ts
-            trades.append(rec)
-    # Filter corrupted events (analytics-only)
-    trades = filter_corrupted(trades)
-    trades.sort(key=lambda x: x["_ts_dt"])
-    return trades
-
-
 def _compute_pf_for_window(
     returns: List[Tuple[float, float]]
 ) -> PFStats:
@@ -216,96 +202,243 @@ def _compute_pf_for_window(
     )
 
 
-def _group_trades_by_symbol(trades: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    by_sym: Dict[str, List[Dict[str, Any]]] = {}
+def _new_bucket() -> Dict[str, float]:
+    return {"win_num": 0.0, "win_den": 0.0, "loss_num": 0.0, "loss_den": 0.0, "wins": 0, "losses": 0, "trades": 0}
 
-    for t in trades:
-        sym = t.get("symbol") or t.get("pair") or "UNKNOWN"
-        by_sym.setdefault(str(sym), []).append(t)
-    return by_sym
 
+def _add_to_bucket(bucket: Dict[str, float], r: float, w: float) -> None:
+    bucket["trades"] += 1
+    if r > 0.0:
+        bucket["wins"] += 1
+        bucket["win_num"] += r * w
+        bucket["win_den"] += abs(w)
+    elif r < 0.0:
+        bucket["losses"] += 1
+        bucket["loss_num"] += abs(r) * w
+        bucket["loss_den"] += abs(w)
 
-def compute_pf_timeseries(now: Optional[datetime] = None) -> Dict[str, Any]:
+
+def _merge_bucket(acc: Dict[str, float], bucket: Dict[str, float]) -> None:
+    for k, v in bucket.items():
+        acc[k] += v
+
+
+def _bucket_stats(bucket: Dict[str, float]) -> Dict[str, Any]:
+    """PF stats for summed buckets (same rules as _compute_pf_for_window)."""
+    avg_win = bucket["win_num"] / (bucket["win_den"] or 1.0) if bucket["wins"] else None
+    avg_loss = bucket["loss_num"] / (bucket["loss_den"] or 1.0) if bucket["losses"] else None
+    pf = None
+    if bucket["losses"] and avg_loss not in (None, 0.0) and avg_win is not None:
+        pf = float(avg_win / avg_loss)
+    return {
+        "pf": pf,
+        "wins": int(bucket["wins"]),
+        "losses": int(bucket["losses"]),
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "trades": int(bucket["trades"]),
+    }
+
+
+def pf_by_group(groups: Sequence[Hashable], returns: Sequence[Tuple[float, float]]) -> Dict[Hashable, PFStats]:
     """
-    Core engine: compute PF time-series for all symbols + global.
+    PF stats of (return_pct, weight) pairs per group key, all groups in one pass
+    (same rules as _compute_pf_for_window).
     """
-    if now is None:
-        now = datetime.now(timezone.utc)
+    if not len(groups):
+        return {}
+    keys, codes = np.unique(np.asarray(groups, dtype=object), return_inverse=True)
+    rw = np.asarray(returns, dtype=float).reshape(-1, 2)
+    r, w = rw[:, 0], rw[:, 1]
+    win, loss = r > 0.0, r < 0.0
+    n = len(keys)
+
+    def total(values: np.ndarray, where: np.ndarray) -> np.ndarray:
+        return np.bincount(codes, weights=np.where(where, values, 0.0), minlength=n)
+
+    sums = {
+        "win_num": total(r * w, win),
+        "win_den": total(np.abs(w), win),
+        "loss_num": total(np.abs(r) * w, loss),
+        "loss_den": total(np.abs(w), loss),
+        "wins": np.bincount(codes, weights=win, minlength=n),
+        "losses": np.bincount(codes, weights=loss, minlength=n),
+        "trades": np.bincount(codes, minlength=n),
+    }
+    return {
+        key: PFStats(**_bucket_stats({name: float(col[i]) for name, col in sums.items()}))
+        for i, key in enumerate(keys)
+    }
+
 
-    trades = _load_trades()
-    by_sym = _group_trades_by_symbol(trades)
+@dataclass
+class _Day:
+    """One UTC day of closes: bucket sums per (symbol, lane) plus the closes themselves."""
+    buckets: Dict[Tuple[str, str], Dict[str, float]] = field(default_factory=dict)
+    closes: List[Tuple[int, str, str, float, float]] = field(default_factory=list)
 
-    def in_window(ts: datetime, days: int) -> bool:
-        delta = now - ts
-        return delta.total_seconds() <= days * 86400.0
 
-    # MTD helper
+def window_starts(now: datetime) -> Dict[str, int]:
+    """
+    Inclusive start (epoch ms) of every window at `now`: "<d>d" is the rolling
+    `now - ts <= d days` window, "mtd" starts at the UTC month start.
+    """
+    now_ms = codec.iso_to_ms(now)
     start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    starts = {f"{d}d": now_ms - d * DAY_MS for d in WINDOW_DAYS}
+    starts["mtd"] = codec.iso_to_ms(start_of_month)
+    return starts
 
-    symbol_stats: Dict[str, Dict[str, Any]] = {}
 
-    # Per-symbol stats
-    for symbol, sym_trades in by_sym.items():
-        sym_returns: Dict[str, List[Tuple[float, float]]] = {f"{d}d": [] for d in WINDOW_DAYS}
-        sym_returns["mtd"] = []
+class PFDayBuckets:
+    """
+    Closes folded into per-UTC-day (symbol, lane) buckets.
 
-        for t in sym_trades:
-            ts = t["_ts_dt"]
-            rets = _extract_return(t)
-            if rets is None:
-                continue
-            r, w = rets
-
-            # assign to windows
-            for d in WINDOW_DAYS:
-                if in_window(ts, d):
-                    sym_returns[f"{d}d"].append((r, w))
-            if ts >= start_of_month:
-                sym_returns["mtd"].append((r, w))
-
-        symbol_stats[symbol] = {}
-        for key, values in sym_returns.items():
-            symbol_stats[symbol][key] = _compute_pf_for_window(values).to_dict()
-
-    # Global stats (trade-weighted)
-    global_stats: Dict[str, Any] = {}
-    global_returns: Dict[str, List[Tuple[float, float]]] = {f"{d}d": [] for d in WINDOW_DAYS}
-    global_returns["mtd"] = []
-
-    for t in trades:
-        ts = t["_ts_dt"]
-        rets = _extract_return(t)
+    window(since_ms) sums the whole days after the window start and filters
+    only the day the window starts in close by close, which keeps the
+    rolling windows exact. Shared by PFTimeseriesEngine and the API's
+    TradesView so both report the same PF per window. Not locked; owners
+    serialize access.
+    """
+
+    def __init__(self) -> None:
+        self.days: Dict[int, _Day] = {}
+
+    def clear(self) -> None:
+        self.days = {}
+
+    def ingest(self, rec: Dict[str, Any]) -> bool:
+        """Fold one trade event in; returns False for non-closes and unusable records."""
+        if str(rec.get("type", "")).lower() != "close" or is_corrupted_trade_event(rec):
+            return False
+        ts_ms = codec.ts_ms_of(rec)
+        rets = _extract_return(rec) if ts_ms is not None else None
         if rets is None:
-            continue
+            return False
         r, w = rets
+        symbol = str(rec.get("symbol") or rec.get("pair") or "UNKNOWN")
+        lane = str(rec.get("trade_kind") or DEFAULT_LANE).lower()
+        day = self.days.setdefault(ts_ms // DAY_MS, _Day())
+        _add_to_bucket(day.buckets.setdefault((symbol, lane), _new_bucket()), r, w)
+        day.closes.append((ts_ms, symbol, lane, r, w))
+        return True
+
+    def keys(self) -> set:
+        """Every (symbol, lane) seen."""
+        return {key for day in self.days.values() for key in day.buckets}
+
+    def window(self, since_ms: Optional[int]) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """Bucket sums per (symbol, lane) over closes with ts >= since_ms (all closes if None)."""
+        totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+        first_day = since_ms // DAY_MS if since_ms is not None else None
+        for day_idx, day in self.days.items():
+            if first_day is None or day_idx > first_day:
+                for key, bucket in day.buckets.items():
+                    _merge_bucket(totals.setdefault(key, _new_bucket()), bucket)
+            elif day_idx == first_day:
+                for ts_ms, symbol, lane, r, w in day.closes:
+                    if ts_ms >= since_ms:
+                        _add_to_bucket(totals.setdefault((symbol, lane), _new_bucket()), r, w)
+        return totals
+
+
+class PFTimeseriesEngine:
+    """
+    Incremental PF time-series over a trades.jsonl file.
 
-        for d in WINDOW_DAYS:
-            if in_window(ts, d):
-                global_returns[f"{d}d"].append((r, w))
-        if ts >= start_of_month:
-            global_returns["mtd"].append((r, w))
-
-    for key, values in global_returns.items():
-        global_stats[key] = _compute_pf_for_window(values).to_dict()
-
-    payload = {
-        "meta": {
-            "engine": "pf_timeseries_v1",
-            "version": "1.0.0",
-            "generated_at": now.isoformat(),
-            "windows_days": WINDOW_DAYS,
-            "advisory_only": True,
-        },
-        "global": global_stats,
-        "symbols": symbol_stats,
-    }
+    refresh() folds closes appended since the last call into PFDayBuckets
+    (a truncated or replaced file is re-read from the start); compute(now)
+    derives every window (see window_starts) from the buckets.
+    """
 
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with OUT_PATH.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, sort_keys=True)
+    def __init__(self, path: Path = TRADES_PATH) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._tail = codec.JsonlTail(path)
+        self._buckets = PFDayBuckets()
+
+    def refresh(self) -> int:
+        """Fold in closes appended since the last refresh; returns how many were added."""
+        with self._lock:
+            records, reset = self._tail.read_new()
+            if reset:
+                self._buckets.clear()
+            return sum(self._buckets.ingest(rec) for rec in records)
+
+    def compute(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """PF per window for all symbols, lanes and global (refreshes first)."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        self.refresh()
+
+        symbol_stats: Dict[str, Dict[str, Any]] = {}
+        lane_stats: Dict[str, Dict[str, Any]] = {}
+        global_stats: Dict[str, Any] = {}
+        with self._lock:
+            keys = self._buckets.keys()
+            windows = {label: self._buckets.window(since_ms) for label, since_ms in window_starts(now).items()}
+
+        for label, totals in windows.items():
+            by_symbol: Dict[str, Dict[str, float]] = {symbol: _new_bucket() for symbol, _ in keys}
+            by_lane: Dict[str, Dict[str, float]] = {lane: _new_bucket() for _, lane in keys}
+            overall = _new_bucket()
+            for (symbol, lane), bucket in totals.items():
+                _merge_bucket(by_symbol[symbol], bucket)
+                _merge_bucket(by_lane[lane], bucket)
+                _merge_bucket(overall, bucket)
+            for symbol, bucket in by_symbol.items():
+                symbol_stats.setdefault(symbol, {})[label] = _bucket_stats(bucket)
+            for lane, bucket in by_lane.items():
+                lane_stats.setdefault(lane, {})[label] = _bucket_stats(bucket)
+            global_stats[label] = _bucket_stats(overall)
 
-    return payload
+        return {
+            "meta": {
+                "engine": "pf_timeseries_v2",
+                "version": "2.0.0",
+                "generated_at": now.isoformat(),
+                "windows_days": WINDOW_DAYS,
+                "advisory_only": True,
+            },
+            "global": global_stats,
+            "symbols": symbol_stats,
+            "lanes": lane_stats,
+        }
 
 
-__all__ = ["compute_pf_timeseries", "OUT_PATH", "TRADES_PATH"]
+_engine: Optional[PFTimeseriesEngine] = None
+
+
+def get_engine() -> PFTimeseriesEngine:
+    """Process-wide engine for TRADES_PATH (rebuilt if TRADES_PATH is repointed)."""
+    global _engine
+    if _engine is None or _engine.path != TRADES_PATH:
+        _engine = PFTimeseriesEngine(TRADES_PATH)
+    return _engine
+
+
+# (path, file_sig after our write, payload minus meta) of the last OUT_PATH write
+_last_written: Optional[Tuple[Path, Any, Dict[str, Any]]] = None
+
+
+def compute_pf_timeseries(now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Core engine: compute PF time-series for all symbols + lanes + global.
+
+    Only closes appended since the previous call are read. OUT_PATH is
+    rewritten only when the stats changed (closes added, or a close or month
+    start crossed a window boundary) or the file was touched by someone else,
+    so its file_sig stays stable across no-op ticks and downstream
+    fingerprints (capital plan) keep hitting. Safe to call every tick.
+    """
+    global _last_written
+    payload = get_engine().compute(now)
+    body = {k: v for k, v in payload.items() if k != "meta"}
+    last = _last_written
+    if last is None or last[0] != OUT_PATH or last[1] != codec.file_sig(OUT_PATH) or last[2] != body:
+        atomic_write_json(OUT_PATH, payload)
+        _last_written = (OUT_PATH, codec.file_sig(OUT_PATH), body)
+    return payload
+
 
+__all__ = ["PFDayBuckets", "PFTimeseriesEngine", "compute_pf_timeseries", "window_starts", "get_engine", "pf_by_group", "OUT_PATH", "TRADES_PATH"]
@@ -0,0 +1,228 @@
+"""
+Structure Scan - fused runner for the structure research artifacts.
+
+Loads each symbol's bars once (one bar cube per symbol, see
+advanced_structure.bar_cube) and runs every structure detector on those
+bars, with symbols processed in parallel:
+- Volume imbalance (reports/research/volume_imbalance.json)
+- Liquidity sweeps (reports/research/liquidity_sweeps.json)
+- Market structure (reports/research/market_structure.json)
+- Microstructure (reports/research/microstructure_snapshot_15m.json)
+- Breakout reliability (reports/research/breakout_reliability.json)
+
+Each detector gets the same views and artifact inputs as its standalone
+scan. Views are capped at LIVE_MAX_BARS bars, which is all one live request
+returns, so a standalone scan asking for more (e.g. 500 x 15m for
+microstructure) also gets only LIVE_MAX_BARS bars. The artifacts match the
+separate runners as long as both read the same provider bars.
+Per-detector timings are written to reports/research/structure_scan.json.
+
+Symbols are scanned in parallel. Concurrent provider and cooldown state
+writes are safe because atomic_write_json uses per-thread temp files.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from engine_alpha.core.paths import REPORTS
+from engine_alpha.data.live_prices import LIVE_MAX_BARS
+from engine_alpha.research.advanced_structure.bar_cube import get_bar_cube, scan_run
+from engine_alpha.research.advanced_structure.liquidity_sweeps import (
+    compute_liquidity_sweeps,
+    write_liquidity_sweeps_report,
+)
+from engine_alpha.research.advanced_structure.volume_imbalance import (
+    compute_volume_imbalance,
+    normalize_volume_imbalance_entry,
+    write_volume_imbalance_report,
+)
+from engine_alpha.research.breakout_reliability import (
+    compute_breakout_reliability,
+    write_breakout_reliability_report,
+)
+from engine_alpha.research.market_structure import (
+    compute_symbol_structure,
+    write_market_structure_report,
+)
+from engine_alpha.research.microstructure_engine import (
+    compute_microstructure_snapshot,
+    save_microstructure_snapshot,
+)
+
+RESEARCH_DIR = REPORTS / "research"
+STRUCTURE_SCAN_PATH = RESEARCH_DIR / "structure_scan.json"
+
+# Views used by the standalone scans
+ASE_BARS = {"5m": 500, "15m": 300, "1h": 100}
+MARKET_STRUCTURE_BARS_1H = 150
+MICROSTRUCTURE_BARS_15M = 500
+# Bars requested per symbol: every view above, capped at what one live request returns
+CUBE_BARS = {
+    tf: min(n, LIVE_MAX_BARS)
+    for tf, n in {
+        "5m": ASE_BARS["5m"],
+        "15m": max(ASE_BARS["15m"], MICROSTRUCTURE_BARS_15M),
+        "1h": max(ASE_BARS["1h"], MARKET_STRUCTURE_BARS_1H),
+    }.items()
+}
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def _load_json(path) -> Dict[str, Any]:
+    """Load JSON file, return empty dict if missing or invalid."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except Exception:
+        return {}
+
+
+def _timed(timings: Dict[str, float], name: str, fn, *args, **kwargs):
+    started = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[name] = timings.get(name, 0.0) + (time.perf_counter() - started)
+
+
+def _scan_symbol(symbol: str) -> Dict[str, Any]:
+    """Load one symbol's bars and run the per-symbol detectors on them."""
+    timings: Dict[str, float] = {}
+    out: Dict[str, Any] = {"symbol": symbol, "timings": timings, "errors": []}
+
+    try:
+        cube = _timed(timings, "load", get_bar_cube, symbol, CUBE_BARS)
+        tf_data = {tf: cube.get(tf, n) for tf, n in ASE_BARS.items()}
+        out["candles_15m"] = cube.get("15m", MICROSTRUCTURE_BARS_15M)
+        bars_1h = cube.get("1h", MARKET_STRUCTURE_BARS_1H)
+    except Exception as e:
+        out["errors"].append(f"load: {e}")
+        tf_data, bars_1h = {}, []
+        out["candles_15m"] = []
+
+    vi = _timed(timings, "volume_imbalance", compute_volume_imbalance, symbol, lookback=20, tf_data=tf_data)
+    out["volume_imbalance"] = vi.get(symbol, {})
+
+    # Sweeps read volume imbalance in its artifact shape (as from volume_imbalance.json)
+    vi_artifact = {symbol: normalize_volume_imbalance_entry(out["volume_imbalance"])}
+    try:
+        sweeps = _timed(timings, "liquidity_sweeps", compute_liquidity_sweeps, symbol, vi_artifact, tf_data=tf_data)
+        out["liquidity_sweeps"] = sweeps.get(symbol, {})
+    except Exception as e:
+        out["errors"].append(f"liquidity_sweeps: {e}")
+        out["liquidity_sweeps"] = {
+            "session": "Unknown",
+            "htf_pool": "none",
+            "equal_highs_1h": False,
+            "equal_lows_1h": False,
+            "sell_sweep_5m": False,
+            "buy_sweep_5m": False,
+            "sell_sweep_15m": False,
+            "buy_sweep_15m": False,
+            "breaker": "none",
+            "strength": 0.0,
+            "notes": [f"Error: {str(e)}"],
+        }
+
+    out["market_structure"] = _timed(timings, "market_structure", compute_symbol_structure, bars_1h)
+    return out
+
+
+def _summarize_timings(per_symbol: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    summary: Dict[str, Dict[str, float]] = {}
+    for timings in per_symbol:
+        for name, elapsed in timings.items():
+            entry = summary.setdefault(name, {"total_s": 0.0, "max_s": 0.0, "count": 0})
+            entry["total_s"] += elapsed
+            entry["max_s"] = max(entry["max_s"], elapsed)
+            entry["count"] += 1
+    for entry in summary.values():
+        entry["total_s"] = round(entry["total_s"], 4)
+        entry["max_s"] = round(entry["max_s"], 4)
+    return summary
+
+
+def run_structure_scan(
+    symbols: Optional[List[str]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[str, Any]:
+    """
+    Run every structure detector for all symbols and write all artifacts.
+
+    Args:
+        symbols: Symbols to scan (if None, load from symbol registry)
+        max_workers: Symbols processed in parallel
+
+    Returns:
+        Dict with per-detector timings, wall time, symbols and errors
+        (also written to reports/research/structure_scan.json)
+    """
+    if symbols is None:
+        try:
+            from engine_alpha.core.symbol_registry import load_symbol_registry
+            symbols = load_symbol_registry()
+        except Exception:
+            symbols = [
+                "BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "AVAXUSDT",
+                "LINKUSDT", "DOTUSDT", "ADAUSDT", "ATOMUSDT", "XRPUSDT", "DOGEUSDT"
+            ]
+
+    started = time.perf_counter()
+    with scan_run():
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols) or 1))) as pool:
+            scanned = list(pool.map(_scan_symbol, symbols))
+
+    timings = _summarize_timings([s["timings"] for s in scanned])
+    writer_timings: Dict[str, float] = {}
+
+    vi_results = {s["symbol"]: s["volume_imbalance"] for s in scanned}
+    sweeps_results = {s["symbol"]: s["liquidity_sweeps"] for s in scanned}
+    ms_results = {s["symbol"]: s["market_structure"] for s in scanned}
+
+    vi_normalized = _timed(writer_timings, "write_volume_imbalance", write_volume_imbalance_report, vi_results)
+    _timed(writer_timings, "write_liquidity_sweeps", write_liquidity_sweeps_report, sweeps_results)
+    _timed(writer_timings, "write_market_structure", write_market_structure_report, ms_results)
+
+    micro_snapshot = _timed(
+        writer_timings, "microstructure", compute_microstructure_snapshot,
+        symbols, "15m", {s["symbol"]: s["candles_15m"] for s in scanned},
+    )
+    _timed(writer_timings, "write_microstructure", save_microstructure_snapshot, micro_snapshot, "15m")
+
+    drift_path = RESEARCH_DIR / "drift_report.json"
+    exec_quality_path = RESEARCH_DIR / "execution_quality.json"
+    breakout = _timed(
+        writer_timings, "breakout_reliability", compute_breakout_reliability,
+        market_struct={"symbols": ms_results},
+        micro=micro_snapshot,
+        sweeps={"symbols": sweeps_results},
+        volume_imbalance={"symbols": vi_normalized},
+        drift=_load_json(drift_path) if drift_path.exists() else None,
+        exec_quality=_load_json(exec_quality_path) if exec_quality_path.exists() else None,
+    )
+    _timed(writer_timings, "write_breakout_reliability", write_breakout_reliability_report, breakout)
+
+    for name, elapsed in writer_timings.items():
+        timings[name] = {"total_s": round(elapsed, 4), "max_s": round(elapsed, 4), "count": 1}
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "symbols": list(symbols),
+        "max_workers": max_workers,
+        "wall_s": round(time.perf_counter() - started, 4),
+        "timings": timings,
+        "errors": {s["symbol"]: s["errors"] for s in scanned if s["errors"]},
+    }
+    try:
+        RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
+        STRUCTURE_SCAN_PATH.write_text(json.dumps(report, indent=2))
+    except Exception as e:
+        print(f"Warning: Failed to write structure_scan.json: {e}")
+    return report
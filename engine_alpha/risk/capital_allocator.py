@@ -25,8 +25,14 @@ For each symbol, computes:
   - policy_mult    : 1.0 / 0.6 / 0.0
   - tier_mult      : 1.0 / 0.7 / 0.3
   - drift_mult     : 1.15 / 1.0 / 0.7
-  - vol_norm       : placeholder (1.0); ready for real volatility input later
+  - vol_norm       : median EW bar volatility / own volatility (0.5–2.0; 1.0 unmeasured)
   - flags          : kill_lane/de_risk/promotion_candidate
+  - corr_cluster   : index into plan["correlation"]["clusters"]
+  - risk_contribution : share of the plan's portfolio volatility
+
+plan["correlation"] carries the EW bar-return correlation matrix and the
+clusters of co-moving symbols (research/correlation_engine) for the
+symbols of the plan.
 
 This allocator is ADVISORY-ONLY and PAPER-SAFE.
 It does NOT:
@@ -37,13 +43,18 @@ It does NOT:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
+from engine_alpha.core import codec
+from engine_alpha.research import correlation_engine
+from engine_alpha.research.correlation_engine import load_correlation_view, view_clusters, view_matrix
+from engine_alpha.risk.portfolio_risk import get_kernel, risk_summary
 
 PF_TS_PATH = Path("reports/pf/pf_timeseries.json")
 EXECQL_PATH = Path("reports/research/execution_quality.json")
@@ -57,14 +68,25 @@ RISK_SNAPSHOT_PATH = Path("reports/risk/risk_snapshot.json")
 OUT_PATH = Path("reports/risk/capital_plan.json")
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        return {}
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+def _input_paths() -> Dict[str, Path]:
+    """Every file the plan is derived from."""
+    return {
+        "pf_timeseries": PF_TS_PATH,
+        "execql": EXECQL_PATH,
+        "drift": DRIFT_PATH,
+        "edge_profile": EDGE_PROFILE_PATH,
+        "policy": POLICY_PATH,
+        "pf_validity": PF_VALIDITY_PATH,
+        "pf_normalized": PF_NORM_PATH,
+        "scm": SCM_PATH,
+        "risk_snapshot": RISK_SNAPSHOT_PATH,
+        "correlation": correlation_engine.CORRELATION_MATRIX_PATH,
+    }
+
+
+def _input_fingerprint() -> str:
+    sigs = {name: [str(path), codec.file_sig(path)] for name, path in _input_paths().items()}
+    return hashlib.sha1(json.dumps(sigs, sort_keys=True).encode("utf-8")).hexdigest()
 
 
 def _fmt_ts(dt: datetime) -> str:
@@ -263,29 +285,13 @@ def _safe_geomean(values: List[float]) -> float:
     return float(math.exp(sum(logs) / len(logs)))
 
 
-def _vol_norm_placeholder(symbol: str) -> float:
-    """
-    Placeholder volatility normalization factor.
-    Real implementation would use realized vol; for now we return 1.0.
-    """
-    return 1.0
-
-
 def _load_pf_validity_scores() -> Dict[str, float]:
     """
     Load PF validity scores per symbol from reports/risk/pf_validity.json.
     Returns a dict: { "SOLUSDT": 0.807, ... }.
     Missing entries default to 0.5 (neutral trust).
     """
-    if not PF_VALIDITY_PATH.exists():
-        return {}
-
-    try:
-        with PF_VALIDITY_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        return {}
-
+    data = codec.load_json_cached(PF_VALIDITY_PATH)
     scores = {}
     for sym, info in (data.get("symbols") or {}).items():
         try:
@@ -308,16 +314,7 @@ def _load_normalized_pf() -> Dict[str, Dict[str, float]]:
 
     Missing entries default to 1.0 for both sides.
     """
-    path = Path(PF_NORM_PATH)
-    if not path.exists():
-        return {}
-
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        return {}
-
+    data = codec.load_json_cached(Path(PF_NORM_PATH))
     out: Dict[str, Dict[str, float]] = {}
     for sym, info in (data.get("symbols") or {}).items():
         try:
@@ -350,114 +347,171 @@ class SymbolAllocation:
     vol_norm: float
     flags: Dict[str, bool]
     lane_intent: str  # Phase 4h: "exploit" | "explore" | "none"
+    corr_cluster: Optional[int] = None  # index into plan["correlation"]["clusters"]
+    risk_contribution: Optional[float] = None  # share of portfolio volatility
 
     def to_dict(self) -> Dict[str, Any]:
         d = asdict(self)
         return d
 
 
-def compute_capital_plan() -> Dict[str, Any]:
+def _score_symbol(
+    sym: str,
+    pf_7d: Optional[float],
+    pf_30d: Optional[float],
+    level: Optional[str],
+    tier: Optional[str],
+    drift_status: Optional[str],
+    exec_label: Optional[str],
+    norm_entry: Dict[str, float],
+    vol_norm: float,
+    scm_level: Optional[str],
+    blocked: bool,
+) -> SymbolAllocation:
+    """Raw score and multipliers of one symbol (weights are filled in later)."""
+    pol_mult = _policy_mult(level)
+    drift_m = _drift_mult(drift_status)
+    exec_f = _execql_factor(exec_label)
+    tier_m = _tier_mult(tier)
+
+    # --- Phase 4g: PF Reality integration (normalized PF) ---
+    # 1) Get normalized exploration PFs (short/long)
+    norm_short = norm_entry.get("short", 1.0)
+    norm_long = norm_entry.get("long", 1.0)
+
+    # 2) Clamp to >= 1.0 when combining to avoid weirdness around PF<1.0
+    pf30_eff = max(1.0, pf_30d or 1.0)
+    nshort_eff = max(1.0, norm_short or 1.0)
+    nlong_eff = max(1.0, norm_long or 1.0)
+
+    # 3) Compute PF alpha as geometric mean of normalized + PF_30D
+    #    This keeps SOL/DOGE/etc ranked appropriately, but in a compressed way.
+    alpha_pf = (nlong_eff * nshort_eff * pf30_eff) ** (1.0 / 3.0)
+
+    # Keep norm_pf for display (using normalized values)
+    norm_pf = (norm_short + norm_long) / 2.0 if norm_short and norm_long else None
+
+    # Kill lane: hostile + degrading → zero score
+    kill_lane = exec_label == "hostile" and drift_status == "degrading"
+
+    # 4) Combine PF alpha with existing multipliers (Phase 4g)
+    score = alpha_pf * exec_f * drift_m * tier_m * pol_mult * vol_norm
+    if kill_lane:
+        score = 0.0
+
+    return SymbolAllocation(
+        symbol=sym,
+        score=score,
+        weight=0.0,  # filled later
+        raw_weight=None,  # Phase 4f: will be set after softmax, before validity caps
+        pf_7d=pf_7d,
+        pf_30d=pf_30d,
+        norm_pf=norm_pf,
+        tier=tier,
+        drift=drift_status,
+        execql=exec_label,
+        policy_level=level,
+        policy_mult=pol_mult,
+        tier_mult=tier_m,
+        drift_mult=drift_m,
+        vol_norm=vol_norm,
+        flags={
+            "kill_lane": kill_lane,
+            "de_risk": False,
+            "promotion_candidate": False,
+        },
+        lane_intent=_compute_lane_intent(scm_level, level, blocked),  # Phase 4h
+    )
+
+
+# Last plan and its input fingerprint; per-symbol (inputs, scored allocation)
+_plan_cache: Dict[str, Any] = {"fingerprint": None, "plan": None}
+_symbol_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+
+def _cached_plan(fingerprint: str) -> Optional[Dict[str, Any]]:
+    """The plan already computed from these inputs (this process or on disk), if any."""
+    if not OUT_PATH.exists():
+        return None
+    if _plan_cache["fingerprint"] == fingerprint:
+        return _plan_cache["plan"]
+    on_disk = codec.load_json_cached(OUT_PATH)
+    if (on_disk.get("meta") or {}).get("input_fingerprint") == fingerprint:
+        _plan_cache.update(fingerprint=fingerprint, plan=on_disk)
+        return on_disk
+    return None
+
+
+def compute_capital_plan(force: bool = False) -> Dict[str, Any]:
     """
     Main entrypoint for capital allocation.
     Computes per-symbol scores and normalized weights.
+
+    Returns the previous plan (meta.reused True) when no input file changed,
+    unless force; otherwise rescores only the symbols whose inputs changed.
     """
+    fingerprint = _input_fingerprint()
+    if not force:
+        cached = _cached_plan(fingerprint)
+        if cached is not None:
+            return {**cached, "meta": {**cached.get("meta", {}), "reused": True}}
+
     now = datetime.now(timezone.utc)
 
-    pf_ts = _load_json(PF_TS_PATH)
-    execql = _load_json(EXECQL_PATH)
-    drift = _load_json(DRIFT_PATH)
-    edge = _load_json(EDGE_PROFILE_PATH)
-    policy = _load_json(POLICY_PATH)
+    pf_ts = codec.load_json_cached(PF_TS_PATH)
+    execql = codec.load_json_cached(EXECQL_PATH)
+    drift = codec.load_json_cached(DRIFT_PATH)
+    edge = codec.load_json_cached(EDGE_PROFILE_PATH)
+    policy = codec.load_json_cached(POLICY_PATH)
     normalized_pf = _load_normalized_pf()  # Phase 4g: normalized PF
-    scm = _load_json(SCM_PATH)  # Phase 4h: SCM state
-    risk = _load_json(RISK_SNAPSHOT_PATH)  # Phase 4h: risk snapshot for blocked status
+    scm = codec.load_json_cached(SCM_PATH)  # Phase 4h: SCM state
+    risk = codec.load_json_cached(RISK_SNAPSHOT_PATH)  # Phase 4h: risk snapshot for blocked status
 
     symbol_set = set()
     symbol_set.update((pf_ts.get("symbols") or {}).keys())
     symbol_set.update((policy.get("symbols") or {}).keys())
+    symbols = sorted(
+        sym for sym in symbol_set
+        if isinstance(sym, str) and sym.endswith("USDT") and sym.isupper()
+    )
+
+    # Realized-vol normalization from the portfolio risk kernel (EW bar returns)
+    risk_kernel = get_kernel()
+    vol_norms = risk_kernel.vol_norm(symbols)
 
     allocations: Dict[str, SymbolAllocation] = {}
     raw_scores: Dict[str, float] = {}
+    rescored = 0
 
-    # First pass: compute raw scores using normalized PF (Phase 4g)
-    for sym in symbol_set:
-        if not isinstance(sym, str):
-            continue
-        if not sym.endswith("USDT") or not sym.isupper():
-            continue
-
+    # First pass: compute raw scores using normalized PF (Phase 4g), reusing
+    # the scored allocation of every symbol whose inputs are unchanged
+    for sym in symbols:
         pf_7d, pf_30d = _get_pf_for_symbol(pf_ts, sym)
         pol = _get_policy_for_symbol(policy, sym)
-        level = pol.get("level")
-        pol_mult = _policy_mult(level)
-        drift_status = _get_drift_for_symbol(drift, sym)
-        drift_m = _drift_mult(drift_status)
-        exec_label = _get_execql_for_symbol(execql, sym)
-        exec_f = _execql_factor(exec_label)
-        # Prefer tier from policy (Exploration Policy V3), fall back to edge profile
-        tier = pol.get("tier") or _get_tier_for_symbol(edge, sym)
-        tier_m = _tier_mult(tier)
-
-        # --- Phase 4g: PF Reality integration (normalized PF) ---
-        # 1) Get normalized exploration PFs (short/long)
-        norm_entry = normalized_pf.get(sym, {})
-        norm_short = norm_entry.get("short", 1.0)
-        norm_long = norm_entry.get("long", 1.0)
-
-        # 2) Clamp to >= 1.0 when combining to avoid weirdness around PF<1.0
-        pf7_eff = max(1.0, pf_7d or 1.0)
-        pf30_eff = max(1.0, pf_30d or 1.0)
-        nshort_eff = max(1.0, norm_short or 1.0)
-        nlong_eff = max(1.0, norm_long or 1.0)
-
-        # 3) Compute PF alpha as geometric mean of normalized + PF_30D
-        #    This keeps SOL/DOGE/etc ranked appropriately, but in a compressed way.
-        alpha_pf = (nlong_eff * nshort_eff * pf30_eff) ** (1.0 / 3.0)
-
-        # Keep norm_pf for display (using normalized values)
-        norm_pf = (norm_short + norm_long) / 2.0 if norm_short and norm_long else None
-
-        # Volatility placeholder
-        vol_norm = _vol_norm_placeholder(sym)
-
-        # Kill lane: hostile + degrading → zero score
-        kill_lane = exec_label == "hostile" and drift_status == "degrading"
-
-        # 4) Combine PF alpha with existing multipliers (Phase 4g)
-        score = alpha_pf * exec_f * drift_m * tier_m * pol_mult * vol_norm
-        if kill_lane:
-            score = 0.0
-
-        raw_scores[sym] = score
-
-        # Phase 4h: Compute lane_intent
-        scm_level = _get_scm_for_symbol(scm, sym)
-        blocked = _get_blocked_for_symbol(risk, sym)
-        lane_intent = _compute_lane_intent(scm_level, level, blocked)
-
-        allocations[sym] = SymbolAllocation(
-            symbol=sym,
-            score=score,
-            weight=0.0,  # filled later
-            raw_weight=None,  # Phase 4f: will be set after softmax, before validity caps
-            pf_7d=pf_7d,
-            pf_30d=pf_30d,
-            norm_pf=norm_pf,
-            tier=tier,
-            drift=drift_status,
-            execql=exec_label,
-            policy_level=level,
-            policy_mult=pol_mult,
-            tier_mult=tier_m,
-            drift_mult=drift_m,
-            vol_norm=vol_norm,
-            flags={
-                "kill_lane": kill_lane,
-                "de_risk": False,
-                "promotion_candidate": False,
-            },
-            lane_intent=lane_intent,
+        inputs = (
+            pf_7d,
+            pf_30d,
+            pol.get("level"),
+            # Prefer tier from policy (Exploration Policy V3), fall back to edge profile
+            pol.get("tier") or _get_tier_for_symbol(edge, sym),
+            _get_drift_for_symbol(drift, sym),
+            _get_execql_for_symbol(execql, sym),
+            normalized_pf.get(sym, {}),
+            vol_norms.get(sym, 1.0),
+            _get_scm_for_symbol(scm, sym),
+            _get_blocked_for_symbol(risk, sym),
         )
+        key = json.dumps(inputs, sort_keys=True, default=str)
+        cached = _symbol_cache.get(sym)
+        if cached is None or cached[0] != key:
+            cached = (key, _score_symbol(sym, *inputs).to_dict())
+            _symbol_cache[sym] = cached
+            rescored += 1
+        alloc = SymbolAllocation(**{**cached[1], "flags": dict(cached[1]["flags"])})
+        allocations[sym] = alloc
+        raw_scores[sym] = alloc.score
+    for sym in set(_symbol_cache) - set(symbols):
+        del _symbol_cache[sym]
 
     # Softmax normalization
     # Apply PF_30D cap: if PF_30D < 0.85, cap score
@@ -585,12 +639,27 @@ def compute_capital_plan() -> Dict[str, Any]:
         ):
             alloc.flags["promotion_candidate"] = True
 
+    # Portfolio VaR / ES and risk contributions of the final weights
+    portfolio_risk = risk_kernel.assess({sym: alloc.weight for sym, alloc in allocations.items()})
+    for sym, share in (portfolio_risk.get("pct_contribution") or {}).items():
+        allocations[sym].risk_contribution = round(share, 4)
+
+    # Correlation clusters of the plan's symbols (EW bar-return correlation)
+    correlation = load_correlation_view()
+    clusters = view_clusters(correlation, allocations)
+    for idx, group in enumerate(clusters):
+        for sym in group:
+            allocations[sym].corr_cluster = idx
+
     plan = {
         "meta": {
             "engine": "capital_allocator_v1",
             "version": "1.0.0",
             "generated_at": _fmt_ts(now),
             "advisory_only": True,
+            "input_fingerprint": fingerprint,
+            "rescored_symbols": rescored,
+            "reused": False,
         },
         "symbols": {
             sym: alloc.to_dict() for sym, alloc in sorted(allocations.items())
@@ -601,12 +670,21 @@ def compute_capital_plan() -> Dict[str, Any]:
                 allocations.items(), key=lambda kv: kv[1].score, reverse=True
             )[:5]
         ],
+        "correlation": {
+            "generated_at": correlation.get("generated_at"),
+            "last_bar_ts": correlation.get("last_bar_ts"),
+            "halflife_bars": correlation.get("halflife_bars"),
+            "matrix": view_matrix(correlation, sorted(allocations)),
+            "clusters": clusters,
+        },
+        "portfolio_risk": risk_summary(portfolio_risk),
     }
 
     OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUT_PATH.open("w", encoding="utf-8") as f:
         json.dump(plan, f, indent=2, sort_keys=True)
 
+    _plan_cache.update(fingerprint=fingerprint, plan=plan)
     return plan
 
 
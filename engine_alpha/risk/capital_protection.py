@@ -22,11 +22,13 @@ It does not modify configs, positions, or accounts.
 from __future__ import annotations
 
 import json
+from collections import Counter
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS
 from engine_alpha.core.config_loader import load_engine_config
 
@@ -101,40 +103,43 @@ def _extract_trades(pf_ts: Dict[str, Any], key: str) -> int:
         return 0
 
 
+class _BootstrapCloses(trade_analytics.Reducer):
+    """Closes of the last 24h per (trade_kind, exit reason); manual and unlabeled exits skipped."""
+
+    def __init__(self, now: datetime) -> None:
+        super().__init__(now)
+        self.cutoff = now - timedelta(hours=24)
+        self.counts: Counter = Counter()
+
+    def add(self, evt: Dict[str, Any]) -> None:
+        if (evt.get("type") or "").lower() != "close":
+            return
+        reason = (evt.get("exit_reason") or evt.get("exit_label") or "").lower()
+        if not reason or reason.startswith("manual_"):
+            return
+        ts = evt.get("ts") or evt.get("timestamp")
+        if not ts:
+            return
+        try:
+            ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc)
+        except Exception:
+            return
+        if ts_dt >= self.cutoff:
+            self.counts[((evt.get("trade_kind") or "").lower(), reason)] += 1
+
+    def result(self) -> Counter:
+        return self.counts
+
+
+trade_analytics.register("capital_protection.bootstrap_closes_24h", lambda: TRADES_PATH, _BootstrapCloses)
+
+
 def _count_bootstrap_closes_24h(now: datetime, allowed_reasons: set[str], allowed_kinds: set[str]) -> int:
-    if not TRADES_PATH.exists():
-        return 0
-    cutoff = now - timedelta(hours=24)
-    n = 0
     try:
-        with TRADES_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    evt = json.loads(line)
-                except Exception:
-                    continue
-                if (evt.get("type") or "").lower() != "close":
-                    continue
-                tk = (evt.get("trade_kind") or "").lower()
-                if tk not in allowed_kinds:
-                    continue
-                reason = (evt.get("exit_reason") or evt.get("exit_label") or "").lower()
-                if not reason or reason.startswith("manual_"):
-                    continue
-                if reason not in allowed_reasons:
-                    continue
-                ts = evt.get("ts") or evt.get("timestamp")
-                if not ts:
-                    continue
-                try:
-                    ts_dt = datetime.fromisoformat(ts.replace("Z", "+00:00")).astimezone(timezone.utc)
-                except Exception:
-                    continue
-                if ts_dt >= cutoff:
-                    n += 1
+        counts = trade_analytics.reduce("capital_protection.bootstrap_closes_24h", now)
     except Exception:
         return 0
-    return n
+    return sum(n for (kind, reason), n in counts.items() if kind in allowed_kinds and reason in allowed_reasons)
 
 
 def _load_mode_state() -> Dict[str, Any]:
@@ -5,21 +5,29 @@ Multi-Asset Risk Engine
 
 Computes portfolio-level risk metrics weighted by:
 - Expected edge (bps)
-- Volatility
+- Volatility (EW bar-return volatility relative to BTC when measured)
 - Trade frequency
 - Position size
+
+Correlation clusters of the assets (research/correlation_engine) are
+reported alongside, since co-moving assets add up to one risk, together with
+the one-day VaR / ES of the enabled assets' max notionals and each asset's
+contribution to it (risk/portfolio_risk).
 """
 
 from __future__ import annotations
 
 import json
-from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Mapping, Optional
 from dataclasses import dataclass
 
-ROOT_DIR = Path(__file__).resolve().parents[3]
-CONFIG_DIR = ROOT_DIR / "config"
-REPORTS_DIR = ROOT_DIR / "reports"
+from engine_alpha.core import codec
+from engine_alpha.core.paths import CONFIG, REPORTS
+from engine_alpha.research.correlation_engine import load_correlation_view, view_clusters, view_matrix
+from engine_alpha.risk.portfolio_risk import get_kernel, risk_summary
+
+CONFIG_DIR = CONFIG
+REPORTS_DIR = REPORTS
 RESEARCH_DIR = REPORTS_DIR / "research"
 
 STRATEGY_PROFILER_PATH = CONFIG_DIR / "multi_asset_strategy_profiler.json"
@@ -41,22 +49,17 @@ class AssetRiskMetrics:
     risk_score: float
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    """Safely load JSON file."""
-    if not path.exists():
-        return {}
-    try:
-        with path.open("r") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-
-
-def _estimate_volatility_multiplier(symbol: str) -> float:
+def _estimate_volatility_multiplier(symbol: str, measured: Optional[float] = None) -> float:
     """
     Estimate volatility multiplier based on asset class.
     Higher volatility = higher risk multiplier.
+
+    measured is the EW bar volatility relative to BTCUSDT (portfolio risk
+    kernel); the asset-class map is the fallback.
     """
+    if measured:
+        return float(measured)
+
     # Rough volatility estimates (can be refined with actual data)
     volatility_map = {
         "BTCUSDT": 1.0,   # Baseline
@@ -108,7 +111,8 @@ def _estimate_trade_frequency(symbol: str, regime: str, edge_bps: float) -> floa
 def compute_asset_risk_metrics(
     symbol: str,
     profiler: Dict[str, Any],
-    paper_config: Dict[str, Any]
+    paper_config: Dict[str, Any],
+    vol_multipliers: Optional[Mapping[str, float]] = None,
 ) -> AssetRiskMetrics:
     """Compute risk metrics for a single asset."""
     
@@ -155,7 +159,7 @@ def compute_asset_risk_metrics(
     status = _get_asset_status(symbol, paper_config)
     
     # Compute metrics
-    volatility_mult = _estimate_volatility_multiplier(symbol)
+    volatility_mult = _estimate_volatility_multiplier(symbol, (vol_multipliers or {}).get(symbol))
     trade_freq = _estimate_trade_frequency(symbol, regime, edge_bps)
     
     # Risk score = edge × volatility × trade_freq × max_notional
@@ -208,8 +212,8 @@ def compute_portfolio_risk_summary() -> Dict[str, Any]:
     Returns:
         Dictionary with portfolio risk metrics
     """
-    profiler = _load_json(STRATEGY_PROFILER_PATH)
-    paper_config = _load_json(PAPER_CONFIG_PATH)
+    profiler = codec.load_json_cached(STRATEGY_PROFILER_PATH)
+    paper_config = codec.load_json_cached(PAPER_CONFIG_PATH)
     
     if not profiler:
         return {}
@@ -224,10 +228,12 @@ def compute_portfolio_risk_summary() -> Dict[str, Any]:
     for symbol in profiler.get("tier3_research_only", {}).keys():
         all_assets.append(symbol)
     
-    # Compute metrics for each asset
+    # Compute metrics for each asset (measured vol relative to BTC in one step)
+    kernel = get_kernel()
+    vol_multipliers = kernel.relative_vol(all_assets, base="BTCUSDT")
     asset_metrics = []
     for symbol in all_assets:
-        metrics = compute_asset_risk_metrics(symbol, profiler, paper_config)
+        metrics = compute_asset_risk_metrics(symbol, profiler, paper_config, vol_multipliers)
         asset_metrics.append(metrics)
     
     # Portfolio aggregates
@@ -243,7 +249,22 @@ def compute_portfolio_risk_summary() -> Dict[str, Any]:
         weighted_edge = sum(m.edge_bps * m.max_notional_usd for m in enabled_assets) / total_max_notional
     else:
         weighted_edge = 0.0
-    
+
+    # One-day VaR / ES of the enabled assets at max notional; edge x frequency as the drift
+    portfolio_risk = kernel.assess(
+        {m.symbol: m.max_notional_usd for m in enabled_assets},
+        expected_returns={m.symbol: m.edge_bps * 1e-4 * m.expected_trades_per_day for m in enabled_assets},
+    )
+    risk_contribution = portfolio_risk.get("component") or {}
+
+    # Correlation structure of the assets
+    correlation = load_correlation_view()
+    clusters = view_clusters(correlation, all_assets)
+    cluster_of = {sym: idx for idx, group in enumerate(clusters) for sym in group}
+    enabled_matrix = view_matrix(correlation, [m.symbol for m in enabled_assets])
+    pairs = [corr for a, row in enabled_matrix.items() for b, corr in row.items() if a < b]
+    avg_enabled_corr = sum(pairs) / len(pairs) if pairs else None
+
     return {
         "total_assets": len(all_assets),
         "enabled_assets": len(enabled_assets),
@@ -255,6 +276,10 @@ def compute_portfolio_risk_summary() -> Dict[str, Any]:
         "total_max_notional_usd": total_max_notional,
         "total_expected_trades_per_day": total_expected_trades_per_day,
         "total_risk_score": total_risk_score,
+        "correlation_clusters": clusters,
+        "avg_enabled_correlation": avg_enabled_corr,
+        "correlation_matrix": view_matrix(correlation, all_assets),
+        "portfolio_risk_usd": risk_summary(portfolio_risk, digits=2),
         "per_asset_metrics": [
             {
                 "symbol": m.symbol,
@@ -266,7 +291,10 @@ def compute_portfolio_risk_summary() -> Dict[str, Any]:
                 "max_notional_usd": m.max_notional_usd,
                 "expected_trades_per_day": m.expected_trades_per_day,
                 "volatility_multiplier": m.volatility_multiplier,
-                "risk_score": m.risk_score
+                "risk_score": m.risk_score,
+                "corr_cluster": cluster_of.get(m.symbol),
+                "risk_contribution_usd": (round(risk_contribution[m.symbol], 2)
+                                          if m.symbol in risk_contribution else None),
             }
             for m in asset_metrics
         ]
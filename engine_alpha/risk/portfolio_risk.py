@@ -0,0 +1,181 @@
+"""
+Portfolio Risk Kernel
+---------------------
+
+Vectorized portfolio risk on the EW covariance of bar returns kept by
+research/correlation_engine (updated from the market snapshot every tick).
+
+The kernel holds per-symbol volatility and the covariance matrix in memory
+and is rebuilt only when the correlation report changed on disk (one new
+bar), so callers never reload or recompute it per symbol.
+
+For an exposure vector w (weights or USD) and expected returns mu over the
+horizon (h bars, one day by default):
+
+  sigma      = sqrt(w' S w * h)
+  VaR_a      = z_a * sigma - w.mu               (Gaussian, a = 0.95 / 0.99)
+  ES_a       = sigma * phi(z_a) / (1 - a) - w.mu
+  marginal_i = (S w)_i * h / sigma              component_i = w_i * marginal_i
+  vol_norm_i = clip(median vol / vol_i, VOL_NORM_MIN, VOL_NORM_MAX)
+
+Symbols without a measured volatility get the median one and zero
+correlation. All outputs are ADVISORY-ONLY and PAPER-SAFE.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine_alpha.core.timeframe_utils import timeframe_to_seconds
+from engine_alpha.research.correlation_engine import load_correlation_view
+
+CONFIDENCES: Sequence[float] = (0.95, 0.99)
+VOL_NORM_MIN = 0.5
+VOL_NORM_MAX = 2.0
+
+
+@dataclass
+class PortfolioRiskKernel:
+    """Per-bar volatility and correlation of the tracked symbols."""
+    symbols: List[str]
+    vol: np.ndarray  # Per-bar EW volatility, NaN where not measured yet
+    corr: np.ndarray  # Correlation, 0.0 where not measured yet
+    bars_per_day: float = 96.0
+
+    @classmethod
+    def from_view(cls, view: Mapping[str, Any]) -> "PortfolioRiskKernel":
+        """Kernel from a correlation report (see correlation_engine.load_correlation_view)."""
+        symbols = [str(s) for s in view.get("symbols") or []]
+        vols = view.get("volatility") or {}
+        matrix = view.get("matrix") or {}
+        vol = np.asarray([vols.get(s) if vols.get(s) is not None else np.nan for s in symbols], dtype=float)
+        corr = np.asarray([[(matrix.get(a) or {}).get(b, 0.0) for b in symbols] for a in symbols], dtype=float)
+        corr = np.nan_to_num(corr.reshape(len(symbols), len(symbols)), nan=0.0)
+        np.fill_diagonal(corr, 1.0)
+        seconds = timeframe_to_seconds(str(view.get("timeframe") or "15m")) or 900
+        return cls(symbols=symbols, vol=vol, corr=corr, bars_per_day=86400.0 / seconds)
+
+    def _lookup(self, symbols: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        index = {s: i for i, s in enumerate(self.symbols)}
+        rows = np.asarray([index.get(s, -1) for s in symbols], dtype=np.int64)
+        return rows, rows >= 0
+
+    def volatility(self, symbols: Sequence[str]) -> np.ndarray:
+        """Per-bar volatility of symbols (NaN where unknown)."""
+        rows, known = self._lookup(symbols)
+        out = np.full(len(symbols), np.nan)
+        out[known] = self.vol[rows[known]]
+        return out
+
+    def covariance(self, symbols: Sequence[str]) -> Optional[np.ndarray]:
+        """Per-bar covariance of symbols; None when no volatility is measured at all."""
+        measured = self.vol[np.isfinite(self.vol)]
+        if not len(measured):
+            return None
+        rows, known = self._lookup(symbols)
+        vol = self.volatility(symbols)
+        vol[~np.isfinite(vol)] = float(np.median(measured))
+        corr = np.eye(len(symbols))
+        both = known[:, None] & known[None, :]
+        corr[both] = self.corr[np.ix_(rows[known], rows[known])].ravel()
+        return corr * np.outer(vol, vol)
+
+    def vol_norm(self, symbols: Sequence[str]) -> Dict[str, float]:
+        """Score multiplier per symbol: median vol / own vol, clipped (1.0 when unknown)."""
+        vol = self.volatility(symbols)
+        measured = self.vol[np.isfinite(self.vol)]
+        if not len(measured):
+            return {s: 1.0 for s in symbols}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            norm = np.clip(float(np.median(measured)) / vol, VOL_NORM_MIN, VOL_NORM_MAX)
+        return {s: (round(float(v), 4) if np.isfinite(v) else 1.0) for s, v in zip(symbols, norm)}
+
+    def relative_vol(self, symbols: Sequence[str], base: str = "BTCUSDT") -> Dict[str, float]:
+        """Volatility relative to base for the symbols measured on both sides."""
+        vol = self.volatility(symbols)
+        base_vol = self.volatility([base])[0]
+        if not (np.isfinite(base_vol) and base_vol > 0):
+            return {}
+        return {s: round(float(v / base_vol), 3) for s, v in zip(symbols, vol) if np.isfinite(v)}
+
+    def assess(
+        self,
+        exposures: Mapping[str, float],
+        expected_returns: Optional[Mapping[str, float]] = None,
+        horizon_bars: Optional[float] = None,
+        confidences: Sequence[float] = CONFIDENCES,
+    ) -> Dict[str, Any]:
+        """
+        VaR / ES, marginal and component risk of the exposures in one step.
+
+        expected_returns are per-symbol returns over the horizon (fractions).
+        Losses are in the unit of the exposures; empty dict without volatility data.
+        """
+        symbols = sorted(exposures)
+        cov = self.covariance(symbols)
+        if cov is None or not symbols:
+            return {}
+        h = float(horizon_bars if horizon_bars is not None else self.bars_per_day)
+        w = np.asarray([float(exposures[s] or 0.0) for s in symbols])
+        mu = np.asarray([float((expected_returns or {}).get(s) or 0.0) for s in symbols])
+
+        cov_w = cov @ w * h
+        sigma = math.sqrt(max(float(w @ cov_w), 0.0))
+        expected = float(w @ mu)
+        marginal = cov_w / sigma if sigma > 0 else np.zeros_like(w)
+        component = w * marginal
+        inv_vol = 1.0 / np.sqrt(np.diag(cov))
+        vol_norm = self.vol_norm(symbols)
+
+        normal = NormalDist()
+        var, es = {}, {}
+        for conf in confidences:
+            z = normal.inv_cdf(conf)
+            key = f"{conf * 100:g}"
+            var[key] = sigma * z - expected
+            es[key] = sigma * normal.pdf(z) / (1.0 - conf) - expected
+
+        return {
+            "horizon_bars": h,
+            "sigma": sigma,
+            "expected": expected,
+            "var": var,
+            "es": es,
+            "marginal": dict(zip(symbols, marginal.tolist())),
+            "component": dict(zip(symbols, component.tolist())),
+            "pct_contribution": dict(zip(symbols, (component / sigma if sigma > 0 else component).tolist())),
+            "vol_norm": vol_norm,
+            "inverse_vol_weights": dict(zip(symbols, (inv_vol / inv_vol.sum()).tolist())),
+        }
+
+
+_cache: Dict[str, Any] = {"view": None, "kernel": None}
+
+
+def get_kernel() -> PortfolioRiskKernel:
+    """Kernel for the current correlation report, rebuilt only when the report changed."""
+    view = load_correlation_view()
+    if view is not _cache["view"]:
+        _cache.update(view=view, kernel=PortfolioRiskKernel.from_view(view))
+    return _cache["kernel"]
+
+
+def risk_summary(risk: Mapping[str, Any], digits: int = 6) -> Dict[str, Any]:
+    """Compact, rounded portfolio-level fields of an assess() result."""
+    if not risk:
+        return {}
+    return {
+        "horizon_bars": risk["horizon_bars"],
+        "sigma": round(risk["sigma"], digits),
+        "expected": round(risk["expected"], digits),
+        "var": {k: round(v, digits) for k, v in risk["var"].items()},
+        "es": {k: round(v, digits) for k, v in risk["es"].items()},
+    }
+
+
+__all__ = ["PortfolioRiskKernel", "get_kernel", "risk_summary"]
@@ -20,6 +20,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.research.pf_timeseries import _extract_return, _safe_parse_ts as _parse_timestamp
 
@@ -44,26 +45,6 @@ def _load_json(path: Path) -> Dict[str, Any]:
         return {}
 
 
-def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load JSONL file."""
-    if not path.exists():
-        return []
-    trades = []
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    trades.append(json.loads(line))
-                except Exception:
-                    continue
-    except Exception:
-        pass
-    return trades
-
-
 def _load_config() -> Dict[str, Any]:
     """Load quarantine configuration."""
     defaults = {
@@ -97,45 +78,43 @@ def _load_config() -> Dict[str, Any]:
         return defaults
 
 
-def _load_trades_all_lanes(window_days: int, now: datetime) -> List[Dict[str, Any]]:
-    """Load trades from all lanes (core, exploit, shadow)."""
-    all_trades = []
-    
-    # Core trades
-    core_trades = _load_jsonl(TRADES_PATH)
-    for trade in core_trades:
-        trade["_lane"] = "core"
-        all_trades.append(trade)
-    
-    # Exploit trades
-    exploit_trades = _load_jsonl(EXPLOIT_TRADES_PATH)
-    for trade in exploit_trades:
-        trade["_lane"] = "exploit"
-        all_trades.append(trade)
-    
-    # Shadow trades (for attribution, but not counted in capital impact)
-    shadow_trades = _load_jsonl(SHADOW_TRADES_PATH)
-    for trade in shadow_trades:
-        trade["_lane"] = "shadow"
-        all_trades.append(trade)
-    
-    # Filter by window
-    window_trades = []
-    for trade in all_trades:
+class _LaneCloses(trade_analytics.Reducer):
+    """(time, close tagged with its lane) for every timestamped close / would_exit of one lane log."""
+
+    def __init__(self, now: datetime, lane: str) -> None:
+        super().__init__(now)
+        self.lane = lane
+        self.closes: List[Tuple[datetime, Dict[str, Any]]] = []
+
+    def add(self, trade: Dict[str, Any]) -> None:
         ts = _parse_timestamp(trade.get("ts") or trade.get("timestamp"))
         if ts is None:
-            continue
-        delta = now - ts
-        if delta.total_seconds() > window_days * 86400.0:
-            continue
-        
+            return
         # Only count closes for PnL
         event_type = str(trade.get("type") or trade.get("event", "")).lower()
         if event_type not in ("close", "would_exit"):
-            continue
-        
-        window_trades.append(trade)
-    
+            return
+        self.closes.append((ts, {**trade, "_lane": self.lane}))
+
+    def result(self) -> List[Tuple[datetime, Dict[str, Any]]]:
+        return self.closes
+
+
+# Core and exploit trades, plus shadow trades (for attribution, but not counted in capital impact)
+trade_analytics.register("quarantine.closes.core", lambda: TRADES_PATH, lambda now: _LaneCloses(now, "core"))
+trade_analytics.register("quarantine.closes.exploit", lambda: EXPLOIT_TRADES_PATH, lambda now: _LaneCloses(now, "exploit"))
+trade_analytics.register("quarantine.closes.shadow", lambda: SHADOW_TRADES_PATH, lambda now: _LaneCloses(now, "shadow"))
+
+
+def _load_trades_all_lanes(window_days: int, now: datetime) -> List[Dict[str, Any]]:
+    """Load trades from all lanes (core, exploit, shadow)."""
+    window_trades = []
+    for lane in ("core", "exploit", "shadow"):
+        for ts, trade in trade_analytics.reduce(f"quarantine.closes.{lane}", now):
+            # Filter by window
+            if (now - ts).total_seconds() > window_days * 86400.0:
+                continue
+            window_trades.append(trade)
     return window_trades
 
 
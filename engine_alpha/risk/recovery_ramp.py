@@ -19,6 +19,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 
+from engine_alpha.core import trade_analytics
 from engine_alpha.core.paths import REPORTS, CONFIG
 from engine_alpha.reflect.trade_sanity import is_close_like_event, get_close_return_pct
 
@@ -198,6 +199,63 @@ def _compute_pf_metrics(pf_timeseries: Dict[str, Any], now: datetime) -> Dict[st
     return result
 
 
+def _clean_close_pct(trade: Dict[str, Any]) -> Optional[float]:
+    """Return pct of a close with valid entry/exit prices and a finite pct, else None."""
+    entry_px = trade.get("entry_px")
+    exit_px = trade.get("exit_px")
+    try:
+        entry_px_val = float(entry_px) if entry_px is not None else None
+        exit_px_val = float(exit_px) if exit_px is not None else None
+    except Exception:
+        return None
+    if trade.get("entry_px_invalid") is True:
+        return None
+    if entry_px_val is None or exit_px_val is None:
+        return None
+    if entry_px_val == 0.0 or exit_px_val == 0.0:
+        return None
+    if abs(entry_px_val - 1.0) < 1e-12:
+        return None  # treat 1.0 sentinel as invalid
+
+    # Use canonical pct extractor
+    pct = get_close_return_pct(trade)
+    if pct is None:
+        return None
+    try:
+        pct_val = float(pct)
+    except Exception:
+        return None
+    if not (float("-inf") < pct_val < float("inf")):
+        return None
+    return pct_val
+
+
+class _RecentCloses(trade_analytics.Reducer):
+    """(close time, raw ts, clean pct or None) for every close-like event with a timestamp."""
+
+    def __init__(self, now: datetime) -> None:
+        super().__init__(now)
+        self.closes: List[Tuple[datetime, str, Optional[float]]] = []
+
+    def add(self, trade: Dict[str, Any]) -> None:
+        try:
+            # Canonical close detection (event/type)
+            if not is_close_like_event(trade):
+                return
+            ts_str = trade.get("ts") or trade.get("timestamp") or trade.get("time")
+            if not ts_str:
+                return
+            self.closes.append((_parse_timestamp(ts_str), ts_str, _clean_close_pct(trade)))
+        except Exception:
+            return
+
+    def result(self) -> List[Tuple[datetime, str, Optional[float]]]:
+        return self.closes
+
+
+trade_analytics.register("recovery_ramp.closes", lambda: TRADES_PATH, _RecentCloses)
+
+
 def _load_recent_closes(now: datetime, window_hours: int = 24) -> Tuple[int, int, Optional[str]]:
     """Load recent closes from trades.jsonl.
     
@@ -212,80 +270,32 @@ def _load_recent_closes(now: datetime, window_hours: int = 24) -> Tuple[int, int
       - scratches (pct == 0) count as clean if valid
       - losses count as clean (they are tracked separately in loss_closes)
     """
-    if not TRADES_PATH.exists():
-        return 0, 0, None
-    
     cutoff = now - timedelta(hours=window_hours)
     clean_closes = 0
     loss_closes = 0
     last_close_ts = None
-    
+    last_close_time = None
+
     try:
-        with TRADES_PATH.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    trade = json.loads(line)
-                    # Canonical close detection (event/type)
-                    if not is_close_like_event(trade):
-                        continue
-                    
-                    ts_str = trade.get("ts") or trade.get("timestamp") or trade.get("time")
-                    if not ts_str:
-                        continue
-                    
-                    trade_time = _parse_timestamp(ts_str)
-                    if trade_time < cutoff:
-                        continue
-                    
-                    if last_close_ts is None or trade_time > _parse_timestamp(last_close_ts):
-                        last_close_ts = ts_str
-                    
-                    # Validate entry/exit prices
-                    entry_px = trade.get("entry_px")
-                    exit_px = trade.get("exit_px")
-                    entry_invalid_flag = trade.get("entry_px_invalid") is True
-                    try:
-                        entry_px_val = float(entry_px) if entry_px is not None else None
-                        exit_px_val = float(exit_px) if exit_px is not None else None
-                    except Exception:
-                        continue
-                    if entry_invalid_flag:
-                        continue
-                    if entry_px_val is None or exit_px_val is None:
-                        continue
-                    if entry_px_val == 0.0 or exit_px_val == 0.0:
-                        continue
-                    if abs(entry_px_val - 1.0) < 1e-12:
-                        continue  # treat 1.0 sentinel as invalid
-                    
-                    # Use canonical pct extractor
-                    pct = get_close_return_pct(trade)
-                    if pct is None:
-                        continue
-                    try:
-                        pct_val = float(pct)
-                    except Exception:
-                        continue
-                    if not (float("-inf") < pct_val < float("inf")):
-                        continue
-                    
-                    # Loss tracking
-                    if pct_val < -0.001:
-                        loss_closes += 1
-                        clean_closes += 1  # losses count as clean if data is valid
-                    elif pct_val > 0.001:
-                        clean_closes += 1
-                    else:
-                        # scratches and near-zero/fees count as clean if valid
-                        clean_closes += 1
-                except Exception:
-                    continue
+        closes = trade_analytics.reduce("recovery_ramp.closes", now)
     except Exception:
-        pass
-    
+        return 0, 0, None
+
+    for trade_time, ts_str, pct_val in closes:
+        try:
+            if trade_time < cutoff:
+                continue
+        except TypeError:
+            continue
+        if last_close_time is None or trade_time > last_close_time:
+            last_close_ts, last_close_time = ts_str, trade_time
+        if pct_val is None:
+            continue
+        # Losses and scratches (near-zero / fees) count as clean if data is valid
+        clean_closes += 1
+        if pct_val < -0.001:
+            loss_closes += 1
+
     return clean_closes, loss_closes, last_close_ts
 
 
@@ -0,0 +1,218 @@
+"""
+Compiled signal registry - precomputed normalization plan.
+
+signal_registry.json is parsed once and compiled into a CompiledRegistry:
+resolved fetcher callables, name -> index positions and per-signal
+normalization parameter arrays (z-tanh mean/std, bounded min/max/center).
+The compiled object is cached and revalidated on file change (mtime/size),
+and signal vectors are produced by one NumPy pass over the raw values.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+REGISTRY_PATH = Path(__file__).parent / "signal_registry.json"
+
+# Normalization method codes
+NORM_CLAMP = 0
+NORM_Z_TANH = 1
+NORM_BOUNDED = 2
+
+_NORM_CODES = {"z-tanh": NORM_Z_TANH, "bounded": NORM_BOUNDED}
+
+# z-tanh heuristic from _normalize_signal: adaptive std ~ 1/3 of |value|
+Z_TANH_STD_FACTOR = 0.33
+Z_TANH_STD_FLOOR = 0.01
+Z_TANH_ZERO_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class CompiledRegistry:
+    """
+    Signal registry compiled into index positions and normalization arrays.
+
+    Attributes:
+        registry: Parsed registry JSON
+        names: Signal names in vector order
+        configs: Per-signal config dicts (vector order)
+        sources: Fetcher source names
+        fetchers: Resolved fetcher callables (None for live-only / missing)
+        index: Signal name -> vector position
+        norm_codes: NORM_* code per signal
+        is_flow: True where registry norm is "flow_dict"
+        z_mean / z_std: z-tanh parameters (std NaN = adaptive heuristic)
+        b_min / b_max / b_center: bounded-mapping parameters
+    """
+    registry: Dict[str, Any]
+    names: Tuple[str, ...]
+    configs: Tuple[Dict[str, Any], ...]
+    sources: Tuple[str, ...]
+    fetchers: Tuple[Optional[Callable[..., Any]], ...]
+    index: Dict[str, int]
+    norm_codes: np.ndarray
+    is_flow: np.ndarray
+    z_mean: np.ndarray
+    z_std: np.ndarray
+    b_min: np.ndarray
+    b_max: np.ndarray
+    b_center: np.ndarray
+    stamp: Tuple[int, int]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def normalize(self, raw: Sequence[float]) -> np.ndarray:
+        """
+        Vectorized _normalize_signal over a full raw-value vector (or N x S matrix).
+
+        flow_dict signals are normalized by their registry fallback (clamp);
+        callers normalize flow z-scores with normalize_flow().
+        """
+        x = np.asarray(raw, dtype=float)
+        # Scalar min/max clamping sends NaN to the upper bound; mirror that for clamp/bounded
+        x_clamped = np.where(np.isnan(x), np.inf, x)
+        out = np.clip(x_clamped, -1.0, 1.0)
+
+        # z-tanh: z = (x - mean) / std, std adaptive unless configured
+        adaptive = np.maximum(np.abs(x) * Z_TANH_STD_FACTOR, Z_TANH_STD_FLOOR)
+        std = np.where(np.isnan(self.z_std), adaptive, self.z_std)
+        z = np.divide(x - self.z_mean, std, out=np.zeros_like(x), where=std != 0)
+        z_tanh = np.tanh(z / 2.0)
+        z_tanh = np.where(np.isnan(self.z_std) & (np.abs(x) < Z_TANH_ZERO_EPS), 0.0, z_tanh)
+        z_tanh = np.where(std == 0, 0.0, z_tanh)
+
+        # bounded: clamp to [min, max], map [min, center] -> [-1, 0] and [center, max] -> [0, 1]
+        v = np.clip(x_clamped, self.b_min, self.b_max)
+        low_span = self.b_center - self.b_min
+        high_span = self.b_max - self.b_center
+        low = np.where(
+            low_span == 0, 0.0,
+            -1.0 * (1.0 - np.divide(v - self.b_min, low_span, out=np.zeros_like(v), where=low_span != 0)),
+        )
+        high = np.where(
+            high_span == 0, 0.0,
+            np.divide(v - self.b_center, high_span, out=np.zeros_like(v), where=high_span != 0),
+        )
+        bounded = np.where(v < self.b_center, low, high)
+
+        out = np.where(self.norm_codes == NORM_Z_TANH, z_tanh, out)
+        out = np.where(self.norm_codes == NORM_BOUNDED, bounded, out)
+        return out
+
+    @staticmethod
+    def normalize_flow(z_scores: Sequence[float]) -> np.ndarray:
+        """Flow signals: tanh(z / 2) of the fetcher's z-score."""
+        return np.tanh(np.asarray(z_scores, dtype=float) / 2.0)
+
+    def vector_from_values(self, values: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (raw, normalized) arrays for a name -> raw value mapping (missing = 0.0)."""
+        raw = np.array([float(values.get(name, 0.0)) for name in self.names], dtype=float)
+        return raw, self.normalize(raw)
+
+
+def _registry_stamp(path: Path) -> Tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def compile_registry(
+    registry: Dict[str, Any],
+    fetcher_module: Any = None,
+    stamp: Tuple[int, int] = (0, 0),
+) -> CompiledRegistry:
+    """
+    Compile a parsed registry into a CompiledRegistry.
+
+    Args:
+        registry: Parsed signal_registry.json
+        fetcher_module: Module providing fetcher functions (signal_fetchers if None)
+        stamp: (mtime_ns, size) of the source file for revalidation
+    """
+    if fetcher_module is None:
+        from engine_alpha.signals import signal_fetchers as fetcher_module
+
+    signals = registry.get("signals", [])
+    names: List[str] = []
+    configs: List[Dict[str, Any]] = []
+    sources: List[str] = []
+    fetchers: List[Optional[Callable[..., Any]]] = []
+    codes: List[int] = []
+    is_flow: List[bool] = []
+    z_mean: List[float] = []
+    z_std: List[float] = []
+    b_min: List[float] = []
+    b_max: List[float] = []
+    b_center: List[float] = []
+
+    for cfg in signals:
+        name = cfg["name"]
+        source = cfg.get("source", "")
+        norm = cfg.get("norm", "z-tanh")
+        names.append(name)
+        configs.append(cfg)
+        sources.append(source)
+        fetcher = getattr(fetcher_module, source, None) if source != "live_core_only" else None
+        fetchers.append(fetcher if callable(fetcher) else None)
+        codes.append(_NORM_CODES.get(norm, NORM_CLAMP))
+        is_flow.append(norm == "flow_dict")
+
+        z_mean.append(float(cfg.get("mean", 0.0)))
+        std_val = cfg.get("std")
+        z_std.append(float(std_val) if std_val is not None else float("nan"))
+
+        bounds = cfg.get("bounds", {}) or {}
+        lo = float(bounds.get("min", 0.0))
+        hi = float(bounds.get("max", 1.0))
+        b_min.append(lo)
+        b_max.append(hi)
+        b_center.append(float(bounds.get("center", (lo + hi) / 2.0)))
+
+    return CompiledRegistry(
+        registry=registry,
+        names=tuple(names),
+        configs=tuple(configs),
+        sources=tuple(sources),
+        fetchers=tuple(fetchers),
+        index={name: i for i, name in enumerate(names)},
+        norm_codes=np.array(codes, dtype=int),
+        is_flow=np.array(is_flow, dtype=bool),
+        z_mean=np.array(z_mean, dtype=float),
+        z_std=np.array(z_std, dtype=float),
+        b_min=np.array(b_min, dtype=float),
+        b_max=np.array(b_max, dtype=float),
+        b_center=np.array(b_center, dtype=float),
+        stamp=stamp,
+    )
+
+
+_CACHE: Dict[str, Optional[CompiledRegistry]] = {"compiled": None}
+
+
+def get_compiled_registry(path: Path = REGISTRY_PATH) -> CompiledRegistry:
+    """
+    Return the cached CompiledRegistry, recompiling if the registry file changed.
+
+    Raises:
+        FileNotFoundError: If the registry file is missing
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Signal registry not found: {path}")
+    stamp = _registry_stamp(path)
+    compiled = _CACHE["compiled"]
+    if compiled is None or compiled.stamp != stamp:
+        with open(path, "r") as f:
+            registry = json.load(f)
+        compiled = compile_registry(registry, stamp=stamp)
+        _CACHE["compiled"] = compiled
+    return compiled
+
+
+def invalidate_compiled_registry() -> None:
+    """Force recompilation on next access."""
+    _CACHE["compiled"] = None
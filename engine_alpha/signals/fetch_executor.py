@@ -0,0 +1,261 @@
+"""
+Signal fetch executor - concurrent fetchers under a per-tick deadline.
+
+I/O-bound fetcher families (on-chain flow, volatility, microstructure,
+cross-asset) are submitted to a shared thread pool and collected under a
+per-tick deadline. Results are memoized per (fetcher, symbol, timeframe, bar)
+so repeated builds for the same bar (and cross-asset fetchers running for
+several symbols) reuse what was already pulled this tick. A fetcher that
+misses the deadline falls back to its last value with a staleness flag.
+
+Concurrency is only used in live mode; sim/backtest builds stay sequential
+so stub fetchers that draw from the global RNG remain deterministic. With
+enough bars, get_signal_vector_live computes the registry signals from the
+bars themselves; its one provider call (funding bias) goes through the
+executor, so it is memoized per bar and bounded by the same deadline. The
+registry fetchers only run for short histories (fewer than 25 bars).
+
+Config (engine_config.json -> "signal_fetch"):
+    concurrent: bool (default True)
+    max_workers: int (default 8)
+    deadline_seconds: float (default 2.0)
+    memo_bars: int (default 4) - bars of memoized results kept per key
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from engine_alpha.core import codec
+from engine_alpha.core.paths import CONFIG
+
+# Registry categories whose fetchers hit providers / other symbols
+IO_BOUND_CATEGORIES = {"flow", "volatility", "microstructure", "cross_asset"}
+
+DEFAULT_FETCH_CONFIG = {
+    "concurrent": True,
+    "max_workers": 8,
+    "deadline_seconds": 2.0,
+    "memo_bars": 4,
+}
+
+
+@dataclass
+class FetchOutcome:
+    """Result of one fetcher call (value or error, plus staleness info)."""
+    value: Any = None
+    error: Optional[BaseException] = None
+    stale: bool = False
+    stale_age_s: Optional[float] = None
+    memo_hit: bool = False
+    elapsed_s: float = 0.0
+
+
+def _load_fetch_config() -> Dict[str, Any]:
+    """signal_fetch config from engine_config.json (re-read only when it changes), or defaults."""
+    result = dict(DEFAULT_FETCH_CONFIG)
+    section = codec.load_json_cached(CONFIG / "engine_config.json").get("signal_fetch")
+    if isinstance(section, dict):
+        result.update(section)
+    return result
+
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_SIZE = 0
+_POOL_LOCK = threading.Lock()
+
+# (source, symbol, timeframe, bar_key) -> value
+_MEMO: "OrderedDict[Tuple[str, str, str, str], Any]" = OrderedDict()
+# (source, symbol, timeframe) -> (value, monotonic ts)
+_LAST_VALUES: Dict[Tuple[str, str, str], Tuple[Any, float]] = {}
+# (source, symbol, timeframe, bar_key) -> in-flight future (late results still land in the memo)
+_IN_FLIGHT: Dict[Tuple[str, str, str, str], Future] = {}
+_STATE_LOCK = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+    global _POOL, _POOL_SIZE
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_SIZE != max_workers:
+            if _POOL is not None:
+                _POOL.shutdown(wait=False)
+            _POOL = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signal-fetch")
+            _POOL_SIZE = max_workers
+        return _POOL
+
+
+def _remember(key: Tuple[str, str, str, str], value: Any, memo_limit: int) -> None:
+    with _STATE_LOCK:
+        _MEMO[key] = value
+        _MEMO.move_to_end(key)
+        _LAST_VALUES[key[:3]] = (value, time.monotonic())
+        while len(_MEMO) > memo_limit:
+            _MEMO.popitem(last=False)
+
+
+def _memo_get(key: Tuple[str, str, str, str]) -> Tuple[bool, Any]:
+    with _STATE_LOCK:
+        if key in _MEMO:
+            return True, _MEMO[key]
+    return False, None
+
+
+def _stale_fallback(key: Tuple[str, str, str, str], error: BaseException) -> FetchOutcome:
+    with _STATE_LOCK:
+        last = _LAST_VALUES.get(key[:3])
+    if last is None:
+        return FetchOutcome(error=error)
+    value, ts = last
+    return FetchOutcome(value=value, stale=True, stale_age_s=time.monotonic() - ts)
+
+
+def clear_fetch_memo() -> None:
+    """Drop memoized and last-known fetcher values (tests / config reload)."""
+    with _STATE_LOCK:
+        _MEMO.clear()
+        _LAST_VALUES.clear()
+        _IN_FLIGHT.clear()
+
+
+def run_fetchers(
+    jobs: Sequence[Tuple[int, str, Callable[..., Any], bool]],
+    symbol: str,
+    timeframe: str,
+    ctx: Optional[Dict[str, Any]],
+    *,
+    bar_key: Optional[str] = None,
+    concurrent: Optional[bool] = None,
+    deadline_seconds: Optional[float] = None,
+) -> Dict[int, FetchOutcome]:
+    """
+    Run signal fetchers, concurrently for I/O-bound ones, under one deadline.
+
+    Args:
+        jobs: (position, source name, fetcher callable, io_bound) tuples
+        symbol: Trading symbol
+        timeframe: Timeframe
+        ctx: Fetcher context (shared; fetchers only setdefault symbol/timeframe)
+        bar_key: Bar identifier for memoization (None disables memo/stale fallback)
+        concurrent: Override config "concurrent"
+        deadline_seconds: Override config "deadline_seconds"
+
+    Returns:
+        Dict position -> FetchOutcome
+    """
+    cfg = _load_fetch_config()
+    if concurrent is None:
+        concurrent = bool(cfg.get("concurrent", True))
+    if deadline_seconds is None:
+        deadline_seconds = float(cfg.get("deadline_seconds", 2.0))
+    memo_limit = max(1, int(cfg.get("memo_bars", 4))) * max(1, len(jobs)) * 16
+
+    outcomes: Dict[int, FetchOutcome] = {}
+    pending: List[Tuple[int, Tuple[str, str, str, str], Future, float]] = []
+
+    def _call(fetcher: Callable[..., Any]) -> Any:
+        return fetcher(symbol=symbol, timeframe=timeframe, context=ctx)
+
+    pool = _get_pool(max(1, int(cfg.get("max_workers", 8)))) if concurrent else None
+    for pos, source, fetcher, io_bound in jobs:
+        key = (source, symbol, timeframe, bar_key or "")
+        if bar_key is not None:
+            hit, value = _memo_get(key)
+            if hit:
+                outcomes[pos] = FetchOutcome(value=value, memo_hit=True)
+                continue
+
+        if pool is not None and io_bound:
+            with _STATE_LOCK:
+                future = _IN_FLIGHT.get(key) if bar_key is not None else None
+            if future is None:
+                future = pool.submit(_call, fetcher)
+                if bar_key is not None:
+                    with _STATE_LOCK:
+                        _IN_FLIGHT[key] = future
+                    future.add_done_callback(
+                        lambda f, k=key: _on_done(k, f, memo_limit)
+                    )
+            pending.append((pos, key, future, time.monotonic()))
+            continue
+
+        started = time.monotonic()
+        try:
+            value = _call(fetcher)
+        except Exception as e:
+            outcomes[pos] = FetchOutcome(error=e, elapsed_s=time.monotonic() - started)
+            continue
+        if bar_key is not None:
+            _remember(key, value, memo_limit)
+        outcomes[pos] = FetchOutcome(value=value, elapsed_s=time.monotonic() - started)
+
+    deadline = time.monotonic() + max(0.0, deadline_seconds)
+    for pos, key, future, started in pending:
+        remaining = deadline - time.monotonic()
+        try:
+            value = future.result(timeout=max(0.0, remaining))
+            outcomes[pos] = FetchOutcome(value=value, elapsed_s=time.monotonic() - started)
+        except (FutureTimeoutError, TimeoutError):
+            err = TimeoutError(f"fetcher '{key[0]}' missed {deadline_seconds:.2f}s deadline")
+            outcomes[pos] = _stale_fallback(key, err) if bar_key is not None else FetchOutcome(error=err)
+        except Exception as e:
+            outcomes[pos] = FetchOutcome(error=e, elapsed_s=time.monotonic() - started)
+    return outcomes
+
+
+def _on_done(key: Tuple[str, str, str, str], future: Future, memo_limit: int) -> None:
+    """Memoize completed (possibly late) results so the next build for this bar reuses them."""
+    with _STATE_LOCK:
+        if _IN_FLIGHT.get(key) is future:
+            del _IN_FLIGHT[key]
+    if future.cancelled() or future.exception() is not None:
+        return
+    _remember(key, future.result(), memo_limit)
+
+
+def _realized_vol(closes: Sequence[float]) -> float:
+    rets = [
+        (closes[i] - closes[i - 1]) / closes[i - 1]
+        for i in range(1, len(closes))
+        if closes[i - 1] > 0
+    ]
+    if len(rets) < 2:
+        return 0.0
+    mean = sum(rets) / len(rets)
+    var = sum((r - mean) ** 2 for r in rets) / len(rets)
+    return math.sqrt(var) if var > 0 else 0.0
+
+
+def cross_asset_from_snapshot(timeframe: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Build a context.cross_asset mapping from the per-tick MarketSnapshot.
+
+    Cross-asset fetchers then reuse BTC/ETH/... bars already pulled this tick
+    instead of fetching them again. Returns None without a fresh snapshot.
+    """
+    try:
+        from engine_alpha.data.market_snapshot import get_market_snapshot
+        snapshot = get_market_snapshot()
+    except Exception:
+        return None
+    if snapshot is None or snapshot.timeframe != timeframe:
+        return None
+    out: Dict[str, Dict[str, Any]] = {}
+    for sym, snap in snapshot.symbols.items():
+        closes = [float(b.get("close", 0.0) or 0.0) for b in snap.bars]
+        if len(closes) < 3:
+            continue
+        out[sym] = {
+            "rows": snap.bar_rows(),
+            "vol": _realized_vol(closes[-10:]),
+            "vol_prev": _realized_vol(closes[:-5][-10:]) if len(closes) > 5 else _realized_vol(closes[-10:]),
+            "return": (closes[-1] - closes[-2]) / closes[-2] if closes[-2] else 0.0,
+            "last_price": snap.last_price,
+        }
+    return out or None
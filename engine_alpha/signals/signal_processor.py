@@ -7,7 +7,6 @@ import json
 import logging
 import math
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -19,7 +18,12 @@ except ImportError:  # pragma: no cover
 
 from engine_alpha.data.live_prices import get_live_ohlcv
 from engine_alpha.data.funding_rates import get_funding_bias
-from engine_alpha.signals import signal_fetchers
+from engine_alpha.signals.compiled_registry import get_compiled_registry
+from engine_alpha.signals.fetch_executor import (
+    IO_BOUND_CATEGORIES,
+    cross_asset_from_snapshot,
+    run_fetchers,
+)
 from engine_alpha.core.paths import CONFIG
 
 # PCI imports (Phase 1 + 2)
@@ -232,13 +236,8 @@ def _compute_pci_scores(features: Dict[str, float]) -> Dict[str, Any]:
 
 
 def _load_registry() -> Dict[str, Any]:
-    """Load signal registry from JSON file."""
-    registry_path = Path(__file__).parent / "signal_registry.json"
-    if not registry_path.exists():
-        raise FileNotFoundError(f"Signal registry not found: {registry_path}")
-    
-    with open(registry_path, "r") as f:
-        return json.load(f)
+    """Load signal registry (parsed once; reloaded when the JSON file changes)."""
+    return get_compiled_registry().registry
 
 
 def _normalize_z_tanh(value: float, mean: float = 0.0, std: float = 1.0) -> float:
@@ -316,7 +315,11 @@ def _normalize_signal(raw_value: float, signal_config: Dict[str, Any]) -> float:
         center = bounds.get("center", (min_val + max_val) / 2.0)
         return _normalize_bounded(raw_value, min_val, max_val, center)
     elif norm_method == "z-tanh":
-        # For z-tanh, use a simple heuristic for stub
+        mean = float(signal_config.get("mean", 0.0))
+        std = signal_config.get("std")
+        if std is not None:
+            return _normalize_z_tanh(raw_value, mean=mean, std=float(std))
+        # Without a configured std, use a simple heuristic for stub
         # In production, you'd maintain rolling statistics
         # For Phase 1, use a fixed reasonable std based on typical value magnitude
         # Scale by a factor that maps typical ranges to reasonable z-scores
@@ -324,7 +327,7 @@ def _normalize_signal(raw_value: float, signal_config: Dict[str, Any]) -> float:
             return 0.0
         # Use a std that's roughly 1/3 of the absolute value for reasonable scaling
         typical_std = max(abs(raw_value) * 0.33, 0.01)
-        return _normalize_z_tanh(raw_value, mean=0.0, std=typical_std)
+        return _normalize_z_tanh(raw_value, mean=mean, std=typical_std)
     else:
         # Default: clamp to [-1, 1]
         return max(-1.0, min(1.0, raw_value))
@@ -542,18 +545,39 @@ def _compute_direction_conf_edge(signals: Dict[str, float]) -> Dict[str, float]:
 
 
 def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, Any]] = None, ts_override: Optional[str] = None) -> Dict[str, Any]:
-    # Load registry
-    registry = _load_registry()
-    signals = registry.get("signals", [])
-    
-    # Initialize results
-    signal_vector: List[float] = []
+    # Compiled registry: fetchers, positions and normalization arrays resolved once
+    compiled = get_compiled_registry()
+    n_signals = len(compiled)
+    
+    # Raw values are collected per fetcher, then normalized in one NumPy pass
+    raw_values = np.zeros(n_signals, dtype=float)
+    flow_z = np.zeros(n_signals, dtype=float)
+    has_raw = np.zeros(n_signals, dtype=bool)
+    has_flow = np.zeros(n_signals, dtype=bool)
     raw_registry: Dict[str, Any] = {}
     
+    # Live builds run I/O-bound fetchers concurrently under a per-tick deadline,
+    # memoized per bar; sim/backtest builds stay sequential (deterministic RNG stubs)
+    is_live = bool(ctx) and ctx.get("mode") == "live"
+    if is_live and "cross_asset" not in ctx:
+        cross_asset = cross_asset_from_snapshot(timeframe)
+        if cross_asset:
+            ctx["cross_asset"] = cross_asset
+    jobs = [
+        (i, compiled.sources[i], fetcher, cfg.get("category") in IO_BOUND_CATEGORIES)
+        for i, (cfg, fetcher) in enumerate(zip(compiled.configs, compiled.fetchers))
+        if fetcher is not None and compiled.sources[i] != "live_core_only"
+    ]
+    outcomes = run_fetchers(
+        jobs, symbol, timeframe, ctx,
+        bar_key=ctx.get("now") if is_live else None,
+        concurrent=None if is_live else False,
+    )
+    
     # Process each signal
-    for signal_config in signals:
-        signal_name = signal_config["name"]
-        source_func_name = signal_config["source"]
+    for i, signal_config in enumerate(compiled.configs):
+        signal_name = compiled.names[i]
+        source_func_name = compiled.sources[i]
 
         if source_func_name == "live_core_only":
             raw_registry[signal_name] = {
@@ -563,20 +587,18 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
                 "category": signal_config.get("category", "unknown"),
                 "weight": signal_config.get("weight", 1.0),
             }
-            signal_vector.append(0.0)
             continue
         
-        # Dynamically call fetcher function
-        if hasattr(signal_fetchers, source_func_name):
-            fetcher_func = getattr(signal_fetchers, source_func_name)
+        fetcher_func = compiled.fetchers[i]
+        if fetcher_func is not None:
             try:
-                # Call fetcher with symbol, timeframe, and context
-                fetcher_result = fetcher_func(symbol=symbol, timeframe=timeframe, context=ctx)
+                outcome = outcomes[i]
+                if outcome.error is not None:
+                    raise outcome.error
+                fetcher_result = outcome.value
                 
                 # Handle flow signals (dict) vs traditional signals (float)
-                norm_method = signal_config.get("norm", "z-tanh")
-                
-                if norm_method == "flow_dict" and isinstance(fetcher_result, dict):
+                if compiled.is_flow[i] and isinstance(fetcher_result, dict):
                     # Flow signal: extract components
                     raw_value = fetcher_result.get("raw", 0.0)
                     z_score = fetcher_result.get("z_score", 0.0)
@@ -598,10 +620,9 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
                         "type": "flow_dict"
                     }
                     
-                    # Use z_score for signal vector (already normalized)
-                    # Apply tanh to bound to [-1, 1]
-                    normalized_value = math.tanh(z_score / 2.0)
-                    signal_vector.append(normalized_value)
+                    # Use z_score for signal vector (already normalized; tanh-bounded below)
+                    flow_z[i] = float(z_score)
+                    has_flow[i] = True
                     
                 else:
                     # Traditional signal: single float value
@@ -615,9 +636,13 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
                         "weight": signal_config.get("weight", 1.0)
                     }
                     
-                    # Normalize signal
-                    normalized_value = _normalize_signal(raw_value, signal_config)
-                    signal_vector.append(normalized_value)
+                    raw_values[i] = float(raw_value)
+                    has_raw[i] = True
+                
+                if outcome.stale:
+                    # Deadline missed: last known value reused
+                    raw_registry[signal_name]["stale"] = True
+                    raw_registry[signal_name]["stale_age_s"] = round(outcome.stale_age_s or 0.0, 3)
                 
             except Exception as e:
                 # On error, use 0.0 as default
@@ -627,7 +652,6 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
                     "error": error_msg,
                     "source": source_func_name
                 }
-                signal_vector.append(0.0)
                 
                 # Log MATIC signal errors for debugging
                 if symbol == "MATICUSDT":
@@ -647,7 +671,10 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
                 "error": f"Fetcher function '{source_func_name}' not found",
                 "source": source_func_name
             }
-            signal_vector.append(0.0)
+    
+    # Single vectorized normalization pass (live-only / failed signals stay 0.0)
+    normalized = np.where(has_flow, compiled.normalize_flow(flow_z), compiled.normalize(raw_values))
+    signal_vector: List[float] = np.where(has_flow | has_raw, normalized, 0.0).tolist()
     
     ts = ts_override or datetime.now(timezone.utc).isoformat()
     if ctx:
@@ -676,6 +703,21 @@ def _build_signal_vector(symbol: str, timeframe: str, ctx: Optional[Dict[str, An
     return result
 
 
+def _live_funding_bias(symbol: str, timeframe: str, ctx: Dict[str, Any]) -> float:
+    """
+    Funding bias through the fetch executor: one provider round per symbol and
+    bar (memoized on ctx["now"]), bounded by the per-tick deadline, with the
+    last known value reused when the providers are slow.
+    """
+    outcome = run_fetchers(
+        [(0, "funding_bias", lambda symbol, timeframe, context: get_funding_bias(symbol), True)],
+        symbol, timeframe, ctx, bar_key=ctx.get("now"),
+    )[0]
+    if outcome.error is not None or outcome.value is None:
+        return 0.0
+    return float(outcome.value)
+
+
 def get_signal_vector(symbol: str = "ETHUSDT", timeframe: str = None) -> Dict[str, Any]:
     """
     Generate signal vector via stub fetchers (simulation/testing mode).
@@ -691,19 +733,35 @@ def get_signal_vector(symbol: str = "ETHUSDT", timeframe: str = None) -> Dict[st
     return _build_signal_vector(symbol, timeframe, ctx=ctx, ts_override=ctx["now"])
 
 
-def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit: int = 200) -> Dict[str, Any]:
+def get_signal_vector_live(
+    symbol: str = "ETHUSDT",
+    timeframe: str = None,
+    limit: int = 200,
+    rows: Optional[List[Dict[str, Any]]] = None,
+    offline: bool = False,
+    funding_bias: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     Generate signal vector using live OHLCV context (read-only).
     
     If live feed is unavailable or stale, returns neutral signal vector (all zeros)
     and logs an error instead of using stale data.
+
+    If rows are provided (e.g. from the per-tick MarketSnapshot) they are used
+    instead of fetching OHLCV again.
+
+    offline=True computes the vector from `rows` alone (historical replay): no
+    OHLCV or funding requests and no PCI compute/log. Funding_Bias is
+    `funding_bias` (e.g. historical funding) or neutral 0.0, and fewer than 25
+    rows give a neutral vector instead of the fetcher fallback.
     """
     import logging
     
     if timeframe is None:
         timeframe = _get_default_timeframe()
     
-    rows, _ = get_live_ohlcv(symbol, timeframe, limit=limit)
+    if rows is None and not offline:
+        rows, _ = get_live_ohlcv(symbol, timeframe, limit=limit)
     
     # Check if feed is unavailable
     if not rows:
@@ -720,9 +778,7 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
         )
         
         # Return neutral signal vector (all zeros) instead of using stale data
-        registry = _load_registry()
-        signals = registry.get("signals", [])
-        signal_vector = [0.0] * len(signals)
+        signal_vector = [0.0] * len(get_compiled_registry())
         raw_registry = {
             "_feed_unavailable": True,
             "_symbol": symbol,
@@ -772,12 +828,22 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
     ctx = {
         "symbol": symbol,
         "timeframe": timeframe,
-        "mode": "live",
+        "mode": "replay" if offline else "live",
         "now": ts,
         "rows_available": len(rows),
         "limit": limit,
     }
     df = _rows_to_dataframe(rows)
+    if offline and (df is None or len(df) < 25):
+        return {
+            "signal_vector": [0.0] * len(get_compiled_registry()),
+            "raw_registry": {},
+            "ts": ts,
+            "context": ctx,
+            "dir": 0,
+            "conf": 0.0,
+            "combined_edge": 0.0,
+        }
     if df is None or len(df) < 25:
         result = _build_signal_vector(symbol, timeframe, ctx=ctx, ts_override=ts)
         result["context"] = ctx
@@ -789,7 +855,7 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
         pci_config = _load_pci_config()
         if pci_config.get("log_enabled", True) and PCI_AVAILABLE:
             try:
-                funding_bias = get_funding_bias(symbol) if df is not None else 0.0
+                funding_bias = _live_funding_bias(symbol, timeframe, ctx) if df is not None else 0.0
                 pci_features = _compute_pci_features(symbol, timeframe, df, funding_bias, ctx)
                 pci_output = _compute_pci_scores(pci_features)
                 if pci_output:
@@ -802,17 +868,14 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
     core_signals = _compute_core_live_signals(df)
     expanded_signals = _compute_expanded_signals(df)
     all_signals = {**core_signals, **expanded_signals}
-    try:
-        all_signals["Funding_Bias"] = get_funding_bias(symbol)
-    except Exception:
-        all_signals["Funding_Bias"] = 0.0
+    if offline:
+        all_signals["Funding_Bias"] = float(funding_bias or 0.0)
+    else:
+        all_signals["Funding_Bias"] = _live_funding_bias(symbol, timeframe, ctx)
 
-    registry = _load_registry()
-    signals_cfg = registry.get("signals", [])
-    signal_vector: List[float] = []
+    compiled = get_compiled_registry()
     raw_registry: Dict[str, Any] = {}
-    for sig_cfg in signals_cfg:
-        name = sig_cfg["name"]
+    for name, sig_cfg in zip(compiled.names, compiled.configs):
         raw_val = all_signals.get(name, 0.0)
         raw_registry[name] = {
             "value": raw_val,
@@ -820,7 +883,8 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
             "category": sig_cfg.get("category", "unknown"),
             "weight": sig_cfg.get("weight", 1.0),
         }
-        signal_vector.append(_normalize_signal(raw_val, sig_cfg))
+    _, normalized = compiled.vector_from_values(all_signals)
+    signal_vector: List[float] = normalized.tolist()
 
     decision_inputs = _compute_direction_conf_edge(all_signals)
     result = {
@@ -834,7 +898,7 @@ def get_signal_vector_live(symbol: str = "ETHUSDT", timeframe: str = None, limit
     }
 
     # PCI computation (Phase 1 + 2: compute + log only, no gating)
-    pci_config = _load_pci_config()
+    pci_config = {"log_enabled": False} if offline else _load_pci_config()
     if pci_config.get("log_enabled", True) and PCI_AVAILABLE:
         try:
             funding_bias = all_signals.get("Funding_Bias", 0.0)
@@ -0,0 +1,205 @@
+"""
+Variant kernel - batched threshold / exit evaluation for strategy variants.
+
+All variants on a symbol see the same market inputs on a bar (price, council
+decision, regime); only their mutated thresholds differ. A VariantBook holds
+the positions and stats of every variant for one symbol as arrays, and step()
+applies one bar's MarketStep to all of them at once, with the same exit /
+entry rules as the per-variant loop it replaces.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Exit rules (mirror exploration lane)
+EXIT_MIN_CONF = 0.30
+REVERSE_MIN_CONF = 0.60
+MAX_BARS_OPEN = 10
+BASE_EXPLORATION_CAP = 2
+
+# Threshold columns; any other regime uses the "chop" column
+REGIME_KEYS = ("trend", "chop", "high_vol")
+
+EXIT_REASONS = np.array(["", "low_conf", "reverse", "timeout"], dtype=object)
+
+
+@dataclass(frozen=True)
+class MarketStep:
+    """Shared market inputs for one (symbol, bar)."""
+    symbol: str
+    ts: str
+    price: float
+    dir: int
+    conf: float
+    regime: str
+
+
+def regime_column(regime: str) -> int:
+    """Column of REGIME_KEYS used for a regime label."""
+    if regime in ("trend_up", "trend_down", "panic_down"):
+        regime = "trend"
+    return REGIME_KEYS.index(regime) if regime in REGIME_KEYS else REGIME_KEYS.index("chop")
+
+
+class VariantBook:
+    """
+    Positions, stats and thresholds of every variant on one symbol.
+
+    Args:
+        states: Variant state dicts (as from initialize_variant_states); the
+            position / stats dicts are updated in place by write_back()
+        thresholds: (n_variants x len(REGIME_KEYS)) mutated entry thresholds
+        exploration_caps: Max exploration trades per variant
+    """
+
+    def __init__(self, states: List[Dict[str, Any]], thresholds: np.ndarray, exploration_caps: np.ndarray) -> None:
+        self.states = states
+        self.thresholds = np.asarray(thresholds, dtype=float).reshape(len(states), len(REGIME_KEYS))
+        self.caps = np.asarray(exploration_caps, dtype=np.int64)
+        positions = [s["position"] for s in states]
+        stats = [s["stats"] for s in states]
+        self.dir = np.array([int(p.get("dir", 0) or 0) for p in positions], dtype=np.int64)
+        self.entry_px = np.array(
+            [np.nan if p.get("entry_px") is None else float(p["entry_px"]) for p in positions], dtype=float
+        )
+        self.bars_open = np.array([int(p.get("bars_open", 0) or 0) for p in positions], dtype=np.int64)
+        self.exp_trades = np.array([int(s.get("exp_trades", 0) or 0) for s in stats], dtype=np.int64)
+        self.wins = np.array([int(s.get("wins", 0) or 0) for s in stats], dtype=np.int64)
+        self.losses = np.array([int(s.get("losses", 0) or 0) for s in stats], dtype=np.int64)
+        self.total_pnl = np.array([float(s.get("total_pnl", 0.0) or 0.0) for s in stats], dtype=float)
+        self._closed_any = np.zeros(len(states), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def step(self, market: MarketStep) -> Dict[str, np.ndarray]:
+        """
+        Apply one bar to every variant: exits first, then entries.
+
+        Returns:
+            Dict of per-variant arrays: "closed", "exit_reason", "pct",
+            "close_dir", "close_entry_px", "close_bars_open", "opened",
+            "threshold"
+        """
+        conf, direction, price = float(market.conf), int(market.dir), float(market.price)
+        held = self.dir != 0
+        self.bars_open[held] += 1
+
+        # Later conditions take precedence, as in the sequential checks
+        reason = np.zeros(len(self), dtype=np.int64)
+        if conf < EXIT_MIN_CONF:
+            reason[held] = 1
+        if direction != 0 and conf >= REVERSE_MIN_CONF:
+            reason[held & (self.dir != direction)] = 2
+        reason[held & (self.bars_open >= MAX_BARS_OPEN)] = 3
+        closed = reason > 0
+
+        entry = self.entry_px
+        valid_entry = closed & ~np.isnan(entry) & (entry != 0)
+        pct = np.zeros(len(self), dtype=float)
+        pct[valid_entry] = ((price - entry[valid_entry]) / entry[valid_entry]) * self.dir[valid_entry]
+        close_dir = self.dir.copy()
+        close_entry_px = entry.copy()
+        close_bars_open = self.bars_open.copy()
+
+        self.exp_trades += closed
+        self.total_pnl[closed] += pct[closed]
+        self.wins += closed & (pct > 0)
+        self.losses += closed & (pct < 0)
+        self._closed_any |= closed
+        self.dir[closed] = 0
+        self.entry_px[closed] = np.nan
+        self.bars_open[closed] = 0
+
+        threshold = self.thresholds[:, regime_column(market.regime)]
+        opened = np.zeros(len(self), dtype=bool)
+        if direction != 0:
+            opened = (self.dir == 0) & (self.exp_trades < self.caps) & (conf >= threshold)
+            self.dir[opened] = direction
+            self.entry_px[opened] = price
+            self.bars_open[opened] = 0
+
+        return {
+            "closed": closed,
+            "exit_reason": EXIT_REASONS[reason],
+            "pct": pct,
+            "close_dir": close_dir,
+            "close_entry_px": close_entry_px,
+            "close_bars_open": close_bars_open,
+            "opened": opened,
+            "threshold": threshold,
+        }
+
+    def write_back(self) -> None:
+        """Copy array state back into the variant state dicts."""
+        for i, state in enumerate(self.states):
+            position = state["position"]
+            position["dir"] = int(self.dir[i])
+            position["entry_px"] = None if np.isnan(self.entry_px[i]) else float(self.entry_px[i])
+            position["bars_open"] = int(self.bars_open[i])
+            stats = state["stats"]
+            stats["exp_trades"] = int(self.exp_trades[i])
+            stats["wins"] = int(self.wins[i])
+            stats["losses"] = int(self.losses[i])
+            stats["total_pnl"] = float(self.total_pnl[i])
+            if self._closed_any[i]:
+                stats["exp_pf"] = _exp_pf(stats["wins"], stats["losses"])
+
+
+def _exp_pf(wins: int, losses: int) -> Optional[float]:
+    """Exploration PF as tracked by the variant runner (count based)."""
+    if losses > 0:
+        return abs(wins * 0.01 / losses)
+    return float("inf") if wins > 0 else None
+
+
+def step_events(
+    book: VariantBook,
+    market: MarketStep,
+    result: Dict[str, np.ndarray],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Close / open trade records per variant id for one step (only variants with events)."""
+    events: Dict[str, List[Dict[str, Any]]] = {}
+    for i in np.flatnonzero(result["closed"] | result["opened"]):
+        state = book.states[i]
+        out = events.setdefault(state["id"], [])
+        if result["closed"][i]:
+            entry_px = result["close_entry_px"][i]
+            out.append({
+                "ts": market.ts,
+                "type": "close",
+                "symbol": market.symbol,
+                "variant_id": state["id"],
+                "dir": int(result["close_dir"][i]),
+                "entry_px": None if np.isnan(entry_px) else float(entry_px),
+                "exit_px": market.price,
+                "pct": float(result["pct"][i]),
+                "exit_reason": str(result["exit_reason"][i]),
+                "regime": market.regime,
+                "bars_open": int(result["close_bars_open"][i]),
+            })
+        if result["opened"][i]:
+            out.append({
+                "ts": market.ts,
+                "type": "open",
+                "symbol": market.symbol,
+                "variant_id": state["id"],
+                "dir": int(market.dir),
+                "entry_px": market.price,
+                "regime": market.regime,
+                "conf": market.conf,
+                "mutated_threshold": float(result["threshold"][i]),
+            })
+    return events
+
+
+__all__ = [
+    "MarketStep",
+    "VariantBook",
+    "regime_column",
+    "step_events",
+]
@@ -4,26 +4,50 @@ Strategy Variant Runner - Execute mutation strategies in parallel.
 This module allows Chloe to run multiple strategy variants simultaneously,
 testing mutations safely without affecting the main trading loop.
 
+Market inputs (latest bar, signals, regime, council decision) are computed
+once per (symbol, bar) and shared by every variant on that symbol; the
+variants' mutated thresholds and exit rules are then evaluated together in
+a VariantBook (see variant_kernel). replay_variants() runs the same logic
+offline over historical bars.
+
 All execution is paper-only, isolated, and non-invasive.
 """
 
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 
+import numpy as np
+
+from engine_alpha.core.atomic_io import atomic_write_json
 from engine_alpha.core.paths import REPORTS, CONFIG
-from engine_alpha.signals.signal_processor import get_signal_vector
+from engine_alpha.signals.signal_processor import get_signal_vector, get_signal_vector_live
 from engine_alpha.core.confidence_engine import decide
+from engine_alpha.core.council_kernel import decide_batch, get_council_layout, signal_matrix
 from engine_alpha.core.regime import classify_regime
 from engine_alpha.data.live_prices import get_live_ohlcv
+from engine_alpha.variant.variant_kernel import (
+    BASE_EXPLORATION_CAP,
+    REGIME_KEYS,
+    MarketStep,
+    VariantBook,
+    step_events,
+)
 
 ROOT = Path(__file__).resolve().parents[2]
 MUTATION_STRATEGIES_PATH = REPORTS / "evolver" / "mutation_strategies.jsonl"
 VARIANT_DIR = REPORTS / "variant"
 VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+REPLAY_SUMMARY_PATH = VARIANT_DIR / "replay_summary.json"
+
+# Bars of history behind each replayed bar (signal window) and bars skipped at the start
+REPLAY_LOOKBACK = 200
+REPLAY_WARMUP = 50
+DEFAULT_MAX_WORKERS = 8
 
 
 def load_active_variants() -> List[Dict[str, Any]]:
@@ -70,7 +94,6 @@ def initialize_variant_states(variants: List[Dict[str, Any]]) -> Dict[str, Dict[
     
     for variant in variants:
         variant_id = variant["id"]
-        symbol = variant["symbol"]
         
         # Load existing state if available
         summary_path = VARIANT_DIR / f"{variant_id}_summary.json"
@@ -81,26 +104,33 @@ def initialize_variant_states(variants: List[Dict[str, Any]]) -> Dict[str, Dict[
             except Exception:
                 pass
         
-        states[variant_id] = {
-            "id": variant_id,
-            "symbol": symbol,
-            "mutations": variant.get("mutations", {}),
-            "position": existing_state.get("position", {"dir": 0, "entry_px": None, "bars_open": 0}),
-            "stats": existing_state.get("stats", {
-                "exp_trades": 0,
-                "exp_pf": None,
-                "norm_trades": 0,
-                "norm_pf": None,
-                "total_pnl": 0.0,
-                "wins": 0,
-                "losses": 0,
-            }),
-            "trades": existing_state.get("trades", []),
-        }
+        states[variant_id] = _variant_state(variant, existing_state)
     
     return states
 
 
+def _variant_state(variant: Dict[str, Any], existing_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Variant state from its strategy dict and (optionally) a saved summary."""
+    variant_id = variant["id"]
+    symbol = variant["symbol"]
+    return {
+        "id": variant_id,
+        "symbol": symbol,
+        "mutations": variant.get("mutations", {}),
+        "position": existing_state.get("position", {"dir": 0, "entry_px": None, "bars_open": 0}),
+        "stats": existing_state.get("stats", {
+            "exp_trades": 0,
+            "exp_pf": None,
+            "norm_trades": 0,
+            "norm_pf": None,
+            "total_pnl": 0.0,
+            "wins": 0,
+            "losses": 0,
+        }),
+        "trades": existing_state.get("trades", []),
+    }
+
+
 def _load_base_thresholds() -> Dict[str, float]:
     """Load base entry thresholds from gates.yaml."""
     try:
@@ -152,30 +182,39 @@ def _apply_mutations(base_thresholds: Dict[str, float], mutations: Dict[str, Any
     return max(0.50, min(0.95, mutated_threshold))
 
 
-def simulate_variant_step(
-    variant_state: Dict[str, Any],
-    symbol: str,
-    timeframe: str = "15m",
-) -> None:
+def build_variant_book(
+    states: List[Dict[str, Any]],
+    base_thresholds: Optional[Dict[str, float]] = None,
+) -> VariantBook:
+    """Compile the variants' mutated thresholds and exploration caps into a VariantBook."""
+    if base_thresholds is None:
+        base_thresholds = _load_base_thresholds()
+    thresholds = np.array(
+        [[_apply_mutations(base_thresholds, s["mutations"], key) for key in REGIME_KEYS] for s in states],
+        dtype=float,
+    ).reshape(len(states), len(REGIME_KEYS))
+    caps = np.array(
+        [max(1, BASE_EXPLORATION_CAP + s["mutations"].get("exploration_cap_delta", 0)) for s in states],
+        dtype=np.int64,
+    )
+    return VariantBook(states, thresholds, caps)
+
+
+def compute_market_step(symbol: str, timeframe: str = "15m") -> Optional[MarketStep]:
     """
-    Simulate one step (one bar) for a variant strategy.
-    
-    This mirrors exploration lane logic but uses mutated thresholds.
-    
-    Args:
-        variant_state: Variant state dict (modified in-place)
-        symbol: Symbol to trade
-        timeframe: Timeframe (default: "15m")
+    Latest bar, signals, regime and council decision for a symbol.
+
+    Computed once per cycle and shared by every variant on the symbol.
+    Returns None when the bar or the decision is unavailable.
     """
     # Get latest candle
     try:
-        ohlcv = get_live_ohlcv(symbol, timeframe)
-        if not ohlcv or len(ohlcv) == 0:
-            return
-        
-        latest_candle = ohlcv.iloc[-1]
+        rows, _ = get_live_ohlcv(symbol, timeframe)
+        if not rows:
+            return None
+        current_price = float(rows[-1]["close"])
     except Exception:
-        return
+        return None
     
     # Get signals
     try:
@@ -183,12 +222,11 @@ def simulate_variant_step(
         signal_vector = result["signal_vector"]
         raw_registry = result["raw_registry"]
     except Exception:
-        return
+        return None
     
     # Classify regime
     try:
-        regime_result = classify_regime(signal_vector, raw_registry)
-        regime = regime_result.get("regime", "chop")
+        regime = classify_regime(rows).get("regime", "chop")
     except Exception:
         regime = "chop"
     
@@ -198,118 +236,56 @@ def simulate_variant_step(
         final_conf = decision["final"]["conf"]
         final_dir = decision["final"]["dir"]
     except Exception:
-        return
-    
-    # Load base thresholds and apply mutations
-    base_thresholds = _load_base_thresholds()
-    mutations = variant_state["mutations"]
-    mutated_threshold = _apply_mutations(base_thresholds, mutations, regime)
-    
-    # Get exploration cap mutation
-    exploration_cap_delta = mutations.get("exploration_cap_delta", 0)
-    base_exploration_cap = 2  # Default exploration cap
-    mutated_exploration_cap = max(1, base_exploration_cap + exploration_cap_delta)
-    
-    position = variant_state["position"]
-    stats = variant_state["stats"]
-    trades = variant_state["trades"]
+        return None
     
-    current_price = float(latest_candle["close"])
-    now = datetime.now(timezone.utc).isoformat()
+    return MarketStep(
+        symbol=symbol,
+        ts=datetime.now(timezone.utc).isoformat(),
+        price=current_price,
+        dir=int(final_dir),
+        conf=float(final_conf),
+        regime=regime,
+    )
+
+
+def apply_market_step(book: VariantBook, market: MarketStep) -> None:
+    """Step every variant in the book and append their trade records to their states."""
+    result = book.step(market)
+    events = step_events(book, market, result)
+    if events:
+        by_id = {state["id"]: state for state in book.states}
+        for variant_id, records in events.items():
+            by_id[variant_id]["trades"].extend(records)
+    book.write_back()
+
+
+def simulate_variant_step(
+    variant_state: Dict[str, Any],
+    symbol: str,
+    timeframe: str = "15m",
+) -> None:
+    """
+    Simulate one step (one bar) for a single variant strategy.
     
-    # Exit logic: check if we should close existing position
-    if position["dir"] != 0:
-        position["bars_open"] += 1
-        
-        # Simple exit conditions (mirror exploration lane)
-        should_exit = False
-        exit_reason = None
-        
-        # Exit if confidence drops below threshold
-        if final_conf < 0.30:  # exit_min_conf
-            should_exit = True
-            exit_reason = "low_conf"
-        
-        # Exit if direction flips and opposite confidence is high
-        current_dir = position["dir"]
-        if final_dir != 0 and final_dir != current_dir and final_conf >= 0.60:  # reverse_min_conf
-            should_exit = True
-            exit_reason = "reverse"
-        
-        # Exit if position open too long
-        if position["bars_open"] >= 10:  # max_bars_open
-            should_exit = True
-            exit_reason = "timeout"
-        
-        if should_exit:
-            # Calculate P&L (simplified: use price change)
-            entry_px = position.get("entry_px", current_price)
-            if entry_px:
-                pct_change = ((current_price - entry_px) / entry_px) * position["dir"]
-            else:
-                pct_change = 0.0
-            
-            # Log close trade
-            close_trade = {
-                "ts": now,
-                "type": "close",
-                "symbol": symbol,
-                "variant_id": variant_state["id"],
-                "dir": position["dir"],
-                "entry_px": entry_px,
-                "exit_px": current_price,
-                "pct": pct_change,
-                "exit_reason": exit_reason,
-                "regime": regime,
-                "bars_open": position["bars_open"],
-            }
-            trades.append(close_trade)
-            
-            # Update stats
-            stats["exp_trades"] += 1
-            stats["total_pnl"] += pct_change
-            if pct_change > 0:
-                stats["wins"] += 1
-            elif pct_change < 0:
-                stats["losses"] += 1
-            
-            # Calculate PF
-            if stats["losses"] > 0:
-                stats["exp_pf"] = abs(stats["wins"] * 0.01 / stats["losses"]) if stats["losses"] > 0 else None
-            else:
-                stats["exp_pf"] = float("inf") if stats["wins"] > 0 else None
-            
-            # Reset position
-            position["dir"] = 0
-            position["entry_px"] = None
-            position["bars_open"] = 0
+    This mirrors exploration lane logic but uses mutated thresholds.
+    run_variant_cycle steps all variants of a symbol together instead.
     
-    # Entry logic: check if we should open new position
-    if position["dir"] == 0:
-        # Check if we've hit exploration cap
-        if stats["exp_trades"] >= mutated_exploration_cap:
-            return  # Cap reached, no more entries
-        
-        # Check if confidence meets mutated threshold
-        if final_dir != 0 and final_conf >= mutated_threshold:
-            # Open position
-            position["dir"] = final_dir
-            position["entry_px"] = current_price
-            position["bars_open"] = 0
-            
-            # Log open trade
-            open_trade = {
-                "ts": now,
-                "type": "open",
-                "symbol": symbol,
-                "variant_id": variant_state["id"],
-                "dir": final_dir,
-                "entry_px": current_price,
-                "regime": regime,
-                "conf": final_conf,
-                "mutated_threshold": mutated_threshold,
-            }
-            trades.append(open_trade)
+    Args:
+        variant_state: Variant state dict (modified in-place)
+        symbol: Symbol to trade
+        timeframe: Timeframe (default: "15m")
+    """
+    market = compute_market_step(symbol, timeframe)
+    if market is None:
+        return
+    apply_market_step(build_variant_book([variant_state]), market)
+
+
+def _group_by_symbol(states: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for state in states:
+        groups.setdefault(state["symbol"], []).append(state)
+    return groups
 
 
 def run_variant_cycle(timeframe: str = "15m") -> Dict[str, Any]:
@@ -333,31 +309,27 @@ def run_variant_cycle(timeframe: str = "15m") -> Dict[str, Any]:
     
     # Initialize states
     variant_states = initialize_variant_states(variants)
+    base_thresholds = _load_base_thresholds()
     
-    # Execute one step for each variant
+    # One market step per symbol, shared by all of its variants
     executed = 0
     errors = []
     
-    for variant in variants:
-        variant_id = variant["id"]
-        symbol = variant["symbol"]
-        
+    for symbol, states in _group_by_symbol(list(variant_states.values())).items():
         try:
-            state = variant_states[variant_id]
-            simulate_variant_step(state, symbol, timeframe)
-            executed += 1
+            market = compute_market_step(symbol, timeframe)
+            if market is not None:
+                apply_market_step(build_variant_book(states, base_thresholds), market)
+            executed += len(states)
         except Exception as e:
-            errors.append(f"{variant_id}: {str(e)}")
+            errors.extend(f"{state['id']}: {str(e)}" for state in states)
     
     # Save updated states
     for variant_id, state in variant_states.items():
-        # Save trades log
+        # Save trades log (trades recorded this cycle)
         trades_path = VARIANT_DIR / f"{variant_id}_trades.jsonl"
         if state["trades"]:
             with trades_path.open("a") as f:
-                # Only append new trades (not already saved)
-                # For simplicity, we'll append all trades each time
-                # In production, you'd track which trades are new
                 for trade in state["trades"]:
                     f.write(json.dumps(trade) + "\n")
         
@@ -380,3 +352,135 @@ def run_variant_cycle(timeframe: str = "15m") -> Dict[str, Any]:
         "summary": f"Executed {executed}/{len(variants)} variants",
     }
 
+
+# ---------- Offline replay ----------
+
+def _bar_ts(row: Dict[str, Any]) -> str:
+    ts = row.get("ts") or row.get("timestamp") or row.get("open_time") or ""
+    return str(ts)
+
+
+def replay_market_steps(
+    symbol: str,
+    bars: List[Dict[str, Any]],
+    timeframe: str = "15m",
+    lookback: int = REPLAY_LOOKBACK,
+    warmup: int = REPLAY_WARMUP,
+) -> List[MarketStep]:
+    """
+    Market steps for every historical bar after the warmup.
+
+    Signals and regime use the trailing `lookback` bars up to each bar; the
+    council decisions for all bars are computed in one decide_batch call
+    (same result as decide() per bar without a classifier). Signals are
+    computed offline from the bars (no network, no PCI logging); funding
+    bias is neutral since the bars carry no funding history.
+    """
+    start = max(0, min(warmup, len(bars)) - 1) if warmup > 0 else 0
+    vectors: List[List[float]] = []
+    meta: List[tuple] = []
+    for i in range(start, len(bars)):
+        window = bars[max(0, i + 1 - lookback): i + 1]
+        try:
+            price = float(window[-1]["close"])
+            signal = get_signal_vector_live(
+                symbol=symbol, timeframe=timeframe, limit=lookback, rows=window, offline=True,
+            )
+        except Exception:
+            continue
+        try:
+            regime = classify_regime(window).get("regime", "chop")
+        except Exception:
+            regime = "chop"
+        vectors.append(signal["signal_vector"])
+        meta.append((_bar_ts(window[-1]), price, regime))
+    if not vectors:
+        return []
+
+    layout = get_council_layout()
+    decision = decide_batch(signal_matrix(vectors, layout.n_signals), None, layout=layout)
+    return [
+        MarketStep(symbol=symbol, ts=ts, price=price, dir=int(d), conf=float(c), regime=regime)
+        for (ts, price, regime), d, c in zip(meta, decision["dir"], decision["conf"])
+    ]
+
+
+def _load_replay_bars(symbol: str, timeframe: str) -> List[Dict[str, Any]]:
+    try:
+        from engine_alpha.data.historical_loader import load_cache
+        return load_cache(symbol, timeframe) or []
+    except Exception:
+        return []
+
+
+def replay_variants(
+    variants: Optional[List[Dict[str, Any]]] = None,
+    bars_by_symbol: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    timeframe: str = "15m",
+    lookback: int = REPLAY_LOOKBACK,
+    warmup: int = REPLAY_WARMUP,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    write_report: bool = True,
+) -> Dict[str, Any]:
+    """
+    Replay variants over historical bars, starting from flat positions.
+    
+    Each symbol's bars are turned into market steps once; all of the
+    symbol's variants are then stepped together bar by bar. Symbols run in
+    parallel. Live variant state files are not touched.
+    
+    Args:
+        variants: Variant strategy dicts (active shadow variants if None)
+        bars_by_symbol: OHLCV rows per symbol (historical cache if missing)
+        timeframe: Bar timeframe
+        lookback: Bars of history behind each replayed bar
+        warmup: Bars before the first replayed bar
+        max_workers: Symbols replayed in parallel
+        write_report: Write reports/variant/replay_summary.json
+    
+    Returns:
+        Dict with per-variant stats / trade counts and bars replayed per symbol
+    """
+    if variants is None:
+        variants = load_active_variants()
+    bars_by_symbol = bars_by_symbol or {}
+    states = [_variant_state(v, {}) for v in variants]
+    base_thresholds = _load_base_thresholds()
+    groups = _group_by_symbol(states)
+
+    def _replay_symbol(symbol: str) -> int:
+        bars = bars_by_symbol.get(symbol)
+        if bars is None:
+            bars = _load_replay_bars(symbol, timeframe)
+        steps = replay_market_steps(symbol, bars, timeframe, lookback=lookback, warmup=warmup)
+        book = build_variant_book(groups[symbol], base_thresholds)
+        for market in steps:
+            apply_market_step(book, market)
+        return len(steps)
+
+    symbols = list(groups)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols) or 1))) as pool:
+        bars_replayed = dict(zip(symbols, pool.map(_replay_symbol, symbols)))
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "timeframe": timeframe,
+        "bars_replayed": bars_replayed,
+        "variants": {
+            state["id"]: {
+                "symbol": state["symbol"],
+                "mutations": state["mutations"],
+                "stats": state["stats"],
+                "position": state["position"],
+                "trades": sum(1 for t in state["trades"] if t["type"] == "close"),
+            }
+            for state in states
+        },
+    }
+    if write_report:
+        try:
+            atomic_write_json(REPLAY_SUMMARY_PATH, report)
+        except Exception as e:
+            print(f"Warning: Failed to write replay_summary.json: {e}")
+    report["trades"] = {state["id"]: state["trades"] for state in states}
+    return report
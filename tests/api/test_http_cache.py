@@ -0,0 +1,133 @@
+"""
+Unit tests for the API response cache (ETag / Last-Modified / 304 / gzip).
+"""
+import json
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from engine_alpha.api.http_cache import HTTPCacheMiddleware, ResponseCache
+
+
+@pytest.fixture
+def cached_app(tmp_path):
+    (tmp_path / "reports").mkdir()
+    source = tmp_path / "reports" / "pf_local.json"
+    source.write_text(json.dumps({"pf": 1.2}))
+    calls = []
+
+    app = FastAPI()
+    cache = ResponseCache(
+        sources={"/pf": (("reports/pf_local.json",), None), "/big": (("reports/pf_local.json",), None)},
+        root=tmp_path,
+    )
+    app.add_middleware(HTTPCacheMiddleware, cache=cache)
+
+    @app.get("/pf")
+    def pf(window: str = "all"):
+        calls.append(window)
+        return json.loads(source.read_text())
+
+    @app.get("/big")
+    def big():
+        calls.append("big")
+        return {"rows": [{"symbol": "ETHUSDT", "pf": 1.0}] * 200}
+
+    @app.get("/missing")
+    def missing():
+        calls.append("missing")
+        return {}
+
+    return TestClient(app), source, calls
+
+
+class TestHTTPCache:
+    """Cached responses are revalidated against the source file signature."""
+
+    def test_cache_hit_until_source_changes(self, cached_app):
+        client, source, calls = cached_app
+        first = client.get("/pf")
+        second = client.get("/pf")
+        assert first.json() == second.json() == {"pf": 1.2}
+        assert calls == ["all"]
+        assert first.headers["etag"] == second.headers["etag"]
+        assert "last-modified" in first.headers
+
+        client.get("/pf?window=7d")
+        assert calls == ["all", "7d"]  # query params are part of the key
+
+        source.write_text(json.dumps({"pf": 1.5}))
+        future = time.time() + 5
+        os.utime(source, (future, future))
+        third = client.get("/pf")
+        assert third.json() == {"pf": 1.5}
+        assert third.headers["etag"] != first.headers["etag"]
+
+    def test_conditional_requests(self, cached_app):
+        client, _, calls = cached_app
+        first = client.get("/pf")
+        etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+        assert client.get("/pf", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/pf", headers={"If-Modified-Since": last_modified}).status_code == 304
+        assert client.get("/pf", headers={"If-None-Match": '"other"'}).status_code == 200
+        head = client.head("/pf")
+        assert head.status_code == 200 and head.headers["etag"] == etag
+        assert calls == ["all"]
+
+    def test_gzip_large_payloads_and_passthrough(self, cached_app):
+        client, _, calls = cached_app
+        plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        zipped = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.json() == plain.json()
+        assert calls == ["big"]
+
+        client.get("/missing")
+        client.get("/missing")
+        assert calls == ["big", "missing", "missing"]  # not a cached endpoint
+
+    def test_head_miss_runs_handler(self, cached_app):
+        client, _, calls = cached_app
+        head = client.head("/pf")
+        assert head.status_code == 200 and head.content == b""
+        assert calls == ["all"]
+        assert client.get("/pf").headers["etag"] == head.headers["etag"]
+        assert calls == ["all"]
+
+    def test_guard_runs_before_cached_and_304_responses(self, tmp_path):
+        from fastapi.responses import JSONResponse
+
+        (tmp_path / "reports").mkdir()
+        (tmp_path / "reports" / "pf_local.json").write_text("{}")
+
+        async def guard(request):
+            if request.headers.get("X-CHLOE-API-KEY") == "k":
+                return None
+            return JSONResponse(status_code=401, content={"error": "UNAUTHORIZED"})
+
+        app = FastAPI()
+        cache = ResponseCache(sources={"/pf": (("reports/pf_local.json",), None)}, root=tmp_path)
+        app.add_middleware(HTTPCacheMiddleware, cache=cache, guard=guard)
+
+        @app.get("/pf")
+        def pf():
+            return {"pf": 1.0}
+
+        client = TestClient(app)
+        assert client.get("/pf").status_code == 401
+        first = client.get("/pf", headers={"X-CHLOE-API-KEY": "k"})
+        assert first.status_code == 200
+        assert client.get("/pf").status_code == 401  # cached entry is not served without auth
+        stale = {"X-CHLOE-API-KEY": "bad", "If-None-Match": first.headers["etag"]}
+        assert client.get("/pf", headers=stale).status_code == 401
+
+    def test_status_sources_cover_report_files(self):
+        from engine_alpha.api.http_cache import ENDPOINT_SOURCES
+
+        files, _ = ENDPOINT_SOURCES["/status"]
+        assert "reports/trades.jsonl" in files and "reports/risk/auto_promotions.json" in files
+        assert len(files) == 7
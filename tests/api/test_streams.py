@@ -0,0 +1,64 @@
+"""
+Unit tests for the shared SSE file follower.
+"""
+import asyncio
+import json
+
+from engine_alpha.api.streams import StreamHub
+
+
+def _append(path, records):
+    with path.open("a") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+class TestStreamHub:
+    """One follower fans new records out to every subscriber."""
+
+    def test_only_new_records_are_pushed(self, tmp_path):
+        trades = tmp_path / "trades.jsonl"
+        _append(trades, [{"id": "old"}])
+        hub = StreamHub(tmp_path)
+        hub._start_follow()
+        assert hub.poll() == []  # existing history is not replayed
+
+        _append(trades, [{"id": 1}, {"id": 2}])
+        (tmp_path / "loop_health.json").write_text(json.dumps({"status": "ok"}))
+        events = hub.poll()
+        assert [(e.topic, e.data) for e in events] == [
+            ("trades", {"id": 1}), ("trades", {"id": 2}), ("health", {"status": "ok"}),
+        ]
+        assert hub.poll() == []
+        assert events[0].to_sse().startswith("id: trades:")
+        assert 'data: {"id":1}' in events[0].to_sse()
+
+    def test_shared_follower_for_many_clients(self, tmp_path):
+        trades = tmp_path / "trades.jsonl"
+        trades.write_text("")
+
+        async def scenario():
+            hub = StreamHub(tmp_path, poll_interval=0.01)
+            clients = [hub.events(["trades"]) for _ in range(5)] + [hub.events(["health"])]
+            for c in clients:
+                assert (await c.__anext__()).startswith("retry:")
+            _append(trades, [{"id": 7}])
+            received = [await asyncio.wait_for(c.__anext__(), 1.0) for c in clients[:5]]
+            polls_before = hub.polls
+            await asyncio.sleep(0.05)
+            assert hub.subscriber_count == 6
+            for c in clients:
+                await c.aclose()
+            return hub, received, polls_before
+
+        hub, received, polls_before = asyncio.run(scenario())
+        assert all('"id":7' in r for r in received)
+        assert hub.subscriber_count == 0
+        # One poll loop serves every client (not one per subscriber)
+        assert hub.polls - polls_before < 20
+
+    def test_stream_endpoint_rejects_unknown_topics(self):
+        from fastapi.testclient import TestClient
+        from engine_alpha.api.app import app
+
+        assert TestClient(app).get("/stream?topics=trades,bogus").status_code == 400
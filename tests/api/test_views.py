@@ -0,0 +1,129 @@
+"""
+Unit tests for the materialized views served to the dashboard and API.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.api.views import JsonFileView, TradesView, ViewRegistry
+from engine_alpha.research import pf_timeseries
+
+
+NOW = datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _close(days_ago, pct, symbol="ETHUSDT"):
+    return {"type": "close", "symbol": symbol, "pct": pct, "ts": (NOW - timedelta(days=days_ago)).isoformat()}
+
+
+def _append(path, records):
+    with path.open("a") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+class TestTradesView:
+    """Incremental trades.jsonl tailing and PF windows."""
+
+    def test_pf_windows_match_batch_engine(self, tmp_path):
+        path = tmp_path / "trades.jsonl"
+        records = [
+            _close(0, 0.02), _close(0, -0.01), _close(3, 0.015, "BTCUSDT"), _close(3, -0.02, "BTCUSDT"),
+            _close(10, 0.03), _close(10, -0.005), _close(40, -0.01), _close(40, 0.01),
+            {"type": "open", "symbol": "ETHUSDT", "ts": NOW.isoformat()},
+        ]
+        _append(path, records)
+        view = TradesView(path)
+        data = view.pf_windows(now=NOW).data
+
+        closes = [r for r in records if r["type"] == "close"]
+        for label, days in (("7d", 7), ("30d", 30), ("all", None)):
+            window = [
+                (r["pct"], 1.0) for r in closes
+                if days is None or (NOW - datetime.fromisoformat(r["ts"])).total_seconds() <= days * 86400
+            ]
+            expected = pf_timeseries._compute_pf_for_window(window).to_dict()
+            assert data["global"][label] == pytest.approx(expected)
+        assert data["symbols"]["BTCUSDT"]["7d"]["trades"] == 2
+        assert data["global"]["1d"]["trades"] == 2
+
+    def test_pf_windows_agree_with_pf_timeseries(self, tmp_path):
+        path = tmp_path / "trades.jsonl"
+        # Closes just inside / outside the rolling 1d and 7d windows (not whole UTC days)
+        _append(path, [
+            _close(0.5, 0.02), _close(0.99, -0.01), _close(1.01, 0.03),
+            _close(6.9, -0.02, "BTCUSDT"), _close(7.1, 0.01, "BTCUSDT"),
+        ])
+        view = TradesView(path).pf_windows(now=NOW).data
+        engine = pf_timeseries.PFTimeseriesEngine(path).compute(NOW)
+        for label in ("1d", "7d", "30d"):
+            assert view["global"][label] == engine["global"][label]
+            assert view["symbols"]["BTCUSDT"][label] == engine["symbols"]["BTCUSDT"][label]
+        assert view["global"]["1d"]["trades"] == 2
+
+    def test_incremental_tail_and_partial_lines(self, tmp_path):
+        path = tmp_path / "trades.jsonl"
+        _append(path, [_close(0, 0.01)])
+        view = TradesView(path, recent_limit=3)
+        first = view.recent()
+        assert len(first.data) == 1
+
+        # A partially written line is not consumed until it is complete
+        with path.open("a") as f:
+            f.write(json.dumps(_close(0, -0.01))[:10])
+        assert view.recent().etag == first.etag
+        with path.open("a") as f:
+            f.write(json.dumps(_close(0, -0.01))[10:] + "\n")
+        _append(path, [_close(0, 0.02), _close(0, 0.03)])
+        second = view.recent()
+        assert second.etag != first.etag
+        assert [r["pct"] for r in second.data] == [-0.01, 0.02, 0.03]  # bounded to recent_limit
+        assert view.pf_windows(now=NOW).data["global"]["all"]["trades"] == 4
+
+        # Truncation / rewrite triggers a full re-read
+        path.write_text(json.dumps(_close(0, 0.05)) + "\n")
+        assert [r["pct"] for r in view.recent().data] == [0.05]
+
+
+class TestJsonFileView:
+    """JSON report views reload only when the file changes."""
+
+    def test_reload_and_etag(self, tmp_path):
+        path = tmp_path / "position_state.json"
+        view = JsonFileView("positions", path)
+        assert view.get().data is None and "not found" in view.get().error
+
+        path.write_text(json.dumps({"ETHUSDT": {"dir": 1}}))
+        snap = view.get()
+        assert snap.data == {"ETHUSDT": {"dir": 1}}
+        assert view.get() is snap  # unchanged file -> same snapshot
+
+        path.write_text("{broken")
+        assert view.get().data is None and "Invalid JSON" in view.get().error
+
+    def test_registry_names(self, tmp_path):
+        registry = ViewRegistry(tmp_path)
+        assert set(registry.names()) >= {"recent_trades", "pf_windows", "positions", "symbol_states", "staleness"}
+        with pytest.raises(KeyError):
+            registry.get("nope")
+
+
+class TestViewEndpoint:
+    """/views/{name} serves from memory with ETags."""
+
+    def test_etag_round_trip(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        from engine_alpha.api import app as app_module, views
+
+        (tmp_path / "risk").mkdir()
+        (tmp_path / "risk" / "symbol_states.json").write_text(json.dumps({"symbols": {"ETHUSDT": {}}}))
+        monkeypatch.setattr(views, "_REGISTRY", ViewRegistry(tmp_path))
+        client = TestClient(app_module.app)
+
+        first = client.get("/views/symbol_states")
+        assert first.status_code == 200
+        assert first.json()["data"] == {"symbols": {"ETHUSDT": {}}}
+        assert client.get("/views/symbol_states", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+        assert client.get("/views/positions").status_code == 404
+        assert client.get("/views/unknown").status_code == 404
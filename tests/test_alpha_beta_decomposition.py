@@ -0,0 +1,97 @@
+"""
+Tests for the batched alpha/beta regressions and the grouped PF kernel.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine_alpha.research.alpha_beta_decomposition import (
+    aligned_returns,
+    decompose,
+    fit_alpha_beta,
+    rolling_alpha_beta,
+)
+from engine_alpha.research.pf_timeseries import _compute_pf_for_window, pf_by_group
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _market(n, seed=0):
+    rng = np.random.default_rng(seed)
+    btc = rng.normal(0, 0.01, n)
+    eth = 0.8 * btc + rng.normal(0, 0.006, n)
+    returns = np.column_stack([btc, eth] + [b * btc + rng.normal(0.0002 * b, 0.008, n) for b in (0.5, 1.5, 2.0)])
+    returns[rng.random(returns.shape) < 0.1] = np.nan
+    returns[:, :2] = np.column_stack([btc, eth])  # Benchmarks complete
+    return returns
+
+
+def test_batch_fit_matches_per_symbol_lstsq():
+    returns = _market(400)
+    factors = returns[:, :2]
+    fit = fit_alpha_beta(returns, factors)
+    for col in range(returns.shape[1]):
+        ok = np.isfinite(returns[:, col])
+        design = np.column_stack([np.ones(ok.sum()), factors[ok]])
+        coef, ssr, _, _ = np.linalg.lstsq(design, returns[ok, col], rcond=None)
+        assert fit["alpha"][col] == pytest.approx(coef[0], abs=1e-10)
+        np.testing.assert_allclose(fit["beta"][col], coef[1:], atol=1e-8)
+        assert fit["n"][col] == ok.sum()
+        if len(ssr):
+            assert fit["residual_vol"][col] == pytest.approx(np.sqrt(ssr[0] / (ok.sum() - 3)))
+    np.testing.assert_allclose(fit["beta"][0], [1.0, 0.0], atol=1e-9)
+
+    sparse = fit_alpha_beta(returns[:20], factors[:20])
+    assert np.isnan(sparse["beta"]).all()
+
+
+def test_rolling_windows_match_direct_fits():
+    returns = _market(300, seed=1)
+    rolling = rolling_alpha_beta(returns, returns[:, 0], window=96, step=24)
+    assert rolling["end"].tolist() == list(range(108, 301, 24))
+    for w, end in enumerate(rolling["end"]):
+        direct = fit_alpha_beta(returns[end - 96:end], returns[end - 96:end, 0])
+        np.testing.assert_allclose(rolling["beta"][w], direct["beta"], atol=1e-9)
+        np.testing.assert_allclose(rolling["alpha"][w], direct["alpha"], atol=1e-11)
+
+
+def test_report_from_aligned_bars():
+    rng = random.Random(2)
+    price = {"BTCUSDT": 100.0, "ETHUSDT": 50.0, "SOLUSDT": 20.0}
+    bars = {s: [] for s in price}
+    for i in range(250):
+        market = rng.gauss(0, 0.01)
+        for symbol, beta in (("BTCUSDT", 1.0), ("ETHUSDT", 1.2), ("SOLUSDT", 1.8)):
+            price[symbol] *= np.exp(beta * market + (rng.gauss(0, 0.002) if beta != 1.0 else 0.0))
+            if symbol == "SOLUSDT" and i % 10 == 3:
+                continue  # Missing bar
+            ts = (START + timedelta(minutes=15 * i)).isoformat()
+            bars[symbol].append({"ts": ts, "close": price[symbol]})
+
+    ts_ms, symbols, returns = aligned_returns(bars)
+    assert symbols == ["BTCUSDT", "ETHUSDT", "SOLUSDT"] and returns.shape == (249, 3)
+    report = decompose(ts_ms, symbols, returns)
+    sol = report["symbols"]["SOLUSDT"]
+    assert sol["beta"] == pytest.approx(1.8, abs=0.05)
+    assert sol["sample_size"] < 249 and sol["r2"] > 0.9
+    assert report["symbols"]["BTCUSDT"]["beta"] == 1.0
+    assert len(sol["rolling_beta"]) == len(report["rolling"]["end_ts"]) > 0
+
+    assert decompose(ts_ms, ["ETHUSDT"], returns[:, 1:2])["symbols"] == {}
+
+
+def test_pf_by_group_matches_per_window():
+    rng = random.Random(3)
+    groups = [rng.choice(["core", "explore", "exploit"]) for _ in range(400)]
+    returns = [(rng.choice([0.0, rng.gauss(0, 0.01)]), rng.choice([1.0, 3.0])) for _ in groups]
+    groups.append("wins_only")
+    returns.append((0.01, 1.0))
+    stats = pf_by_group(groups, returns)
+    for key, got in stats.items():
+        expected = _compute_pf_for_window([rw for g, rw in zip(groups, returns) if g == key])
+        assert (got.wins, got.losses, got.trades) == (expected.wins, expected.losses, expected.trades)
+        assert got.pf == pytest.approx(expected.pf)
+    assert stats["wins_only"].pf is None
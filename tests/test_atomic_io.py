@@ -70,3 +70,20 @@ def test_atomic_append_jsonl():
         atomic_append_jsonl(nested_path, {"test": "data"})
         assert nested_path.exists()
 
+
+
+def test_atomic_write_json_concurrent_writers(tmp_path):
+    """Concurrent writers of one path never collide on the temp file."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    target = tmp_path / "state.json"
+
+    def write(i):
+        for j in range(25):
+            atomic_write_json(target, {"writer": i, "n": j})
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(write, range(16)))  # Re-raises any writer error
+
+    assert json.loads(target.read_text())["n"] == 24
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,96 @@
+"""
+Tests for the shared ASE bar cube (single fetch + resampling + CSV tail read).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine_alpha.data.historical_prices import load_ohlcv_csv, load_ohlcv_csv_tail
+from engine_alpha.research.advanced_structure import bar_cube
+from engine_alpha.research.advanced_structure.multi_timeframe_loader import load_all_timeframes
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _rows_5m(n, start=T0, minutes=5):
+    rng = np.random.default_rng(1)
+    rows = []
+    for i in range(n):
+        o = 100 + rng.normal()
+        c = o + rng.normal()
+        rows.append({
+            "ts": (start + timedelta(minutes=minutes * i)).isoformat(),
+            "open": o, "high": max(o, c) + 0.5, "low": min(o, c) - 0.5, "close": c, "volume": 1.0 + i,
+        })
+    return rows
+
+
+def _capped_live(calls, cap=200):
+    """Fake get_live_ohlcv that, like the default provider, returns at most cap bars."""
+    def fake_live(symbol, timeframe, limit=300, **kwargs):
+        calls.append((symbol, timeframe, limit))
+        minutes = {"5m": 5, "15m": 15, "1h": 60}[timeframe]
+        return _rows_5m(min(limit, cap), minutes=minutes), {}
+    return fake_live
+
+
+def test_resample_matches_groupwise_reference():
+    # Start 10 minutes into the hour: the first 1h bucket is partial and dropped
+    rows = _rows_5m(100, start=T0 + timedelta(minutes=10))
+    cube = bar_cube.BarCube("ETHUSDT", bar_cube._rows_to_arrays(rows))
+    hourly = cube.get("1h", 100)
+    assert hourly[0]["ts"] == (T0 + timedelta(hours=1)).isoformat()
+    for bar in hourly:
+        start = datetime.fromisoformat(bar["ts"])
+        group = [r for r in rows if start <= datetime.fromisoformat(r["ts"]) < start + timedelta(hours=1)]
+        assert bar["open"] == group[0]["open"]
+        assert bar["close"] == group[-1]["close"]
+        assert bar["high"] == max(r["high"] for r in group)
+        assert bar["low"] == min(r["low"] for r in group)
+        assert bar["volume"] == pytest.approx(sum(r["volume"] for r in group))
+    assert len(cube.get("15m", 5)) == 5
+
+    # The last base bar (08:25) does not close the 08:00 bucket: it is still forming
+    assert hourly[-1]["ts"] == (T0 + timedelta(hours=7)).isoformat()
+    kept = bar_cube.resample_arrays(bar_cube._rows_to_arrays(rows), 300, 3600, keep_partial=True)
+    assert kept["ts"][-1] == (T0 + timedelta(hours=8)).timestamp()
+
+
+def test_one_fetch_per_symbol_per_scan(monkeypatch):
+    calls = []
+    monkeypatch.setattr(bar_cube, "get_live_ohlcv", _capped_live(calls))
+    bar_cube.clear_bar_cubes()
+    with bar_cube.scan_run():
+        for _ in range(3):  # three ASE engines
+            data = load_all_timeframes("ETHUSDT", max_bars_5m=150, max_bars_15m=60, max_bars_1h=15)
+    assert calls == [("ETHUSDT", "5m", 180)]  # 15 x 1h, within the provider cap
+    assert len(data["5m"]) == 150 and len(data["15m"]) == 60 and len(data["1h"]) == 15
+    bar_cube.clear_bar_cubes()
+
+
+def test_capped_base_fetches_coarse_views_natively(monkeypatch):
+    calls = []
+    monkeypatch.setattr(bar_cube, "get_live_ohlcv", _capped_live(calls))
+    bar_cube.clear_bar_cubes()
+    with bar_cube.scan_run():
+        for _ in range(3):
+            data = load_all_timeframes("ETHUSDT", max_bars_5m=500, max_bars_15m=300, max_bars_1h=100)
+    # 200 x 5m bars only span 66 x 15m and 16 x 1h; both views are fetched at their own timeframe
+    assert calls == [("ETHUSDT", "5m", 200), ("ETHUSDT", "15m", 200), ("ETHUSDT", "1h", 100)]
+    assert len(data["5m"]) == 200 and len(data["15m"]) == 200 and len(data["1h"]) == 100
+    assert data["1h"][1]["ts"] == (T0 + timedelta(hours=1)).isoformat()
+    bar_cube.clear_bar_cubes()
+
+
+def test_csv_tail_matches_full_parse(tmp_path):
+    path = tmp_path / "ETHUSDT_1h.csv"
+    lines = ["ts,open,high,low,close,volume"]
+    for i in range(500):
+        ts = (T0 + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        lines.append(f"{ts},{100 + i},{101 + i},{99 + i},{100.5 + i},{i}")
+    path.write_text("\n".join(lines) + "\n")
+    full = load_ohlcv_csv("ETHUSDT", "1h", csv_path=str(path))
+    assert load_ohlcv_csv_tail("ETHUSDT", "1h", 37, csv_path=str(path)) == full[-37:]
+    assert load_ohlcv_csv_tail("ETHUSDT", "1h", 1000, csv_path=str(path)) == full
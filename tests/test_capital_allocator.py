@@ -0,0 +1,43 @@
+"""
+Tests for input fingerprinting and incremental rescoring in the capital allocator.
+"""
+
+import json
+
+from engine_alpha.research import correlation_engine
+from engine_alpha.risk import capital_allocator
+
+
+def test_capital_plan_recomputes_only_on_input_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(correlation_engine, "CORRELATION_MATRIX_PATH", tmp_path / "missing.json")
+    monkeypatch.setattr(capital_allocator, "_plan_cache", {"fingerprint": None, "plan": None})
+    monkeypatch.setattr(capital_allocator, "_symbol_cache", {})
+    pf_path = tmp_path / "pf_timeseries.json"
+    drift_path = tmp_path / "drift.json"
+    pf_path.write_text(json.dumps({"symbols": {s: {"30d": {"pf": 1.2}} for s in ("BTCUSDT", "ETHUSDT", "SOLUSDT")}}))
+    for name in ("EXECQL_PATH", "EDGE_PROFILE_PATH", "POLICY_PATH", "PF_VALIDITY_PATH",
+                 "PF_NORM_PATH", "SCM_PATH", "RISK_SNAPSHOT_PATH"):
+        monkeypatch.setattr(capital_allocator, name, tmp_path / "missing.json")
+    monkeypatch.setattr(capital_allocator, "PF_TS_PATH", pf_path)
+    monkeypatch.setattr(capital_allocator, "DRIFT_PATH", drift_path)
+    out_path = tmp_path / "capital_plan.json"
+    monkeypatch.setattr(capital_allocator, "OUT_PATH", out_path)
+
+    first = capital_allocator.compute_capital_plan()
+    assert first["meta"]["rescored_symbols"] == 3
+    mtime = out_path.stat().st_mtime_ns
+    again = capital_allocator.compute_capital_plan()
+    assert again["meta"]["reused"] and not first["meta"]["reused"]
+    assert again["symbols"] == first["symbols"]
+    assert out_path.stat().st_mtime_ns == mtime
+
+    # A new process picks the fingerprint up from the written plan
+    monkeypatch.setattr(capital_allocator, "_plan_cache", {"fingerprint": None, "plan": None})
+    assert capital_allocator.compute_capital_plan()["meta"]["reused"]
+
+    drift_path.write_text(json.dumps({"symbols": {"SOLUSDT": {"status": "degrading"}}}))
+    second = capital_allocator.compute_capital_plan()
+    assert second["meta"]["rescored_symbols"] == 1
+    assert second["symbols"]["SOLUSDT"]["drift"] == "degrading"
+    assert second["symbols"]["SOLUSDT"]["score"] < second["symbols"]["BTCUSDT"]["score"]
+    assert capital_allocator.compute_capital_plan(force=True)["meta"]["rescored_symbols"] == 0
@@ -0,0 +1,114 @@
+"""
+Tests for the JSONL event codec (backends, ts_ms stamping, range reads).
+"""
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.core import codec
+from engine_alpha.core.atomic_io import atomic_append_jsonl
+
+
+@pytest.fixture(params=codec.available_backends())
+def backend(request):
+    previous = codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+def test_round_trip_matches_stdlib(backend):
+    event = {"ts": "2024-05-01T12:00:00+00:00", "symbol": "ETHUSDT", "pct": 0.0123, "dir": -1,
+             "nested": {"a": [1, 2.5, None, True]}, "note": "Δ move"}
+    line = codec.dumps_line(event)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert codec.loads(line) == json.loads(line) == event
+
+
+def test_fallbacks_for_unusual_values(backend):
+    # Non-string keys and legacy NaN lines still go through
+    assert codec.loads(codec.dumps({1: "x"})) == {"1": "x"}
+    assert math.isnan(codec.loads(b'{"pf": NaN}')["pf"])
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_non_finite_floats_match_stdlib(backend):
+    event = {"pf": float("nan"), "edges": [float("inf"), -float("inf"), 1.5], "note": None}
+    line = codec.dumps(event)
+    assert line == json.dumps(event, separators=(",", ":")).encode("utf-8")
+    decoded = codec.loads(line)
+    assert math.isnan(decoded["pf"]) and decoded["edges"][:2] == [float("inf"), -float("inf")]
+    assert codec.dumps({"note": None}) == b'{"note":null}'
+
+
+def test_stamp_adds_ts_ms_next_to_iso():
+    original = {"ts": "2024-05-01T12:00:00.250000+00:00"}
+    event = codec.stamp(original)
+    assert event["ts_ms"] == 1714564800250
+    assert "ts_ms" not in original  # the caller's event is not modified
+    assert codec.stamp({"timestamp": "2024-05-01T12:00:00Z"})["ts_ms"] == 1714564800000
+    # Naive ISO is UTC; events without a timestamp are left alone
+    assert codec.stamp({"ts": "2024-05-01T12:00:00"})["ts_ms"] == 1714564800000
+    assert "ts_ms" not in codec.stamp({"type": "open"})
+    # An existing ts_ms is kept
+    assert codec.stamp({"ts": "2024-05-01T12:00:00Z", "ts_ms": 5})["ts_ms"] == 5
+
+
+def test_ts_ms_of_prefers_stored_field():
+    assert codec.ts_ms_of({"ts": "garbage", "ts_ms": 42}) == 42
+    assert codec.ts_ms_of({"ts": "2024-05-01T12:00:00Z"}) == 1714564800000
+    # ts_ms mirrors "ts", so another key is parsed
+    assert codec.ts_ms_of({"ts": "x", "ts_ms": 42, "exit_ts": "2024-05-01T12:00:00Z"}, "exit_ts") == 1714564800000
+    assert codec.ts_ms_of({"type": "open"}) is None
+
+
+def test_range_reads_filter_on_ts_ms(tmp_path):
+    path = tmp_path / "events.jsonl"
+    start = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    for i in range(10):
+        codec.append_jsonl(path, {"ts": (start + timedelta(hours=i)).isoformat(), "i": i})
+    with path.open("a") as f:
+        f.write('{"ts": "2024-05-01T05:30:00+00:00", "i": "legacy"}\n')  # written before ts_ms existed
+        f.write('{"i": "undated"}\n')
+        f.write("not json\n")
+
+    lo = codec.iso_to_ms(start + timedelta(hours=3))
+    hi = codec.iso_to_ms(start + timedelta(hours=6))
+    got = [r["i"] for r in codec.iter_jsonl(path, since_ms=lo, until_ms=hi)]
+    assert got == [3, 4, 5, "legacy"]
+    assert [r["i"] for r in codec.read_jsonl_range(path, since_ms=lo, limit=2)] == [9, "legacy"]
+    assert len(list(codec.iter_jsonl(path))) == 12
+    assert "undated" in [r["i"] for r in codec.iter_jsonl(path, since_ms=lo, keep_undated=True)]
+
+
+def test_writers_stamp_ts_ms(tmp_path, monkeypatch):
+    from engine_alpha.loop import execute_trade, xray_logger
+
+    trades = tmp_path / "trades.jsonl"
+    monkeypatch.setattr(execute_trade, "_get_trades_path", lambda: trades)
+    execute_trade.log_trade_event({"ts": "2024-05-01T12:00:00+00:00", "type": "open", "symbol": "ETHUSDT"})
+    rec = json.loads(trades.read_text())
+    assert rec["ts_ms"] == 1714564800000 and rec["logger_version"] == "trades_v2"
+
+    atomic_append_jsonl(tmp_path / "a.jsonl", {"timestamp": "2024-05-01T12:00:00+00:00"})
+    assert json.loads((tmp_path / "a.jsonl").read_text())["ts_ms"] == 1714564800000
+
+    monkeypatch.setattr(xray_logger, "XRAY_PATH", tmp_path / "xray" / "latest.jsonl")
+    xray_logger.write_xray_snapshot("ETHUSDT", "15m", "bar", "chop", 1, 0.7, 0.1, True, True, False, True, True)
+    snap = xray_logger.load_recent_xray()[-1]
+    assert snap["ts_ms"] == codec.iso_to_ms(snap["ts"])
+
+
+def test_load_json_cached_reparses_only_on_change(tmp_path):
+    path = tmp_path / "report.json"
+    assert codec.load_json_cached(path) == {}
+    path.write_text(json.dumps({"a": 1}))
+    first = codec.load_json_cached(path)
+    assert first == {"a": 1} and codec.load_json_cached(path) is first
+    path.write_text(json.dumps({"a": 22}))
+    assert codec.load_json_cached(path) == {"a": 22}
+    path.write_text("[1, 2]")
+    assert codec.load_json_cached(str(path)) == {}
@@ -0,0 +1,78 @@
+"""
+Tests for the compiled signal registry / vectorized normalization plan.
+"""
+
+import json
+import math
+import os
+import random
+
+import pytest
+
+from engine_alpha.signals.compiled_registry import compile_registry, get_compiled_registry
+from engine_alpha.signals.signal_processor import _normalize_signal
+
+
+def test_vectorized_normalization_matches_scalar():
+    compiled = get_compiled_registry()
+    rng = random.Random(3)
+    for _ in range(300):
+        raw = [rng.choice([0.0, 1e-7, rng.uniform(-3, 3), rng.uniform(-150, 150), float("nan")]) for _ in compiled.names]
+        vec = compiled.normalize(raw)
+        for i, cfg in enumerate(compiled.configs):
+            expected = _normalize_signal(raw[i], cfg)
+            if math.isnan(expected):
+                assert math.isnan(vec[i])
+            else:
+                assert vec[i] == pytest.approx(expected, abs=1e-12)
+
+
+def test_vectorized_normalization_matches_scalar_with_configured_params():
+    compiled = compile_registry({"signals": [
+        {"name": "A", "source": "live_core_only", "norm": "z-tanh", "mean": 1.5, "std": 2.0},
+        {"name": "B", "source": "live_core_only", "norm": "z-tanh", "mean": -0.5},
+        {"name": "C", "source": "live_core_only", "norm": "z-tanh", "mean": 0.3, "std": 0},
+        {"name": "D", "source": "live_core_only", "norm": "z-tanh"},
+    ]})
+    rng = random.Random(5)
+    for _ in range(200):
+        raw = [rng.choice([0.0, 1e-7, rng.uniform(-3, 3), rng.uniform(-150, 150)]) for _ in compiled.names]
+        vec = compiled.normalize(raw)
+        for i, cfg in enumerate(compiled.configs):
+            assert vec[i] == pytest.approx(_normalize_signal(raw[i], cfg), abs=1e-12)
+
+
+def test_compiled_registry_resolves_fetchers_and_positions():
+    compiled = get_compiled_registry()
+    assert len(compiled) == len(compiled.registry["signals"])
+    for name, idx in compiled.index.items():
+        assert compiled.names[idx] == name
+    for source, fetcher in zip(compiled.sources, compiled.fetchers):
+        if source == "live_core_only":
+            assert fetcher is None
+        else:
+            assert callable(fetcher)
+
+
+def test_compiled_registry_revalidates_on_file_change(tmp_path):
+    path = tmp_path / "signal_registry.json"
+    path.write_text(json.dumps({"signals": [{"name": "A", "source": "live_core_only", "norm": "bounded"}]}))
+    first = get_compiled_registry(path)
+    assert get_compiled_registry(path) is first
+
+    path.write_text(json.dumps({"signals": [
+        {"name": "A", "source": "live_core_only", "norm": "bounded"},
+        {"name": "B", "source": "live_core_only", "norm": "z-tanh", "mean": 1.0, "std": 2.0},
+    ]}))
+    os.utime(path, ns=(first.stamp[0] + 10**9, first.stamp[0] + 10**9))
+    second = get_compiled_registry(path)
+    assert second is not first
+    assert second.names == ("A", "B")
+    # Configured z-tanh parameters are honoured
+    assert second.normalize([0.5, 3.0])[1] == pytest.approx(math.tanh(((3.0 - 1.0) / 2.0) / 2.0))
+    get_compiled_registry()  # restore default cache
+
+
+def test_compile_registry_missing_fetcher_is_none():
+    compiled = compile_registry({"signals": [{"name": "X", "source": "does_not_exist"}]})
+    assert compiled.fetchers == (None,)
@@ -0,0 +1,118 @@
+"""
+Tests for the incremental EW covariance on aligned bar returns and its report.
+"""
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine_alpha.research import correlation_engine
+from engine_alpha.research.correlation_engine import EWCovariance, cluster_symbols, load_correlation_view
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _bars(closes, offset=0):
+    return [{"ts": (START + timedelta(minutes=15 * (offset + i))).isoformat(),
+             "open": c, "high": c, "low": c, "close": c, "volume": 1.0} for i, c in enumerate(closes)]
+
+
+def _paths(n, seed=0):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, n)
+    moves = {
+        "BTCUSDT": market + rng.normal(0, 0.002, n),
+        "ETHUSDT": market + rng.normal(0, 0.003, n),
+        "DOGEUSDT": rng.normal(0, 0.02, n),
+    }
+    return {s: 100 * np.exp(np.concatenate([[0.0], np.cumsum(r)])) for s, r in moves.items()}
+
+
+def _reference(returns, alpha):
+    """Direct EW moments: weights (1-a)^(n-1-t) on the observations (first one seeds the mean)."""
+    n = len(returns)
+    mean = returns[0].copy()
+    cov = np.zeros((returns.shape[1],) * 2)
+    for t in range(1, n):
+        d = returns[t] - mean
+        mean = mean + alpha * d
+        cov = (1 - alpha) * (cov + alpha * np.outer(d, d))
+    return mean, cov
+
+
+def test_incremental_matches_batch_and_reference():
+    closes = _paths(300)
+    bars = {s: _bars(c) for s, c in closes.items()}
+
+    batch = EWCovariance(halflife_bars=50)
+    assert batch.apply_bars(bars) == 300
+    assert batch.apply_bars(bars) == 0  # Nothing new
+
+    # Overlapping 200-bar windows, like the per-tick snapshot
+    ticked = EWCovariance(halflife_bars=50)
+    for end in range(120, 302, 7):
+        ticked.apply_bars({s: rows[max(0, end - 200):end] for s, rows in bars.items()})
+    ticked.apply_bars(bars)
+    assert ticked.symbols == batch.symbols == ["BTCUSDT", "DOGEUSDT", "ETHUSDT"]
+    np.testing.assert_allclose(ticked.cov, batch.cov)
+
+    returns = np.column_stack([np.diff(np.log(closes[s])) for s in batch.symbols])
+    mean, cov = _reference(returns, batch.alpha)
+    np.testing.assert_allclose(batch.mean, mean)
+    np.testing.assert_allclose(batch.cov, cov)
+
+    corr = batch.correlation()
+    assert corr[0, 2] > 0.8 and abs(corr[0, 1]) < 0.3
+    assert batch.clusters() == [["BTCUSDT", "ETHUSDT"], ["DOGEUSDT"]]
+
+
+def test_late_symbol_and_missing_bars():
+    closes = _paths(120, seed=1)
+    engine = EWCovariance(halflife_bars=40)
+    engine.apply_bars({"BTCUSDT": _bars(closes["BTCUSDT"][:80])})
+    # ETH joins later with history overlapping what BTC already applied
+    engine.apply_bars({"BTCUSDT": _bars(closes["BTCUSDT"]), "ETHUSDT": _bars(closes["ETHUSDT"])})
+    i, j = engine.symbols.index("BTCUSDT"), engine.symbols.index("ETHUSDT")
+    assert engine.obs[i, i] == 120 and engine.obs[j, j] == engine.obs[i, j] == 41
+    assert math.isfinite(engine.correlation()[i, j])
+
+    engine.apply_bars({"ETHUSDT": _bars([1.0, 1.1], offset=121)})
+    assert engine.obs[i, i] == 120 and engine.obs[j, j] == 42
+
+
+def test_cluster_symbols_links_transitively():
+    corr = np.array([[1, 0.8, 0.1, np.nan], [0.8, 1, 0.75, 0], [0.1, 0.75, 1, 0], [np.nan, 0, 0, 1]])
+    assert cluster_symbols(["A", "B", "C", "D"], corr, 0.7) == [["A", "B", "C"], ["D"]]
+
+
+def test_snapshot_update_writes_report_and_state(tmp_path, monkeypatch):
+    from engine_alpha.data.market_snapshot import MarketSnapshot, SymbolSnapshot
+
+    monkeypatch.setattr(correlation_engine, "CORRELATION_MATRIX_PATH", tmp_path / "correlation_matrix.json")
+    monkeypatch.setattr(correlation_engine, "CORRELATION_STATE_PATH", tmp_path / "correlation_state.json")
+    monkeypatch.setattr(correlation_engine, "_engine", None)
+
+    closes = _paths(200, seed=2)
+    snapshot = MarketSnapshot(version=1, created_at=0.0, timeframe="15m", symbols={
+        s: SymbolSnapshot(symbol=s, timeframe="15m", bars=tuple(_bars(c))) for s, c in closes.items()
+    })
+    report = correlation_engine.update_from_snapshot(snapshot)
+    assert correlation_engine.update_from_snapshot(snapshot) is None
+
+    assert report["symbols"] == ["BTCUSDT", "DOGEUSDT", "ETHUSDT"]
+    assert report["matrix"]["BTCUSDT"]["BTCUSDT"] == 1.0
+    assert report["matrix"]["BTCUSDT"]["ETHUSDT"] == report["matrix"]["ETHUSDT"]["BTCUSDT"] > 0.7
+    assert report["cluster_of"]["ETHUSDT"] == report["cluster_of"]["BTCUSDT"] == 0
+    assert report["volatility"]["DOGEUSDT"] > report["volatility"]["BTCUSDT"]
+    assert load_correlation_view(tmp_path / "correlation_matrix.json")["clusters"] == report["clusters"]
+
+    # A new process resumes from the state file
+    monkeypatch.setattr(correlation_engine, "_engine", None)
+    resumed = correlation_engine.get_engine()
+    state = json.loads((tmp_path / "correlation_state.json").read_text())
+    assert resumed.last_bar_ms == state["last_bar_ms"] == int((START + timedelta(minutes=15 * 200)).timestamp() * 1000)
+    np.testing.assert_allclose(resumed.cov, np.asarray(state["cov"]))
+    assert resumed.correlation()[0, 2] == pytest.approx(report["matrix"]["BTCUSDT"]["ETHUSDT"], abs=1e-4)
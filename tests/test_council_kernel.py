@@ -0,0 +1,77 @@
+"""
+Parity tests for the batched council kernel vs confidence_engine.decide.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from engine_alpha.core.confidence_engine import decide, REGIME_BUCKET_MASK
+from engine_alpha.core.council_kernel import (
+    classify_regimes_batch,
+    decide_batch,
+    get_council_layout,
+)
+from engine_alpha.core.regime import RegimeClassifier
+
+REGIMES = sorted(set(REGIME_BUCKET_MASK) | {"trend_up", "trend_down", "panic_down", "high_vol", "chop", "unknown"})
+
+
+def _random_matrix(n_steps: int, seed: int) -> np.ndarray:
+    rng = random.Random(seed)
+    n_signals = get_council_layout().n_signals
+    rows = []
+    for _ in range(n_steps):
+        # Mix of strong, weak and exactly-zero signals to hit every bucket branch
+        rows.append([rng.choice([0.0, rng.uniform(-0.04, 0.04), rng.uniform(-1.0, 1.0)]) for _ in range(n_signals)])
+    return np.array(rows, dtype=float)
+
+
+@pytest.mark.parametrize("mode", ["PAPER", "LIVE"])
+@pytest.mark.parametrize("regime", REGIMES)
+def test_decide_batch_matches_decide(monkeypatch, mode, regime):
+    monkeypatch.setenv("MODE", mode)
+    X = _random_matrix(60, seed=REGIMES.index(regime) + (0 if mode == "PAPER" else 100))
+    batch = decide_batch(X, regime)
+    for i, row in enumerate(X):
+        ref = decide(list(row), {}, regime_override=regime)
+        assert batch["dir"][i] == ref["final"]["dir"]
+        assert batch["conf"][i] == pytest.approx(ref["final"]["conf"], abs=1e-12)
+        assert batch["score"][i] == pytest.approx(ref["final"]["score"], abs=1e-12)
+        assert batch["regime"][i] == ref["regime"]
+
+
+def test_decide_batch_per_step_regimes_and_short_vectors(monkeypatch):
+    monkeypatch.setenv("MODE", "PAPER")
+    X = _random_matrix(len(REGIMES), seed=7)
+    batch = decide_batch(X, REGIMES)
+    for i, regime in enumerate(REGIMES):
+        ref = decide(list(X[i]), {}, regime_override=regime)
+        assert batch["dir"][i] == ref["final"]["dir"]
+        assert batch["conf"][i] == pytest.approx(ref["final"]["conf"], abs=1e-12)
+
+    # Ragged input: short vectors behave like decide() skipping missing signals
+    short = [list(X[0][:3]), list(X[1])]
+    batch = decide_batch(short, "chop")
+    for i, vec in enumerate(short):
+        ref = decide(vec, {}, regime_override="chop")
+        assert batch["dir"][i] == ref["final"]["dir"]
+        assert batch["conf"][i] == pytest.approx(ref["final"]["conf"], abs=1e-12)
+
+
+def test_classify_regimes_batch_matches_stateful_classifier(monkeypatch):
+    monkeypatch.setenv("MODE", "PAPER")
+    X = _random_matrix(150, seed=11)
+    classifier = RegimeClassifier(window_size=20)
+    expected = [classifier.classify(list(row), {})["regime"] for row in X]
+    got = classify_regimes_batch(X, window_size=20)
+    assert list(got) == expected
+
+    # Feeding the regimes through the kernel matches decide() with a shared classifier
+    classifier = RegimeClassifier(window_size=20)
+    batch = decide_batch(X, got)
+    for i, row in enumerate(X):
+        ref = decide(list(row), {}, classifier)
+        assert batch["dir"][i] == ref["final"]["dir"]
+        assert batch["conf"][i] == pytest.approx(ref["final"]["conf"], abs=1e-12)
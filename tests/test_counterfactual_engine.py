@@ -0,0 +1,126 @@
+"""
+Tests for the bar-level counterfactual engine and the ledger decision index.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine_alpha.reflect.counterfactual_engine import (
+    BarSeries,
+    DecisionIndex,
+    ExitRules,
+    resolve_decisions,
+    simulate_forward_paths,
+)
+from engine_alpha.reflect.counterfactual_ledger import CounterfactualDecision, CounterfactualLedger
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _series(closes, spread=0.001):
+    rows = []
+    for i, c in enumerate(closes):
+        rows.append({
+            "ts": (T0 + timedelta(minutes=15 * i)).isoformat(),
+            "open": c, "high": c * (1 + spread), "low": c * (1 - spread), "close": c,
+        })
+    return BarSeries.from_rows("ETHUSDT", "15m", rows)
+
+
+def _reference(series, i, direction, rules):
+    """Scalar bar-by-bar walk used as the parity reference."""
+    sign = -1.0 if direction < 0 else 1.0
+    entry = series.close[i]
+    for step in range(1, rules.max_bars + 1):
+        j = i + step
+        if j >= len(series):
+            return float((series.close[j - 1] / entry - 1) * sign) if step > 1 else None, "time" if step > 1 else "no_data"
+        fav = (series.high[j] / entry - 1) if sign > 0 else (1 - series.low[j] / entry)
+        adv = (series.low[j] / entry - 1) if sign > 0 else (1 - series.high[j] / entry)
+        if adv <= -rules.stop_loss_pct:
+            return -rules.stop_loss_pct, "sl"
+        if fav >= rules.take_profit_pct:
+            return rules.take_profit_pct, "tp"
+    return float((series.close[i + rules.max_bars] / entry - 1) * sign), "time"
+
+
+def test_vectorized_paths_match_scalar_walk():
+    rng = np.random.default_rng(5)
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.004, 400))
+    series = _series(closes, spread=0.003)
+    rules = ExitRules(horizons=(1, 8), take_profit_pct=0.015, stop_loss_pct=0.01, max_bars=24)
+    idx = np.arange(0, 399, 3)
+    dirs = np.where(idx % 2 == 0, 1, -1)
+    out = simulate_forward_paths(series, idx, dirs, rules)
+    for k, (i, d) in enumerate(zip(idx, dirs)):
+        ret, reason = _reference(series, i, d, rules)
+        assert out["exit_reason"][k] == reason
+        if ret is None:
+            assert np.isnan(out["exit_return"][k])
+        else:
+            assert out["exit_return"][k] == pytest.approx(ret)
+        sign = -1 if d < 0 else 1
+        if i + 8 < len(series):
+            assert out["horizon_returns"][k, 1] == pytest.approx((series.close[i + 8] / series.close[i] - 1) * sign)
+
+
+def test_resolve_decisions_uses_closed_bar_and_groups_symbols():
+    series = _series([100.0, 101.0, 102.0, 103.0, 104.0])
+    decisions = [
+        {"ts": (T0 + timedelta(minutes=16)).isoformat(), "symbol": "ETHUSDT", "direction": 1},
+        {"ts": (T0 - timedelta(hours=1)).isoformat(), "symbol": "ETHUSDT", "direction": 1},
+        {"ts": T0.isoformat(), "symbol": "BTCUSDT", "direction": -1},
+    ]
+    rules = ExitRules(horizons=(2,), take_profit_pct=None, stop_loss_pct=None, max_bars=2)
+    out = resolve_decisions(decisions, rules, loader=lambda s, tf: series if s == "ETHUSDT" else None)
+    # First 15m bar closed at T0+15m -> entry at close 100, +2 bars -> 102
+    assert out[0]["entry_price"] == 100.0
+    assert out[0]["horizon_returns"]["2"] == pytest.approx(0.02)
+    assert out[0]["exit_reason"] == "time"
+    assert out[1]["exit_reason"] == "no_data"
+    assert out[2]["exit_reason"] == "no_data"
+
+
+def test_decision_index_lookup_and_incremental_refresh(tmp_path):
+    ledger = CounterfactualLedger(ledger_file=tmp_path / "cf.jsonl")
+    for minutes, sym, dtype in [(0, "ETHUSDT", "entry"), (30, "BTCUSDT", "entry"), (60, "ETHUSDT", "skip")]:
+        ledger.record_decision(CounterfactualDecision(
+            ts=T0 + timedelta(minutes=minutes), symbol=sym, direction=1, confidence=0.6,
+            regime="chop", entry_price=100.0, market_state={}, decision_type=dtype,
+        ))
+    found = ledger._find_matching_decision("ETHUSDT", T0 + timedelta(minutes=90))
+    assert found.ts == T0 and found.decision_type == "entry"
+    assert ledger._find_matching_decision("ETHUSDT", T0 + timedelta(hours=30)) is None
+
+    index = DecisionIndex(tmp_path / "cf.jsonl")
+    assert len(index.range(T0, T0 + timedelta(days=1))) == 3
+    with (tmp_path / "cf.jsonl").open("a") as f:
+        f.write(json.dumps({"type": "decision", "ts": (T0 + timedelta(minutes=5)).isoformat(),
+                            "symbol": "ETHUSDT", "direction": -1, "decision_type": "entry"}) + "\n")
+    # Out-of-order append is still found via the sorted index
+    rec = index.latest("ETHUSDT", T0 + timedelta(minutes=10))
+    assert rec["direction"] == -1
+    assert [r["symbol"] for r in index.range(T0, T0 + timedelta(minutes=31), symbol="ETHUSDT")] == ["ETHUSDT", "ETHUSDT"]
+
+
+def test_resolve_day_is_idempotent(tmp_path, monkeypatch):
+    from engine_alpha.reflect import counterfactual_ledger as cl
+
+    ledger = CounterfactualLedger(ledger_file=tmp_path / "cf.jsonl")
+    for i, symbol in enumerate(["ETHUSDT", "BTCUSDT", "ETHUSDT"]):
+        ledger.record_decision(CounterfactualDecision(
+            ts=T0 + timedelta(minutes=15 * i), symbol=symbol, direction=1, confidence=0.7,
+            regime="trend", entry_price=100.0, market_state={}, decision_type="entry",
+        ))
+    monkeypatch.setattr(cl, "resolve_decisions", lambda decisions, rules, timeframe: [
+        {"type": "cf_resolution", "decision_ts": d["ts"], "symbol": d["symbol"], "decision_type": d["decision_type"]}
+        for d in decisions
+    ])
+
+    assert len(ledger.resolve_decisions_for_day(T0.date())) == 3
+    assert len(ledger.resolve_decisions_for_day(T0.date())) == 3  # re-run / retry
+    lines = ledger.resolutions_file.read_text().splitlines()
+    assert len(lines) == 3
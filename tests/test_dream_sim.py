@@ -0,0 +1,117 @@
+"""
+Parity tests for the batched dream simulation engine vs the scalar replay.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from engine_alpha.core.confidence_engine import decide
+from engine_alpha.core.council_kernel import get_council_layout
+from engine_alpha.core.regime import RegimeClassifier
+from engine_alpha.reflect.dream_sim import (
+    DreamSteps,
+    best_by_regime,
+    build_gate_grid,
+    collect_dream_steps,
+    simulate_gate_grid,
+)
+
+
+def _scalar_pf(steps, entry_min, exit_min, flip_min):
+    """Reference: the original per-combo dream_mode replay."""
+    position = 0
+    wins = 0.0
+    losses = 0.0
+    for step in steps:
+        direction, conf, ret = step["dir"], step["conf"], step["ret"]
+        if position == 0:
+            if direction != 0 and conf >= entry_min:
+                position = direction
+        else:
+            pnl = position * ret
+            if pnl > 0:
+                wins += pnl
+            elif pnl < 0:
+                losses += -pnl
+            if conf < exit_min:
+                position = 0
+            elif direction != 0 and direction != position and conf >= flip_min:
+                position = direction
+    if losses <= 0:
+        return wins if wins > 0 else 1.0
+    return wins / losses
+
+
+def _random_steps(n, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "dir": rng.choice([-1, 0, 1]),
+            "conf": round(rng.uniform(0.3, 0.8), 4),
+            "ret": rng.uniform(-0.02, 0.02),
+            "regime": rng.choice(["trend", "chop", "high_vol"]),
+        }
+        for _ in range(n)
+    ]
+
+
+def test_grid_matches_original_27_combos():
+    grid = build_gate_grid(0.6, 0.42, 0.55, offsets=(-0.02, 0.0, 0.02))
+    assert grid.shape == (27, 3)
+    assert tuple(grid[0]) == (0.6 - 0.02, 0.42 - 0.02, 0.55 - 0.02)
+    assert build_gate_grid(0.6, 0.42, 0.55).shape == (729, 3)
+    # Clamped duplicates collapse
+    assert build_gate_grid(0.01, 0.01, 0.01, offsets=(-0.02, 0.0, 0.02)).shape == (8, 3)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_grid_pf_matches_scalar_replay(seed):
+    records = _random_steps(250, seed)
+    steps = DreamSteps.from_records(records)
+    grid = build_gate_grid(0.55, 0.45, 0.6)
+    sim = simulate_gate_grid(steps, grid)
+    for i in range(0, grid.shape[0], 17):
+        e, x, f = grid[i]
+        assert sim["pf"][i] == _scalar_pf(records, e, x, f)
+
+
+def test_regime_attribution_sums_to_totals():
+    steps = DreamSteps.from_records(_random_steps(200, 7))
+    grid = build_gate_grid(0.5, 0.45, 0.55)
+    sim = simulate_gate_grid(steps, grid, by_regime=True)
+    assert set(sim["regimes"]) == {"chop", "high_vol", "trend"}
+    assert sim["trades_by_regime"].sum(axis=1).tolist() == sim["trades"].tolist()
+
+    best = best_by_regime(grid, sim)
+    for regime, combo in best.items():
+        j = sim["regimes"].index(regime)
+        assert combo["pf_cf"] == pytest.approx(sim["pf_by_regime"][:, j][sim["trades_by_regime"][:, j] >= 1].max())
+
+
+def test_empty_window_is_neutral():
+    steps = DreamSteps.from_records([])
+    sim = simulate_gate_grid(steps, build_gate_grid(0.6, 0.42, 0.55))
+    assert np.all(sim["pf"] == 1.0)
+
+
+def test_collect_steps_matches_decide_loop(monkeypatch):
+    monkeypatch.setenv("MODE", "PAPER")
+    names = get_council_layout().signal_names
+    rng = random.Random(5)
+    feed = []
+    for _ in range(60):
+        vec = [rng.choice([0.0, rng.uniform(-1.0, 1.0)]) for _ in names]
+        raw = {name: {"value": rng.uniform(-0.05, 0.05)} for name in names}
+        feed.append({"signal_vector": vec, "raw_registry": raw})
+    it = iter(feed)
+
+    steps = collect_dream_steps(len(feed), signal_fn=lambda: next(it))
+
+    classifier = RegimeClassifier()
+    for i, item in enumerate(feed):
+        ref = decide(item["signal_vector"], item["raw_registry"], classifier)
+        assert steps.dir[i] == ref["final"]["dir"]
+        assert steps.conf[i] == pytest.approx(ref["final"]["conf"], abs=1e-12)
+        assert steps.ret[i] == item["raw_registry"]["Ret_G5"]["value"]
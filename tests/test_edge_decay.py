@@ -0,0 +1,134 @@
+"""
+Tests for the vectorized edge decay fit and the batched edge half-life state.
+"""
+
+import json
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.reflect import edge_half_life
+from engine_alpha.reflect.edge_decay import CloseSeries, fit_edge_decay, load_close_series, relative_strength
+from engine_alpha.reflect.edge_half_life import EdgeHalfLifeTracker
+
+NOW = datetime.now(timezone.utc)
+
+
+def _pf(returns):
+    wins = [r for r in returns if r > 0]
+    losses = [-r for r in returns if r < 0]
+    if not wins or not losses:
+        return None
+    return (sum(wins) / len(wins)) / (sum(losses) / len(losses))
+
+
+def _reference_decay(returns, min_samples=20):
+    """Scalar decay model, one symbol at a time (the per-symbol loop it replaces)."""
+    if len(returns) < min_samples:
+        return {"model_type": "default_assumption", "half_life_days": 30.0, "decay_rate": 0.02}
+    rolling = {}
+    for days in (7, 14, 30, 60, 90):
+        size = days * 2
+        pfs = []
+        for i in range(0, len(returns) - size + 1, size // 4):
+            pf = _pf(returns[i:i + size])
+            if pf is not None:
+                pfs.append(pf)
+        if pfs:
+            rolling[days] = sum(pfs) / len(pfs)
+    if not rolling:
+        return {"model_type": "insufficient_data", "half_life_days": 30.0, "decay_rate": 0.02}
+    peak_pf = max(rolling.values())
+    peak_window = max(rolling, key=lambda k: rolling[k])
+    points = [(abs(d - peak_window), pf / peak_pf) for d, pf in rolling.items() if pf > 0.8 and pf / peak_pf > 0]
+    if len(points) >= 3:
+        n = len(points)
+        sum_t = sum(t for t, _ in points)
+        sum_lr = sum(math.log(max(r, 0.01)) for _, r in points)
+        sum_t_lr = sum(t * math.log(max(r, 0.01)) for t, r in points)
+        sum_t2 = sum(t * t for t, _ in points)
+        if n * sum_t2 - sum_t * sum_t != 0:
+            rate = max(0.001, min(0.1, -(n * sum_t_lr - sum_t * sum_lr) / (n * sum_t2 - sum_t * sum_t)))
+            return {"model_type": "exponential_decay_fit", "decay_rate": rate,
+                    "half_life_days": max(7, min(180, math.log(0.5) / -rate)), "peak_pf": peak_pf}
+    return {"model_type": "empirical_fallback", "half_life_days": 45.0, "decay_rate": 0.015}
+
+
+def _returns(n, seed, drift=0.0):
+    rng = random.Random(seed)
+    return [round(rng.gauss(drift, 0.01), 5) for _ in range(n)]
+
+
+def test_batch_fit_matches_scalar_reference():
+    by_symbol = {f"S{i}USDT": _returns(n, seed=i, drift=0.002 * (i % 3 - 1))
+                 for i, n in enumerate([5, 19, 40, 120, 200, 333, 180])}
+    by_symbol["FLATUSDT"] = [0.01] * 60  # No losses: no window PF at all
+    series = CloseSeries.from_returns(by_symbol)
+    models = fit_edge_decay(series)
+
+    for symbol, model in zip(series.symbols, models):
+        expected = _reference_decay(by_symbol[symbol])
+        assert model["model_type"] == expected["model_type"], symbol
+        for key in ("half_life_days", "decay_rate", "peak_pf"):
+            if key in expected:
+                assert model[key] == pytest.approx(expected[key]), (symbol, key)
+
+    current = [_pf(r[-30:]) or 1.0 for r in by_symbol.values()]
+    strengths = relative_strength(series, current)
+    for row, (symbol, returns) in enumerate(by_symbol.items()):
+        pfs = [pf for i in range(0, len(returns) - 29, 15) if (pf := _pf(returns[i:i + 30])) is not None]
+        if not pfs:
+            assert strengths[row] == 0.5
+            continue
+        mean = sum(pfs) / len(pfs)
+        std = math.sqrt(sum((p - mean) ** 2 for p in pfs) / len(pfs))
+        expected = 0.5 if std == 0 else 1.0 / (1.0 + math.exp(-(current[row] - mean) / std))
+        assert strengths[row] == pytest.approx(expected), symbol
+
+
+def test_series_windows_follow_close_times(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    with path.open("w") as f:
+        for i in range(12):
+            ts = (NOW - timedelta(days=12 - i)).isoformat()
+            f.write(json.dumps({"type": "close", "symbol": "ETHUSDT", "pct": i, "ts": ts}) + "\n")
+        f.write(json.dumps({"type": "open", "symbol": "ETHUSDT", "pct": 99}) + "\n")
+        f.write(json.dumps({"type": "close", "symbol": "BTCUSDT", "pct": 1.0, "ts": NOW.isoformat()}) + "\n")
+
+    series = load_close_series(path)
+    assert series.symbols == ["BTCUSDT", "ETHUSDT"]
+    cutoff = int((NOW - timedelta(days=5, hours=1)).timestamp() * 1000)
+    recent = series.since(cutoff).select(["ETHUSDT", "SOLUSDT"])
+    assert recent.returns[0, : recent.lengths[0]].tolist() == [7, 8, 9, 10, 11]
+    assert recent.lengths.tolist() == [5, 0]
+    assert series.last(3).returns[1].tolist() == [9, 10, 11]
+
+
+def test_analyze_all_symbols_writes_compact_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(edge_half_life.fvg_detector, "get_fvg_statistics", lambda *a, **k: {"status": "no_data"})
+    trades = tmp_path / "trades.jsonl"
+    with trades.open("w") as f:
+        for symbol, n, seed in (("ETHUSDT", 150, 1), ("BTCUSDT", 60, 2), ("SOLUSDT", 5, 3)):
+            for i, pct in enumerate(_returns(n, seed, drift=0.001)):
+                ts = (NOW - timedelta(hours=n - i)).isoformat()
+                f.write(json.dumps({"type": "close", "symbol": symbol, "pct": pct, "ts": ts}) + "\n")
+
+    tracker = EdgeHalfLifeTracker(state_file=tmp_path / "edge_state.json")
+    results = tracker.analyze_all_symbols(trades, now=NOW)
+    assert sorted(results) == ["BTCUSDT", "ETHUSDT"]  # SOLUSDT has too few closes
+    size = tracker.state_file.stat().st_size
+    for _ in range(15):
+        tracker.analyze_all_symbols(trades, now=NOW)
+    assert tracker.state_file.stat().st_size < size * 3
+
+    state = tracker.symbol_states()["ETHUSDT"]
+    assert state["edge_metrics"]["total_trades"] == 30
+    assert len(state["recent"]) == 10
+    assert state["daily_counts"] == {NOW.date().isoformat(): 16}
+    assert state["edge_strength"]["half_life_days"] == results["ETHUSDT"].half_life_days
+
+    health = tracker.get_edge_health_assessment("ETHUSDT")
+    assert health["data_points"] == 16
+    assert health["current_strength"] == pytest.approx(results["ETHUSDT"].absolute_strength)
@@ -0,0 +1,103 @@
+"""
+Tests for the concurrent signal fetch executor.
+"""
+
+import threading
+import time
+
+from engine_alpha.signals.fetch_executor import clear_fetch_memo, run_fetchers
+
+
+def _job(pos, name, fn, io_bound=True):
+    return (pos, name, fn, io_bound)
+
+
+def test_io_bound_fetchers_run_concurrently_and_memoize():
+    clear_fetch_memo()
+    calls = []
+    lock = threading.Lock()
+
+    def slow(symbol, timeframe, context):
+        with lock:
+            calls.append(symbol)
+        time.sleep(0.2)
+        return 1.5
+
+    jobs = [_job(i, f"slow_{i}", slow) for i in range(4)]
+    started = time.monotonic()
+    out = run_fetchers(jobs, "ETHUSDT", "15m", {}, bar_key="bar-1", concurrent=True, deadline_seconds=2.0)
+    assert time.monotonic() - started < 0.6
+    assert all(out[i].value == 1.5 and out[i].error is None for i in range(4))
+
+    # Same bar: served from memo without calling the fetchers again
+    out = run_fetchers(jobs, "ETHUSDT", "15m", {}, bar_key="bar-1", concurrent=True, deadline_seconds=2.0)
+    assert len(calls) == 4
+    assert all(o.memo_hit for o in out.values())
+
+
+def test_deadline_miss_falls_back_to_last_value_with_staleness():
+    clear_fetch_memo()
+    delay = {"s": 0.0}
+
+    def fetcher(symbol, timeframe, context):
+        time.sleep(delay["s"])
+        return 0.7
+
+    jobs = [_job(0, "flow", fetcher)]
+    assert run_fetchers(jobs, "BTCUSDT", "15m", {}, bar_key="bar-1", concurrent=True)[0].value == 0.7
+
+    delay["s"] = 0.5
+    out = run_fetchers(jobs, "BTCUSDT", "15m", {}, bar_key="bar-2", concurrent=True, deadline_seconds=0.05)[0]
+    assert out.stale and out.value == 0.7 and out.stale_age_s >= 0.0
+
+    # No previous value: the deadline miss surfaces as an error
+    out = run_fetchers(jobs, "SOLUSDT", "15m", {}, bar_key="bar-2", concurrent=True, deadline_seconds=0.05)[0]
+    assert isinstance(out.error, TimeoutError)
+
+
+def test_sequential_mode_preserves_errors_and_order():
+    order = []
+
+    def ok(symbol, timeframe, context):
+        order.append("ok")
+        return 2
+
+    def broken(symbol, timeframe):
+        order.append("broken")
+        return 0
+
+    out = run_fetchers([_job(0, "ok", ok, False), _job(1, "broken", broken, True)], "ETHUSDT", "15m", {}, concurrent=False)
+    assert order == ["ok"]
+    assert out[0].value == 2
+    assert isinstance(out[1].error, TypeError)
+
+
+def test_live_vector_fetches_funding_once_per_bar(monkeypatch):
+    from engine_alpha.signals import signal_processor
+
+    clear_fetch_memo()
+    calls = []
+
+    def funding(symbol):
+        calls.append(symbol)
+        return 0.25
+
+    monkeypatch.setattr(signal_processor, "get_funding_bias", funding)
+    monkeypatch.setattr(signal_processor, "PCI_AVAILABLE", False)
+    rows = [
+        {"ts": f"2026-01-01T{i // 4:02d}:{15 * (i % 4):02d}:00+00:00", "open": 100.0 + i, "high": 101.0 + i,
+         "low": 99.0 + i, "close": 100.5 + i, "volume": 10.0}
+        for i in range(40)
+    ]
+    first = signal_processor.get_signal_vector_live("ETHUSDT", "15m", rows=rows)
+    second = signal_processor.get_signal_vector_live("ETHUSDT", "15m", rows=rows)
+    assert first["raw_registry"]["Funding_Bias"]["value"] == second["raw_registry"]["Funding_Bias"]["value"] == 0.25
+    assert calls == ["ETHUSDT"]
+
+    signal_processor.get_signal_vector_live("ETHUSDT", "15m", rows=rows + [dict(rows[-1], ts="2026-01-01T10:00:00+00:00")])
+    assert calls == ["ETHUSDT", "ETHUSDT"]
+
+    offline = signal_processor.get_signal_vector_live("ETHUSDT", "15m", rows=rows, offline=True, funding_bias=-0.1)
+    assert offline["raw_registry"]["Funding_Bias"]["value"] == -0.1
+    assert offline["context"]["mode"] == "replay"
+    assert calls == ["ETHUSDT", "ETHUSDT"]  # offline vectors never fetch funding
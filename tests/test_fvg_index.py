@@ -0,0 +1,124 @@
+"""
+Tests for the array FVG scan, the open-gap interval index and the gap snapshot.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.reflect.fair_value_gaps import FVGDetector
+from engine_alpha.reflect.fvg_index import BULLISH, GapIndex, scan_fvgs
+
+START = int((datetime.now(timezone.utc) - timedelta(days=3)).timestamp()) // 60 * 60
+
+
+def _candles(n, seed, start=START, step=60):
+    rng = random.Random(seed)
+    price, out = 100.0, []
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.gauss(0, 0.006))
+        h, l = max(o, c) * (1 + abs(rng.gauss(0, 0.002))), min(o, c) * (1 - abs(rng.gauss(0, 0.002)))
+        out.append({"timestamp": start + i * step, "open": o, "high": h, "low": l, "close": c, "volume": 1000.0})
+        price = c
+    return out
+
+
+def _reference_hits(candles, min_pct=0.1, max_pct=5.0):
+    """Per-position three-bar check, one candle triple at a time."""
+    hits = []
+    for i in range(len(candles) - 2):
+        c1, c3 = candles[i], candles[i + 2]
+        if c3["low"] > c1["high"]:
+            pct = (c3["low"] - c1["high"]) / c1["high"] * 100
+            if min_pct <= pct <= max_pct:
+                hits.append((i + 2, "bullish", c3["low"], c1["high"]))
+        elif c3["high"] < c1["low"]:
+            pct = (c1["low"] - c3["high"]) / c1["low"] * 100
+            if min_pct <= pct <= max_pct:
+                hits.append((i + 2, "bearish", c1["low"], c3["high"]))
+    return hits
+
+
+def test_scan_matches_per_position_check():
+    candles = _candles(3000, seed=1)
+    hits = scan_fvgs(*([c[k] for c in candles] for k in ("open", "high", "low", "close")), 0.1, 5.0)
+    got = [(int(b), "bullish" if d == BULLISH else "bearish", u, l)
+           for b, d, u, l in zip(hits["bar"], hits["direction"], hits["upper"], hits["lower"])]
+    assert got == _reference_hits(candles)
+    assert len(got) > 20
+    assert ((hits["impulse"] >= 0) & (hits["impulse"] <= 1)).all()
+
+
+def test_gap_index_overlap_matches_brute_force():
+    rng = random.Random(2)
+    index, live = GapIndex(), {}
+    for step in range(3000):
+        if live and rng.random() < 0.3:
+            gap_id = rng.choice(sorted(live))
+            assert index.remove(gap_id)
+            del live[gap_id]
+        else:
+            lower = rng.uniform(0, 100)
+            live[f"g{step}"] = (lower, lower + rng.uniform(0.01, 5))
+            index.add(f"g{step}", *live[f"g{step}"])
+        low = rng.uniform(0, 100)
+        high = low + rng.uniform(0, 3)
+        expected = {g for g, (lo, up) in live.items() if min(high, up) - max(low, lo) > 0}
+        assert set(index.overlapping(low, high)) == expected
+    assert len(index) == len(live)
+    assert [g for g, _, _ in index.items()] == sorted(live, key=lambda g: live[g][0])
+
+
+def test_incremental_calls_match_single_scan(tmp_path):
+    candles = _candles(1200, seed=3)
+    whole = FVGDetector(gap_log_file=tmp_path / "a" / "fvg.jsonl", gap_expiry_candles=150)
+    found = whole.detect_fvgs("ETHUSDT", list(reversed(candles)), "chop")
+    assert len(found) == len(_reference_hits(candles))
+
+    chunked = FVGDetector(gap_log_file=tmp_path / "b" / "fvg.jsonl", gap_expiry_candles=150)
+    pieces = []
+    for i in range(0, len(candles), 37):
+        # Overlapping windows, like the live loop passing its last 50 candles
+        pieces += chunked.detect_fvgs("ETHUSDT", candles[max(0, i - 13):i + 37], "chop")
+    assert pieces == found
+    assert chunked.recent_gaps(30, "ETHUSDT") == whole.recent_gaps(30, "ETHUSDT")
+
+    stats = whole.get_fvg_statistics("ETHUSDT", days_back=30)
+    by_status = stats["gaps_by_status"]
+    assert stats["total_gaps"] == len(found)
+    assert by_status["filled"] > 0 and by_status["expired"] > 0 and by_status["active"] > 0
+
+
+def test_fill_expiry_and_snapshot_round_trip(tmp_path):
+    detector = FVGDetector(gap_log_file=tmp_path / "fvg.jsonl", gap_expiry_candles=3)
+    bar = lambda i, h, l: {"ts": datetime.fromtimestamp(START + i * 60, tz=timezone.utc).isoformat(),
+                           "open": l, "high": h, "low": l, "close": h, "volume": 1.0}
+    gaps = detector.detect_fvgs("ETHUSDT", [bar(0, 100, 99), bar(1, 103, 100), bar(2, 104, 102)], "trend_up")
+    assert [(g.direction, g.lower_bound, g.upper_bound) for g in gaps] == [("bullish", 100, 102)]
+    assert detector.detect_fvgs("ETHUSDT", [bar(2, 104, 102)], "trend_up") == []  # Already scanned
+
+    detector.detect_fvgs("ETHUSDT", [bar(3, 104, 101.5)], "trend_up")
+    gap = detector.recent_gaps(7, "ETHUSDT")[0]
+    assert gap.status == "active" and gap.filled_percentage == pytest.approx(0.25) and gap.time_to_first_fill == 1
+
+    # A fresh detector resumes from the snapshot: same gap state, no re-detection
+    resumed = FVGDetector(gap_log_file=tmp_path / "fvg.jsonl", gap_expiry_candles=3)
+    assert resumed.recent_gaps(7, "ETHUSDT") == [gap._replace(creation_candles={})]
+    resumed.detect_fvgs("ETHUSDT", [bar(4, 105, 103), bar(5, 106, 104), bar(6, 107, 105)], "trend_up")
+    assert resumed.recent_gaps(7, "ETHUSDT")[0].status == "expired"
+
+    log = [json.loads(line) for line in (tmp_path / "fvg.jsonl").read_text().splitlines()]
+    assert [r["status"] for r in log if r.get("updated")] == ["expired"]
+    snapshot = json.loads(detector.state_file.read_text())["symbols"]["ETHUSDT"]
+    assert snapshot["bars"] == 7 and len(snapshot["tail"]) == 2
+
+
+def test_scan_symbols_writes_one_snapshot(tmp_path):
+    detector = FVGDetector(gap_log_file=tmp_path / "fvg.jsonl")
+    found = detector.scan_symbols({"ETHUSDT": _candles(500, seed=4), "BTCUSDT": _candles(500, seed=5)})
+    assert detector.symbols() == sorted(s for s, gaps in found.items() if gaps)
+    assert not (tmp_path / "fvg.jsonl").exists()
+    assert set(json.loads(detector.state_file.read_text())["symbols"]) == {"ETHUSDT", "BTCUSDT"}
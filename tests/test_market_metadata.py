@@ -0,0 +1,175 @@
+"""
+Tests for the exchange instrument/ticker cache and its use in ExchangeRouter.
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+
+from engine_alpha.core.models import OrderIntent, OrderType, Side, TdMode, ValidatedOrder, Venue
+from engine_alpha.exchanges.exchange_router import ExchangeRouter
+from engine_alpha.exchanges.market_metadata import ExchangeMetadataService, InstrumentSpec
+
+
+BYBIT_BTC = {
+    "symbol": "BTCUSDT",
+    "lotSizeFilter": {"qtyStep": "0.001", "minOrderQty": "0.001", "minNotionalValue": "5"},
+    "priceFilter": {"tickSize": "0.10"},
+}
+
+
+class FakeClient:
+    name = "Fake"
+
+    def __init__(self):
+        self.calls = {"all_instruments": 0, "instrument": 0, "all_tickers": 0, "place": 0}
+        self.last = 60000.0
+
+    def get_all_instruments(self):
+        self.calls["all_instruments"] += 1
+        return {"BTCUSDT": BYBIT_BTC}
+
+    def get_instrument_meta(self, symbol):
+        self.calls["instrument"] += 1
+        if symbol == "SOLUSDT":
+            return {"symbol": symbol, "lotSizeFilter": {"qtyStep": "0.1"}, "priceFilter": {"tickSize": "0.01"}}
+        raise ValueError(f"Instrument not found: {symbol}")
+
+    def get_all_tickers(self):
+        self.calls["all_tickers"] += 1
+        return {"BTCUSDT": {"last": self.last, "bid": None, "ask": None, "mark": None}}
+
+    def place_order(self, order):
+        self.calls["place"] += 1
+        return {"retCode": 0, "qty": str(order.quantity)}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRiskEngine:
+    def __init__(self):
+        self.prices = []
+
+    def validate_order(self, intent, exchange, price_usd=None, leverage=None):
+        self.prices.append(price_usd)
+        return ValidatedOrder(
+            venue=intent.venue, symbol=intent.symbol, side=intent.side, quantity=intent.quantity,
+            price=intent.price, order_type=intent.order_type, td_mode=TdMode.CROSS,
+            strategy_id=intent.strategy_id,
+        )
+
+
+def test_spec_parsing_across_venue_shapes():
+    bybit = InstrumentSpec.from_meta("BTCUSDT", BYBIT_BTC)
+    assert (bybit.qty_step, bybit.min_qty, bybit.tick_size, bybit.min_notional) == (
+        Decimal("0.001"), Decimal("0.001"), Decimal("0.10"), Decimal("5"),
+    )
+    okx = InstrumentSpec.from_meta("BTC-USDT-SWAP", {"lotSz": "1", "minSz": "1", "tickSz": "0.1"})
+    assert (okx.qty_step, okx.min_qty, okx.tick_size) == (Decimal("1"), Decimal("1"), Decimal("0.1"))
+    paper = InstrumentSpec.from_meta("X", {
+        "filters": {"lotSize": {"minQty": "0.001", "stepSize": "0.001"}, "priceFilter": {"tickSize": "0.01"}, "minNotional": "5"},
+    })
+    assert paper.min_notional == Decimal("5")
+
+
+def test_instruments_served_from_memory_until_ttl():
+    client, clock = FakeClient(), Clock()
+    service = ExchangeMetadataService(client, instruments_ttl=100.0, clock=clock)
+    for _ in range(5):
+        assert service.get_spec("BTCUSDT").tick_size == Decimal("0.10")
+    assert client.calls["all_instruments"] == 1
+
+    clock.now += 101.0
+    service.get_spec("BTCUSDT")
+    assert client.calls["all_instruments"] == 2
+
+
+def test_unknown_symbol_falls_back_once_then_cached():
+    client, clock = FakeClient(), Clock()
+    service = ExchangeMetadataService(client, clock=clock)
+    assert service.get_spec("SOLUSDT").qty_step == Decimal("0.1")
+    assert service.get_spec("SOLUSDT").qty_step == Decimal("0.1")
+    assert client.calls["instrument"] == 1
+    with pytest.raises(ValueError):
+        service.get_spec("NOPEUSDT")
+
+
+def test_ticker_cache_is_read_only_and_expires():
+    client, clock = FakeClient(), Clock()
+    service = ExchangeMetadataService(client, tickers_ttl=10.0, clock=clock)
+    assert service.get_price("BTCUSDT") is None
+    assert client.calls["all_tickers"] == 0  # the read path never fetches
+
+    service.refresh_tickers()
+    client.last = 61000.0
+    assert service.get_price("BTCUSDT") == 60000.0
+    clock.now += 11.0
+    assert service.get_price("BTCUSDT") is None  # stale counts as unknown
+    service.refresh_tickers()
+    assert service.get_price("BTCUSDT") == 61000.0
+
+
+def test_background_ticker_refresh():
+    client = FakeClient()
+    service = ExchangeMetadataService(client)
+    service.start_ticker_refresh(interval=0.01)
+    service.start_ticker_refresh(interval=0.01)  # already running
+    deadline = time.monotonic() + 2.0
+    while client.calls["all_tickers"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    service.stop_ticker_refresh()
+    assert client.calls["all_tickers"] >= 2
+    assert service.get_price("BTCUSDT") == 60000.0
+
+
+def test_router_order_path_uses_cached_metadata(monkeypatch):
+    monkeypatch.setenv("BYBIT_SHADOW_MODE", "false")
+    client, risk = FakeClient(), FakeRiskEngine()
+    router = ExchangeRouter(risk_engine=risk, bybit_client=client)
+    router.warm_metadata()
+    router.bybit_metadata.stop_ticker_refresh()
+
+    for _ in range(3):
+        intent = OrderIntent(
+            strategy_id="s", venue=Venue.BYBIT, symbol="BTCUSDT", side=Side.BUY,
+            quantity=Decimal("0.01"), price=None, order_type=OrderType.MARKET,
+        )
+        router.route_and_execute(intent)
+
+    assert client.calls == {"all_instruments": 1, "instrument": 0, "all_tickers": 1, "place": 3}
+    assert risk.prices == [60000.0, 60000.0, 60000.0]
+
+    tiny = OrderIntent(
+        strategy_id="s", venue=Venue.BYBIT, symbol="BTCUSDT", side=Side.BUY,
+        quantity=Decimal("0.001"), price=Decimal("1000"), order_type=OrderType.LIMIT,
+    )
+    with pytest.raises(ValueError, match="Notional"):
+        router.route_and_execute(tiny)
+
+
+def test_router_defers_min_notional_without_a_price(monkeypatch):
+    monkeypatch.setenv("BYBIT_SHADOW_MODE", "false")
+    client, risk = FakeClient(), FakeRiskEngine()
+    client.get_all_instruments = lambda: {"SOLUSDT": {
+        "lotSizeFilter": {"qtyStep": "0.1", "minOrderQty": "0.1", "minNotionalValue": "5"},
+        "priceFilter": {"tickSize": "0.01"},
+    }}
+    router = ExchangeRouter(risk_engine=risk, bybit_client=client)
+
+    intent = OrderIntent(
+        strategy_id="s", venue=Venue.BYBIT, symbol="SOLUSDT", side=Side.BUY,
+        quantity=Decimal("1"), price=None, order_type=OrderType.MARKET,
+    )
+    router.route_and_execute(intent)  # first order warms the caches
+    router.bybit_metadata.stop_ticker_refresh()
+
+    # No SOL ticker: the 1.0 risk placeholder must not trip the min-notional check
+    assert client.calls["place"] == 1
+    assert client.calls["all_tickers"] == 1
@@ -0,0 +1,102 @@
+"""
+Test per-tick market snapshot publishing (in-process + mmap file).
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from engine_alpha.data import market_snapshot as ms
+from engine_alpha.data.market_snapshot import (
+    MarketSnapshot,
+    SymbolSnapshot,
+    publish_market_snapshot,
+    read_snapshot_file,
+    get_market_snapshot,
+    clear_market_snapshot,
+)
+
+
+def _make_snapshot(price: float = 100.0, created_at: float = None) -> MarketSnapshot:
+    bars = ({"ts": "2024-01-01T00:00:00+00:00", "open": 99.0, "high": 101.0, "low": 98.0, "close": price, "volume": 5.0},)
+    sym = SymbolSnapshot(
+        symbol="ETHUSDT",
+        timeframe="15m",
+        bars=ms._freeze(list(bars)),
+        last_price=price,
+        last_bar_ts=bars[-1]["ts"],
+        funding=0.01,
+        regime="chop",
+        signal=ms._freeze({"signal_vector": [0.1, -0.2], "raw_registry": {"A": {"value": 1.0}}}),
+        meta=ms._freeze({"limit": 200, "source": "test"}),
+    )
+    return MarketSnapshot(
+        version=0,
+        created_at=created_at if created_at is not None else time.time(),
+        timeframe="15m",
+        symbols=MappingProxyType({"ETHUSDT": sym}),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    clear_market_snapshot()
+    yield
+    clear_market_snapshot()
+
+
+def test_snapshot_is_immutable():
+    snap = _make_snapshot()
+    with pytest.raises(Exception):
+        snap.version = 5  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        snap.get("ETHUSDT").bars[0]["close"] = 1.0  # type: ignore[index]
+    # Consumers get mutable copies
+    out = snap.get("ETHUSDT").signal_output()
+    out["signal_vector"].append(9.9)
+    assert snap.get("ETHUSDT").signal_vector == (0.1, -0.2)
+
+
+def test_publish_and_read_mmap_roundtrip():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "market_snapshot.bin"
+        first = publish_market_snapshot(_make_snapshot(100.0), path=path)
+        second = publish_market_snapshot(_make_snapshot(101.0), path=path)
+        assert second.version == first.version + 1
+
+        clear_market_snapshot()
+        loaded = read_snapshot_file(path)
+        assert loaded is not None
+        assert loaded.version == second.version
+        assert loaded.get("ethusdt").last_price == 101.0
+        assert loaded.get("ETHUSDT").bar_rows()[0]["close"] == 101.0
+
+        # Unchanged version returns the cached object without re-decoding
+        assert read_snapshot_file(path) is loaded
+
+
+def test_get_market_snapshot_respects_max_age():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "market_snapshot.bin"
+        publish_market_snapshot(_make_snapshot(created_at=time.time() - 600), path=path)
+        assert get_market_snapshot(max_age_seconds=120, path=path) is None
+        assert get_market_snapshot(max_age_seconds=None, path=path) is not None
+
+
+def test_collect_symbol_bars_fetches_within_provider_cap(monkeypatch):
+    from engine_alpha.data import live_prices
+
+    calls = []
+
+    def fake_live(symbol, timeframe, limit=200, **kwargs):
+        calls.append((symbol, limit))
+        return [{"ts": "2024-01-01T00:00:00+00:00", "close": 1.0}], {}
+
+    monkeypatch.setattr(live_prices, "get_live_ohlcv", fake_live)
+    monkeypatch.setattr(live_prices, "_ensure_completed", lambda rows, timeframe: rows)
+    bars = ms.collect_symbol_bars(["BTCUSDT"], "15m", 500)
+    assert calls == [("BTCUSDT", live_prices.LIVE_MAX_BARS)]
+    assert list(bars) == ["BTCUSDT"]
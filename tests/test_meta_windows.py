@@ -0,0 +1,236 @@
+"""
+Tests for the in-memory meta-intelligence log windows.
+"""
+
+import json
+import pathlib
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.reflect import meta_intelligence
+from engine_alpha.reflect.counterfactual_ledger import CounterfactualLedger
+from engine_alpha.reflect.edge_half_life import EdgeHalfLifeTracker
+from engine_alpha.reflect.inaction_performance import InactionPerformanceTracker
+from engine_alpha.reflect.meta_windows import BucketRing, RegimeUncertaintyWindow
+from engine_alpha.reflect.regime_uncertainty import RegimeUncertaintyTracker
+
+NOW = datetime.now(timezone.utc)
+
+
+def _ago(**kw):
+    return (NOW - timedelta(**kw)).isoformat()
+
+
+def _write(path, records):
+    with path.open("a", encoding="utf-8") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+def _regime_records(n, seed, minutes=50):
+    rng = random.Random(seed)
+    return [
+        {
+            "timestamp": _ago(minutes=minutes * (n - i) / n),
+            "regime_label": rng.choice(["chop", "trend_up", "high_vol"]),
+            "confidence_score": rng.random(),
+            "stability_score": rng.random(),
+            "transition_probability": rng.random(),
+            "entropy": rng.random(),
+        }
+        for i in range(n)
+    ]
+
+
+def _inaction_outcomes(n, seed, hours=20):
+    rng = random.Random(seed)
+    return [
+        {
+            "type": "inaction_outcome",
+            "decision_timestamp": _ago(hours=hours * (n - i) / n),
+            "analysis_timestamp": _ago(hours=hours * (n - i) / n - 0.5),
+            "symbol": "ETHUSDT",
+            "counterfactual_return": 0.0,
+            "inaction_quality_score": round(rng.random(), 3),
+            "opportunity_cost": rng.uniform(-0.01, 0.01),
+            "hindsight_regret": rng.uniform(0, 0.01),
+            "discipline_value": rng.uniform(0, 0.01),
+            "market_development": rng.choice(["sideways", "minor_move", "strong_uptrend"]),
+            "decision_context": {"barrier_type": rng.choice(["capital_mode", "regime_gate", "entry_min_conf"])},
+        }
+        for i in range(n)
+    ]
+
+
+def test_bucket_ring_window_and_expiry():
+    ring = BucketRing(bucket_seconds=10.0, n_buckets=4)
+    for ts in (0.0, 5.0, 12.0, 25.0, 31.0):
+        ring.add(ts, {"n": 1.0})
+    assert ring.totals(since=20.0) == {"n": 2.0}
+    assert ring.totals(since=0.0) == {"n": 5.0}
+    # Advancing past the ring recycles the oldest bucket (two values at t=0, 5)
+    ring.add(45.0, {"n": 1.0})
+    assert ring.totals(since=0.0) == {"n": 4.0}
+    assert ring.add(1.0, {"n": 1.0}) is False
+
+
+def test_regime_metrics_window_matches_scan(tmp_path):
+    tracker = RegimeUncertaintyTracker(uncertainty_log_file=tmp_path / "regime.jsonl")
+    assert tracker.get_uncertainty_metrics(60) == {}
+    _write(tracker.uncertainty_log_file, _regime_records(300, seed=1))
+
+    windowed = tracker.get_uncertainty_metrics(60)
+    scanned = tracker.get_uncertainty_metrics(60 * 48)  # beyond the 24h ring -> full scan
+    assert windowed["total_assessments"] == scanned["total_assessments"] == 300
+    assert windowed["aggregate_metrics"] == pytest.approx(scanned["aggregate_metrics"])
+    assert windowed["regime_breakdown"].keys() == scanned["regime_breakdown"].keys()
+    for label, stats in windowed["regime_breakdown"].items():
+        assert stats == pytest.approx(scanned["regime_breakdown"][label])
+    assert windowed["current_uncertainty_level"] == scanned["current_uncertainty_level"]
+
+
+def test_regime_history_served_from_memory(tmp_path):
+    tracker = RegimeUncertaintyTracker(uncertainty_log_file=tmp_path / "regime.jsonl")
+    records = _regime_records(40, seed=2, minutes=90)
+    _write(tracker.uncertainty_log_file, records)
+
+    expected = [r["regime_label"] for r in records if r["timestamp"] >= _ago(minutes=60)]
+    assert tracker._get_recent_regime_history(NOW, 60) == expected
+
+    # Appends through the tracker are visible without re-reading the log
+    tracker.window.append(dict(records[-1], timestamp=NOW.isoformat(), regime_label="panic_down"))
+    assert tracker._get_recent_regime_history(NOW, 60)[-1] == "panic_down"
+
+
+def test_restore_reads_only_the_log_tail(tmp_path):
+    path = tmp_path / "regime.jsonl"
+    old = _regime_records(3000, seed=3)
+    for rec in old:
+        rec["timestamp"] = _ago(days=3)
+    recent = _regime_records(50, seed=4)
+    _write(path, old + recent)
+
+    window = RegimeUncertaintyWindow(path)
+    window.refresh()
+    assert window._offset == path.stat().st_size
+    assert window.totals(3600.0)["count"] == 50
+    # Only the tail was parsed: the ring holds no trace of the 3-day-old records
+    assert window.totals(24 * 3600.0)["count"] == 50
+
+    # External writers are picked up on the next read
+    _write(path, _regime_records(5, seed=5, minutes=1))
+    assert window.totals(3600.0)["count"] == 55
+
+
+def test_inaction_metrics_window_matches_scan(tmp_path):
+    tracker = InactionPerformanceTracker(inaction_log_file=tmp_path / "inaction.jsonl")
+    assert tracker.get_inaction_performance_metrics()["status"] == "no_data"
+    _write(tracker.inaction_log_file, [{"type": "inaction_decision", "timestamp": _ago(hours=1)}])
+    assert tracker.get_inaction_performance_metrics()["status"] == "insufficient_data"
+
+    _write(tracker.inaction_log_file, _inaction_outcomes(200, seed=6))
+    windowed = tracker.get_inaction_performance_metrics(24)
+    scanned = tracker.get_inaction_performance_metrics(24 * 30)
+    assert windowed["status"] == scanned["status"] == "success"
+    assert windowed["total_inaction_decisions"] == 200
+    assert windowed["performance_summary"] == pytest.approx(scanned["performance_summary"])
+    assert windowed["barrier_analysis"].keys() == scanned["barrier_analysis"].keys()
+    assert windowed["recommendations"] == scanned["recommendations"]
+    counts = windowed["market_development_breakdown"]["development_counts"]
+    assert sum(counts.values()) == 200
+
+    patience = tracker.get_patience_score("ETHUSDT")
+    assert patience["sample_size"] == 200
+    assert 0.0 <= patience["patience_score"] <= 1.0
+
+
+def test_edge_assessment_uses_last_ten_recorded(tmp_path, monkeypatch):
+    from engine_alpha.reflect import edge_half_life
+    from engine_alpha.reflect.edge_half_life import EdgeMetrics, EdgeStrength
+
+    monkeypatch.setattr(edge_half_life.fvg_detector, "get_fvg_statistics", lambda *a, **k: {"status": "no_data"})
+    tracker = EdgeHalfLifeTracker(state_file=tmp_path / "edge_state.json")
+    assert tracker.get_edge_health_assessment("ETHUSDT", 7)["status"] == "insufficient_data"
+
+    strengths = []
+    for i in range(25):
+        symbol = "ETHUSDT" if i % 5 else "BTCUSDT"
+        at = NOW - timedelta(days=2, hours=-i)
+        metrics = EdgeMetrics(at, symbol, 1.1, 0.5, 0.001, 30, 7)
+        strength = EdgeStrength(0.2 + 0.02 * i, 0.5, 0.6, 30.0 - i, 0.01, 1.0)
+        tracker._record_analyses([(symbol, metrics, strength, {"model_type": "test"})], now=at)
+        if symbol == "ETHUSDT":
+            strengths.append(strength.absolute_strength)
+
+    health = tracker.get_edge_health_assessment("ETHUSDT", 7)
+    assert health["data_points"] == len(strengths)
+    assert health["current_strength"] == strengths[-1]
+    assert health["strength_trend"] == tracker._calculate_trend(strengths[-10:])
+    assert tracker.get_edge_health_assessment("ETHUSDT", 1)["status"] == "insufficient_data"
+
+    # The state keeps a fixed-size ring per symbol, and a fresh tracker reads it back
+    state = json.loads(tracker.state_file.read_text())["symbols"]
+    assert len(state["ETHUSDT"]["recent"]) == 10
+    assert EdgeHalfLifeTracker(state_file=tracker.state_file).symbols() == ["BTCUSDT", "ETHUSDT"]
+
+
+def test_counterfactual_window_matches_ledger_scan(tmp_path):
+    ledger = CounterfactualLedger(ledger_file=tmp_path / "ledger.jsonl")
+    rng = random.Random(8)
+    records = []
+    for i in range(120):
+        actual = rng.choice([None, rng.uniform(-0.02, 0.02)])
+        records.append({
+            "type": "outcome",
+            "decision_ts": _ago(days=5, hours=-i),
+            "symbol": "ETHUSDT",
+            "actual_pnl_pct": actual,
+            "counterfactual_pnl_pct": rng.uniform(-0.01, 0.01),
+            "regime_at_decision": rng.choice(["chop", "trend_up", None]),
+            "confidence_at_decision": rng.random(),
+        })
+    _write(ledger.ledger_file, records)
+
+    windowed = ledger.get_window_metrics(7)
+    scanned = ledger.get_counterfactual_metrics(7)
+    for key in ("total_decisions", "avg_opportunity_cost", "beneficial_trade_rate",
+                "total_opportunity_gain", "total_opportunity_loss"):
+        assert windowed[key] == pytest.approx(scanned[key])
+    assert windowed["counterfactual_pf"].pf == pytest.approx(scanned["counterfactual_pf"].pf)
+    assert windowed["null_pf"].trades == scanned["null_pf"].trades
+    assert windowed["by_regime"].keys() == scanned["by_regime"].keys()
+    for regime, stats in windowed["by_regime"].items():
+        assert stats == pytest.approx(scanned["by_regime"][regime])
+
+
+def test_assessment_does_not_rescan_logs(tmp_path, monkeypatch):
+    cf = CounterfactualLedger(ledger_file=tmp_path / "ledger.jsonl")
+    regime = RegimeUncertaintyTracker(uncertainty_log_file=tmp_path / "regime.jsonl")
+    edge = EdgeHalfLifeTracker(state_file=tmp_path / "edge_state.json")
+    inaction = InactionPerformanceTracker(inaction_log_file=tmp_path / "inaction.jsonl")
+    _write(regime.uncertainty_log_file, _regime_records(50, seed=9, minutes=20))
+    _write(inaction.inaction_log_file, _inaction_outcomes(30, seed=10))
+    monkeypatch.setattr(meta_intelligence, "counterfactual_ledger", cf)
+    monkeypatch.setattr(meta_intelligence, "regime_uncertainty_tracker", regime)
+    monkeypatch.setattr(meta_intelligence, "edge_half_life_tracker", edge)
+    monkeypatch.setattr(meta_intelligence, "inaction_performance_tracker", inaction)
+
+    orchestrator = meta_intelligence.MetaIntelligenceOrchestrator()
+    first = orchestrator.assess_meta_decision_quality("ETHUSDT")
+
+    logs = {cf.ledger_file, regime.uncertainty_log_file, edge.state_file, inaction.inaction_log_file}
+    opened = []
+    real_open = pathlib.Path.open
+
+    def tracking_open(self, *args, **kwargs):
+        if self in logs:
+            opened.append(self)
+        return real_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "open", tracking_open)
+    second = orchestrator.assess_meta_decision_quality("ETHUSDT")
+    assert opened == []
+    assert second.component_scores == first.component_scores
+    assert first.component_scores["inaction_performance"] != 0.5
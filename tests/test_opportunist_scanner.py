@@ -0,0 +1,93 @@
+"""
+Tests for the parallel opportunist scanner (vectorized scoring + batched universe write).
+"""
+
+import json
+
+import numpy as np
+
+from engine_alpha.opportunist import scanner, universe_manager
+
+
+def _rows(n, seed):
+    rng = np.random.default_rng(seed)
+    rows, price = [], 10.0 + seed
+    for i in range(n):
+        o = price
+        c = o * (1 + rng.normal(scale=0.02))
+        rows.append({
+            "ts": f"2024-01-01T00:{i:02d}:00+00:00",
+            "open": o, "high": max(o, c) * 1.01, "low": min(o, c) * 0.99, "close": c,
+            "volume": float(rng.integers(0, 1_000_000)),
+        })
+        price = c
+    return rows
+
+
+def _reference(rows):
+    closes = [r["close"] for r in rows]
+    volumes = [r["volume"] for r in rows]
+    p15 = scanner._safe_pct_change(closes[-1], closes[-2])
+    p1h = scanner._safe_pct_change(closes[-1], closes[-5])
+    atr_rel = scanner._compute_atr_rel(rows, period=6)
+    vr = scanner._compute_volume_ratio(volumes)
+    return {
+        "pct_change_15m": p15,
+        "pct_change_1h": p1h,
+        "atr_rel": atr_rel,
+        "liquidity_usd": closes[-1] * volumes[-1],
+        "volume_ratio": vr,
+        "impulse_score": abs(p15) * 0.6 + abs(p1h) * 0.3 + max(0.0, vr - 1.0) * 0.05 + atr_rel * 0.25,
+    }
+
+
+def test_vectorized_scores_match_per_row_helpers():
+    rows_by_symbol = {f"S{i}USDT": _rows(32, i) for i in range(20)}
+    rows_by_symbol["S0USDT"][-3]["volume"] = 0.0
+    for r in rows_by_symbol["S1USDT"][-5:-1]:
+        r["volume"] = 0.0  # zero prior volume -> ratio 0
+    rows_by_symbol["SHORTUSDT"] = _rows(5, 99)  # too few bars -> skipped
+    scored = {c.symbol: c for c in scanner.score_candidates(rows_by_symbol)}
+    assert "SHORTUSDT" not in scored
+    for sym, rows in rows_by_symbol.items():
+        if sym == "SHORTUSDT":
+            continue
+        for field, value in _reference(rows).items():
+            assert getattr(scored[sym], field) == value, (sym, field)
+
+
+def test_scan_fetches_concurrently_and_writes_state_once(monkeypatch, tmp_path):
+    universe = [f"S{i}USDT" for i in range(30)]
+    monkeypatch.setattr(scanner, "_resolve_symbol_universe", lambda max_symbols=80: universe)
+    monkeypatch.setattr(scanner, "OPPORTUNIST_DIR", tmp_path)
+    monkeypatch.setattr(universe_manager, "UNIVERSE_STATE_PATH", tmp_path / "universe_state.json")
+    monkeypatch.setattr(
+        scanner, "get_live_ohlcv",
+        lambda symbol, timeframe, limit=300, no_cache=False: (_rows(limit, int(symbol[1:-4])), {}),
+    )
+    saves = []
+    real_save = universe_manager.save_universe_state
+    monkeypatch.setattr(universe_manager, "save_universe_state", lambda e: (saves.append(len(e)), real_save(e)))
+
+    result = scanner.scan_opportunist_candidates(min_liquidity_usd=0.0, top_n=5, exclude_symbols=["s3usdt"])
+
+    assert len(saves) == 1
+    state = json.loads((tmp_path / "universe_state.json").read_text())
+    assert set(state["symbols"]) == set(universe) - {"S3USDT"}
+    scores = [c["impulse_score"] for c in result["candidates"]]
+    assert len(scores) == 5 and scores == sorted(scores, reverse=True)
+    assert json.loads((tmp_path / "opportunist_candidates.json").read_text())["universe_size"] == 30
+
+
+def test_failed_fetches_are_logged(monkeypatch, caplog):
+    def fetch(symbol, timeframe, limit=300, no_cache=False):
+        if symbol == "BADUSDT":
+            raise OSError("provider down")
+        return _rows(limit if symbol != "SHORTUSDT" else 3, 1), {}
+
+    monkeypatch.setattr(scanner, "get_live_ohlcv", fetch)
+    with caplog.at_level("INFO", logger="opportunist.scanner"):
+        rows = scanner.fetch_universe_rows(["AUSDT", "BADUSDT", "SHORTUSDT"], "15m")
+    assert list(rows) == ["AUSDT"]
+    assert "BADUSDT" in caplog.text and "provider down" in caplog.text
+    assert "dropped 2/3 symbols" in caplog.text
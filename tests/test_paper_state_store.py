@@ -0,0 +1,124 @@
+"""
+Tests for the journaled paper exchange state (PaperStateStore + PaperExchangeClient).
+"""
+
+import json
+from decimal import Decimal
+
+from engine_alpha.core.models import OrderType, Side, TdMode, ValidatedOrder, Venue
+from engine_alpha.exchange.paper_client import PaperExchangeClient
+from engine_alpha.exchange.paper_state_store import PaperStateStore
+
+
+def _store(tmp_path, **kwargs):
+    return PaperStateStore(tmp_path / "paper_trading_state.json", **kwargs)
+
+
+def _order(side=Side.BUY, order_type=OrderType.MARKET, qty="1", price="100"):
+    return ValidatedOrder(
+        venue=Venue.BINANCE,
+        symbol="BTCUSDT",
+        side=side,
+        quantity=Decimal(qty),
+        price=Decimal(price),
+        order_type=order_type,
+        td_mode=TdMode.CROSS,
+        strategy_id="test",
+    )
+
+
+def _journal_lines(store):
+    if not store.journal_path.exists():
+        return []
+    return [l for l in store.journal_path.read_text().splitlines() if l.strip()]
+
+
+def test_state_survives_restart_via_journal(tmp_path):
+    client = PaperExchangeClient(initial_balance_usdt=1000.0, store=_store(tmp_path))
+    client.place_order(_order(qty="2", price="100"))
+    client.place_order(_order(order_type=OrderType.LIMIT, qty="1", price="90"))
+    client.add_balance(50.0)
+
+    restarted = PaperExchangeClient(initial_balance_usdt=1.0, store=_store(tmp_path))
+    assert restarted.state["balance_usdt"] == client.state["balance_usdt"]
+    assert restarted.state["positions"] == client.state["positions"]
+    assert restarted.state["order_counter"] == 2
+    assert [o["orderId"] for o in restarted.get_open_orders()] == ["PAPER_00000002"]
+
+
+def test_cancel_archives_order_out_of_hot_map(tmp_path):
+    store = _store(tmp_path)
+    client = PaperExchangeClient(store=store)
+    placed = client.place_order(_order(order_type=OrderType.LIMIT, price="90"))
+
+    canceled = client.cancel_order("BTCUSDT", ord_id=placed["orderId"])
+    assert canceled["status"] == "CANCELED"
+    assert client.state["orders"] == {}
+    assert [o["orderId"] for o in store.iter_archived_orders()] == [placed["orderId"]]
+
+    restarted = PaperExchangeClient(store=_store(tmp_path))
+    assert restarted.state["orders"] == {}
+
+
+def test_compaction_writes_snapshot_and_truncates_journal(tmp_path):
+    store = _store(tmp_path, snapshot_every=3)
+    client = PaperExchangeClient(initial_balance_usdt=1000.0, store=store)
+    for _ in range(4):
+        client.add_balance(1.0)
+
+    snapshot = json.loads(store.snapshot_path.read_text())
+    assert snapshot["journal_seq"] == 3
+    assert '": ' not in store.snapshot_path.read_text()  # compact separators
+    assert not list(store.snapshot_path.parent.glob("*.tmp"))
+    assert snapshot["balance_usdt"] == 1003.0
+    assert len(_journal_lines(store)) == 1
+
+    restarted = PaperExchangeClient(store=_store(tmp_path))
+    assert restarted.state["balance_usdt"] == 1004.0
+
+
+def test_replay_skips_entries_covered_by_snapshot(tmp_path):
+    store = _store(tmp_path)
+    client = PaperExchangeClient(initial_balance_usdt=100.0, store=store)
+    client.add_balance(10.0)
+    journal = store.journal_path.read_text()
+    store.snapshot()
+    # Crash after snapshot but before truncation: stale journal still on disk
+    store.journal_path.write_text(journal)
+
+    restarted = PaperExchangeClient(store=_store(tmp_path))
+    assert restarted.state["balance_usdt"] == 110.0
+
+
+def test_bulk_placement_writes_one_journal_entry(tmp_path):
+    store = _store(tmp_path)
+    client = PaperExchangeClient(initial_balance_usdt=10000.0, store=store)
+    results = client.place_orders([
+        _order(qty="1"),
+        _order(qty="1"),
+        _order(order_type=OrderType.LIMIT, price="95"),
+        _order(side=Side.SELL, qty="1"),
+    ])
+
+    assert [r["status"] for r in results] == ["FILLED", "FILLED", "NEW", "FILLED"]
+    assert len(_journal_lines(store)) == 1
+
+    sequential = PaperExchangeClient(initial_balance_usdt=10000.0, store=PaperStateStore(tmp_path / "seq.json"))
+    for o in [_order(qty="1"), _order(qty="1"), _order(order_type=OrderType.LIMIT, price="95"), _order(side=Side.SELL, qty="1")]:
+        sequential.place_order(o)
+
+    restarted = PaperExchangeClient(store=_store(tmp_path))
+    assert restarted.state["balance_usdt"] == sequential.state["balance_usdt"]
+    assert restarted.state["positions"] == sequential.state["positions"]
+    assert len(restarted.get_open_orders()) == 1
+
+
+def test_reset_state_snapshots_and_clears_journal(tmp_path):
+    store = _store(tmp_path)
+    client = PaperExchangeClient(store=store)
+    client.add_balance(5.0)
+    client.reset_state(initial_balance=500.0)
+
+    assert _journal_lines(store) == []
+    restarted = PaperExchangeClient(store=_store(tmp_path))
+    assert restarted.state["balance_usdt"] == 500.0
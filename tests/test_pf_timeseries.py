@@ -0,0 +1,133 @@
+"""
+Tests for the incremental PF time-series engine.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.core import codec
+from engine_alpha.research import pf_timeseries
+from engine_alpha.research.pf_timeseries import PFTimeseriesEngine, _compute_pf_for_window
+
+NOW = datetime(2024, 3, 10, 13, 37, 21, tzinfo=timezone.utc)
+
+
+def _trades(n, seed, max_days=120):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        ts = NOW - timedelta(seconds=rng.uniform(-3600, max_days * 86400))
+        out.append({
+            "type": rng.choice(["close", "close", "close", "open"]),
+            "ts": ts.isoformat(),
+            "symbol": rng.choice(["ETHUSDT", "BTCUSDT", "SOLUSDT"]),
+            "pct": rng.choice([0.0, round(rng.uniform(-0.03, 0.03), 5)]),
+            "trade_kind": rng.choice(["normal", "exploration", None]),
+        })
+    return out
+
+
+def _append(path, records):
+    with path.open("a") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+def _reference(records, now, **match):
+    """Full recompute with the original rolling-window rules."""
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    rows = [
+        (datetime.fromisoformat(r["ts"]), r["pct"]) for r in records
+        if r["type"] == "close" and all((r.get(k) or "normal") == v for k, v in match.items())
+    ]
+    out = {f"{d}d": [(p, 1.0) for ts, p in rows if (now - ts).total_seconds() <= d * 86400.0]
+           for d in pf_timeseries.WINDOW_DAYS}
+    out["mtd"] = [(p, 1.0) for ts, p in rows if ts >= start_of_month]
+    return {label: _compute_pf_for_window(values).to_dict() for label, values in out.items()}
+
+
+def _assert_matches(got, expected):
+    assert got.keys() == expected.keys()
+    for label, stats in expected.items():
+        assert got[label] == pytest.approx(stats), label
+
+
+def test_windows_match_full_recompute(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    records = _trades(600, seed=1)
+    _append(path, records)
+    payload = PFTimeseriesEngine(path).compute(NOW)
+
+    _assert_matches(payload["global"], _reference(records, NOW))
+    _assert_matches(payload["symbols"]["BTCUSDT"], _reference(records, NOW, symbol="BTCUSDT"))
+    _assert_matches(payload["lanes"]["exploration"], _reference(records, NOW, trade_kind="exploration"))
+    _assert_matches(payload["lanes"]["normal"], _reference(records, NOW, trade_kind="normal"))
+
+
+def test_new_closes_are_folded_from_offset(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    first, second = _trades(300, seed=2), _trades(50, seed=3, max_days=2)
+    _append(path, first)
+    engine = PFTimeseriesEngine(path)
+    engine.compute(NOW)
+    offset = engine._tail.offset
+
+    _append(path, second)
+    assert engine.refresh() == sum(r["type"] == "close" for r in second)
+    assert engine._tail.offset > offset
+    assert engine.refresh() == 0
+    _assert_matches(engine.compute(NOW)["global"], _reference(first + second, NOW))
+
+    # A rewritten (shorter) ledger is rebuilt from the start
+    path.write_text("")
+    _append(path, second[:10])
+    _assert_matches(engine.compute(NOW)["global"], _reference(second[:10], NOW))
+
+
+def test_window_edges_and_skipped_records(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    exactly_7d = (NOW - timedelta(days=7)).isoformat()
+    just_older = (NOW - timedelta(days=7, milliseconds=1)).isoformat()
+    _append(path, [
+        {"type": "close", "ts": exactly_7d, "symbol": "ETHUSDT", "pct": 0.01},
+        {"type": "close", "ts": just_older, "symbol": "ETHUSDT", "pct": -0.01},
+        {"type": "close", "ts": NOW.isoformat(), "symbol": "ETHUSDT", "pct": 0.5, "entry_px_invalid": True},
+        {"type": "close", "symbol": "ETHUSDT", "pct": 0.01},
+    ])
+    with path.open("a") as f:
+        f.write("not json\n")
+    payload = PFTimeseriesEngine(path).compute(NOW)
+    assert payload["global"]["7d"]["trades"] == 1
+    assert payload["global"]["14d"]["trades"] == 2
+    assert payload["global"]["mtd"]["trades"] == 2
+
+
+def test_compute_pf_timeseries_writes_report(tmp_path, monkeypatch):
+    trades, out = tmp_path / "trades.jsonl", tmp_path / "pf" / "pf_timeseries.json"
+    monkeypatch.setattr(pf_timeseries, "TRADES_PATH", trades)
+    monkeypatch.setattr(pf_timeseries, "OUT_PATH", out)
+    _append(trades, _trades(40, seed=4))
+
+    payload = pf_timeseries.compute_pf_timeseries(NOW)
+    assert json.loads(out.read_text()) == json.loads(json.dumps(payload))
+    assert pf_timeseries.get_engine() is pf_timeseries.get_engine()
+    assert payload["meta"]["generated_at"] == NOW.isoformat()
+
+
+def test_noop_refresh_leaves_report_untouched(tmp_path, monkeypatch):
+    trades, out = tmp_path / "trades.jsonl", tmp_path / "pf" / "pf_timeseries.json"
+    monkeypatch.setattr(pf_timeseries, "TRADES_PATH", trades)
+    monkeypatch.setattr(pf_timeseries, "OUT_PATH", out)
+    _append(trades, _trades(40, seed=5))
+
+    pf_timeseries.compute_pf_timeseries(NOW)
+    sig = codec.file_sig(out)
+    pf_timeseries.compute_pf_timeseries(NOW + timedelta(seconds=30))
+    assert codec.file_sig(out) == sig  # nothing new, no window boundary crossed
+
+    _append(trades, [{"type": "close", "ts": NOW.isoformat(), "symbol": "ETHUSDT", "pct": 0.01}])
+    pf_timeseries.compute_pf_timeseries(NOW + timedelta(seconds=60))
+    assert codec.file_sig(out) != sig
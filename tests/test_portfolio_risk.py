@@ -0,0 +1,85 @@
+"""
+Tests for the portfolio risk kernel and its use by the capital allocator.
+"""
+
+import json
+import math
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from engine_alpha.research import correlation_engine
+from engine_alpha.risk import capital_allocator, portfolio_risk
+from engine_alpha.risk.portfolio_risk import PortfolioRiskKernel
+
+VIEW = {
+    "timeframe": "1h",
+    "symbols": ["BTCUSDT", "ETHUSDT", "DOGEUSDT", "NEWUSDT"],
+    "volatility": {"BTCUSDT": 0.004, "ETHUSDT": 0.005, "DOGEUSDT": 0.012, "NEWUSDT": None},
+    "matrix": {
+        "BTCUSDT": {"BTCUSDT": 1.0, "ETHUSDT": 0.8, "DOGEUSDT": 0.3, "NEWUSDT": 0.0},
+        "ETHUSDT": {"BTCUSDT": 0.8, "ETHUSDT": 1.0, "DOGEUSDT": 0.4, "NEWUSDT": 0.0},
+        "DOGEUSDT": {"BTCUSDT": 0.3, "ETHUSDT": 0.4, "DOGEUSDT": 1.0, "NEWUSDT": 0.0},
+        "NEWUSDT": {"BTCUSDT": 0.0, "ETHUSDT": 0.0, "DOGEUSDT": 0.0, "NEWUSDT": 1.0},
+    },
+}
+
+
+def test_assess_matches_direct_formulas():
+    kernel = PortfolioRiskKernel.from_view(VIEW)
+    assert kernel.bars_per_day == 24
+
+    exposures = {"BTCUSDT": 0.5, "ETHUSDT": 0.3, "DOGEUSDT": 0.2}
+    risk = kernel.assess(exposures, expected_returns={"BTCUSDT": 0.001})
+    symbols = sorted(exposures)
+    vol = np.array([VIEW["volatility"][s] for s in symbols])
+    corr = np.array([[VIEW["matrix"][a][b] for b in symbols] for a in symbols])
+    w = np.array([exposures[s] for s in symbols])
+    cov = corr * np.outer(vol, vol) * 24
+    sigma = math.sqrt(w @ cov @ w)
+
+    assert risk["sigma"] == pytest.approx(sigma)
+    assert risk["var"]["95"] == pytest.approx(NormalDist().inv_cdf(0.95) * sigma - 0.0005)
+    z = NormalDist().inv_cdf(0.99)
+    assert risk["es"]["99"] == pytest.approx(sigma * NormalDist().pdf(z) / 0.01 - 0.0005)
+    assert risk["es"]["99"] > risk["var"]["99"] > risk["var"]["95"]
+    assert sum(risk["component"].values()) == pytest.approx(sigma)
+    assert sum(risk["pct_contribution"].values()) == pytest.approx(1.0)
+    assert risk["pct_contribution"]["DOGEUSDT"] > exposures["DOGEUSDT"]  # High vol adds more than its weight
+    assert sum(risk["inverse_vol_weights"].values()) == pytest.approx(1.0)
+
+
+def test_unmeasured_symbols_use_median_vol_and_no_correlation():
+    kernel = PortfolioRiskKernel.from_view(VIEW)
+    norms = kernel.vol_norm(["BTCUSDT", "DOGEUSDT", "NEWUSDT", "UNKNOWNUSDT"])
+    # Median measured vol is 0.005; DOGE (0.005 / 0.012) is clipped at VOL_NORM_MIN
+    assert norms == {"BTCUSDT": 1.25, "DOGEUSDT": 0.5, "NEWUSDT": 1.0, "UNKNOWNUSDT": 1.0}
+
+    cov = kernel.covariance(["BTCUSDT", "UNKNOWNUSDT"])
+    assert cov[1, 1] == pytest.approx(0.005 ** 2) and cov[0, 1] == 0.0
+    assert kernel.relative_vol(["ETHUSDT", "NEWUSDT"]) == {"ETHUSDT": 1.25}
+    assert PortfolioRiskKernel.from_view({}).assess({"BTCUSDT": 1.0}) == {}
+
+
+def test_capital_plan_uses_kernel(tmp_path, monkeypatch):
+    view_path = tmp_path / "correlation_matrix.json"
+    view_path.write_text(json.dumps(VIEW))
+    monkeypatch.setattr(correlation_engine, "CORRELATION_MATRIX_PATH", view_path)
+    monkeypatch.setattr(portfolio_risk, "_cache", {"view": None, "kernel": None})
+    pf_path = tmp_path / "pf_timeseries.json"
+    pf_path.write_text(json.dumps({"symbols": {s: {"30d": {"pf": 1.2}} for s in ("BTCUSDT", "ETHUSDT", "DOGEUSDT")}}))
+    for name in ("EXECQL_PATH", "DRIFT_PATH", "EDGE_PROFILE_PATH", "POLICY_PATH", "PF_VALIDITY_PATH",
+                 "PF_NORM_PATH", "SCM_PATH", "RISK_SNAPSHOT_PATH"):
+        monkeypatch.setattr(capital_allocator, name, tmp_path / "missing.json")
+    monkeypatch.setattr(capital_allocator, "PF_TS_PATH", pf_path)
+    monkeypatch.setattr(capital_allocator, "OUT_PATH", tmp_path / "capital_plan.json")
+
+    plan = capital_allocator.compute_capital_plan()
+    symbols = plan["symbols"]
+    assert symbols["DOGEUSDT"]["vol_norm"] < 1.0 < symbols["BTCUSDT"]["vol_norm"]
+    assert symbols["DOGEUSDT"]["score"] < symbols["BTCUSDT"]["score"]
+    assert sum(s["risk_contribution"] for s in symbols.values()) == pytest.approx(1.0, abs=1e-3)
+    assert plan["portfolio_risk"]["var"]["99"] > plan["portfolio_risk"]["var"]["95"] > 0
+    assert plan["correlation"]["clusters"] == []  # View without clusters
+
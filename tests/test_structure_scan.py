@@ -0,0 +1,138 @@
+"""
+Tests for the fused structure scan (vectorized detectors + single-load runner).
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine_alpha.core import paths
+from engine_alpha.research import breakout_reliability, market_structure, microstructure_engine, structure_scan
+from engine_alpha.research.advanced_structure import bar_cube, liquidity_sweeps, volume_imbalance
+from engine_alpha.research.advanced_structure import market_structure as ase_market_structure
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _candles(n, seed=0, start=T0, minutes=5):
+    rng = np.random.default_rng(seed)
+    rows = []
+    price = 100.0
+    for i in range(n):
+        o = price
+        c = o + rng.normal(scale=0.8)
+        rows.append({
+            "ts": (start + timedelta(minutes=minutes * i)).isoformat(),
+            "open": o,
+            "high": max(o, c) + abs(rng.normal(scale=0.6)),
+            "low": min(o, c) - abs(rng.normal(scale=0.6)),
+            "close": c,
+            "volume": float(rng.integers(0, 50)),
+        })
+        price = c
+    return rows
+
+
+def _ref_swings(bars):
+    highs, lows = [], []
+    for i in range(1, len(bars) - 1):
+        h_prev, h, h_next = (float(bars[j]["high"]) for j in (i - 1, i, i + 1))
+        l_prev, l, l_next = (float(bars[j]["low"]) for j in (i - 1, i, i + 1))
+        if h > h_prev and h > h_next:
+            highs.append(i)
+        if l < l_prev and l < l_next:
+            lows.append(i)
+    return highs, lows
+
+
+def _ref_sweep(candles, level, pool_type, lookback=10):
+    if len(candles) < lookback:
+        return False
+    recent = candles[-lookback:]
+    for i, c in enumerate(recent[:-1]):
+        nxt = float(recent[i + 1]["close"])
+        if pool_type == "above" and c["high"] > level and c["close"] < level and nxt < level:
+            return True
+        if pool_type == "below" and c["low"] < level and c["close"] > level and nxt > level:
+            return True
+    return False
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_swings_match_loop(seed):
+    bars = _candles(150, seed=seed)
+    bars[10]["high"] = bars[9]["high"] = bars[11]["high"]  # ties are not swings
+    highs, lows = _ref_swings(bars)
+    assert market_structure.detect_swings(bars) == (highs, lows)
+    ase_highs, ase_lows = ase_market_structure._find_swing_points(bars, lookback=150)
+    assert ase_highs == [float(bars[i]["high"]) for i in highs]
+    assert ase_lows == [float(bars[i]["low"]) for i in lows]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_sweep_matches_loop(seed):
+    candles = _candles(40, seed=seed)
+    for level in np.linspace(95, 105, 21):
+        for pool_type in ("above", "below", "none"):
+            assert liquidity_sweeps._detect_sweep(candles, level, pool_type) == _ref_sweep(candles, level, pool_type)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_volume_imbalance_matches_per_candle(seed):
+    recent = _candles(20, seed=seed)
+    recent[3]["high"] = recent[3]["low"] = recent[3]["open"]  # zero range
+    infos = [volume_imbalance._compute_delta_approximation(c) for c in recent]
+    mean_vol = sum(float(c["volume"]) for c in recent) / len(recent)
+    arrays = bar_cube.candle_arrays(recent)
+    vec = volume_imbalance._delta_arrays(arrays)
+    assert vec["delta"].tolist() == [i["delta"] for i in infos]
+    assert volume_imbalance._seq_sum(vec["imbalance"]) == sum(i["imbalance"] for i in infos)
+    absorb, exhaust = volume_imbalance._absorption_exhaustion_counts(arrays, vec["delta"], mean_vol)
+    assert absorb == sum(1 for c, i in zip(recent, infos) if volume_imbalance._detect_absorption(c, i))
+    assert exhaust == sum(1 for c in recent if volume_imbalance._detect_exhaustion(c, mean_vol))
+
+
+def test_fused_scan_loads_once_and_writes_all_artifacts(monkeypatch, tmp_path):
+    research = tmp_path / "research"
+    research.mkdir()
+    monkeypatch.setattr(paths, "REPORTS", tmp_path)
+    monkeypatch.setattr(market_structure, "REPORTS_DIR", research)
+    monkeypatch.setattr(microstructure_engine, "MICROSTRUCTURE_SNAPSHOT_PATH", research / "microstructure_snapshot_15m.json")
+    monkeypatch.setattr(breakout_reliability, "RESEARCH_DIR", research)
+    monkeypatch.setattr(breakout_reliability, "BREAKOUT_RELIABILITY_PATH", research / "breakout_reliability.json")
+    monkeypatch.setattr(structure_scan, "RESEARCH_DIR", research)
+    monkeypatch.setattr(structure_scan, "STRUCTURE_SCAN_PATH", research / "structure_scan.json")
+
+    calls = []
+
+    def fake_live(symbol, timeframe, limit=300, **kwargs):
+        calls.append((symbol, timeframe, limit))
+        minutes = {"5m": 5, "15m": 15, "1h": 60}[timeframe]
+        return _candles(min(limit, 200), seed=len(symbol), minutes=minutes), {}  # Provider cap
+
+    def no_fetch(*args, **kwargs):
+        raise AssertionError("detectors must not load bars themselves")
+
+    monkeypatch.setattr(bar_cube, "get_live_ohlcv", fake_live)
+    monkeypatch.setattr(market_structure, "get_live_ohlcv", no_fetch)
+    monkeypatch.setattr(microstructure_engine, "get_live_ohlcv", no_fetch)
+    bar_cube.clear_bar_cubes()
+
+    report = structure_scan.run_structure_scan(["BTCUSDT", "ETHUSDT", "SOLUSDT"], max_workers=3)
+
+    # One 5m base per symbol; 15m / 1h views longer than the capped base spans are fetched natively
+    assert structure_scan.CUBE_BARS == {"5m": 200, "15m": 200, "1h": 150}
+    assert sorted(calls) == [(s, tf, n) for s in ("BTCUSDT", "ETHUSDT", "SOLUSDT")
+                             for tf, n in (("15m", 200), ("1h", 150), ("5m", 200))]
+    for name in ("volume_imbalance", "liquidity_sweeps", "market_structure",
+                 "microstructure_snapshot_15m", "breakout_reliability", "structure_scan"):
+        data = json.loads((research / f"{name}.json").read_text())
+        if name != "structure_scan":
+            assert set(data["symbols"]) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+    for detector in ("load", "volume_imbalance", "liquidity_sweeps", "market_structure",
+                     "microstructure", "breakout_reliability"):
+        assert report["timings"][detector]["total_s"] >= 0.0
+    assert report["timings"]["load"]["count"] == 3
+    assert report["errors"] == {}
@@ -0,0 +1,147 @@
+"""
+Tests for the shared trade analytics pass (one scan per log across engines).
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from engine_alpha.core import trade_analytics
+from engine_alpha.loop import promotion_gate, recovery_lane_v2
+from engine_alpha.reflect import shadow_exploit_scorer
+from engine_alpha.risk import capital_protection, quarantine, recovery_ramp
+
+NOW = datetime.now(timezone.utc)
+REASONS = {"tp", "sl", "timeout_max_hold"}
+
+
+def _append(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+
+
+def _trades(n, seed):
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        out.append({
+            "type": rng.choice(["close", "close", "open"]),
+            "ts": (NOW - timedelta(hours=rng.uniform(0.1, 24 * 40))).isoformat(),
+            "symbol": rng.choice(["ETHUSDT", "BTCUSDT"]),
+            "pct": round(rng.uniform(-0.02, 0.02), 5),
+            "entry_px": rng.choice([100.0, 1.0, None]),
+            "exit_px": 101.0,
+            "trade_kind": rng.choice(["exploration", "normal", "recovery_v2"]),
+            "exit_reason": rng.choice(["tp", "sl", "manual_close", "timeout_max_hold", ""]),
+            "intent": rng.choice(["probe", "core"]),
+        })
+    return out
+
+
+def _shadow(n, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "ts": (NOW - timedelta(hours=rng.uniform(0.1, 24 * 40))).isoformat(),
+            "symbol": "ETHUSDT",
+            "action": rng.choice(["would_open", "would_exit"]),
+            "event": "would_exit",
+            "pnl_pct": round(rng.uniform(-0.02, 0.02), 5),
+        }
+        for _ in range(n)
+    ]
+
+
+@pytest.fixture
+def logs(tmp_path, monkeypatch):
+    trades = tmp_path / "trades.jsonl"
+    exploit = tmp_path / "exploit_trades.jsonl"
+    micro = tmp_path / "exploit_micro_log.jsonl"
+    shadow = tmp_path / "shadow_exploit_log.jsonl"
+    probe = tmp_path / "probe_lane_log.jsonl"
+    for module in (capital_protection, quarantine, recovery_ramp, promotion_gate, recovery_lane_v2):
+        monkeypatch.setattr(module, "TRADES_PATH", trades)
+    monkeypatch.setattr(quarantine, "EXPLOIT_TRADES_PATH", micro)
+    monkeypatch.setattr(quarantine, "SHADOW_TRADES_PATH", shadow)
+    monkeypatch.setattr(shadow_exploit_scorer, "LOG_PATH", shadow)
+    monkeypatch.setattr(promotion_gate, "EXPLOIT_TRADES_PATH", exploit)
+    monkeypatch.setattr(promotion_gate, "PROBE_LOG_PATH", probe)
+
+    _append(trades, _trades(400, seed=1))
+    _append(exploit, _trades(40, seed=2))
+    _append(micro, _trades(30, seed=3))
+    _append(shadow, _shadow(60, seed=4))
+    _append(probe, [{"action": "opened", "ts": (NOW - timedelta(days=d)).isoformat(), "selected_symbol": "ETHUSDT"}
+                    for d in (1, 3, 10)])
+    return {"trades": trades, "exploit": exploit, "micro": micro, "shadow": shadow, "probe": probe}
+
+
+def _all_results():
+    return {
+        "bootstrap": capital_protection._count_bootstrap_closes_24h(NOW, REASONS, {"exploration"}),
+        "quarantine": quarantine._load_trades_all_lanes(30, NOW),
+        "recent": recovery_ramp._load_recent_closes(NOW),
+        "probe": promotion_gate._load_probe_trades(NOW),
+        "shadow": shadow_exploit_scorer._load_events(),
+        "recovery_pf": recovery_lane_v2._compute_recovery_pf_7d(NOW),
+    }
+
+
+def test_pass_matches_standalone_engines_with_one_scan_per_log(logs):
+    standalone = _all_results()
+    assert standalone["bootstrap"] > 0 and standalone["recent"][0] > 0
+    assert {t["_lane"] for t in standalone["quarantine"]} == {"core", "exploit", "shadow"}
+
+    with trade_analytics.analytics_pass(now=NOW) as shared:
+        assert _all_results() == standalone
+        assert _all_results() == standalone
+        assert shared.scans() == {logs[k]: 1 for k in ("trades", "micro", "shadow", "exploit", "probe")}
+
+
+def test_pass_folds_in_appended_lines(logs):
+    with trade_analytics.analytics_pass(now=NOW) as shared:
+        before = recovery_ramp._load_recent_closes(NOW)
+        _append(logs["trades"], [{
+            "type": "close", "ts": (NOW - timedelta(minutes=5)).isoformat(), "pct": -0.01,
+            "entry_px": 100.0, "exit_px": 99.0, "trade_kind": "exploration", "exit_reason": "sl",
+        }])
+        after = recovery_ramp._load_recent_closes(NOW)
+        assert after[:2] == (before[0] + 1, before[1] + 1)
+        assert capital_protection._count_bootstrap_closes_24h(NOW, REASONS, {"exploration"}) == \
+            _standalone_bootstrap()
+        assert shared.scans()[logs["trades"]] == 2
+
+
+def _standalone_bootstrap():
+    saved, trade_analytics._active = trade_analytics._active, None
+    try:
+        return capital_protection._count_bootstrap_closes_24h(NOW, REASONS, {"exploration"})
+    finally:
+        trade_analytics._active = saved
+
+
+class _Count(trade_analytics.Reducer):
+    def __init__(self, now):
+        super().__init__(now)
+        self.n = 0
+
+    def add(self, record):
+        self.n += 1
+
+    def result(self):
+        return self.n
+
+
+def test_late_reducer_is_backfilled(logs):
+    with trade_analytics.analytics_pass(now=NOW) as shared:
+        recovery_lane_v2._compute_recovery_pf_7d(NOW)
+        trade_analytics.register("test.count", lambda: logs["trades"], _Count)
+        try:
+            assert trade_analytics.reduce("test.count") == 400
+            assert shared.scans()[logs["trades"]] == 2
+        finally:
+            trade_analytics._REGISTRY.pop("test.count")
@@ -0,0 +1,185 @@
+"""
+Tests for the batched variant runner (shared market step + VariantBook).
+"""
+
+import json
+import math
+import random
+
+from engine_alpha.variant import variant_runner
+from engine_alpha.variant.variant_kernel import MarketStep
+
+BASE = {"trend": 0.70, "chop": 0.72, "high_vol": 0.71}
+
+
+def _reference_step(state, market, base_thresholds):
+    """Original per-variant step logic, given precomputed market inputs."""
+    mutations = state["mutations"]
+    threshold = variant_runner._apply_mutations(base_thresholds, mutations, market.regime)
+    cap = max(1, 2 + mutations.get("exploration_cap_delta", 0))
+    position, stats, trades = state["position"], state["stats"], state["trades"]
+    price, final_conf, final_dir = market.price, market.conf, market.dir
+    if position["dir"] != 0:
+        position["bars_open"] += 1
+        should_exit, exit_reason = False, None
+        if final_conf < 0.30:
+            should_exit, exit_reason = True, "low_conf"
+        if final_dir != 0 and final_dir != position["dir"] and final_conf >= 0.60:
+            should_exit, exit_reason = True, "reverse"
+        if position["bars_open"] >= 10:
+            should_exit, exit_reason = True, "timeout"
+        if should_exit:
+            entry_px = position.get("entry_px", price)
+            pct = ((price - entry_px) / entry_px) * position["dir"] if entry_px else 0.0
+            trades.append({"type": "close", "dir": position["dir"], "pct": pct, "exit_reason": exit_reason,
+                           "bars_open": position["bars_open"]})
+            stats["exp_trades"] += 1
+            stats["total_pnl"] += pct
+            if pct > 0:
+                stats["wins"] += 1
+            elif pct < 0:
+                stats["losses"] += 1
+            if stats["losses"] > 0:
+                stats["exp_pf"] = abs(stats["wins"] * 0.01 / stats["losses"])
+            else:
+                stats["exp_pf"] = float("inf") if stats["wins"] > 0 else None
+            position.update({"dir": 0, "entry_px": None, "bars_open": 0})
+    if position["dir"] == 0:
+        if stats["exp_trades"] >= cap:
+            return
+        if final_dir != 0 and final_conf >= threshold:
+            position.update({"dir": final_dir, "entry_px": price, "bars_open": 0})
+            trades.append({"type": "open", "dir": final_dir, "mutated_threshold": threshold})
+
+
+def _variants(n, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"v{i}",
+            "symbol": "ETHUSDT",
+            "status": "shadow",
+            "mutations": {
+                "conf_min_delta": rng.choice([-0.3, -0.2, -0.1, 0.0, 0.05]),
+                "exploration_cap_delta": rng.choice([-1, 0, 5, 50]),
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def _markets(n, seed):
+    rng = random.Random(seed)
+    price = 100.0
+    out = []
+    for i in range(n):
+        price *= 1 + rng.uniform(-0.01, 0.01)
+        out.append(MarketStep(
+            symbol="ETHUSDT", ts=str(i), price=price,
+            dir=rng.choice([-1, 0, 1]), conf=round(rng.uniform(0.2, 0.9), 2),
+            regime=rng.choice(["trend_up", "trend_down", "chop", "high_vol", "weird"]),
+        ))
+    return out
+
+
+def _strip(trade):
+    keep = ("type", "dir", "pct", "exit_reason", "bars_open", "mutated_threshold")
+    return {k: trade[k] for k in keep if k in trade}
+
+
+def test_book_matches_per_variant_loop():
+    variants = _variants(40, seed=3)
+    batched = [variant_runner._variant_state(v, {}) for v in variants]
+    reference = [variant_runner._variant_state(v, {}) for v in variants]
+    book = variant_runner.build_variant_book(batched, BASE)
+
+    for market in _markets(300, seed=4):
+        variant_runner.apply_market_step(book, market)
+        for state in reference:
+            _reference_step(state, market, BASE)
+
+    for got, ref in zip(batched, reference):
+        assert got["position"] == ref["position"]
+        for key in ("exp_trades", "wins", "losses"):
+            assert got["stats"][key] == ref["stats"][key]
+        assert got["stats"]["total_pnl"] == ref["stats"]["total_pnl"]
+        assert got["stats"]["exp_pf"] == ref["stats"]["exp_pf"]
+        assert [_strip(t) for t in got["trades"]] == [_strip(t) for t in ref["trades"]]
+
+
+def test_cycle_computes_market_inputs_once_per_symbol(tmp_path, monkeypatch):
+    strategies = tmp_path / "mutation_strategies.jsonl"
+    variants = _variants(5, seed=1) + [dict(_variants(1, seed=2)[0], id="btc0", symbol="BTCUSDT")]
+    strategies.write_text("".join(json.dumps(v) + "\n" for v in variants))
+    monkeypatch.setattr(variant_runner, "MUTATION_STRATEGIES_PATH", strategies)
+    monkeypatch.setattr(variant_runner, "VARIANT_DIR", tmp_path)
+    monkeypatch.setattr(variant_runner, "_load_base_thresholds", lambda: BASE)
+
+    calls = {"ohlcv": 0, "signals": 0, "decide": 0}
+
+    def fake_ohlcv(symbol, timeframe):
+        calls["ohlcv"] += 1
+        return [{"close": 100.0}], {}
+
+    def fake_signals(symbol, timeframe):
+        calls["signals"] += 1
+        return {"signal_vector": [0.0], "raw_registry": {}}
+
+    def fake_decide(vec, raw):
+        calls["decide"] += 1
+        return {"final": {"dir": 1, "conf": 0.95}}
+
+    monkeypatch.setattr(variant_runner, "get_live_ohlcv", fake_ohlcv)
+    monkeypatch.setattr(variant_runner, "get_signal_vector", fake_signals)
+    monkeypatch.setattr(variant_runner, "decide", fake_decide)
+
+    result = variant_runner.run_variant_cycle()
+    assert result["variants_executed"] == 6
+    assert calls == {"ohlcv": 2, "signals": 2, "decide": 2}
+    summary = json.loads((tmp_path / "v0_summary.json").read_text())
+    assert summary["position"]["dir"] == 1
+    assert summary["position"]["entry_px"] == 100.0
+    assert (tmp_path / "v0_trades.jsonl").read_text().count('"type": "open"') == 1
+
+
+def test_replay_uses_one_market_series_for_all_variants(monkeypatch):
+    monkeypatch.setattr(variant_runner, "_load_base_thresholds", lambda: BASE)
+    markets = _markets(120, seed=9)
+    calls = {"n": 0}
+
+    def fake_steps(symbol, bars, timeframe="15m", lookback=200, warmup=50):
+        calls["n"] += 1
+        return markets
+
+    monkeypatch.setattr(variant_runner, "replay_market_steps", fake_steps)
+    variants = _variants(200, seed=5)
+    report = variant_runner.replay_variants(variants, bars_by_symbol={"ETHUSDT": []}, write_report=False)
+
+    assert calls["n"] == 1
+    assert report["bars_replayed"] == {"ETHUSDT": 120}
+    assert len(report["variants"]) == 200
+    reference = variant_runner._variant_state(variants[7], {})
+    for market in markets:
+        _reference_step(reference, market, BASE)
+    assert report["variants"]["v7"]["stats"]["exp_trades"] == reference["stats"]["exp_trades"]
+
+
+def test_replay_market_steps_on_bars(monkeypatch):
+    from engine_alpha.signals import signal_processor
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("replay must not fetch live data")
+
+    for name in ("get_live_ohlcv", "get_funding_bias", "run_fetchers", "_compute_pci_features"):
+        monkeypatch.setattr(signal_processor, name, no_network)
+    rng = random.Random(0)
+    price, bars = 100.0, []
+    for i in range(90):
+        o = price
+        price *= 1 + rng.uniform(-0.01, 0.01)
+        bars.append({"ts": f"2024-01-01T{i // 4:02d}:{(i % 4) * 15:02d}:00+00:00", "open": o,
+                     "high": max(o, price) * 1.002, "low": min(o, price) * 0.998, "close": price, "volume": 1000.0})
+    steps = variant_runner.replay_market_steps("ETHUSDT", bars, lookback=60, warmup=50)
+    assert len(steps) == 41
+    assert steps[-1].price == bars[-1]["close"]
+    assert all(s.dir in (-1, 0, 1) and 0.0 <= s.conf <= 1.0 and not math.isnan(s.conf) for s in steps)
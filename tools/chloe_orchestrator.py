@@ -158,9 +158,33 @@ def _run_step(step_name: str, module_path: str, function_name: str = "main", arg
         )
 
 
+# Engines whose trade-log aggregates share one scan per log in a FAST run
+FAST_ANALYTICS_CONSUMERS = (
+    "engine_alpha.risk.capital_protection",
+    "engine_alpha.risk.quarantine",
+    "engine_alpha.risk.recovery_ramp",
+    "engine_alpha.loop.promotion_gate",
+    "engine_alpha.loop.recovery_lane_v2",
+    "engine_alpha.reflect.shadow_exploit_scorer",
+)
+
+
 def run_fast() -> OrchestratorRun:
     """
     Run fast cadence (lightweight policy stack).
+
+    All steps run inside one trade analytics pass, so trades.jsonl and the
+    lane logs are read once per run rather than once per engine.
+    """
+    from engine_alpha.core.trade_analytics import analytics_pass
+
+    with analytics_pass(consumers=FAST_ANALYTICS_CONSUMERS):
+        return _run_fast_steps()
+
+
+def _run_fast_steps() -> OrchestratorRun:
+    """
+    Run the FAST steps.
     
     Steps:
     1. policy_refresh
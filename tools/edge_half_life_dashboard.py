@@ -14,7 +14,6 @@ Key insights:
 
 from __future__ import annotations
 from pathlib import Path
-import json
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict, Counter
 from typing import Dict, List, Any
@@ -73,9 +72,9 @@ def main() -> None:
     print("EDGE HALF-LIFE DASHBOARD")
     print("=" * 80)
 
-    # Get edge rotation signals for active symbols
-    # For now, check a few key symbols
-    active_symbols = ["ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"]
+    # Get edge rotation signals for every analyzed symbol (key symbols until the batch has run)
+    symbol_states = edge_half_life_tracker.symbol_states()
+    active_symbols = sorted(symbol_states) or ["ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"]
 
     rotation_signals = edge_half_life_tracker.get_edge_rotation_signals(active_symbols)
 
@@ -131,19 +130,11 @@ def main() -> None:
     print("⏱️  EDGE LONGEVITY PATTERNS")
     print("-" * 35)
 
-    # Load historical data for pattern analysis
+    # Recent analyses per symbol from the edge state
     longevity_stats = defaultdict(list)
-    if edge_half_life_tracker.edge_history_file.exists():
-        with edge_half_life_tracker.edge_history_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    symbol = record["symbol"]
-                    half_life = record["edge_strength"]["half_life_days"]
-                    strength = record["edge_strength"]["absolute_strength"]
-                    longevity_stats[symbol].append((half_life, strength))
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    for symbol, state in symbol_states.items():
+        for record in state.get("recent", []):
+            longevity_stats[symbol].append((record["half_life_days"], record["absolute_strength"]))
 
     if longevity_stats:
         print("Average Edge Longevity by Symbol:")
@@ -185,16 +176,7 @@ def main() -> None:
     print("-" * 40)
 
     # Get recent analyses (last 10 per symbol)
-    recent_analyses = defaultdict(list)
-    if edge_half_life_tracker.edge_history_file.exists():
-        with edge_half_life_tracker.edge_history_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    symbol = record["symbol"]
-                    recent_analyses[symbol].append(record)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+    recent_analyses = {symbol: state.get("recent", []) for symbol, state in symbol_states.items()}
 
     # Show trends for top 3 symbols
     for symbol in list(recent_analyses.keys())[:3]:
@@ -202,8 +184,8 @@ def main() -> None:
                          key=lambda x: x["timestamp"])
 
         if len(analyses) >= 2:
-            strengths = [a["edge_strength"]["absolute_strength"] for a in analyses]
-            half_lives = [a["edge_strength"]["half_life_days"] for a in analyses]
+            strengths = [a["absolute_strength"] for a in analyses]
+            half_lives = [a["half_life_days"] for a in analyses]
 
             strength_trend = "📈" if strengths[-1] > strengths[0] else "📉" if strengths[-1] < strengths[0] else "➡️"
             half_life_trend = "📈" if half_lives[-1] > half_lives[0] else "📉" if half_lives[-1] < half_lives[0] else "➡️"
@@ -10,8 +10,6 @@ Observer-only: FVGs detected but not yet used for trading decisions.
 
 from __future__ import annotations
 from pathlib import Path
-import json
-from datetime import datetime, timezone, timedelta
 from collections import defaultdict, Counter
 from typing import Dict, List, Any
 
@@ -54,8 +52,8 @@ def main() -> None:
     print("🎯 FAIR VALUE GAP DASHBOARD")
     print("=" * 80)
 
-    # Get FVG statistics for key symbols
-    symbols = ["ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"]
+    # Get FVG statistics for every tracked symbol (key symbols before the first scan)
+    symbols = fvg_detector.symbols() or ["ADAUSDT", "ATOMUSDT", "BTCUSDT", "DOTUSDT", "ETHUSDT", "LINKUSDT", "SOLUSDT", "BNBUSDT"]
 
     all_stats = {}
     total_gaps = 0
@@ -151,30 +149,18 @@ def main() -> None:
     print("📈 RECENT FVGs")
     print("-" * 20)
 
-    # Load recent FVGs from log
-    recent_gaps = []
-    if fvg_detector.gap_log_file.exists():
-        with fvg_detector.gap_log_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if not record.get("updated", False):  # Skip updates, show originals
-                        gap_ts = datetime.fromisoformat(record["timestamp"])
-                        if gap_ts >= datetime.now(timezone.utc) - timedelta(days=7):
-                            recent_gaps.append(record)
-                except:
-                    continue
-
-    # Sort by timestamp and show last 5
-    recent_gaps.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-    for gap in recent_gaps[:5]:
-        ts = gap.get("timestamp", "")[:19]
-        symbol = gap.get("symbol", "UNKNOWN")
-        direction = gap.get("direction", "unknown")
-        size_pct = gap.get("gap_size_pct", 0)
-        impulse = gap.get("impulse_strength", 0)
-        status = gap.get("status", "unknown")
-        regime = gap.get("regime_at_creation", "unknown")
+    # Recent FVGs with their current status, from the gap snapshot
+    recent_gaps = fvg_detector.recent_gaps(days_back=7)
+
+    # Show the last 5
+    for gap in reversed(recent_gaps[-5:]):
+        ts = gap.timestamp.isoformat()[:19]
+        symbol = gap.symbol
+        direction = gap.direction
+        size_pct = gap.gap_size_pct
+        impulse = gap.impulse_strength
+        status = gap.status
+        regime = gap.regime_at_creation or "unknown"
 
         dir_icon = get_direction_icon(direction)
         status_color = get_gap_status_color(status)
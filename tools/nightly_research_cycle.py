@@ -98,20 +98,18 @@ def main() -> None:
     #       variables. Ensure these are set before running the nightly cycle to use v4.
     research_steps = [
         ("ARE", "tools.run_are_cycle", "main"),
-        ("MicrostructureScan", "tools.run_microstructure_scan", "main"),
+        ("StructureScan", "tools.run_structure_scan", "main"),  # Fused: microstructure, sweeps, volume imbalance, market structure
         ("DriftScan", "tools.run_drift_scan", "main"),
         ("CorrelationScan", "tools.run_correlation_scan", "main"),
         ("AlphaBetaScan", "tools.run_alpha_beta_scan", "main"),
         ("ExecutionQuality", "tools.run_execution_quality_scan", "main"),
         ("NormalLaneOptimizer", "tools.run_normal_lane_optimizer", "main"),
         ("SymbolEdgeProfile", "tools.run_symbol_edge_profile", "main"),  # Added for PSOE
-        ("LiquiditySweeps", "tools.run_liquidity_sweeps", "main"),  # Phase 12A: Liquidity Sweeps Engine
-        ("VolumeImbalance", "tools.run_volume_imbalance_scan", "main"),  # Phase 12B: Volume Imbalance Engine
-        ("MarketStructure", "tools.run_market_structure_scan", "main"),  # Phase 12D: Market Structure + Sessions
-        ("BreakoutReliability", "tools.run_breakout_reliability_scan", "main"),  # Phase 1: Breakout Reliability Engine
+        ("BreakoutReliability", "tools.run_breakout_reliability_scan", "main"),  # Phase 1: re-run with fresh drift/execution quality
         ("RegimeFusion", "engine_alpha.core.regime_fusion", "run_regime_fusion_for_universe"),  # Phase 2: Regime Awareness V2
         ("ConfidenceV2", "engine_alpha.core.confidence_v2", "run_confidence_v2_for_universe"),  # Phase 2: Confidence Engine V2
         ("PreCandleAttribution", "engine_alpha.reflect.pre_candle_attribution", "generate_attribution_report"),  # Phase 3: PCI attribution analysis
+        ("EdgeHalfLife", "engine_alpha.reflect.edge_half_life", "run_edge_half_life_batch"),  # Batch edge decay fit for all symbols
         ("Reflection", "tools.run_reflection_cycle", "main"),  # v4-aware: respects USE_GPT_REFLECTION_V4
         ("Tuner", "tools.run_tuner_cycle", "main"),  # v4-aware: respects USE_GPT_TUNER_V4
         ("Dream", "tools.run_dream_cycle", "main"),
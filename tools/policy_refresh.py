@@ -496,10 +496,17 @@ def run_policy_refresh() -> None:
         _log("Recomputing Capital Plan (capital_allocator)...")
         plan = compute_capital_plan()
         meta = plan.get("meta", {})
-        _log(
-            f"Capital Plan updated: engine={meta.get('engine')} "
-            f"generated_at={meta.get('generated_at')}"
-        )
+        if meta.get("reused"):
+            _log(
+                f"Capital Plan reused (inputs unchanged): engine={meta.get('engine')} "
+                f"generated_at={meta.get('generated_at')}"
+            )
+        else:
+            _log(
+                f"Capital Plan updated: engine={meta.get('engine')} "
+                f"generated_at={meta.get('generated_at')} "
+                f"rescored_symbols={meta.get('rescored_symbols')}"
+            )
     except Exception as exc:
         _log(f"ERROR: Capital Plan refresh failed: {exc!r}")
         traceback.print_exc()
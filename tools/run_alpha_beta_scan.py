@@ -27,27 +27,30 @@ def main() -> int:
     
     if not symbols_data:
         print("⚠️  No symbol data found")
-        print("   Run some trades first to generate alpha/beta analysis")
+        print("   Needs live bars for the benchmark (market snapshot or exchange fetch)")
         return 0
     
     print("ALPHA/BETA BY SYMBOL:")
     print("-" * 70)
-    print(f"{'Symbol':<12} {'Alpha':>10} {'Beta':>10} {'Sample':>8}")
+    print(f"{'Symbol':<12} {'Alpha bps':>10} {'Beta':>10} {'R2':>6} {'Sample':>8}")
     print("-" * 70)
     
     for symbol, data in sorted(symbols_data.items()):
-        alpha = data.get("alpha")
+        alpha = data.get("alpha_bps")
         beta = data.get("beta")
+        r2 = data.get("r2")
         sample_size = data.get("sample_size", 0)
         
-        alpha_str = f"{alpha:+.4f}" if alpha is not None else "N/A"
+        alpha_str = f"{alpha:+.2f}" if alpha is not None else "N/A"
         beta_str = f"{beta:.2f}" if beta is not None else "N/A"
+        r2_str = f"{r2:.2f}" if r2 is not None else "N/A"
         
-        print(f"{symbol:<12} {alpha_str:>10} {beta_str:>10} {sample_size:>8}")
+        print(f"{symbol:<12} {alpha_str:>10} {beta_str:>10} {r2_str:>6} {sample_size:>8}")
     
     print()
+    print(f"Bars: {report.get('bars', 0)} x {report.get('timeframe')}  (last {report.get('last_bar_ts')})")
     print("Interpretation:")
-    print("  Alpha: Idiosyncratic return (positive = outperforms market)")
+    print("  Alpha: Idiosyncratic return per bar (positive = outperforms market)")
     print("  Beta: Market sensitivity (1.0 = moves with market, >1.0 = more volatile)")
     print()
     print(f"✅ Alpha/beta report written to: reports/research/alpha_beta.json")
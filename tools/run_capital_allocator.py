@@ -2,7 +2,10 @@
 CLI wrapper for Capital Allocator V1 (Phase 4a).
 
 Usage:
-    python3 -m tools.run_capital_allocator
+    python3 -m tools.run_capital_allocator [--cached]
+
+By default the plan is recomputed from scratch; --cached returns the last
+plan when none of its input files changed.
 
 This is ADVISORY-ONLY and PAPER-SAFE.
 It recomputes the capital plan and prints a brief summary.
@@ -10,11 +13,13 @@ It recomputes the capital plan and prints a brief summary.
 
 from __future__ import annotations
 
+import sys
+
 from engine_alpha.risk.capital_allocator import compute_capital_plan
 
 
 def main() -> None:
-    plan = compute_capital_plan()
+    plan = compute_capital_plan(force="--cached" not in sys.argv[1:])
     meta = plan.get("meta", {})
     syms = plan.get("symbols", {})
     top = plan.get("marksman_top5", [])
@@ -24,6 +29,7 @@ def main() -> None:
     print(f"Engine      : {meta.get('engine')}")
     print(f"Version     : {meta.get('version')}")
     print(f"GeneratedAt : {meta.get('generated_at')}")
+    print(f"Rescored    : {meta.get('rescored_symbols')}")
     print()
     print("Top 5 Symbols by Score:")
     print("----------------------------------------------------------------------")
@@ -26,7 +26,7 @@ def main() -> int:
     
     if not matrix or not symbols:
         print("⚠️  No correlation data found")
-        print("   Run some trades first to generate correlation analysis")
+        print("   Needs live bars (market snapshot or exchange fetch) to build the matrix")
         return 0
     
     # Collect all pairs with correlations
@@ -55,9 +55,16 @@ def main() -> int:
     for sym1, sym2, corr in pairs[-5:]:
         print(f"  {sym1} ↔ {sym2}: {corr:+.3f}")
     
+    print()
+    print(f"CORRELATION CLUSTERS (corr >= {report.get('cluster_threshold')}):")
+    print("-" * 70)
+    for group in report.get("clusters", []):
+        if len(group) > 1:
+            print(f"  {', '.join(group)}")
+
     print()
     print(f"✅ Correlation matrix written to: reports/research/correlation_matrix.json")
-    print(f"   Common timestamps: {report.get('common_timestamps_count', 0)}")
+    print(f"   Last bar: {report.get('last_bar_ts')}  (EW half-life {report.get('halflife_bars')} bars)")
     print("=" * 70)
     
     return 0
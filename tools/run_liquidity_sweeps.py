@@ -11,11 +11,13 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from engine_alpha.research.advanced_structure.liquidity_sweeps import compute_liquidity_sweeps
+from engine_alpha.research.advanced_structure.liquidity_sweeps import (
+    compute_liquidity_sweeps,
+    write_liquidity_sweeps_report,
+)
 from engine_alpha.core.paths import REPORTS
 from pathlib import Path
 import json
-from datetime import datetime, timezone
 
 
 def main() -> int:
@@ -23,7 +25,6 @@ def main() -> int:
     try:
         RESEARCH_DIR = REPORTS / "research"
         RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
-        OUTPUT_PATH = RESEARCH_DIR / "liquidity_sweeps.json"
         
         # Get enabled symbols
         try:
@@ -74,27 +75,8 @@ def main() -> int:
                     "notes": [f"Error: {str(e)}"],
                 }
         
-        # Compute health
-        health_status = "ok"
-        health_reasons = []
-        
-        unknown_sessions = sum(1 for r in all_results.values() if r.get("session") == "Unknown" or r.get("session") == "unknown")
-        if unknown_sessions == len(all_results) and len(all_results) > 0:
-            health_status = "degraded"
-            health_reasons.append("unknown_session_for_all")
-        
-        # Write output
-        output_data = {
-            "version": "v2.1",
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "health": {
-                "status": health_status,
-                "reasons": health_reasons,
-            },
-            "symbols": all_results,
-        }
-        
-        OUTPUT_PATH.write_text(json.dumps(output_data, indent=2))
+        # Write output (with health)
+        write_liquidity_sweeps_report(all_results)
         
         # Print summary
         print("LIQUIDITY SWEEPS SCAN")
@@ -19,16 +19,18 @@ from __future__ import annotations
 
 import json
 import sys
-from collections import defaultdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from engine_alpha.core.paths import REPORTS
-from engine_alpha.research.pf_timeseries import _extract_return, _compute_pf_for_window
+from engine_alpha.research.alpha_beta_decomposition import ALPHA_BETA_PATH
+from engine_alpha.research.pf_timeseries import _extract_return, pf_by_group
 from engine_alpha.reflect.trade_sanity import filter_corrupted
 
 
@@ -103,78 +105,52 @@ def _classify_lane(trade: Dict[str, Any]) -> str:
     return "core"  # Default to core
 
 
-def _compute_pf_by_lane(
+def _window_closes(
     trades: List[Dict[str, Any]],
     window_days: int,
     now: datetime,
-) -> Tuple[Optional[float], int]:
-    """Compute PF for a lane within a time window."""
-    window_trades = []
+) -> List[Tuple[str, Optional[str], Tuple[float, float]]]:
+    """(lane, symbol, (return_pct, weight)) of the closes within the window."""
+    closes = []
     for trade in trades:
-        ts = _parse_timestamp(trade.get("ts") or trade.get("timestamp"))
-        if ts is None:
-            continue
-        delta = now - ts
-        if delta.total_seconds() > window_days * 86400.0:
-            continue
-        
-        # Only count closes for PF
         event_type = str(trade.get("type") or trade.get("event", "")).lower()
         if event_type not in ("close", "would_exit"):
             continue
-        
+        ts = _parse_timestamp(trade.get("ts") or trade.get("timestamp"))
+        if ts is None or (now - ts).total_seconds() > window_days * 86400.0:
+            continue
         rets = _extract_return(trade)
         if rets is None:
             continue
-        
-        window_trades.append(rets)
-    
-    if not window_trades:
-        return None, 0
-    
-    stats = _compute_pf_for_window(window_trades)
-    return stats.pf, stats.trades
+        symbol = trade.get("symbol") or trade.get("pair")
+        if symbol == "UNKNOWN":
+            symbol = None
+        closes.append((trade.get("_lane", "core"), symbol, rets))
+    return closes
+
+
+def _compute_pf_by_lane(
+    closes: List[Tuple[str, Optional[str], Tuple[float, float]]],
+) -> Dict[str, Tuple[Optional[float], int]]:
+    """PF and trade count per lane."""
+    stats = pf_by_group([lane for lane, _, _ in closes], [rets for _, _, rets in closes])
+    return {lane: (s.pf, s.trades) for lane, s in stats.items()}
 
 
 def _compute_pf_by_symbol(
-    trades: List[Dict[str, Any]],
-    window_days: int,
-    now: datetime,
+    closes: List[Tuple[str, Optional[str], Tuple[float, float]]],
 ) -> Dict[str, Tuple[Optional[float], float, int]]:
     """Compute PF, PnL USD, and trade count per symbol."""
-    by_symbol: Dict[str, List[Tuple[float, float]]] = defaultdict(list)
-    
-    for trade in trades:
-        ts = _parse_timestamp(trade.get("ts") or trade.get("timestamp"))
-        if ts is None:
-            continue
-        delta = now - ts
-        if delta.total_seconds() > window_days * 86400.0:
-            continue
-        
-        event_type = str(trade.get("type") or trade.get("event", "")).lower()
-        if event_type not in ("close", "would_exit"):
-            continue
-        
-        symbol = trade.get("symbol") or trade.get("pair")
-        if not symbol or symbol == "UNKNOWN":
-            # Skip trades without valid symbol
-            continue
-        rets = _extract_return(trade)
-        if rets is None:
-            continue
-        
-        r, w = rets
-        pnl_usd = r * w  # Approximate PnL in USD
-        by_symbol[symbol].append((r, w))
-    
-    results = {}
-    for symbol, returns in by_symbol.items():
-        stats = _compute_pf_for_window(returns)
-        total_pnl = sum(r * w for r, w in returns)
-        results[symbol] = (stats.pf, total_pnl, stats.trades)
-    
-    return results
+    # Skip trades without valid symbol
+    keyed = [(symbol, rets) for _, symbol, rets in closes if symbol]
+    if not keyed:
+        return {}
+    symbols = [symbol for symbol, _ in keyed]
+    rw = np.asarray([rets for _, rets in keyed], dtype=float)
+    stats = pf_by_group(symbols, rw)
+    keys, codes = np.unique(np.asarray(symbols, dtype=object), return_inverse=True)
+    pnl = np.bincount(codes, weights=rw[:, 0] * rw[:, 1], minlength=len(keys))  # Approximate PnL in USD
+    return {sym: (stats[sym].pf, float(pnl[i]), stats[sym].trades) for i, sym in enumerate(keys)}
 
 
 def _get_capital_mode_explanation(
@@ -274,15 +250,16 @@ def run_pf_attribution() -> Dict[str, Any]:
     # Load capital protection
     capital_protection = _load_json(REPORTS / "risk" / "capital_protection.json")
     
-    # Compute PF by lane (30D window)
+    # Closes of the 30D window, grouped by lane and by symbol in one pass each
+    closes = _window_closes(all_trades, window_days=30, now=now)
+    by_lane = _compute_pf_by_lane(closes)
     lane_pf = {}
     for lane in ["core", "explore", "exploit", "shadow"]:
-        lane_trades = [t for t in all_trades if t.get("_lane") == lane]
-        pf, trades = _compute_pf_by_lane(lane_trades, window_days=30, now=now)
+        pf, trades = by_lane.get(lane, (None, 0))
         lane_pf[lane] = {"pf": pf, "trades": trades}
     
     # Compute PF by symbol (30D window)
-    symbol_pf = _compute_pf_by_symbol(all_trades, window_days=30, now=now)
+    symbol_pf = _compute_pf_by_symbol(closes)
     
     # Sort symbols by PF (worst first)
     symbol_list = [
@@ -293,6 +270,13 @@ def run_pf_attribution() -> Dict[str, Any]:
     
     # Capital mode explanation
     mode_explanation = _get_capital_mode_explanation(capital_protection, symbol_pf)
+
+    # Market (beta) vs idiosyncratic (alpha) profile of the loss contributors
+    alpha_beta = _load_json(ALPHA_BETA_PATH).get("symbols") or {}
+    for contrib in mode_explanation["top_contributors"]:
+        ab = alpha_beta.get(contrib["symbol"]) or {}
+        contrib["beta"] = ab.get("beta")
+        contrib["alpha_bps"] = ab.get("alpha_bps")
     
     return {
         "lane_pf": lane_pf,
@@ -349,7 +333,9 @@ def main() -> int:
             pf = contrib["pf"]
             pct = contrib["pct_contribution"]
             pf_str = f"{pf:.2f}" if pf is not None else "—"
-            print(f"{sym:<12} PnL=${pnl:+.2f}  PF={pf_str:<6}  Contribution={pct:.1f}%")
+            beta = contrib.get("beta")
+            beta_str = f"{beta:.2f}" if beta is not None else "—"
+            print(f"{sym:<12} PnL=${pnl:+.2f}  PF={pf_str:<6}  Contribution={pct:.1f}%  beta={beta_str}")
     else:
         print("(no significant losses found)")
     print()